@@ -0,0 +1,63 @@
+# aluguel.py
+# Motor único de cálculo de aluguel, baseado em tabelas pré-calculadas.
+# Usado por Propriedade/CasaMetro/CasaCompanhia, GestorPropriedades, ValidadorRegras e Jogo.
+
+from functools import lru_cache
+
+# Tipos de aluguel (atributo tipo_aluguel das propriedades)
+TIPO_ALUGUEL_COMUM = 0
+TIPO_ALUGUEL_METRO = 1
+TIPO_ALUGUEL_COMPANHIA = 2
+
+# Multiplicador do aluguel base por nº de casas (0 a 4 casas, 5 = hotel)
+MULTIPLICADORES_CASAS = (1, 5, 15, 45, 80, 100)
+
+# Aluguel do metrô pelo nº de estações do proprietário (índice 0 não é usado)
+ALUGUEL_METRO = (0, 25, 50, 100, 200)
+
+# Multiplicador da rolagem pelo nº de companhias do proprietário
+MULTIPLICADOR_COMPANHIA = (0, 4, 10)
+
+
+@lru_cache(maxsize=None)
+def tabela_aluguel_comum(aluguel_base):
+    """
+    Tabela de aluguel de uma propriedade comum, compartilhada por propriedades de mesmo aluguel base.
+
+    Índices:
+        0: sem construções
+        1: sem construções, com monopólio do grupo (aluguel dobrado)
+        2-6: 1 a 4 casas e hotel
+    """
+    return (aluguel_base, aluguel_base * 2) + tuple(
+        aluguel_base * multiplicador for multiplicador in MULTIPLICADORES_CASAS[1:]
+    )
+
+
+def calcular_aluguel(propriedade, rolagem_dados=0):
+    """
+    Calcula o aluguel devido ao cair em uma propriedade.
+
+    Args:
+        propriedade: Propriedade, CasaMetro ou CasaCompanhia
+        rolagem_dados: Total dos dados (usado apenas para companhias)
+
+    Returns:
+        int: Valor do aluguel (0 se sem dono ou hipotecada)
+    """
+    dono = propriedade.proprietario
+    if dono is None or propriedade.hipotecada:
+        return 0
+
+    tipo = propriedade.tipo_aluguel
+    if tipo == TIPO_ALUGUEL_COMUM:
+        casas = propriedade.casas
+        if casas:
+            return propriedade.tabela_aluguel[casas + 1]
+        return propriedade.tabela_aluguel[1 if dono.tem_monopolio(propriedade.grupo_cor) else 0]
+
+    # Metrô e companhia: tabela indexada pelo nº de propriedades do grupo que o dono possui
+    quantidade = dono.contagem_grupos.get(propriedade.grupo_cor, 0)
+    if tipo == TIPO_ALUGUEL_METRO:
+        return propriedade.tabela_aluguel[quantidade]
+    return propriedade.tabela_aluguel[quantidade] * rolagem_dados
@@ -0,0 +1,268 @@
+# avaliacao.py
+# Serviço único de avaliação de propriedades, usado pelos bots (IIABot, IIABotNegociacao)
+# e pelo cálculo de patrimônio. O valor de uma propriedade para um dono combina o preço,
+# as construções e o aluguel esperado (probabilidades de pouso x tabela de aluguel) num
+# horizonte de turnos, incluindo o bônus de monopólio e o potencial de construção.
+
+from aluguel import TIPO_ALUGUEL_COMUM, TIPO_ALUGUEL_COMPANHIA
+from probabilidades_tabuleiro import REGRAS_PADRAO, ROLAGEM_MEDIA, frequencias_pouso
+from tabuleiro import TabelasTabuleiro
+
+
+class ServicoAvaliacao:
+    """
+    Avalia propriedades e conjuntos de propriedades para um dono.
+
+    O valor de um conjunto é a soma do valor de cada grupo, e o valor de um grupo depende só
+    de quais propriedades do grupo o dono tem, das casas e das hipotecas. Esse trio forma a
+    chave compacta do cache: mudanças de posse ou de construção geram uma chave nova (o valor
+    antigo nunca é reutilizado), e avaliar muitas trocas custa consultas ao cache.
+    """
+
+    HORIZONTE_PADRAO = 20            # Turnos de cada adversário considerados no aluguel esperado
+    NUM_ADVERSARIOS_PADRAO = 3
+    FATOR_POTENCIAL_CONSTRUCAO = 0.5  # Peso do ganho de construir 3 casas num monopólio sem casas
+
+    _padrao = None
+
+    def __init__(self, num_adversarios=NUM_ADVERSARIOS_PADRAO, horizonte_turnos=HORIZONTE_PADRAO,
+                 regras=REGRAS_PADRAO, tabelas=None):
+        """
+        Args:
+            num_adversarios: Nº de adversários que podem cair nas propriedades
+            horizonte_turnos: Nº de turnos de cada adversário considerados
+            regras: RegrasMarkov das probabilidades de pouso
+            tabelas: TabelasTabuleiro (padrão: tabuleiro padrão)
+        """
+        self.tabelas = tabelas if tabelas is not None else TabelasTabuleiro.padrao()
+        self.num_adversarios = num_adversarios
+        self.horizonte_turnos = horizonte_turnos
+        self.frequencias = frequencias_pouso(regras)
+        self._fator_renda = num_adversarios * horizonte_turnos
+        self._cache_grupos = {}
+        self.consultas = 0
+        self.calculos = 0
+
+        # Índice de cada posição dentro do seu grupo (bit na máscara de posse do grupo)
+        indice_no_grupo = [-1] * len(self.tabelas.grupos)
+        for membros in self.tabelas.posicoes_grupo:
+            for indice, posicao in enumerate(membros):
+                indice_no_grupo[posicao] = indice
+        self.indice_no_grupo = tuple(indice_no_grupo)
+
+    @classmethod
+    def padrao(cls):
+        """Instância compartilhada com os parâmetros padrão."""
+        if cls._padrao is None:
+            cls._padrao = cls()
+        return cls._padrao
+
+    # --- Núcleo: valor de um grupo por chave compacta ---
+
+    def valor_grupo(self, grupo, mascara, casas=None, hipotecas=0):
+        """
+        Valor de cada propriedade de um grupo para um dono.
+
+        Args:
+            grupo: Índice do grupo (TabelasTabuleiro.posicoes_grupo)
+            mascara: Bits (pela ordem do grupo) das propriedades que o dono tem
+            casas: Tupla com as casas de cada propriedade do grupo (None = sem casas)
+            hipotecas: Bits (pela ordem do grupo) das propriedades hipotecadas
+
+        Returns:
+            tuple: Valor de cada propriedade do grupo (0 para as que o dono não tem)
+        """
+        chave = (grupo, mascara, casas, hipotecas)
+        self.consultas += 1
+        valores = self._cache_grupos.get(chave)
+        if valores is None:
+            valores = self._cache_grupos[chave] = self._calcular_grupo(grupo, mascara, casas, hipotecas)
+        return valores
+
+    def _calcular_grupo(self, grupo, mascara, casas, hipotecas):
+        self.calculos += 1
+        tabelas = self.tabelas
+        membros = tabelas.posicoes_grupo[grupo]
+        quantidade = bin(mascara).count('1')
+        monopolio = quantidade == len(membros)
+        valores = []
+
+        for indice, posicao in enumerate(membros):
+            if not mascara >> indice & 1:
+                valores.append(0.0)
+                continue
+
+            preco = tabelas.precos[posicao]
+            num_casas = casas[indice] if casas else 0
+            construcoes = num_casas * tabelas.custo_casa[posicao]
+            if hipotecas >> indice & 1:
+                valores.append(preco / 2 + construcoes)
+                continue
+
+            tabela = tabelas.tabelas_aluguel[posicao]
+            renda_por_aluguel = self.frequencias[posicao] * self._fator_renda
+            tipo = tabelas.tipos_aluguel[posicao]
+            potencial = 0.0
+            if tipo == TIPO_ALUGUEL_COMUM:
+                nivel = num_casas + 1 if num_casas else (1 if monopolio else 0)
+                renda = renda_por_aluguel * tabela[nivel]
+                if monopolio and tabelas.construivel[posicao] and num_casas < 3:
+                    ganho = renda_por_aluguel * (tabela[4] - tabela[nivel]) - (3 - num_casas) * tabelas.custo_casa[posicao]
+                    potencial = max(0.0, ganho) * self.FATOR_POTENCIAL_CONSTRUCAO
+            elif tipo == TIPO_ALUGUEL_COMPANHIA:
+                renda = renda_por_aluguel * tabela[quantidade] * ROLAGEM_MEDIA
+            else:
+                renda = renda_por_aluguel * tabela[quantidade]
+
+            valores.append(preco + construcoes + renda + potencial)
+
+        return tuple(valores)
+
+    # --- Chaves compactas ---
+
+    def chave_conjunto(self, propriedades):
+        """
+        Chave compacta de um conjunto de propriedades (objetos Propriedade, com casas e hipotecas).
+
+        Returns:
+            dict: grupo -> (mascara, casas, hipotecas)
+        """
+        por_grupo = {}
+        grupos, indice_no_grupo = self.tabelas.grupos, self.indice_no_grupo
+        for propriedade in propriedades:
+            posicao = propriedade.posicao
+            grupo = grupos[posicao]
+            mascara, casas, hipotecas = por_grupo.get(grupo, (0, None, 0))
+            bit = 1 << indice_no_grupo[posicao]
+            if propriedade.casas:
+                casas = list(casas or (0,) * len(self.tabelas.posicoes_grupo[grupo]))
+                casas[indice_no_grupo[posicao]] = propriedade.casas
+                casas = tuple(casas)
+            if propriedade.hipotecada:
+                hipotecas |= bit
+            por_grupo[grupo] = (mascara | bit, casas, hipotecas)
+        return por_grupo
+
+    def _valor_chave(self, chave):
+        return sum(sum(self.valor_grupo(grupo, *estado)) for grupo, estado in chave.items())
+
+    # --- Consultas sobre objetos do jogo ---
+
+    def valor_conjunto(self, propriedades):
+        """Valor total de um conjunto de propriedades para um mesmo dono."""
+        return self._valor_chave(self.chave_conjunto(propriedades))
+
+    def valor_propriedade(self, propriedade, dono=None):
+        """
+        Valor de uma propriedade dentro das posses do dono (sem dono: avaliada sozinha).
+
+        Returns:
+            float: Valor esperado da propriedade
+        """
+        propriedades = dono.propriedades if dono is not None else ()
+        grupo = self.tabelas.grupos[propriedade.posicao]
+        do_grupo = [p for p in propriedades if self.tabelas.grupos[p.posicao] == grupo]
+        if propriedade not in do_grupo:
+            do_grupo.append(propriedade)
+        mascara, casas, hipotecas = self.chave_conjunto(do_grupo)[grupo]
+        return self.valor_grupo(grupo, mascara, casas, hipotecas)[self.indice_no_grupo[propriedade.posicao]]
+
+    def valor_marginal(self, propriedade, jogador):
+        """Quanto o valor das posses do jogador aumenta ao receber a propriedade (sem casas)."""
+        return self.avaliar_troca(jogador, recebe=[propriedade], entrega=[])
+
+    def avaliar_troca(self, jogador, recebe, entrega, dinheiro=0):
+        """
+        Variação de valor para o jogador numa troca. Só os grupos tocados pela troca são reavaliados.
+
+        Args:
+            jogador: Jogador avaliado
+            recebe: Propriedades que o jogador recebe (construções são vendidas antes da troca)
+            entrega: Propriedades que o jogador entrega
+            dinheiro: Dinheiro recebido (negativo = pago)
+
+        Returns:
+            float: Valor após a troca - valor antes da troca
+        """
+        grupos = self.tabelas.grupos
+        tocados = {grupos[p.posicao] for p in recebe} | {grupos[p.posicao] for p in entrega}
+        antes = [p for p in jogador.propriedades if grupos[p.posicao] in tocados]
+        depois = [p for p in antes if p not in entrega] + list(recebe)
+
+        chave_antes = self.chave_conjunto(antes)
+        chave_depois = self.chave_conjunto(depois)
+        for propriedade in recebe:
+            # A propriedade chega sem casas (construções são vendidas antes de negociar)
+            grupo = grupos[propriedade.posicao]
+            mascara, casas, hipotecas = chave_depois[grupo]
+            if casas:
+                casas = list(casas)
+                casas[self.indice_no_grupo[propriedade.posicao]] = 0
+                casas = tuple(casas) if any(casas) else None
+            chave_depois[grupo] = (mascara, casas, hipotecas)
+        return self._valor_chave(chave_depois) - self._valor_chave(chave_antes) + dinheiro
+
+    def importancia(self, propriedade, jogador):
+        """
+        Importância estratégica (0-5) da propriedade para o jogador: quanto o valor marginal
+        supera o preço de tabela (o dono atual, se houver, é ignorado).
+
+        Returns:
+            int: 0 (irrelevante) a 5 (completa um monopólio valioso)
+        """
+        if propriedade in jogador.propriedades:
+            restantes = [p for p in jogador.propriedades if p is not propriedade]
+            valor = self.valor_conjunto(restantes + [propriedade]) - self.valor_conjunto(restantes)
+        else:
+            valor = self.valor_marginal(propriedade, jogador)
+        excesso = valor / propriedade.preco_compra - 1
+        return max(0, min(5, int(excesso * 5)))
+
+    def valor_contabil(self, propriedades):
+        """
+        Valor contábil (custo) das propriedades, usado no patrimônio dos jogadores: preço de
+        compra (metade se hipotecada) + custo das construções (tabelas.custo_casa).
+        Não é o valor de liquidação, que é menor (ver Liquidador.valor_liquidavel).
+        """
+        custo_casa = self.tabelas.custo_casa
+        total = 0
+        for propriedade in propriedades:
+            preco = propriedade.preco_compra
+            total += preco // 2 if propriedade.hipotecada else preco
+            if propriedade.casas:
+                total += propriedade.casas * custo_casa[propriedade.posicao]
+        return total
+
+    def estatisticas_cache(self):
+        """Retorna consultas, cálculos efetivos e nº de chaves guardadas."""
+        return {"consultas": self.consultas, "calculos": self.calculos, "chaves": len(self._cache_grupos)}
+
+
+if __name__ == '__main__':
+    import time
+    from tabuleiro import Tabuleiro
+    from jogador import Jogador
+    from registro import log, DESLIGADO
+
+    log.definir_nivel(DESLIGADO)
+    print("--- Teste do Módulo ServicoAvaliacao ---")
+    servico = ServicoAvaliacao()
+    tabuleiro = Tabuleiro()
+    jogador = Jogador("Ana", "Carro")
+
+    verdes = tabuleiro.listar_propriedades_por_grupo("Verde")
+    for propriedade in verdes[:2]:
+        jogador.adicionar_propriedade(propriedade)
+
+    for propriedade in (verdes[2], tabuleiro.get_casa(1), tabuleiro.get_casa(5)):
+        print(f"{propriedade.nome:<40} preço R${propriedade.preco_compra:<4} "
+              f"sozinha R${servico.valor_propriedade(propriedade):7.1f} "
+              f"marginal para Ana R${servico.valor_marginal(propriedade, jogador):7.1f} "
+              f"importância {servico.importancia(propriedade, jogador)}")
+
+    todas = tabuleiro.listar_todas_propriedades()
+    inicio = time.perf_counter()
+    for i in range(10000):
+        servico.avaliar_troca(jogador, recebe=[todas[i % len(todas)]], entrega=[verdes[i % 2]], dinheiro=-50)
+    duracao = (time.perf_counter() - inicio) * 1000
+    print(f"\n10000 trocas avaliadas em {duracao:.0f} ms | cache: {servico.estatisticas_cache()}")
@@ -1,6 +1,57 @@
 # banco.py
 # Módulo responsável por gerenciar as contas, saldos e transações financeiras.
 
+from collections import namedtuple
+
+from registro import log
+
+# Entrada do livro-razão: uma por transação confirmada, com todas as pernas numa tupla plana
+# (origem, destino, valor, origem, destino, valor, ...)
+RegistroLivro = namedtuple("RegistroLivro", ["numero", "descricao", "pernas"])
+
+
+class TransacaoBanco:
+    """
+    Transação com várias transferências (pernas) aplicadas juntas ou nenhuma.
+    Criada por Banco.iniciar_transacao; as pernas ficam pendentes até confirmar() ou desfazer().
+    """
+    __slots__ = ('banco', 'descricao', 'pernas', 'aberta')
+
+    def __init__(self, banco, descricao=""):
+        self.banco = banco
+        self.descricao = descricao
+        self.pernas = []
+        self.aberta = True
+
+    def transferir(self, origem, destino, valor):
+        """Adiciona uma perna: 'origem' paga 'valor' a 'destino' ("Banco" = fora de circulação)."""
+        if not self.aberta:
+            raise RuntimeError("Transação já encerrada.")
+        if valor > 0:
+            self.pernas.extend((origem, destino, valor))
+        return self
+
+    def confirmar(self, obrigatorio=False):
+        """Valida e aplica todas as pernas (ver Banco.confirmar_transacao)."""
+        return self.banco.confirmar_transacao(self, obrigatorio)
+
+    def desfazer(self):
+        """Descarta as pernas pendentes sem mover dinheiro."""
+        self.pernas = []
+        self.aberta = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo_excecao, excecao, rastreamento):
+        if self.aberta:
+            if tipo_excecao is None:
+                self.confirmar()
+            else:
+                self.desfazer()
+        return False
+
+
 class Banco:
     SALDO_INICIAL_PADRAO = 1500  # Saldo padrão do Monopoly
 
@@ -8,6 +59,14 @@ class Banco:
         """Inicializa o Banco com um dicionário vazio para armazenar as contas."""
         # Estrutura: {nome_jogador: saldo_atual}
         self.contas = {}
+        # Chamado como liquidador(nome, valor_faltante) quando um pagamento obrigatório não cabe
+        # no saldo (ex: Liquidador, via Jogo), para vender casas/hipotecar antes de recusar
+        self.liquidador = None
+        # Chamado como planejador_liquidacao(nome, valor_faltante) antes de liquidar numa transação
+        # com várias contas: True se o liquidador consegue levantar o valor (nada é vendido)
+        self.planejador_liquidacao = None
+        # Livro-razão das transações confirmadas (RegistroLivro)
+        self.livro_razao = []
     
     def inicializar_conta(self, nome_jogador):
         """
@@ -16,23 +75,28 @@ class Banco:
         """
         if nome_jogador not in self.contas:
             self.contas[nome_jogador] = self.SALDO_INICIAL_PADRAO
-            print(f"Conta de {nome_jogador} criada. Saldo: R${self.SALDO_INICIAL_PADRAO}")
+            log.info("Conta de %s criada. Saldo: R$%s", nome_jogador, self.SALDO_INICIAL_PADRAO)
         else:
-            print(f"A conta de {nome_jogador} já existe.")
+            log.info("A conta de %s já existe.", nome_jogador)
 
-    def pagar(self, pagador, valor, recebedor="Banco"):
+    def pagar(self, pagador, valor, recebedor="Banco", obrigatorio=False):
         """
         Transfere 'valor' de 'pagador' para 'recebedor'.
         Retorna True se a transação for bem-sucedida, False caso contrário (falta de saldo).
+        Em pagamentos obrigatórios (aluguel, impostos, cartas) sem saldo, o liquidador é
+        chamado antes para tentar levantar a diferença.
         """
         # Garante que o valor a pagar é positivo
         if valor <= 0:
-            print("Erro: O valor da transação deve ser positivo.")
+            log.erro("Erro: O valor da transação deve ser positivo.")
             return False
 
+        if obrigatorio and self.liquidador is not None and self.contas.get(pagador, 0) < valor:
+            self.liquidador(pagador, valor - self.contas.get(pagador, 0))
+
         # Validação do Requisito 05 (Confiabilidade): Verifica se o pagador tem saldo
         if self.contas.get(pagador, 0) < valor:
-            print(f"!!! Transação Negada: {pagador} não tem saldo suficiente (R${self.contas.get(pagador, 0)}) para pagar R${valor}.")
+            log.aviso("!!! Transação Negada: %s não tem saldo suficiente (R$%s) para pagar R$%s.", pagador, self.contas.get(pagador, 0), valor)
             # Lógica de falência ou hipoteca seria implementada aqui
             return False
         
@@ -43,23 +107,84 @@ class Banco:
         if recebedor != "Banco":
             if recebedor not in self.contas:
                 # Se for um pagamento entre jogadores e o recebedor não existe, criar conta
-                print(f"Aviso: Conta de {recebedor} não existe. Criando conta automaticamente.")
+                log.aviso("Aviso: Conta de %s não existe. Criando conta automaticamente.", recebedor)
                 self.contas[recebedor] = 0
             
             self.contas[recebedor] += valor
         
-        print(f"  [SUCESSO] {pagador} pagou R${valor} para {recebedor}.")
+        log.info("  [SUCESSO] %s pagou R$%s para %s.", pagador, valor, recebedor)
+        return True
+
+    def iniciar_transacao(self, descricao=""):
+        """
+        Inicia uma transação com várias transferências, aplicadas atomicamente.
+        Uso: t = banco.iniciar_transacao("Troca"); t.transferir(a, b, 100); t.confirmar()
+        (ou como gerenciador de contexto: confirma ao sair, desfaz se houver exceção).
+        """
+        return TransacaoBanco(self, descricao)
+
+    def confirmar_transacao(self, transacao, obrigatorio=False):
+        """
+        Valida todas as pernas numa passada (saldo líquido de cada conta) e, se todas as contas
+        cobrem o que devem, aplica-as e grava uma única entrada no livro-razão.
+        Em transações obrigatórias, as contas sem saldo são primeiro planejadas
+        (planejador_liquidacao) e só são liquidadas se todas puderem ser cobertas.
+
+        Returns:
+            bool: True se aplicou, False se recusou (nenhum saldo nem propriedade muda)
+        """
+        if not transacao.aberta:
+            return False
+        pernas = transacao.pernas
+        transacao.aberta = False
+
+        # Saldo líquido de cada conta envolvida
+        liquido = {}
+        for i in range(0, len(pernas), 3):
+            origem, destino, valor = pernas[i], pernas[i + 1], pernas[i + 2]
+            liquido[origem] = liquido.get(origem, 0) - valor
+            liquido[destino] = liquido.get(destino, 0) + valor
+        liquido.pop("Banco", None)
+
+        for conta in liquido:
+            if conta not in self.contas:
+                log.erro("Erro: Conta de %s não existe. Transação '%s' recusada.", conta, transacao.descricao)
+                return False
+
+        faltando = {conta: -(self.contas[conta] + variacao)
+                    for conta, variacao in liquido.items() if self.contas[conta] + variacao < 0}
+        if faltando and obrigatorio and self.liquidador is not None:
+            # Planeja todas as contas antes de vender qualquer coisa: ou todas são cobertas, ou nenhuma liquida
+            planejador = self.planejador_liquidacao
+            if planejador is None or all(planejador(conta, valor) for conta, valor in faltando.items()):
+                for conta, valor in faltando.items():
+                    self.liquidador(conta, valor)
+                faltando = {conta: valor for conta, valor in faltando.items() if self.contas[conta] + liquido[conta] < 0}
+        if faltando:
+            log.aviso("!!! Transação '%s' negada: saldo insuficiente de %s.", transacao.descricao, ", ".join(faltando))
+            return False
+
+        for conta, variacao in liquido.items():
+            self.contas[conta] += variacao
+        self.livro_razao.append(RegistroLivro(len(self.livro_razao) + 1, transacao.descricao, tuple(pernas)))
+        log.info("  [SUCESSO] Transação '%s' confirmada (%s transferência(s)).", transacao.descricao, len(pernas) // 3)
         return True
 
+    def transferir(self, origem, destino, valor, obrigatorio=False):
+        """Transferência simples entre contas, registrada no livro-razão."""
+        transacao = self.iniciar_transacao(f"{origem} → {destino}")
+        transacao.transferir(origem, destino, valor)
+        return transacao.confirmar(obrigatorio)
+
     def depositar(self, recebedor, valor):
         """Adiciona 'valor' ao saldo do 'recebedor' (ex: passar pela Saída)."""
         if valor > 0:
             if recebedor in self.contas:
                 self.contas[recebedor] += valor
-                print(f"  [DEPÓSITO] {recebedor} recebeu R${valor}. Novo Saldo: R${self.contas[recebedor]}")
+                log.info("  [DEPÓSITO] %s recebeu R$%s. Novo Saldo: R$%s", recebedor, valor, self.contas[recebedor])
                 return True
             else:
-                print(f"Erro: Jogador {recebedor} não encontrado para depósito.")
+                log.erro("Erro: Jogador %s não encontrado para depósito.", recebedor)
                 return False
         return False
 
@@ -92,16 +217,16 @@ class Banco:
         if jogador in self.contas:
             saldo_antigo = self.contas[jogador]
             self.contas[jogador] = novo_saldo
-            print(f"  [AJUSTE] Saldo de {jogador} ajustado de R${saldo_antigo} para R${novo_saldo}")
+            log.info("  [AJUSTE] Saldo de %s ajustado de R$%s para R$%s", jogador, saldo_antigo, novo_saldo)
             return True
         return False
     
     def status_contas(self):
         """Imprime o status de todas as contas para monitoramento."""
-        print("\n--- Status Atual do Banco ---")
+        log.info("\n--- Status Atual do Banco ---")
         for jogador, saldo in self.contas.items():
-            print(f"  {jogador}: R${saldo}")
-        print("----------------------------\n")
+            log.info("  %s: R$%s", jogador, saldo)
+        log.info("----------------------------\n")
 
 # --- Bloco de Teste/Demonstração para a Versão Parcial ---
 if __name__ == '__main__':
@@ -127,7 +252,16 @@ if __name__ == '__main__':
     print("\n--- Transação: Alice passa pela Saída (R$200) ---")
     banco_do_jogo.depositar("Alice", 200)
     
-    # 4. Simulação de transação inválida (Requisito 05: Confiabilidade)
+    # 4. Transação com várias pernas: aplicada inteira ou recusada inteira
+    print("\n--- Transação: Troca com pagamento dos dois lados ---")
+    troca = banco_do_jogo.iniciar_transacao("Troca Alice/Bob")
+    troca.transferir("Alice", "Bob", 100).transferir("Bob", "Alice", 5000)
+    print(f"Confirmada? {troca.confirmar()} | Livro-razão: {banco_do_jogo.livro_razao}")
+    with banco_do_jogo.iniciar_transacao("Troca Alice/Bob") as troca:
+        troca.transferir("Alice", "Bob", 100).transferir("Bob", "Alice", 50)
+    print(f"Livro-razão: {banco_do_jogo.livro_razao}")
+
+    # 5. Simulação de transação inválida (Requisito 05: Confiabilidade)
     print("\n--- Transação: Bob tenta pagar R$5000 ---")
     banco_do_jogo.pagar("Bob", 5000, "Banco")
     
@@ -0,0 +1,102 @@
+# benchmark_inicializacao.py
+# Mede o tempo de inicialização: importação do motor (sem pygame), criação da primeira partida
+# e partida a frio da interface até o primeiro quadro do menu. Cada medida a frio roda num
+# processo novo, com o relatório de -X importtime dos módulos mais lentos.
+#
+# Uso: python benchmark_inicializacao.py [num_modulos]
+#
+# Meta: primeiro quadro do menu em menos de META_PRIMEIRO_QUADRO_MS a partir do início do processo.
+
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+
+META_PRIMEIRO_QUADRO_MS = 300
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+CODIGO_PRIMEIRO_QUADRO = (
+    "import time; inicio = time.perf_counter(); import main; main.main(max_quadros=1); "
+    "print((time.perf_counter() - inicio) * 1000)"
+)
+
+
+def executar(codigo, importtime=False, ambiente=None):
+    """
+    Executa o código num interpretador novo.
+
+    Returns:
+        tuple: (duração total em ms, stdout, stderr, código de saída)
+    """
+    comando = [sys.executable]
+    if importtime:
+        comando += ["-X", "importtime"]
+    comando += ["-c", codigo]
+    env = dict(os.environ, **(ambiente or {}))
+    inicio = time.perf_counter()
+    processo = subprocess.run(comando, cwd=PASTA, env=env, capture_output=True, text=True)
+    duracao = (time.perf_counter() - inicio) * 1000
+    return duracao, processo.stdout, processo.stderr, processo.returncode
+
+
+def ler_importtime(saida):
+    """
+    Interpreta o relatório de -X importtime.
+
+    Returns:
+        dict: módulo -> tempo acumulado em ms (o módulo inclui os que ele importa)
+    """
+    tempos = {}
+    for linha in saida.splitlines():
+        if not linha.startswith("import time:") or "|" not in linha:
+            continue
+        _, acumulado, modulo = linha[len("import time:"):].split("|")
+        if acumulado.strip().isdigit():
+            tempos[modulo.strip()] = int(acumulado) / 1000
+    return tempos
+
+
+def relatorio_importacao(titulo, modulo, num_modulos):
+    """Importa o módulo num processo novo e mostra os módulos mais lentos."""
+    duracao, _, erros, codigo_saida = executar(f"import {modulo}", importtime=True)
+    if codigo_saida != 0:
+        print(f"{titulo}: falhou ({erros.strip().splitlines()[-1]})")
+        return None
+    tempos = ler_importtime(erros)
+    print(f"{titulo}: {tempos.get(modulo, 0):.1f} ms de importação ({duracao:.0f} ms com o interpretador)")
+    for nome, ms in sorted(tempos.items(), key=lambda item: item[1], reverse=True)[1:num_modulos + 1]:
+        print(f"  {ms:7.1f} ms  {nome}")
+    return tempos
+
+
+if __name__ == '__main__':
+    num_modulos = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+
+    print("=== Inicialização ===")
+    tempos_motor = relatorio_importacao("Motor (jogo)", "jogo", num_modulos)
+    if tempos_motor is not None:
+        print(f"  pygame importado pelo motor: {'sim' if 'pygame' in tempos_motor else 'não'}")
+
+    sys.path.insert(0, PASTA)
+    from registro import log, DESLIGADO
+    log.definir_nivel(DESLIGADO)
+    from jogo import Jogo
+    inicio = time.perf_counter()
+    Jogo(["Ana", "Bia"])
+    print(f"Primeira partida (Jogo): {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+    if importlib.util.find_spec("pygame") is None:  # Só verifica se a interface pode ser medida
+        print("Interface: pygame não instalado, medição do primeiro quadro ignorada")
+        sys.exit()
+
+    relatorio_importacao("Interface (main)", "main", num_modulos)
+    duracao, saida, erros, codigo_saida = executar(CODIGO_PRIMEIRO_QUADRO, ambiente={"SDL_VIDEODRIVER": "dummy"})
+    if codigo_saida != 0:
+        print(f"Primeiro quadro: falhou ({erros.strip().splitlines()[-1]})")
+        sys.exit(1)
+    no_processo = float(saida.strip().splitlines()[-1])
+    situacao = "OK" if duracao <= META_PRIMEIRO_QUADRO_MS else "acima da meta"
+    print(f"Primeiro quadro do menu: {duracao:.0f} ms a frio ({no_processo:.0f} ms após o interpretador) "
+          f"| meta {META_PRIMEIRO_QUADRO_MS} ms: {situacao}")
@@ -0,0 +1,136 @@
+# benchmark_memoria.py
+# Mede a memória ocupada por estado de jogo (útil para torneios, buscas e replays,
+# que mantêm muitos estados vivos ao mesmo tempo) e compara com o layout antigo dos objetos
+# (sem __slots__, cartas e índices do tabuleiro copiados por partida), medido na revisão
+# REVISAO_LAYOUT_ANTIGO extraída do git num diretório temporário.
+#
+# Uso: python benchmark_memoria.py [num_estados]
+#
+# Meta: cada estado ocupar menos de META_RAZAO do que ocupava no layout antigo.
+
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import tracemalloc
+
+from registro import log, DESLIGADO
+from jogo import Jogo
+from jogador import Jogador
+from tabuleiro import Tabuleiro
+from cartas import BaralhoCartas
+from sistema_eventos import Evento, TipoEvento
+from gerenciador_inicializacao import GerenciadorInicializacao
+
+EVENTOS_POR_ESTADO = 200  # Histórico típico de uma partida curta
+REVISAO_LAYOUT_ANTIGO = "eb03627"  # Último commit antes do layout com __slots__
+META_RAZAO = 0.5
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+
+def criar_estado_nucleo(indice):
+    """Cria o núcleo de um estado de jogo: tabuleiro, baralhos, 6 jogadores e histórico de eventos."""
+    tabuleiro = Tabuleiro()
+    baralhos = (BaralhoCartas('SORTE'), BaralhoCartas('COFRE'))
+    jogadores = [Jogador(f"Jogador {i}", "Peça", is_ia=True) for i in range(6)]
+
+    # Distribui as propriedades entre os jogadores, como numa partida em andamento
+    for i, propriedade in enumerate(tabuleiro.listar_todas_propriedades()):
+        jogadores[i % 6].adicionar_propriedade(propriedade)
+
+    eventos = [
+        Evento(TipoEvento.PAGAMENTO_ALUGUEL, jogadores[i % 6].nome, "Aluguel pago", {"valor": i})
+        for i in range(EVENTOS_POR_ESTADO)
+    ]
+    return tabuleiro, baralhos, jogadores, eventos
+
+
+def criar_jogo_completo(indice):
+    """Cria um Jogo headless completo com 6 bots."""
+    lista = GerenciadorInicializacao.gerar_lista_bots(['medio'] * 6)
+    return Jogo([], lista_jogadores=lista, headless=True, seed=indice)
+
+
+def medir(fabrica, quantidade):
+    """
+    Mede a memória média alocada por objeto criado pela fábrica.
+
+    Returns:
+        float: Bytes por estado
+    """
+    tracemalloc.start()
+    inicio, _ = tracemalloc.get_traced_memory()
+    estados = [fabrica(i) for i in range(quantidade)]
+    fim, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del estados
+    return (fim - inicio) / quantidade
+
+
+def medir_estados(quantidade):
+    """
+    Mede o núcleo e o Jogo completo com as classes importadas por este processo.
+
+    Returns:
+        tuple: (bytes por núcleo, bytes por Jogo completo)
+    """
+    # Aquece caches de módulo (tabelas, índices do tabuleiro) antes de medir
+    criar_estado_nucleo(0)
+    criar_jogo_completo(0)
+    return medir(criar_estado_nucleo, quantidade), medir(criar_jogo_completo, quantidade)
+
+
+def medir_layout_antigo(quantidade):
+    """
+    Roda este benchmark, num processo novo, sobre os módulos da revisão REVISAO_LAYOUT_ANTIGO.
+
+    Returns:
+        tuple: (bytes por núcleo, bytes por Jogo completo), ou None se a revisão não está disponível
+    """
+    try:
+        arquivo = subprocess.run(["git", "archive", REVISAO_LAYOUT_ANTIGO], cwd=PASTA,
+                                 capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    with tempfile.TemporaryDirectory() as pasta:
+        with tarfile.open(fileobj=io.BytesIO(arquivo)) as tar:
+            tar.extractall(pasta)
+        shutil.copy(os.path.abspath(__file__), pasta)
+        processo = subprocess.run([sys.executable, os.path.basename(__file__), str(quantidade), "--bruto"],
+                                  cwd=pasta, capture_output=True, text=True)
+    if processo.returncode != 0:
+        return None
+    return tuple(float(valor) for valor in processo.stdout.split())
+
+
+if __name__ == '__main__':
+    argumentos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    quantidade = int(argumentos[0]) if argumentos else 200
+    log.definir_nivel(DESLIGADO)
+
+    atuais = medir_estados(quantidade)
+    if "--bruto" in sys.argv:
+        # Saída lida por medir_layout_antigo
+        print(*atuais)
+        sys.exit()
+
+    antigos = medir_layout_antigo(quantidade)
+
+    print(f"=== Memória por estado ({quantidade} estados) ===")
+    titulos = (f"Núcleo (tabuleiro + baralhos + 6 jogadores + {EVENTOS_POR_ESTADO} eventos)",
+               "Jogo completo (headless, 6 bots)")
+    for indice, titulo in enumerate(titulos):
+        atual = atuais[indice]
+        if antigos is None:
+            print(f"{titulo}: {atual / 1024:.1f} KiB (layout antigo indisponível: sem git ou sem a revisão)")
+            continue
+        antigo = antigos[indice]
+        razao = atual / antigo
+        situacao = "OK" if razao < META_RAZAO else "acima da meta"
+        print(f"{titulo}: {atual / 1024:.1f} KiB | layout antigo {antigo / 1024:.1f} KiB | "
+              f"razão {razao:.0%} | meta < {META_RAZAO:.0%}: {situacao}")
@@ -0,0 +1,64 @@
+# benchmark_simulacao.py
+# Mede a vazão das simulações bot-vs-bot headless (SimuladorPartidas) em um núcleo:
+# o motor completo, com busca de trocas, e o caminho rápido para lotes grandes (trocas=False).
+#
+# Uso: python benchmark_simulacao.py [num_partidas]
+#
+# Metas (partidas/s em um núcleo, 4 bots, até 500 turnos): cada caminho atingir
+# META_PARTIDAS_POR_SEGUNDO, abaixo do pior valor medido, para absorver o ruído da máquina.
+# Sai com código 1 se alguma meta não for atingida.
+# Milhares de partidas/s não cabem no motor em Python puro: uma partida tem centenas de
+# turnos e até o SimuladorCompacto fica na casa de 10^5 turnos/s.
+
+import sys
+import time
+
+from registro import log, DESLIGADO
+from simulador import SimuladorPartidas
+
+CONFIGURACAO = ['facil', 'medio', 'dificil', 'medio']
+MAX_TURNOS = 500
+META_PARTIDAS_POR_SEGUNDO = {
+    "completo": 30,   # Bots com busca de trocas (torneios que avaliam estratégias); medido 36-60
+    "rapido": 120,    # Sem trocas (simulações em massa); medido 140-245
+}
+TITULOS = {"completo": "Completo", "rapido": "Rápido"}
+
+
+def medir(trocas, num_partidas):
+    """
+    Simula um lote de partidas e mede a vazão.
+
+    Args:
+        trocas: Se os bots buscam e propõem trocas
+        num_partidas: Tamanho do lote
+
+    Returns:
+        tuple: (partidas por segundo, turnos por segundo)
+    """
+    simulador = SimuladorPartidas(max_turnos=MAX_TURNOS, trocas=trocas)
+    simulador.simular_lote(CONFIGURACAO, 3, seed_inicial=10_000)  # Aquece caches e importações
+    inicio = time.perf_counter()
+    resultados = simulador.simular_lote(CONFIGURACAO, num_partidas, seed_inicial=0)
+    duracao = time.perf_counter() - inicio
+    return num_partidas / duracao, sum(r.turnos for r in resultados) / duracao
+
+
+if __name__ == '__main__':
+    argumentos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    num_partidas = int(argumentos[0]) if argumentos else 40
+    log.definir_nivel(DESLIGADO)
+
+    print(f"=== Vazão do SimuladorPartidas ({num_partidas} partidas, {len(CONFIGURACAO)} bots, "
+          f"até {MAX_TURNOS} turnos) ===")
+    atingidas = True
+    for caminho, trocas in (("completo", True), ("rapido", False)):
+        partidas_s, turnos_s = medir(trocas, num_partidas)
+        meta = META_PARTIDAS_POR_SEGUNDO[caminho]
+        situacao = "OK" if partidas_s >= meta else "abaixo da meta"
+        atingidas = atingidas and partidas_s >= meta
+        print(f"{TITULOS[caminho]} (trocas={trocas}): {partidas_s:.1f} partidas/s "
+              f"({turnos_s:,.0f} turnos/s) | meta {meta} partidas/s: {situacao}")
+
+    if not atingidas:
+        sys.exit(1)
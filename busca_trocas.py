@@ -0,0 +1,249 @@
+# busca_trocas.py
+# Geração de propostas de troca pelos bots (pacotes de propriedades + dinheiro, no formato
+# de SistemaPropostas.criar_proposta). A busca enumera pacotes pequenos nos grupos em que os
+# dois jogadores já têm propriedades, avalia os dois lados com o ServicoAvaliacao e ajusta
+# uma compensação em dinheiro para dividir o ganho, dentro de um orçamento de tempo por turno.
+
+import time
+from collections import namedtuple
+from itertools import combinations
+
+from avaliacao import ServicoAvaliacao
+
+
+# Proposta candidata, do ponto de vista de quem propõe (oferente)
+CandidataTroca = namedtuple(
+    "CandidataTroca",
+    [
+        "destinatario",        # Jogador que recebe a proposta
+        "props_oferecidas",    # Propriedades que o oferente entrega
+        "props_solicitadas",   # Propriedades que o oferente recebe
+        "dinheiro",            # Dinheiro do oferente para o destinatário (negativo = o oferente recebe)
+        "ganho_oferente",      # Variação de valor para o oferente (já descontado o dinheiro)
+        "ganho_destinatario",  # Variação de valor para o destinatário (já somado o dinheiro)
+    ]
+)
+
+
+class BuscadorTrocas:
+    """
+    Busca limitada de trocas mutuamente vantajosas entre um bot e os adversários.
+
+    Só entram na busca propriedades sem construções de grupos em que os dois lados têm pelo
+    menos uma propriedade (trocas que avançam monopólios) e pacotes de até `max_por_lado`
+    propriedades de cada lado. O ganho conjunto da troca não depende do dinheiro; a
+    compensação divide esse ganho ao meio, arredondada para `passo_dinheiro`.
+    """
+
+    ORCAMENTO_PADRAO_MS = 10
+    MAX_POR_LADO = 2
+    MARGEM_PADRAO = 25      # Ganho mínimo de cada lado para a troca valer a pena
+    PASSO_DINHEIRO = 10
+    RESERVA_PADRAO = 100    # Saldo que cada lado mantém depois de pagar a compensação
+
+    def __init__(self, avaliacao=None, orcamento_ms=ORCAMENTO_PADRAO_MS, max_por_lado=MAX_POR_LADO,
+                 margem=MARGEM_PADRAO, reserva=RESERVA_PADRAO):
+        """
+        Args:
+            avaliacao: ServicoAvaliacao usado nos dois lados (padrão: instância compartilhada)
+            orcamento_ms: Tempo máximo de busca por chamada (None = sem limite de tempo)
+            max_por_lado: Máximo de propriedades de cada lado da troca
+            margem: Ganho mínimo exigido para oferente e destinatário
+            reserva: Saldo mínimo mantido por quem paga a compensação
+        """
+        self.avaliacao = avaliacao if avaliacao is not None else ServicoAvaliacao.padrao()
+        self.orcamento_ms = orcamento_ms
+        self.max_por_lado = max_por_lado
+        self.margem = margem
+        self.reserva = reserva
+        self.avaliacoes_ultima_busca = 0
+        # Pares de pacotes com ganho conjunto suficiente, por (jogador, adversário), com as posses
+        # dos dois em que foram calculados. Os ganhos só dependem dessas posses; os saldos só
+        # entram na compensação, refeita a cada busca.
+        self._pares_viaveis = {}
+
+    def buscar(self, jogador, adversarios, banco, max_propostas=3):
+        """
+        Busca as melhores trocas do jogador com os adversários.
+
+        Args:
+            jogador: Jogador que propõe
+            adversarios: Jogadores que podem receber propostas
+            banco: Banco (saldos limitam a compensação em dinheiro)
+            max_propostas: Máximo de propostas retornadas
+
+        Returns:
+            list: CandidataTroca ordenadas pelo ganho do oferente (maior primeiro)
+        """
+        self.avaliacoes_ultima_busca = 0
+        prazo = None
+        if self.orcamento_ms is not None:
+            prazo = time.perf_counter() + self.orcamento_ms / 1000
+
+        grupos = self.avaliacao.tabelas.grupos
+        negociaveis = self._negociaveis(jogador)
+        grupos_jogador = {grupos[p.posicao] for p in negociaveis}
+        posses_jogador = self._chave_posses(jogador)
+        saldo_jogador = banco.consultar_saldo(jogador.nome)
+
+        encontradas = []
+        for adversario in adversarios:
+            if adversario is jogador or not adversario.propriedades:
+                continue
+            chave = (posses_jogador, self._chave_posses(adversario))
+            guardado = self._pares_viaveis.get((jogador.nome, adversario.nome))
+            esgotou = False
+            if guardado is not None and guardado[0] == chave:
+                pares = guardado[1]
+            else:
+                pares, esgotou = self._buscar_pares(jogador, adversario, negociaveis, grupos_jogador, prazo)
+                if not esgotou:  # Uma enumeração interrompida pelo prazo não vai para o cache
+                    self._pares_viaveis[(jogador.nome, adversario.nome)] = (chave, pares)
+
+            saldo_adversario = banco.consultar_saldo(adversario.nome)
+            for solicitadas, oferecidas, ganho_jogador, ganho_adversario in pares:
+                candidata = self._avaliar(adversario, solicitadas, oferecidas, ganho_jogador, ganho_adversario,
+                                          saldo_jogador, saldo_adversario)
+                if candidata is not None:
+                    encontradas.append(candidata)
+            if esgotou:
+                break
+
+        encontradas.sort(key=lambda c: c.ganho_oferente, reverse=True)
+        return self._sem_conflitos(encontradas, max_propostas)
+
+    def _buscar_pares(self, jogador, adversario, negociaveis, grupos_jogador, prazo):
+        """
+        Enumera os pacotes trocáveis com um adversário e guarda os pares com ganho conjunto
+        de pelo menos duas margens.
+
+        Returns:
+            tuple: (lista de (solicitadas, oferecidas, ganho_jogador, ganho_adversario),
+                    True se o prazo acabou antes do fim)
+        """
+        grupos = self.avaliacao.tabelas.grupos
+        avaliar_troca = self.avaliacao.avaliar_troca
+        do_adversario = self._negociaveis(adversario)
+        grupos_comuns = grupos_jogador & {grupos[p.posicao] for p in do_adversario}
+        if not grupos_comuns:
+            return [], False
+
+        quer = [p for p in do_adversario if grupos[p.posicao] in grupos_comuns]
+        pode_dar = [p for p in negociaveis if grupos[p.posicao] in grupos_comuns]
+
+        pares = []
+        for solicitadas in self._pacotes(quer, minimo=1):
+            for oferecidas in self._pacotes(pode_dar, minimo=0):
+                self.avaliacoes_ultima_busca += 1
+                ganho_jogador = avaliar_troca(jogador, recebe=solicitadas, entrega=oferecidas)
+                ganho_adversario = avaliar_troca(adversario, recebe=oferecidas, entrega=solicitadas)
+                if ganho_jogador + ganho_adversario >= 2 * self.margem:
+                    pares.append((solicitadas, oferecidas, ganho_jogador, ganho_adversario))
+                if prazo is not None and time.perf_counter() >= prazo:
+                    return pares, True
+        return pares, False
+
+    def _avaliar(self, adversario, solicitadas, oferecidas, ganho_jogador, ganho_adversario,
+                 saldo_jogador, saldo_adversario):
+        """Ajusta a compensação de um par de pacotes; None se não interessa aos dois."""
+        # Divide o ganho conjunto: dinheiro > 0 sai do jogador, < 0 sai do adversário,
+        # sem deixar quem paga abaixo da reserva (com os dois abaixo dela, não há compensação possível)
+        passo = self.PASSO_DINHEIRO
+        maximo = saldo_jogador - self.reserva
+        minimo = -(saldo_adversario - self.reserva)
+        if minimo > maximo:
+            return None
+        dinheiro = int(round((ganho_jogador - ganho_adversario) / 2 / passo)) * passo
+        dinheiro = max(min(dinheiro, maximo), minimo)
+
+        ganho_oferente = ganho_jogador - dinheiro
+        ganho_destinatario = ganho_adversario + dinheiro
+        if ganho_oferente < self.margem or ganho_destinatario < self.margem:
+            return None
+        return CandidataTroca(adversario, oferecidas, solicitadas, dinheiro, ganho_oferente, ganho_destinatario)
+
+    def _negociaveis(self, jogador):
+        """Propriedades do jogador em grupos sem construções (só esses podem ser trocados)."""
+        grupos = self.avaliacao.tabelas.grupos
+        com_casas = {grupos[p.posicao] for p in jogador.propriedades if p.casas}
+        return [p for p in jogador.propriedades if grupos[p.posicao] not in com_casas]
+
+    def _pacotes(self, propriedades, minimo):
+        for tamanho in range(minimo, min(self.max_por_lado, len(propriedades)) + 1):
+            for pacote in combinations(propriedades, tamanho):
+                yield list(pacote)
+
+    @staticmethod
+    def _chave_posses(jogador):
+        """
+        Tudo de que os ganhos dependem: posses, construções e hipotecas
+        (mudou qualquer um, os pares com esse jogador são recalculados).
+        """
+        return tuple(sorted((p.posicao, p.casas, p.hipotecada) for p in jogador.propriedades))
+
+    @staticmethod
+    def _sem_conflitos(candidatas, max_propostas):
+        """Mantém as melhores candidatas que não disputam as mesmas propriedades."""
+        escolhidas = []
+        usadas = set()
+        for candidata in candidatas:
+            envolvidas = {p.posicao for p in candidata.props_oferecidas} | {p.posicao for p in candidata.props_solicitadas}
+            if envolvidas & usadas:
+                continue
+            escolhidas.append(candidata)
+            usadas |= envolvidas
+            if len(escolhidas) >= max_propostas:
+                break
+        return escolhidas
+
+    def propor(self, sistema_propostas, jogador, adversarios, banco):
+        """
+        Cria em SistemaPropostas a melhor proposta encontrada para o jogador.
+
+        Returns:
+            dict: Proposta criada (SistemaPropostas.proposta_ativa) ou None
+        """
+        for candidata in self.buscar(jogador, adversarios, banco, max_propostas=1):
+            return sistema_propostas.criar_proposta(
+                jogador, candidata.destinatario,
+                candidata.props_oferecidas, candidata.props_solicitadas,
+                dinheiro_oferecido=max(candidata.dinheiro, 0),
+                dinheiro_solicitado=max(-candidata.dinheiro, 0),
+            )
+        return None
+
+
+if __name__ == '__main__':
+    import random
+    from tabuleiro import Tabuleiro
+    from jogador import Jogador
+    from banco import Banco
+    from registro import log, DESLIGADO
+
+    log.definir_nivel(DESLIGADO)
+    print("--- Teste do Módulo BuscadorTrocas ---")
+
+    # 6 jogadores com as 28 propriedades distribuídas ao acaso
+    rng = random.Random(7)
+    tabuleiro = Tabuleiro()
+    banco = Banco()
+    jogadores = [Jogador(f"Bot{i + 1}", "Carro") for i in range(6)]
+    for jogador in jogadores:
+        banco.inicializar_conta(jogador.nome)
+    propriedades = tabuleiro.listar_todas_propriedades()
+    rng.shuffle(propriedades)
+    for indice, propriedade in enumerate(propriedades):
+        dono = jogadores[indice % len(jogadores)]
+        dono.adicionar_propriedade(propriedade)
+        propriedade.proprietario = dono
+
+    buscador = BuscadorTrocas(orcamento_ms=None)
+    for jogador in jogadores:
+        inicio = time.perf_counter()
+        propostas = buscador.buscar(jogador, jogadores, banco)
+        duracao = (time.perf_counter() - inicio) * 1000
+        print(f"\n{jogador.nome}: {buscador.avaliacoes_ultima_busca} pacotes avaliados em {duracao:.1f} ms")
+        for c in propostas:
+            print(f"  → {c.destinatario.nome}: dá {[p.nome for p in c.props_oferecidas]}, "
+                  f"recebe {[p.nome for p in c.props_solicitadas]}, dinheiro R${c.dinheiro} "
+                  f"(ganhos: R${c.ganho_oferente:.0f} / R${c.ganho_destinatario:.0f})")
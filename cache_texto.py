@@ -0,0 +1,101 @@
+# cache_texto.py
+# Cache LRU das superfícies de texto da interface. A cada quadro o HUD redesenha nomes, saldos,
+# botões e títulos que quase nunca mudam; renderizar o texto com a fonte é a parte cara, então a
+# superfície pronta é guardada por (fonte, texto, cor, antialias) e reutilizada nos quadros seguintes.
+
+from collections import OrderedDict
+
+
+class CacheTexto:
+    """
+    Cache limitado de superfícies de texto, com descarte da menos usada recentemente.
+
+    As superfícies devolvidas são compartilhadas entre os quadros: quem desenha só faz blit
+    (e get_rect) e não deve alterá-las.
+    """
+
+    CAPACIDADE_PADRAO = 512
+
+    def __init__(self, capacidade=CAPACIDADE_PADRAO):
+        """
+        Args:
+            capacidade: Máximo de superfícies guardadas
+        """
+        self.capacidade = capacidade
+        self._superficies = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def renderizar(self, fonte, texto, cor, antialias=True):
+        """
+        Equivalente a fonte.render(texto, antialias, cor), reutilizando a superfície em cache.
+
+        Args:
+            fonte: pygame.font.Font usada
+            texto: Texto a renderizar
+            cor: Cor do texto (tupla RGB ou RGBA)
+            antialias: Suavização das bordas
+
+        Returns:
+            pygame.Surface: Superfície com o texto
+        """
+        chave = (fonte, texto, tuple(cor), antialias)
+        superficie = self._superficies.get(chave)
+        if superficie is not None:
+            self.acertos += 1
+            self._superficies.move_to_end(chave)
+            return superficie
+
+        self.falhas += 1
+        superficie = self._superficies[chave] = fonte.render(texto, antialias, cor)
+        if len(self._superficies) > self.capacidade:
+            self._superficies.popitem(last=False)
+        return superficie
+
+    def limpar(self):
+        """Descarta todas as superfícies (os contadores são mantidos)."""
+        self._superficies.clear()
+
+    def estatisticas(self):
+        """Retorna acertos, falhas, taxa de acerto e nº de superfícies guardadas."""
+        total = self.acertos + self.falhas
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "taxa_acerto": self.acertos / total if total else 0.0,
+            "superficies": len(self._superficies),
+        }
+
+
+# Cache compartilhado pelas telas do jogo (main.py e menu.py)
+cache_texto = CacheTexto()
+
+
+def renderizar_texto(fonte, texto, cor, antialias=True):
+    """Renderiza o texto pelo cache compartilhado (ver CacheTexto.renderizar)."""
+    return cache_texto.renderizar(fonte, texto, cor, antialias)
+
+
+if __name__ == '__main__':
+    import time
+
+    class FonteLenta:
+        """Fonte de teste: simula o custo de renderização de uma fonte real."""
+
+        def render(self, texto, antialias, cor):
+            time.sleep(0.0002)
+            return (texto, cor)
+
+    print("--- Teste do Módulo CacheTexto ---")
+    cache = CacheTexto(capacidade=64)
+    fonte = FonteLenta()
+    textos_hud = [f"Jogador {i}" for i in range(6)] + ["LANÇAR DADOS", "COMPRAR", "PASSAR A VEZ"]
+
+    inicio = time.perf_counter()
+    for quadro in range(300):
+        for texto in textos_hud:
+            cache.renderizar(fonte, texto, (255, 255, 255))
+        # O saldo muda de vez em quando
+        cache.renderizar(fonte, f"${1500 - quadro // 60 * 50}", (150, 255, 150))
+    duracao = (time.perf_counter() - inicio) * 1000
+    print(f"300 quadros em {duracao:.0f} ms | {cache.estatisticas()}")
@@ -4,9 +4,11 @@
 
 import random
 from constantes import VALOR_PASSAGEM_SAIDA, POSICAO_PRISAO, POSICAO_SAIDA
+from registro import log
 
 class Carta:
     """Classe base para representar uma carta"""
+    __slots__ = ('descricao', 'tipo_carta', 'é_negociavel')
     
     def __init__(self, descricao, tipo_carta, é_negociavel=False):
         """
@@ -31,6 +33,7 @@ class Carta:
 
 class CartaDinheiro(Carta):
     """Carta que adiciona ou remove dinheiro do jogador"""
+    __slots__ = ('valor',)
     
     def __init__(self, descricao, valor, tipo_carta='SORTE'):
         super().__init__(descricao, tipo_carta)
@@ -39,15 +42,18 @@ class CartaDinheiro(Carta):
     def executar(self, jogador, banco, tabuleiro, jogo=None):
         if self.valor > 0:
             banco.depositar(jogador.nome, self.valor)
-            print(f"  > {jogador.nome} recebeu R${self.valor}!")
+            log.info("  > %s recebeu R$%s!", jogador.nome, self.valor)
         else:
-            sucesso = banco.pagar(jogador.nome, abs(self.valor), "Banco")
+            sucesso = banco.pagar(jogador.nome, abs(self.valor), "Banco", obrigatorio=True)
             if not sucesso:
-                print(f"  > {jogador.nome} não tem dinheiro suficiente!")
+                log.aviso("  > %s não tem dinheiro suficiente!", jogador.nome)
+                if jogo:
+                    jogo.verificar_falencia(jogador, divida=abs(self.valor), credor="Banco")
         return True
 
 class CartaMovimento(Carta):
     """Carta que move o jogador para uma posição específica"""
+    __slots__ = ('posicao_destino', 'cobra_passagem')
     
     def __init__(self, descricao, posicao_destino, tipo_carta='SORTE', cobra_passagem=True):
         super().__init__(descricao, tipo_carta)
@@ -60,12 +66,13 @@ class CartaMovimento(Carta):
         
         if self.cobra_passagem and posicao_antiga > self.posicao_destino:
             banco.depositar(jogador.nome, VALOR_PASSAGEM_SAIDA)
-            print(f"  > {jogador.nome} passou pela Saída e recebeu R${VALOR_PASSAGEM_SAIDA}!")
+            log.info("  > %s passou pela Saída e recebeu R$%s!", jogador.nome, VALOR_PASSAGEM_SAIDA)
         
         return True
 
 class CartaMovimentoRelativo(Carta):
     """Carta que move o jogador X casas para frente ou para trás"""
+    __slots__ = ('casas',)
     
     def __init__(self, descricao, casas, tipo_carta='SORTE'):
         super().__init__(descricao, tipo_carta)
@@ -78,34 +85,37 @@ class CartaMovimentoRelativo(Carta):
         
         if self.casas > 0 and nova_posicao < posicao_antiga:
             banco.depositar(jogador.nome, VALOR_PASSAGEM_SAIDA)
-            print(f"  > {jogador.nome} passou pela Saída e recebeu R${VALOR_PASSAGEM_SAIDA}!")
+            log.info("  > %s passou pela Saída e recebeu R$%s!", jogador.nome, VALOR_PASSAGEM_SAIDA)
         
         return True
 
 class CartaPrisao(Carta):
     """Carta que envia o jogador para a prisão"""
+    __slots__ = ()
     
     def __init__(self, tipo_carta='SORTE'):
         super().__init__("Vá para a Cadeia. Avance diretamente. Não passe pelo Ponto de Partida. Não receba R$200.", tipo_carta)
     
     def executar(self, jogador, banco, tabuleiro, jogo=None):
         jogador.entrar_prisao()
-        print(f"  > {jogador.nome} foi enviado para a Cadeia!")
+        log.info("  > %s foi enviado para a Cadeia!", jogador.nome)
         return True
 
 class CartaLivrePrisao(Carta):
     """Carta que permite sair livre da prisão - negociável"""
+    __slots__ = ()
     
     def __init__(self, tipo_carta='SORTE'):
         super().__init__("Saia da Cadeia de Graça. Esta carta pode ser guardada até ser necessária, ou vendida", tipo_carta, é_negociavel=True)
     
     def executar(self, jogador, banco, tabuleiro, jogo=None):
         jogador.adicionar_carta_livre_prisao(self)
-        print(f"  > {jogador.nome} ganhou uma carta 'Saia Livre da Cadeia'! Armazenada no inventário.")
+        log.info("  > %s ganhou uma carta 'Saia Livre da Cadeia'! Armazenada no inventário.", jogador.nome)
         return False
 
 class CartaReparos(Carta):
     """Carta que cobra reparos baseados em casas e hotéis"""
+    __slots__ = ('valor_por_casa', 'valor_por_hotel')
     
     def __init__(self, descricao, valor_por_casa, valor_por_hotel, tipo_carta='COFRE'):
         super().__init__(descricao, tipo_carta)
@@ -126,17 +136,20 @@ class CartaReparos(Carta):
         total_a_pagar = (total_casas * self.valor_por_casa) + (total_hoteis * self.valor_por_hotel)
         
         if total_a_pagar > 0:
-            sucesso = banco.pagar(jogador.nome, total_a_pagar, "Banco")
-            print(f"  > {jogador.nome} pagou R${total_a_pagar} em reparos ({total_casas} casas, {total_hoteis} hotéis)")
+            sucesso = banco.pagar(jogador.nome, total_a_pagar, "Banco", obrigatorio=True)
+            log.info("  > %s pagou R$%s em reparos (%s casas, %s hotéis)", jogador.nome, total_a_pagar, total_casas, total_hoteis)
             if not sucesso:
-                print(f"  > {jogador.nome} não tem dinheiro suficiente!")
+                log.aviso("  > %s não tem dinheiro suficiente!", jogador.nome)
+                if jogo:
+                    jogo.verificar_falencia(jogador, divida=total_a_pagar, credor="Banco")
         else:
-            print(f"  > {jogador.nome} não tem casas ou hotéis para reparar.")
+            log.info("  > %s não tem casas ou hotéis para reparar.", jogador.nome)
         
         return True
 
 class CartaComunidade(Carta):
     """Carta que afeta todos os jogadores (transações comunitárias)"""
+    __slots__ = ('valor_por_jogador', 'è_recebimento')
     
     def __init__(self, descricao, valor_por_jogador, è_recebimento=True, tipo_carta='COFRE'):
         super().__init__(descricao, tipo_carta)
@@ -145,42 +158,73 @@ class CartaComunidade(Carta):
     
     def executar(self, jogador, banco, tabuleiro, jogo=None):
         if not jogo:
-            print(f"  > Aviso: Carta comunitária executada sem contexto de jogo.")
+            log.aviso("  > Aviso: Carta comunitária executada sem contexto de jogo.")
             return True
         
         jogador_atual_nome = jogador.nome
-        
+        outros = [j for j in jogo.jogadores if j.nome != jogador_atual_nome]
         if self.è_recebimento:
-            print(f"  > {jogador_atual_nome} recebe R${self.valor_por_jogador} de cada jogador!")
-            for j in jogo.jogadores:
-                if j.nome != jogador_atual_nome:
-                    banco.pagar(j.nome, self.valor_por_jogador, jogador_atual_nome)
+            # Cada adversário paga por conta própria: quem não consegue pagar vai à falência
+            # (o saldo restante fica com o jogador da carta) sem anular o pagamento dos outros
+            log.info("  > %s recebe R$%s de cada jogador!", jogador_atual_nome, self.valor_por_jogador)
+            for outro in outros:
+                if not banco.transferir(outro.nome, jogador_atual_nome, self.valor_por_jogador, obrigatorio=True):
+                    jogo.verificar_falencia(outro, divida=self.valor_por_jogador, credor=jogador_atual_nome)
         else:
-            print(f"  > {jogador_atual_nome} paga R${self.valor_por_jogador} para cada jogador!")
-            for j in jogo.jogadores:
-                if j.nome != jogador_atual_nome:
-                    banco.depositar(j.nome, self.valor_por_jogador)
-        
+            # Um só pagador: todas as transferências numa transação (ou todas ou nenhuma)
+            log.info("  > %s paga R$%s para cada jogador!", jogador_atual_nome, self.valor_por_jogador)
+            transacao = banco.iniciar_transacao(self.descricao)
+            for outro in outros:
+                transacao.transferir(jogador_atual_nome, outro.nome, self.valor_por_jogador)
+            if not transacao.confirmar(obrigatorio=True):
+                jogo.verificar_falencia(jogador, divida=self.valor_por_jogador * len(outros), credor="Banco")
         return True
 
 class BaralhoCartas:
     """Gerencia um baralho de cartas (Sorte ou Cofre) com 16 cartas cada"""
     
-    def __init__(self, tipo='SORTE'):
+    def __init__(self, tipo='SORTE', rng=None):
         """
         Args:
             tipo: 'SORTE' ou 'COFRE'
+            rng: Gerador de números aleatórios (padrão: módulo random global)
         """
         self.tipo = tipo
+        self.rng = rng if rng is not None else random
         self.cartas = []
         self.cartas_descartadas = []
         self._criar_baralho()
         self.embaralhar()
     
+    # Cartas padrão por tipo. As cartas não guardam estado de partida,
+    # então todos os baralhos compartilham as mesmas instâncias.
+    _CARTAS_PADRAO = {}
+
+    @classmethod
+    def cartas_padrao(cls, tipo):
+        """
+        Retorna as cartas padrão de um tipo, na ordem de criação (criadas uma única vez).
+
+        Args:
+            tipo: 'SORTE' ou 'COFRE'
+
+        Returns:
+            tuple: Instâncias de Carta compartilhadas por todos os baralhos do tipo
+        """
+        cartas = cls._CARTAS_PADRAO.get(tipo)
+        if cartas is None:
+            cartas = cls._CARTAS_PADRAO[tipo] = tuple(cls._criar_cartas(tipo))
+        return cartas
+
     def _criar_baralho(self):
+        """Monta o baralho a partir das cartas padrão do tipo."""
+        self.cartas = list(self.cartas_padrao(self.tipo))
+
+    @staticmethod
+    def _criar_cartas(tipo):
         """Cria os 32 baralhos corretos (16 de Sorte + 16 de Cofre)"""
-        if self.tipo == 'SORTE':
-            self.cartas = [
+        if tipo == 'SORTE':
+            return [
                 CartaMovimento("Avance para a Casa de Partida (Receba R$200)", POSICAO_SAIDA, 'SORTE', cobra_passagem=False),
                 CartaMovimento("Avance para o Estacionamento (Parada livre)", 20, 'SORTE'),
                 CartaMovimento("Avance para a Avenida Morumbi", 38, 'SORTE'),  # Corrigida posição da Avenida Morumbi de 39 para 38
@@ -199,7 +243,7 @@ class BaralhoCartas:
                 CartaDinheiro("O Banco pagará a você R$50 de dividendos", 50, 'SORTE'),
             ]
         else:  # COFRE
-            self.cartas = [
+            return [
                 CartaMovimento("Avance para a Casa de Partida (Receba R$200)", POSICAO_SAIDA, 'COFRE', cobra_passagem=False),
                 CartaLivrePrisao('COFRE'),
                 CartaPrisao('COFRE'),
@@ -220,14 +264,14 @@ class BaralhoCartas:
     
     def embaralhar(self):
         """Embaralha o baralho"""
-        random.shuffle(self.cartas)
-        print(f"  > Baralho de {self.tipo} embaralhado! ({len(self.cartas)} cartas)")
+        self.rng.shuffle(self.cartas)
+        log.info("  > Baralho de %s embaralhado! (%s cartas)", self.tipo, len(self.cartas))
     
     def pegar_carta(self):
         """Pega uma carta do topo do baralho"""
         if not self.cartas:
             if self.cartas_descartadas:
-                print(f"  > Reembaralhando cartas de {self.tipo}...")
+                log.info("  > Reembaralhando cartas de %s...", self.tipo)
                 self.cartas = self.cartas_descartadas[:]
                 self.cartas_descartadas = []
                 self.embaralhar()
@@ -242,7 +286,7 @@ class BaralhoCartas:
         """Devolve uma carta ao baralho (no final da pilha de descartadas) - exceto cartas negociáveis"""
         if not carta.é_negociavel:
             self.cartas_descartadas.append(carta)
-            print(f"  > Carta '{carta.descricao[:40]}...' devolvida ao baralho de {self.tipo}.")
+            log.info("  > Carta '%s...' devolvida ao baralho de %s.", carta.descricao[:40], self.tipo)
     
     def __str__(self):
         return f"Baralho {self.tipo}: {len(self.cartas)} cartas disponíveis, {len(self.cartas_descartadas)} descartadas"
@@ -277,9 +321,21 @@ if __name__ == '__main__':
         def depositar(self, jogador, valor):
             print(f"    [BANCO] Depositou R${valor} para {jogador}")
         
-        def pagar(self, jogador, valor, destino):
+        def pagar(self, jogador, valor, destino, obrigatorio=False):
             print(f"    [BANCO] {jogador} pagou R${valor} para {destino}")
             return True
+
+        def transferir(self, origem, destino, valor, obrigatorio=False):
+            return self.pagar(origem, valor, destino)
+
+        def iniciar_transacao(self, descricao=""):
+            from banco import TransacaoBanco
+            return TransacaoBanco(self, descricao)
+
+        def confirmar_transacao(self, transacao, obrigatorio=False):
+            for i in range(0, len(transacao.pernas), 3):
+                self.pagar(*transacao.pernas[i:i + 3])
+            return True
     
     class JogoMock:
         def __init__(self):
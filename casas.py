@@ -1,16 +1,22 @@
 # src/casas.py
 # Importação relativa, assumindo que constantes está no mesmo nível (src/)
+import random
 from constantes import IMPOSTO_RENDA_VALOR, POSICAO_PRISAO
+from registro import log
+
+VALOR_SORTEIO = 100  # Prêmio ou taxa das casas de Sorte ou Revés e do Cofre
 
 class Casa:
     """Classe base para qualquer espaço no tabuleiro (40 no total)."""
+    __slots__ = ('nome', 'tipo', 'posicao')
     def __init__(self, nome, tipo):
         self.nome = nome          
         self.tipo = tipo          
+        self.posicao = None       # Definida pelo Tabuleiro ao montar o índice
 
     def acao_ao_cair(self, jogador, banco):
         """Ação padrão (será sobrescrita nas classes específicas)."""
-        print(f"  > {jogador.nome} parou em {self.nome} ({self.tipo}).")
+        log.info("  > %s parou em %s (%s).", jogador.nome, self.nome, self.tipo)
 
     def __str__(self):
         return f"{self.nome} ({self.tipo})"
@@ -22,21 +28,26 @@ class Casa:
 
 class CasaImposto(Casa):
     """Representa casas de impostos/taxas que cobram valor fixo"""
+    __slots__ = ('valor',)
     def __init__(self, nome, valor_imposto): 
         super().__init__(nome, 'IMPOSTO')
         self.valor = valor_imposto
         
     def acao_ao_cair(self, jogador, banco):
-        """Cobra o imposto do jogador"""
+        """
+        Cobra o imposto do jogador.
+        Returns: True se pagou, False se nem liquidando conseguiu (o chamador verifica a falência)
+        """
         super().acao_ao_cair(jogador, banco)
-        print(f"  > Pagamento de Imposto: R${self.valor}.")
-        banco.pagar(jogador.nome, self.valor, recebedor="Banco")
+        log.info("  > Pagamento de Imposto: R$%s.", self.valor)
+        return banco.pagar(jogador.nome, self.valor, recebedor="Banco", obrigatorio=True)
 
     def __str__(self):
         return f"{self.nome} - R${self.valor}"
         
 class CasaVAPrisao(Casa):
     """Casa especial que envia o jogador para a prisão"""
+    __slots__ = ()
     def __init__(self):
         super().__init__("Vá para a Prisão", 'VAPRISÃO')
         
@@ -45,62 +56,73 @@ class CasaVAPrisao(Casa):
         super().acao_ao_cair(jogador, banco)
         jogador.posicao = POSICAO_PRISAO
         jogador.em_prisao = True
-        print(f"  > **{jogador.nome} FOI PRESO!** Moveu-se para a Posição {POSICAO_PRISAO}.")
+        log.info("  > **%s FOI PRESO!** Moveu-se para a Posição %s.", jogador.nome, POSICAO_PRISAO)
 
 class CasaSorteReves(Casa):
     """Casa de Sorte ou Revés - taxa ou prêmio de R$100"""
-    def __init__(self, nome="Sorte ou Revés"):
+    __slots__ = ('rng',)
+    def __init__(self, nome="Sorte ou Revés", rng=None):
         super().__init__(nome, 'SORTE')
+        self.rng = rng if rng is not None else random
     
     def acao_ao_cair(self, jogador, banco):
-        """Sorteia se o jogador ganha ou perde R$100"""
+        """
+        Sorteia se o jogador ganha ou perde VALOR_SORTEIO.
+        Returns: False se não conseguiu pagar a taxa (o chamador verifica a falência), senão True
+        """
         super().acao_ao_cair(jogador, banco)
-        import random
-        if random.choice([True, False]):
-            print(f"  > 🍀 {jogador.nome} foi sorteado! Ganha R$100 do banco!")
-            banco.depositar(jogador.nome, 100)
-        else:
-            print(f"  > ☠️ {jogador.nome} foi azarado! Paga R$100 ao banco!")
-            banco.pagar(jogador.nome, 100, recebedor="Banco")
+        if self.rng.choice([True, False]):
+            log.info("  > 🍀 %s foi sorteado! Ganha R$%s do banco!", jogador.nome, VALOR_SORTEIO)
+            banco.depositar(jogador.nome, VALOR_SORTEIO)
+            return True
+        log.info("  > ☠️ %s foi azarado! Paga R$%s ao banco!", jogador.nome, VALOR_SORTEIO)
+        return banco.pagar(jogador.nome, VALOR_SORTEIO, recebedor="Banco", obrigatorio=True)
 
 class CasaCofre(Casa):
     """Casa do Cofre Comunitário - taxa ou prêmio de R$100"""
-    def __init__(self, nome="Cofre"):
+    __slots__ = ('rng',)
+    def __init__(self, nome="Cofre", rng=None):
         super().__init__(nome, 'COFRE')
+        self.rng = rng if rng is not None else random
     
     def acao_ao_cair(self, jogador, banco):
-        """Sorteia se o jogador ganha ou perde R$100"""
+        """
+        Sorteia se o jogador ganha ou perde VALOR_SORTEIO.
+        Returns: False se não conseguiu pagar a taxa (o chamador verifica a falência), senão True
+        """
         super().acao_ao_cair(jogador, banco)
-        import random
-        if random.choice([True, False]):
-            print(f"  > 💰 {jogador.nome} abriu o cofre! Ganha R$100 do banco!")
-            banco.depositar(jogador.nome, 100)
-        else:
-            print(f"  > 🔓 {jogador.nome} o cofre estava vazio! Paga R$100 ao banco!")
-            banco.pagar(jogador.nome, 100, recebedor="Banco")
+        if self.rng.choice([True, False]):
+            log.info("  > 💰 %s abriu o cofre! Ganha R$%s do banco!", jogador.nome, VALOR_SORTEIO)
+            banco.depositar(jogador.nome, VALOR_SORTEIO)
+            return True
+        log.info("  > 🔓 %s o cofre estava vazio! Paga R$%s ao banco!", jogador.nome, VALOR_SORTEIO)
+        return banco.pagar(jogador.nome, VALOR_SORTEIO, recebedor="Banco", obrigatorio=True)
 
 class CasaEstacionamento(Casa):
     """Casa de Estacionamento Grátis - nenhuma ação"""
+    __slots__ = ()
     def __init__(self):
         super().__init__("Estacionamento Grátis", 'GRATIS')
     
     def acao_ao_cair(self, jogador, banco):
         """Nenhuma ação - apenas descanso"""
         super().acao_ao_cair(jogador, banco)
-        print(f"  > {jogador.nome} está descansando no estacionamento grátis!")
+        log.info("  > %s está descansando no estacionamento grátis!", jogador.nome)
 
 class CasaInicio(Casa):
     """Casa de Início/Saída - ponto de partida"""
+    __slots__ = ()
     def __init__(self):
         super().__init__("Ponto de Partida", 'INICIO')
     
     def acao_ao_cair(self, jogador, banco):
         """Nenhuma ação especial ao cair (bônus é dado ao passar)"""
         super().acao_ao_cair(jogador, banco)
-        print(f"  > {jogador.nome} está no Ponto de Partida!")
+        log.info("  > %s está no Ponto de Partida!", jogador.nome)
 
 class CasaPrisao(Casa):
     """Casa da Prisão - apenas visitando (posição 10)"""
+    __slots__ = ()
     def __init__(self):
         super().__init__("Cadeia/Prisão", 'PRISAO')
     
@@ -108,6 +130,6 @@ class CasaPrisao(Casa):
         """Se não estiver preso, apenas visitando"""
         super().acao_ao_cair(jogador, banco)
         if not jogador.em_prisao:
-            print(f"  > {jogador.nome} está apenas visitando a prisão.")
+            log.info("  > %s está apenas visitando a prisão.", jogador.nome)
         else:
-            print(f"  > {jogador.nome} está PRESO!")
+            log.info("  > %s está PRESO!", jogador.nome)
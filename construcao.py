@@ -2,6 +2,7 @@
 # Módulo responsável pela construção de casas e hotéis
 
 from constantes import POSICAO_SAIDA
+from registro import log
 
 class GestorConstrucao:
     """Gerencia a construção de casas e hotéis nas propriedades"""
@@ -43,8 +44,8 @@ class GestorConstrucao:
         if not hasattr(propriedade, 'grupo_cor') or propriedade.grupo_cor in ['METRÔ', 'SERVIÇO']:
             return False, "Não é possível construir nesta propriedade."
         
-        # Check if property has casas attribute (metro and companies don't)
-        if not hasattr(propriedade, 'casas'):
+        # Metro and companies are not buildable
+        if not getattr(propriedade, 'construivel', False):
             return False, "Não é possível construir nesta propriedade."
         
         # Verifica se o jogador é o proprietário
@@ -59,11 +60,7 @@ class GestorConstrucao:
         grupo = propriedade.grupo_cor
         props_grupo = self.tabuleiro.listar_propriedades_por_grupo(grupo)
         
-        # Count how many properties the player owns in this group
-        props_jogador_no_grupo = [p for p in props_grupo if p.proprietario == jogador]
-        tem_monopolio = len(props_jogador_no_grupo) == len(props_grupo)
-        
-        if not tem_monopolio:
+        if not jogador.tem_monopolio(grupo):
             return False, f"Precisa ter todas as {len(props_grupo)} propriedades do grupo {grupo}."
         
         # Verifica se alguma propriedade do grupo está hipotecada
@@ -98,7 +95,7 @@ class GestorConstrucao:
         pode, mensagem = self.pode_construir(jogador, propriedade)
         
         if not pode:
-            print(f"  > Não foi possível construir: {mensagem}")
+            log.aviso("  > Não foi possível construir: %s", mensagem)
             return False
         
         # Realiza a construção
@@ -110,14 +107,58 @@ class GestorConstrucao:
             propriedade.casas += 1
             
             if propriedade.casas == self.HOTEL:
-                print(f"  > {jogador.nome} construiu um HOTEL em {propriedade.nome}! Custo: R${custo}")
+                log.info("  > %s construiu um HOTEL em %s! Custo: R$%s", jogador.nome, propriedade.nome, custo)
             else:
-                print(f"  > {jogador.nome} construiu a casa {propriedade.casas} em {propriedade.nome}! Custo: R${custo}")
+                log.info("  > %s construiu a casa %s em %s! Custo: R$%s", jogador.nome, propriedade.casas, propriedade.nome, custo)
             
             return True
         
         return False
     
+    def construir_lote(self, jogador, plano):
+        """
+        Aplica um plano de construção (ex: PlanejadorConstrucao) como uma única transação:
+        valida o estado final de cada grupo uma vez, paga o custo total de uma vez e só então
+        adiciona as casas. Se algo for inválido, nada é construído.
+        
+        Args:
+            jogador: Dono das propriedades
+            plano: Propriedades a construir, uma entrada por casa
+            
+        Returns:
+            int: Número de casas construídas (0 se o plano foi recusado)
+        """
+        if not plano:
+            return 0
+        
+        acrescimos = {}
+        for propriedade in plano:
+            acrescimos[propriedade] = acrescimos.get(propriedade, 0) + 1
+        
+        custo_total = 0
+        for grupo in {p.grupo_cor for p in acrescimos}:
+            props_grupo = self.tabuleiro.listar_propriedades_por_grupo(grupo)
+            if not props_grupo[0].construivel or not jogador.tem_monopolio(grupo):
+                log.aviso("  > Construção em lote recusada: %s não tem monopólio de %s", jogador.nome, grupo)
+                return 0
+            if any(p.hipotecada or p.proprietario != jogador for p in props_grupo):
+                log.aviso("  > Construção em lote recusada: grupo %s hipotecado ou com outro dono", grupo)
+                return 0
+            
+            finais = [p.casas + acrescimos.get(p, 0) for p in props_grupo]
+            if max(finais) > self.HOTEL or max(finais) - min(finais) > 1:
+                log.aviso("  > Construção em lote recusada: construção não uniforme em %s", grupo)
+                return 0
+            custo_total += sum(acrescimos.get(p, 0) for p in props_grupo) * self.CUSTO_CONSTRUCAO.get(grupo, 100)
+        
+        if not self.banco.pagar(jogador.nome, custo_total, "Banco"):
+            return 0
+        
+        for propriedade, quantidade in acrescimos.items():
+            propriedade.casas += quantidade
+        log.info("  > %s construiu %s casa(s)/hotel(éis) em lote. Custo: R$%s", jogador.nome, len(plano), custo_total)
+        return len(plano)
+    
     def pode_vender_construcao(self, jogador, propriedade):
         """Verifica se o jogador pode vender uma casa/hotel da propriedade"""
         if propriedade.proprietario != jogador:
@@ -147,7 +188,7 @@ class GestorConstrucao:
         pode, mensagem = self.pode_vender_construcao(jogador, propriedade)
         
         if not pode:
-            print(f"  > Não foi possível vender: {mensagem}")
+            log.aviso("  > Não foi possível vender: %s", mensagem)
             return False
         
         # Realiza a venda (recebe metade do valor de construção)
@@ -161,15 +202,15 @@ class GestorConstrucao:
         propriedade.casas -= 1
         
         if era_hotel:
-            print(f"  > {jogador.nome} vendeu o HOTEL de {propriedade.nome} por R${valor_venda}")
+            log.info("  > %s vendeu o HOTEL de %s por R$%s", jogador.nome, propriedade.nome, valor_venda)
         else:
-            print(f"  > {jogador.nome} vendeu 1 casa de {propriedade.nome} por R${valor_venda}")
+            log.info("  > %s vendeu 1 casa de %s por R$%s", jogador.nome, propriedade.nome, valor_venda)
         
         return True
     
     def get_info_construcao(self, propriedade):
         """Retorna informações sobre construção na propriedade"""
-        if not hasattr(propriedade, 'casas'):
+        if not getattr(propriedade, 'construivel', False):
             return "Esta propriedade não permite construções."
         
         grupo = propriedade.grupo_cor
@@ -6,13 +6,15 @@ import random
 class Dados:
     """Classe para gerenciar a rolagem de dados do jogo"""
     
-    def __init__(self, num_dados=2):
+    def __init__(self, num_dados=2, rng=None):
         """
         Inicializa o sistema de dados.
         Args:
             num_dados: Número de dados a serem rolados (padrão: 2)
+            rng: Gerador de números aleatórios (padrão: módulo random global)
         """
         self.num_dados = num_dados
+        self.rng = rng if rng is not None else random
         self.ultima_rolagem = []
         self.ultimo_total = 0
         
@@ -22,7 +24,7 @@ class Dados:
         Returns:
             tuple: (total, lista_valores, eh_dupla)
         """
-        self.ultima_rolagem = [random.randint(1, 6) for _ in range(self.num_dados)]
+        self.ultima_rolagem = [self.rng.randint(1, 6) for _ in range(self.num_dados)]
         self.ultimo_total = sum(self.ultima_rolagem)
         
         # Verifica se é uma dupla (ambos dados com o mesmo valor)
@@ -43,6 +45,97 @@ class Dados:
             return f"Dados: {self.ultima_rolagem} = {self.ultimo_total}"
         return "Dados: Ainda não foram rolados"
 
+# Todas as 36 combinações de 2 dados: (total, (d1, d2), eh_dupla)
+ROLAGENS_2D6 = tuple(
+    (d1 + d2, (d1, d2), d1 == d2)
+    for d1 in range(1, 7)
+    for d2 in range(1, 7)
+)
+
+# Tradução de bytes aleatórios (0-255) para índices 0-35 em ROLAGENS_2D6.
+# Bytes >= 252 são descartados para não enviesar o sorteio (252 = 7 * 36).
+_TABELA_INDICES = bytes(b % 36 if b < 252 else 0 for b in range(256))
+_BYTES_DESCARTADOS = bytes(range(252, 256))
+
+
+class DadosPreGerados:
+    """
+    Dados de 2d6 para simulações em massa.
+
+    Sorteia as rolagens em blocos grandes (random.randbytes do rng da partida)
+    e as entrega de um buffer circular, evitando criar listas e chamar randint
+    a cada rolagem. Há um só caminho de geração, para que a mesma seed dê os
+    mesmos dados em qualquer ambiente. Substitui Dados onde só
+    rolar() é usado (Jogo.rolar_dados e GestorPrisao.processar_turno_prisao).
+    """
+    
+    TAMANHO_BLOCO = 4096
+    
+    def __init__(self, rng=None, tamanho_bloco=TAMANHO_BLOCO):
+        """
+        Args:
+            rng: Gerador de números aleatórios (padrão: módulo random global)
+            tamanho_bloco: Número de rolagens sorteadas por recarga do buffer
+        """
+        self.num_dados = 2
+        self.rng = rng if rng is not None else random
+        self.tamanho_bloco = tamanho_bloco
+        self._bloco = b""
+        self._posicao = 0
+        self._ultima = None
+    
+    def _recarregar(self):
+        """Sorteia um novo bloco de índices de rolagem (0-35)."""
+        bloco = b""
+        while len(bloco) < self.tamanho_bloco:
+            # Descartes ocorrem em ~1.6% dos bytes; sorteia com folga e completa se faltar
+            aleatorios = self.rng.randbytes(self.tamanho_bloco + self.tamanho_bloco // 32)
+            bloco += aleatorios.translate(_TABELA_INDICES, _BYTES_DESCARTADOS)
+        self._bloco = bloco[:self.tamanho_bloco]
+        self._posicao = 0
+    
+    def rolar_rapido(self):
+        """
+        Rola os dados sem alocar nada.
+        Returns:
+            tuple: (total, (d1, d2), eh_dupla) - tupla compartilhada de ROLAGENS_2D6
+        """
+        if self._posicao >= len(self._bloco):
+            self._recarregar()
+        rolagem = ROLAGENS_2D6[self._bloco[self._posicao]]
+        self._posicao += 1
+        self._ultima = rolagem
+        return rolagem
+    
+    def rolar(self):
+        """
+        Mesma interface de Dados.rolar.
+        Returns:
+            tuple: (total, valores, eh_dupla)
+        """
+        return self.rolar_rapido()
+    
+    @property
+    def ultima_rolagem(self):
+        return list(self._ultima[1]) if self._ultima else []
+    
+    @property
+    def ultimo_total(self):
+        return self._ultima[0] if self._ultima else 0
+    
+    def obter_ultima_rolagem(self):
+        """Retorna informações da última rolagem"""
+        return {
+            'total': self.ultimo_total,
+            'valores': self.ultima_rolagem,
+            'eh_dupla': self._ultima[2] if self._ultima else False
+        }
+    
+    def __str__(self):
+        if self._ultima:
+            return f"Dados: {self.ultima_rolagem} = {self.ultimo_total}"
+        return "Dados: Ainda não foram rolados"
+
 # Teste do módulo
 if __name__ == '__main__':
     print("--- Teste do Módulo Dados ---")
@@ -59,3 +152,12 @@ if __name__ == '__main__':
             duplas_count += 1
     
     print(f"\nTotal de duplas: {duplas_count}/10")
+    
+    print("\n--- Comparando Dados x DadosPreGerados (200.000 rolagens) ---")
+    import time
+    for classe in (Dados, DadosPreGerados):
+        dados_teste = classe(rng=random.Random(1))
+        inicio = time.perf_counter()
+        for _ in range(200000):
+            dados_teste.rolar()
+        print(f"{classe.__name__}: {time.perf_counter() - inicio:.3f}s")
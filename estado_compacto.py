@@ -0,0 +1,273 @@
+# estado_compacto.py
+# Representação plana do estado de uma partida em arrays de tamanho fixo.
+# Clonar um EstadoCompacto é só copiar alguns arrays (poucos microssegundos), o que torna
+# práticas buscas com lookahead e rollouts Monte Carlo a partir de qualquer posição.
+
+from array import array
+from functools import lru_cache
+
+from banco import Banco
+from cartas import BaralhoCartas
+from propriedades import Propriedade
+
+NUM_CASAS = 40
+SEM_DONO = -1          # proprietarios[posicao] quando a casa não tem dono
+FORA_DA_PRISAO = -1    # prisao[jogador] quando o jogador está livre
+
+# Bits de cartas "Saia Livre da Prisão" guardadas por um jogador (uma por baralho)
+BIT_LIVRE_SORTE = 1
+BIT_LIVRE_COFRE = 2
+_BIT_LIVRE_POR_TIPO = {'SORTE': BIT_LIVRE_SORTE, 'COFRE': BIT_LIVRE_COFRE}
+
+
+@lru_cache(maxsize=None)
+def _indices_cartas(tipo):
+    """Mapeia id(carta) -> índice da carta em BaralhoCartas.cartas_padrao(tipo)."""
+    return {id(carta): indice for indice, carta in enumerate(BaralhoCartas.cartas_padrao(tipo))}
+
+
+@lru_cache(maxsize=None)
+def _carta_livre_prisao(tipo):
+    """Carta 'Saia Livre da Prisão' padrão do baralho do tipo."""
+    for carta in BaralhoCartas.cartas_padrao(tipo):
+        if carta.é_negociavel:
+            return carta
+    return None
+
+
+def _baralho_para_array(cartas, tipo):
+    indices = _indices_cartas(tipo)
+    return array('b', [indices[id(carta)] for carta in cartas])
+
+
+def _array_para_baralho(ordem, tipo):
+    padrao = BaralhoCartas.cartas_padrao(tipo)
+    return [padrao[indice] for indice in ordem]
+
+
+class EstadoCompacto:
+    """
+    Estado de uma partida sem grafo de objetos: tudo indexado por assento (0..n-1)
+    ou por posição do tabuleiro (0..39).
+
+    Por jogador: posicoes, saldos, prisao (turnos preso, ou FORA_DA_PRISAO),
+    cartas_livre (BIT_LIVRE_*) e ativos (0 = falido).
+    Por casa: proprietarios (assento, ou SEM_DONO) e casas (0-4, 5 = hotel).
+    Hipotecas ficam num inteiro com um bit por posição do tabuleiro.
+    Baralhos guardam a ordem das cartas como índices de BaralhoCartas.cartas_padrao.
+
+    O estado não inclui o RNG da partida: quem faz rollouts usa seu próprio gerador.
+    """
+    __slots__ = (
+        'nomes', 'posicoes', 'saldos', 'prisao', 'cartas_livre', 'ativos',
+        'proprietarios', 'casas', 'hipotecas',
+        'baralho_sorte', 'descarte_sorte', 'baralho_cofre', 'descarte_cofre',
+        'indice_turno', 'duplas_consecutivas', 'dupla_pendente'
+    )
+
+    def __init__(self, nomes):
+        """
+        Cria o estado inicial de uma partida (todos na Saída, saldo inicial, baralhos em ordem padrão).
+
+        Args:
+            nomes: Nomes dos jogadores, na ordem dos assentos
+        """
+        num_jogadores = len(nomes)
+        self.nomes = tuple(nomes)
+        self.posicoes = array('b', bytes(num_jogadores))
+        self.saldos = array('i', [Banco.SALDO_INICIAL_PADRAO]) * num_jogadores
+        self.prisao = array('b', [FORA_DA_PRISAO]) * num_jogadores
+        self.cartas_livre = array('b', bytes(num_jogadores))
+        self.ativos = array('b', [1]) * num_jogadores
+        self.proprietarios = array('b', [SEM_DONO]) * NUM_CASAS
+        self.casas = array('b', bytes(NUM_CASAS))
+        self.hipotecas = 0
+        self.baralho_sorte = array('b', range(len(BaralhoCartas.cartas_padrao('SORTE'))))
+        self.descarte_sorte = array('b')
+        self.baralho_cofre = array('b', range(len(BaralhoCartas.cartas_padrao('COFRE'))))
+        self.descarte_cofre = array('b')
+        self.indice_turno = 0            # Assento do jogador da vez
+        self.duplas_consecutivas = 0
+        self.dupla_pendente = False      # Última rolagem foi dupla (joga de novo)
+
+    def clone(self):
+        """Cópia independente do estado (os nomes, imutáveis, são compartilhados)."""
+        novo = EstadoCompacto.__new__(EstadoCompacto)
+        novo.nomes = self.nomes
+        novo.posicoes = self.posicoes[:]
+        novo.saldos = self.saldos[:]
+        novo.prisao = self.prisao[:]
+        novo.cartas_livre = self.cartas_livre[:]
+        novo.ativos = self.ativos[:]
+        novo.proprietarios = self.proprietarios[:]
+        novo.casas = self.casas[:]
+        novo.hipotecas = self.hipotecas
+        novo.baralho_sorte = self.baralho_sorte[:]
+        novo.descarte_sorte = self.descarte_sorte[:]
+        novo.baralho_cofre = self.baralho_cofre[:]
+        novo.descarte_cofre = self.descarte_cofre[:]
+        novo.indice_turno = self.indice_turno
+        novo.duplas_consecutivas = self.duplas_consecutivas
+        novo.dupla_pendente = self.dupla_pendente
+        return novo
+
+    def __eq__(self, outro):
+        if not isinstance(outro, EstadoCompacto):
+            return NotImplemented
+        return all(getattr(self, campo) == getattr(outro, campo) for campo in self.__slots__)
+
+    # --- Consultas ---
+
+    @property
+    def num_jogadores(self):
+        return len(self.nomes)
+
+    def jogadores_ativos(self):
+        """Assentos dos jogadores ainda no jogo."""
+        return [assento for assento, ativo in enumerate(self.ativos) if ativo]
+
+    def esta_hipotecada(self, posicao):
+        return bool(self.hipotecas >> posicao & 1)
+
+    def definir_hipoteca(self, posicao, hipotecada):
+        if hipotecada:
+            self.hipotecas |= 1 << posicao
+        else:
+            self.hipotecas &= ~(1 << posicao)
+
+    def em_prisao(self, assento):
+        return self.prisao[assento] != FORA_DA_PRISAO
+
+    # --- Conversão de/para Jogo ---
+
+    @classmethod
+    def de_jogo(cls, jogo):
+        """
+        Captura o estado de um Jogo em andamento (apenas jogadores ainda no jogo).
+
+        Args:
+            jogo: Instância de Jogo
+
+        Returns:
+            EstadoCompacto: Estado equivalente
+        """
+        jogadores = jogo.jogadores
+        estado = cls([jogador.nome for jogador in jogadores])
+        assento_por_jogador = {id(jogador): assento for assento, jogador in enumerate(jogadores)}
+
+        for assento, jogador in enumerate(jogadores):
+            estado.posicoes[assento] = jogador.posicao
+            estado.saldos[assento] = jogo.banco.consultar_saldo(jogador.nome)
+            estado.prisao[assento] = jogador.turnos_na_prisao if jogador.em_prisao else FORA_DA_PRISAO
+            bits = 0
+            for carta in jogador.cartas_livre_prisao:
+                bits |= _BIT_LIVRE_POR_TIPO.get(carta.tipo_carta, 0)
+            estado.cartas_livre[assento] = bits
+
+        for posicao, casa in enumerate(jogo.tabuleiro.casas):
+            if not isinstance(casa, Propriedade):
+                continue
+            if casa.proprietario is not None:
+                estado.proprietarios[posicao] = assento_por_jogador.get(id(casa.proprietario), SEM_DONO)
+            estado.casas[posicao] = casa.casas
+            if casa.hipotecada:
+                estado.hipotecas |= 1 << posicao
+
+        estado.baralho_sorte = _baralho_para_array(jogo.baralho_sorte.cartas, 'SORTE')
+        estado.descarte_sorte = _baralho_para_array(jogo.baralho_sorte.cartas_descartadas, 'SORTE')
+        estado.baralho_cofre = _baralho_para_array(jogo.baralho_cofre.cartas, 'COFRE')
+        estado.descarte_cofre = _baralho_para_array(jogo.baralho_cofre.cartas_descartadas, 'COFRE')
+
+        estado.indice_turno = jogo.indice_turno_atual
+        estado.duplas_consecutivas = jogo.duplas_consecutivas
+        estado.dupla_pendente = jogo.eh_duplo_ultimo
+        return estado
+
+    def aplicar_em_jogo(self, jogo):
+        """
+        Escreve este estado em um Jogo com os mesmos jogadores (ex: o Jogo de onde foi capturado).
+        Jogadores marcados como falidos saem de jogo.jogadores e vão para jogo.jogadores_falidos.
+
+        Args:
+            jogo: Instância de Jogo
+
+        Raises:
+            ValueError: Se algum jogador do estado não existir no Jogo
+        """
+        por_nome = {jogador.nome: jogador for jogador in jogo.jogadores + jogo.jogadores_falidos}
+        try:
+            jogadores = [por_nome[nome] for nome in self.nomes]
+        except KeyError as erro:
+            raise ValueError(f"Jogador {erro.args[0]} não existe neste jogo") from None
+
+        for assento, jogador in enumerate(jogadores):
+            jogador.posicao = self.posicoes[assento]
+            jogo.banco.contas[jogador.nome] = self.saldos[assento]
+            jogador.em_prisao = self.prisao[assento] != FORA_DA_PRISAO
+            jogador.turnos_na_prisao = max(self.prisao[assento], 0)
+            bits = self.cartas_livre[assento]
+            jogador.cartas_livre_prisao = [
+                _carta_livre_prisao(tipo) for tipo, bit in _BIT_LIVRE_POR_TIPO.items() if bits & bit
+            ]
+            jogador.falido = not self.ativos[assento]
+
+        for posicao, casa in enumerate(jogo.tabuleiro.casas):
+            if not isinstance(casa, Propriedade):
+                continue
+            assento = self.proprietarios[posicao]
+            dono = jogadores[assento] if assento != SEM_DONO else None
+            if casa.proprietario is not dono:
+                if casa.proprietario is not None:
+                    casa.proprietario.remover_propriedade(casa)
+                if dono is not None:
+                    dono.adicionar_propriedade(casa)
+            casa.casas = self.casas[posicao]
+            casa.hipotecada = self.esta_hipotecada(posicao)
+
+        jogo.baralho_sorte.cartas = _array_para_baralho(self.baralho_sorte, 'SORTE')
+        jogo.baralho_sorte.cartas_descartadas = _array_para_baralho(self.descarte_sorte, 'SORTE')
+        jogo.baralho_cofre.cartas = _array_para_baralho(self.baralho_cofre, 'COFRE')
+        jogo.baralho_cofre.cartas_descartadas = _array_para_baralho(self.descarte_cofre, 'COFRE')
+
+        # Ativos na ordem dos assentos; falidos mantêm a ordem de falência já registrada
+        jogo.jogadores = [jogador for jogador in jogadores if not jogador.falido]
+        jogo.jogadores_falidos = [jogador for jogador in jogo.jogadores_falidos if jogador.falido]
+        jogo.jogadores_falidos += [
+            jogador for jogador in jogadores if jogador.falido and jogador not in jogo.jogadores_falidos
+        ]
+
+        jogador_da_vez = jogadores[self.indice_turno]
+        jogo.indice_turno_atual = jogo.jogadores.index(jogador_da_vez) if not jogador_da_vez.falido else 0
+        jogo.duplas_consecutivas = self.duplas_consecutivas
+        jogo.eh_duplo_ultimo = self.dupla_pendente
+        jogo.jogo_finalizado = len(jogo.jogadores) <= 1
+
+
+if __name__ == '__main__':
+    import timeit
+    from registro import log, DESLIGADO
+    from jogo import Jogo
+    from gerenciador_inicializacao import GerenciadorInicializacao
+
+    log.definir_nivel(DESLIGADO)
+    jogo = Jogo([], lista_jogadores=GerenciadorInicializacao.gerar_lista_bots(['medio'] * 4),
+                headless=True, seed=7)
+    for _ in range(60):
+        jogo.executar_turno_bot_nao_bloqueante(jogo.jogadores[jogo.indice_turno_atual])
+
+    print("--- Teste do Módulo EstadoCompacto ---")
+    estado = EstadoCompacto.de_jogo(jogo)
+    print(f"Saldos: {list(estado.saldos)} | Posições: {list(estado.posicoes)}")
+    print(f"Casas com dono: {sum(1 for dono in estado.proprietarios if dono != SEM_DONO)}")
+
+    # Joga mais turnos e restaura o estado capturado
+    for _ in range(40):
+        if jogo.jogo_finalizado:
+            break
+        jogo.executar_turno_bot_nao_bloqueante(jogo.jogadores[jogo.indice_turno_atual])
+    estado.aplicar_em_jogo(jogo)
+    print(f"Ida e volta preserva o estado: {EstadoCompacto.de_jogo(jogo) == estado}")
+
+    repeticoes = 100000
+    segundos = timeit.timeit(estado.clone, number=repeticoes)
+    print(f"clone(): {segundos / repeticoes * 1e6:.2f} µs")
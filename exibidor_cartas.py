@@ -1,8 +1,10 @@
 # exibidor_cartas.py
 # Módulo para exibir cartas de sorte/cofre com delay de 2 segundos antes de executar
 
+import threading
 import time
 from enum import Enum
+from registro import log
 
 class EstadoExibicaoCartaEnum(Enum):
     AGUARDANDO = "aguardando"
@@ -13,7 +15,11 @@ class EstadoExibicaoCartaEnum(Enum):
 class ExibidorCartas:
     """
     Gerencia a exibição de cartas na tela com delay antes da execução.
-    Permite que o jogador veja o efeito da carta por 2 segundos antes de ser aplicado.
+    Permite que o jogador veja a carta por alguns segundos antes de o efeito ser aplicado.
+
+    A exibição é uma máquina de estados avançada por atualizar(dt) a cada quadro do laço
+    principal (AGUARDANDO -> EXIBINDO -> EXECUTANDO -> COMPLETO -> AGUARDANDO): nada bloqueia
+    a interface. Com tempo de exibição 0 (simulação headless) o efeito é aplicado na hora.
     """
     
     def __init__(self, tempo_exibicao=2.0):
@@ -25,10 +31,22 @@ class ExibidorCartas:
         self.carta_exibindo = None
         self.estado = EstadoExibicaoCartaEnum.AGUARDANDO
         self.callback_pos_execucao = None
+        self.tempo_restante = 0.0
+        self.info_exibicao = None
+        self.ultimo_resultado = None
+        self._acao = None
+        # A exibição é avançada pelo laço da interface e aguardada pela thread dos bots
+        self._trava = threading.Lock()
+        self._concluida = None  # threading.Event, criado na primeira exibição com tempo (headless não espera)
+    
+    @property
+    def em_exibicao(self):
+        """Indica se há uma carta à mostra aguardando a aplicação do efeito."""
+        return self.estado == EstadoExibicaoCartaEnum.EXIBINDO
     
     def exibir_carta(self, carta, tempo_customizado=None):
         """
-        Exibe uma carta na tela.
+        Exibe uma carta na tela (inicia a contagem; não bloqueia).
         
         Args:
             carta: Objeto da carta a exibir
@@ -37,12 +55,17 @@ class ExibidorCartas:
         Returns:
             dict: Informações para renderização no frontend
         """
-        tempo = tempo_customizado if tempo_customizado else self.tempo_exibicao
+        tempo = tempo_customizado if tempo_customizado is not None else self.tempo_exibicao
         
         self.carta_exibindo = carta
         self.estado = EstadoExibicaoCartaEnum.EXIBINDO
+        self.tempo_restante = tempo
+        if tempo > 0 and self._concluida is None:
+            self._concluida = threading.Event()
+        if self._concluida is not None:
+            self._concluida.clear()
         
-        info_exibicao = {
+        self.info_exibicao = {
             "tipo": "EXIBICAO_CARTA",
             "carta": {
                 "descricao": carta.descricao,
@@ -53,43 +76,84 @@ class ExibidorCartas:
             "timestamp": time.time()
         }
         
-        print(f"  > [CARTA EXIBIDA] {carta.descricao}")
-        print(f"  > Aguardando {tempo} segundos antes de executar...")
-        
-        # Simula o delay de exibição
-        time.sleep(tempo)
-        
-        print(f"  > [CARTA] Executando efeito...")
-        self.estado = EstadoExibicaoCartaEnum.EXECUTANDO
+        log.info("  > [CARTA EXIBIDA] %s", carta.descricao)
+        if tempo > 0:
+            log.info("  > Efeito será aplicado em %s segundos...", tempo)
         
-        return info_exibicao
+        return self.info_exibicao
     
-    def executar_carta_apos_delay(self, carta, jogador, banco, jogo):
+    def executar_carta_apos_delay(self, carta, jogador, banco, jogo, tempo_customizado=None):
         """
-        Exibe a carta e a executa após o delay.
+        Exibe a carta e agenda a execução para o fim da exibição.
         
         Args:
             carta: Objeto da carta
             jogador: Jogador que pegou a carta
             banco: Objeto banco
             jogo: Objeto jogo (para contexto)
+            tempo_customizado: Tempo de exibição em segundos (opcional)
             
         Returns:
-            dict: Resultado da execução
+            dict: Resultado da execução; com tempo de exibição > 0 o efeito ainda não foi
+                  aplicado e "execucao" é None (ver atualizar / aguardar_conclusao)
         """
-        # Exibe a carta
-        info_exibicao = self.exibir_carta(carta)
+        info_exibicao = self.exibir_carta(carta, tempo_customizado)
+        self._acao = lambda: carta.executar(jogador, banco, jogo.tabuleiro, jogo)
         
-        # Executa a carta após delay
-        resultado_execucao = carta.executar(jogador, banco, jogo.tabuleiro, jogo)
+        if info_exibicao["tempo_exibicao"] <= 0:
+            with self._trava:
+                return self._executar()
+        return {"exibicao": info_exibicao, "execucao": None}
+    
+    def atualizar(self, dt):
+        """
+        Avança a exibição (chamado a cada quadro pelo laço principal).
+        
+        Args:
+            dt: Segundos desde a última atualização
+            
+        Returns:
+            dict: Resultado da execução, se o efeito da carta foi aplicado nesta atualização;
+                  None caso contrário
+        """
+        with self._trava:
+            if self.estado != EstadoExibicaoCartaEnum.EXIBINDO:
+                return None
+            self.tempo_restante -= dt
+            if self.tempo_restante > 0:
+                return None
+            return self._executar()
+    
+    def aguardar_conclusao(self, margem=1.0):
+        """
+        Espera o efeito da carta ser aplicado pelo laço principal (usado pela thread dos bots).
+        Se ninguém avançar a exibição até o fim do tempo mais a margem, aplica o efeito aqui.
+        
+        Returns:
+            dict: Resultado da última execução
+        """
+        if self._concluida is None:
+            return self.ultimo_resultado
+        if not self._concluida.wait(max(0.0, self.tempo_restante) + margem):
+            with self._trava:
+                if self.estado == EstadoExibicaoCartaEnum.EXIBINDO:
+                    self._executar()
+        return self.ultimo_resultado
+    
+    def _executar(self):
+        """Aplica o efeito da carta exibida e volta a AGUARDANDO (chamado com a trava adquirida)."""
+        log.info("  > [CARTA] Executando efeito...")
+        self.estado = EstadoExibicaoCartaEnum.EXECUTANDO
+        carta = self.carta_exibindo
+        resultado_execucao = self._acao()
         
         self.estado = EstadoExibicaoCartaEnum.COMPLETO
         
         resultado = {
-            "exibicao": info_exibicao,
+            "exibicao": self.info_exibicao,
             "execucao": {
                 "sucesso": True,
-                "mensagem": f"Efeito aplicado: {carta.descricao}",
+                "carta": carta,  # A interface monta o texto do efeito, se precisar
                 "resultado_execucao": resultado_execucao
             }
         }
@@ -98,7 +162,12 @@ class ExibidorCartas:
             self.callback_pos_execucao(resultado)
         
         self.carta_exibindo = None
+        self._acao = None
+        self.tempo_restante = 0.0
+        self.ultimo_resultado = resultado
         self.estado = EstadoExibicaoCartaEnum.AGUARDANDO
+        if self._concluida is not None:
+            self._concluida.set()
         
         return resultado
     
@@ -111,5 +180,6 @@ class ExibidorCartas:
         return {
             "estado": self.estado.value,
             "carta_exibindo": self.carta_exibindo.descricao if self.carta_exibindo else None,
-            "tempo_exibicao": self.tempo_exibicao
+            "tempo_exibicao": self.tempo_exibicao,
+            "tempo_restante": max(0.0, self.tempo_restante)
         }
@@ -2,6 +2,7 @@
 # Módulo para gerenciar inicialização do jogo com suporte dinâmico de jogadores (1-6)
 
 import random
+from registro import log
 
 class GerenciadorInicializacao:
     """
@@ -35,19 +36,23 @@ class GerenciadorInicializacao:
         return True
     
     @staticmethod
-    def gerar_lista_jogadores(num_humanos, nomes_humanos=None):
+    def gerar_lista_jogadores(num_humanos, nomes_humanos=None, rng=None):
         """
         Gera lista completa de jogadores (humanos + bots).
         
         Args:
             num_humanos: Número de jogadores humanos (1-6)
             nomes_humanos: Lista com nomes dos jogadores humanos (opcional)
+            rng: Gerador usado para sortear a dificuldade dos bots (padrão: módulo random)
             
         Returns:
             list: Lista de tuplas (nome, eh_bot, dificuldade_bot)
         """
         GerenciadorInicializacao.validar_numero_jogadores(num_humanos)
         
+        if rng is None:
+            rng = random
+        
         if nomes_humanos is None:
             nomes_humanos = [f"Jogador {i+1}" for i in range(num_humanos)]
         elif len(nomes_humanos) != num_humanos:
@@ -69,7 +74,7 @@ class GerenciadorInicializacao:
         dificuldades = ["facil", "medio", "dificil"]
         
         for i in range(num_bots_necessarios):
-            dificuldade = random.choice(dificuldades)
+            dificuldade = rng.choice(dificuldades)
             nome_bot = GerenciadorInicializacao.NOMES_BOTS[i % len(GerenciadorInicializacao.NOMES_BOTS)]
             
             jogadores.append({
@@ -81,6 +86,30 @@ class GerenciadorInicializacao:
         
         return jogadores
     
+    @staticmethod
+    def gerar_lista_bots(dificuldades):
+        """
+        Gera lista de jogadores composta apenas por bots (partidas simuladas).
+        
+        Args:
+            dificuldades: Lista com a dificuldade de cada bot, na ordem dos assentos
+            
+        Returns:
+            list: Lista de dicts no mesmo formato de gerar_lista_jogadores()
+        """
+        GerenciadorInicializacao.validar_numero_jogadores(len(dificuldades))
+        
+        jogadores = []
+        for i, dificuldade in enumerate(dificuldades):
+            jogadores.append({
+                "nome": f"Bot{i+1}_{dificuldade}",
+                "eh_bot": True,
+                "dificuldade": dificuldade,
+                "peca": GerenciadorInicializacao.PECAS_DISPONIVEIS[i % len(GerenciadorInicializacao.PECAS_DISPONIVEIS)]
+            })
+        
+        return jogadores
+    
     @staticmethod
     def criar_jogadores_no_jogo(jogo, lista_jogadores):
         """
@@ -99,9 +128,9 @@ class GerenciadorInicializacao:
                 
                 if info["eh_bot"]:
                     jogo.gerenciador_bots.criar_bot(info["nome"], info["dificuldade"])
-                    print(f"  > Bot '{info['nome']}' criado com dificuldade '{info['dificuldade']}'")
+                    log.info("  > Bot '%s' criado com dificuldade '%s'", info['nome'], info['dificuldade'])
             else:
-                print(f"  > Aviso: Jogador '{info['nome']}' não encontrado no jogo")
+                log.aviso("  > Aviso: Jogador '%s' não encontrado no jogo", info['nome'])
     
     @staticmethod
     def obter_estatisticas_jogadores(lista_jogadores):
@@ -10,6 +10,7 @@ from dados import Dados
 from cartas import BaralhoSorte, BaralhoReves
 from transacoes import GerenciadorTransacoes
 from regras_prisao import GerenciadorPrisao
+from avaliacao import ServicoAvaliacao
 from datetime import datetime
 
 
@@ -263,16 +264,8 @@ class GerenciadorPartida:
         """
         patrimonio = self.banco.consultar_saldo(jogador.nome)
         
-        # Somar valor das propriedades
-        for prop in jogador.propriedades:
-            if hasattr(prop, 'preco_compra'):
-                patrimonio += prop.preco_compra
-            
-            # Somar valor das construções
-            if hasattr(prop, 'casas'):
-                patrimonio += prop.casas * (prop.preco_casa if hasattr(prop, 'preco_casa') else 50)
-            if hasattr(prop, 'tem_hotel') and prop.tem_hotel:
-                patrimonio += (prop.preco_hotel if hasattr(prop, 'preco_hotel') else 100)
+        # Propriedades (metade se hipotecadas) + construções pelo custo de GestorConstrucao
+        patrimonio += ServicoAvaliacao.padrao().valor_contabil(jogador.propriedades)
         
         return patrimonio
 
@@ -351,6 +344,7 @@ class GerenciadorPartida:
             # Se voltou ao primeiro jogador, incrementa rodada
             if self.indice_turno_atual == 0:
                 self.rodadas_totais += 1
+                self.gerenciador_transacoes.turno_atual = self.rodadas_totais
                 print(f"\n--- RODADA {self.rodadas_totais} COMPLETA ---\n")
         
         # Verificar fim de jogo
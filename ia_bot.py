@@ -2,23 +2,66 @@
 # Módulo responsável pela IA dos bots para jogadas automáticas
 
 import random
-from propriedades import Propriedade, CasaCompanhia, CasaMetro
+from propriedades import Propriedade
+from registro import log
 
 class IIABot:
     """
     Classe que implementa a IA para bots jogarem automaticamente.
     Toma decisões estratégicas sobre compra de propriedades, construção e outros movimentos.
     """
+    # Saldo que cada dificuldade mantém depois de construir
+    RESERVA_CONSTRUCAO = {'facil': 0, 'medio': 150, 'dificil': 300, 'mcts': 300}
     
-    def __init__(self, dificuldade='medio'):
+    __slots__ = ('dificuldade', 'rng', 'historico_decisoes', 'semente_mcts', 'opcoes_mcts',
+                 '_avaliador', '_avaliacao', '_planejador')
+    
+    def __init__(self, dificuldade='medio', rng=None, semente_mcts=None, **opcoes_mcts):
         """
         Args:
-            dificuldade: 'facil', 'medio', 'dificil'
+            dificuldade: 'facil', 'medio', 'dificil' ou 'mcts' (rollouts Monte Carlo)
+            rng: Gerador de números aleatórios (padrão: módulo random global)
+            semente_mcts: Semente do gerador próprio dos rollouts do bot 'mcts', que nunca
+                          avança o rng da partida (None = semente aleatória)
+            **opcoes_mcts: Parâmetros do AvaliadorMonteCarlo do bot 'mcts'
+                           (ex.: orcamento_ms=None para decidir só pelo limite de rollouts)
         """
         self.dificuldade = dificuldade
+        self.rng = rng if rng is not None else random
         self.historico_decisoes = []
+        self.semente_mcts = semente_mcts
+        self.opcoes_mcts = opcoes_mcts
+        # Avaliadores criados (e seus módulos importados) na primeira decisão: o serviço de
+        # avaliação resolve o modelo de Markov do tabuleiro, o que não deve atrasar o menu
+        self._avaliador = None
+        self._avaliacao = None
+        self._planejador = None
+    
+    @property
+    def avaliador(self):
+        """AvaliadorMonteCarlo do bot 'mcts' (None nas outras dificuldades)."""
+        if self._avaliador is None and self.dificuldade == 'mcts':
+            from ia_bot_mcts import AvaliadorMonteCarlo
+            self._avaliador = AvaliadorMonteCarlo(rng=random.Random(self.semente_mcts), **self.opcoes_mcts)
+        return self._avaliador
+    
+    @property
+    def avaliacao(self):
+        """Serviço de avaliação compartilhado (ServicoAvaliacao.padrao)."""
+        if self._avaliacao is None:
+            from avaliacao import ServicoAvaliacao
+            self._avaliacao = ServicoAvaliacao.padrao()
+        return self._avaliacao
+    
+    @property
+    def planejador(self):
+        """Planejador das construções do bot."""
+        if self._planejador is None:
+            from planejador_construcao import PlanejadorConstrucao
+            self._planejador = PlanejadorConstrucao(self.avaliacao)
+        return self._planejador
     
-    def decidir_compra_propriedade(self, jogador, propriedade, banco):
+    def decidir_compra_propriedade(self, jogador, propriedade, banco, jogo=None):
         """
         Decide se o bot deve comprar uma propriedade.
         
@@ -26,16 +69,20 @@ class IIABot:
             jogador: Objeto do jogador (bot)
             propriedade: Propriedade onde o jogador parou
             banco: Objeto banco para consultar saldo
+            jogo: Jogo em andamento (necessário para o bot 'mcts'; sem ele, usa a heurística 'dificil')
             
         Returns:
             bool: True se deve comprar, False caso contrário
         """
+        if self.avaliador and jogo is not None:
+            return self.avaliador.decidir_compra(jogo, jogador, propriedade)
+        
         saldo = banco.consultar_saldo(jogador.nome)
         
         if self.dificuldade == 'facil':
             # Bot fácil compra 30% das propriedades que pode pagar
             if saldo >= propriedade.preco_compra:
-                return random.random() < 0.3
+                return self.rng.random() < 0.3
         
         elif self.dificuldade == 'medio':
             # Bot médio é mais estratégico
@@ -44,7 +91,7 @@ class IIABot:
                 valor_compra = self._calcular_valor_compra_estrategica(jogador, propriedade)
                 return valor_compra > 0
         
-        elif self.dificuldade == 'dificil':
+        elif self.dificuldade in ('dificil', 'mcts'):
             # Bot difícil otimiza compras para monopólios e propriedades com potencial
             if saldo >= propriedade.preco_compra:
                 valor_compra = self._calcular_valor_compra_estrategica(jogador, propriedade)
@@ -54,30 +101,15 @@ class IIABot:
     
     def _calcular_valor_compra_estrategica(self, jogador, propriedade):
         """
-        Calcula o valor estratégico de comprar uma propriedade.
+        Calcula o valor estratégico de comprar uma propriedade: quanto o valor esperado das
+        posses do bot (ServicoAvaliacao) aumenta além do preço pago.
         
         Returns:
             int: Score de valor (quanto maior, mais desejável a compra)
         """
-        score = 0
-        
-        # 1. Propriedades de alto potencial de aluguel (cores)
-        cores_estrategicas = ['Azul Escuro', 'Vermelho', 'Amarelo', 'Verde']
-        if propriedade.grupo_cor in cores_estrategicas:
-            score += 3
-        
-        # 2. Propriedades que completam monopólios
-        monopolio_progress = jogador.contar_propriedades_grupo(propriedade.grupo_cor)
-        if monopolio_progress > 0:
-            score += monopolio_progress * 2
-        
-        # 3. Ferrovias e companhias (renda passiva boa)
-        if propriedade.grupo_cor in ['METRÔ', 'SERVIÇO']:
-            score += 2
-        
-        return score
+        return int(self.avaliacao.valor_marginal(propriedade, jogador) - propriedade.preco_compra)
     
-    def decidir_construcao(self, jogador, tabuleiro, banco):
+    def decidir_construcao(self, jogador, tabuleiro, banco, jogo=None):
         """
         Decide quais propriedades construir casas/hotéis.
         
@@ -85,53 +117,17 @@ class IIABot:
             jogador: Objeto do jogador (bot)
             tabuleiro: Objeto tabuleiro
             banco: Objeto banco
+            jogo: Jogo em andamento (necessário para o bot 'mcts')
             
         Returns:
-            list: Lista de propriedades para construir
+            list: Propriedades a construir, uma entrada por casa (ver PlanejadorConstrucao)
         """
-        propriedades_para_construir = []
-        saldo = banco.consultar_saldo(jogador.nome)
-        
-        grupos_propriedades = {}
-        for prop in jogador.propriedades:
-            if isinstance(prop, Propriedade) and not isinstance(prop, (CasaCompanhia, CasaMetro)):
-                grupo = prop.grupo_cor
-                if grupo not in grupos_propriedades:
-                    grupos_propriedades[grupo] = []
-                grupos_propriedades[grupo].append(prop)
+        if self.avaliador and jogo is not None:
+            return self.avaliador.decidir_construcao(jogo, jogador)
         
-        # Construir em grupos onde tem monopólio
-        for grupo, props in grupos_propriedades.items():
-            # Verifica se tem todas as propriedades do grupo
-            if len(props) == self._contar_total_grupo(grupo):
-                # Ordena por menor número de casas
-                props.sort(key=lambda p: p.casas)
-                
-                for prop in props:
-                    if prop.casas < 5 and saldo >= 100:  # Assume custo padrão de construção
-                        # Construir uniformemente
-                        if prop.casas < props[0].casas + 1:
-                            propriedades_para_construir.append(prop)
-                            saldo -= 100
-        
-        return propriedades_para_construir
-    
-    def _contar_total_grupo(self, grupo):
-        """Retorna o número total de propriedades de um grupo"""
-        # Grupos padrão do Monopoly
-        grupos_totais = {
-            'Marrom': 2,
-            'Azul Claro': 3,
-            'Rosa': 3,
-            'Laranja': 3,
-            'Vermelho': 3,
-            'Amarelo': 3,
-            'Verde': 3,
-            'Azul Escuro': 2,
-            'METRÔ': 4,
-            'SERVIÇO': 2
-        }
-        return grupos_totais.get(grupo, 0)
+        saldo = banco.consultar_saldo(jogador.nome)
+        reserva = self.RESERVA_CONSTRUCAO.get(self.dificuldade, 150)
+        return self.planejador.planejar(jogador, tabuleiro, saldo, reserva)
     
     def decidir_hipoteca(self, jogador, banco, valor_necessario):
         """
@@ -199,7 +195,7 @@ class IIABot:
             valor_proposto = int(propriedade_alvo.preco_compra * 1.15)
             return valor_proposto <= valor_maximo_oferta, valor_proposto
         
-        elif self.dificuldade == 'dificil':
+        elif self.dificuldade in ('dificil', 'mcts'):
             # Bot difícil negocia apenas se muito estratégico e mantém segurança
             if importancia < 2 or saldo - valor_maximo_oferta < 300:
                 return False, 0
@@ -209,21 +205,8 @@ class IIABot:
         return False, 0
     
     def _calcular_importancia_propriedade_para_bot(self, jogador, propriedade):
-        """Calcula quão importante é uma propriedade para o bot"""
-        score = 0
-        
-        # Propriedades que completam monopólios são muito valiosas
-        if hasattr(propriedade, 'grupo_cor'):
-            progresso = jogador.contar_propriedades_grupo(propriedade.grupo_cor)
-            if progresso > 0:
-                score += progresso * 3
-        
-        # Cores estratégicas têm mais valor
-        cores_premium = ['Azul Escuro', 'Vermelho', 'Amarelo']
-        if hasattr(propriedade, 'grupo_cor') and propriedade.grupo_cor in cores_premium:
-            score += 2
-        
-        return score
+        """Calcula quão importante é uma propriedade para o bot (0-5, ver ServicoAvaliacao.importancia)"""
+        return self.avaliacao.importancia(propriedade, jogador)
 
 class GerenciadorBots:
     """
@@ -231,9 +214,17 @@ class GerenciadorBots:
     Coordena suas ações e decisões.
     """
     
-    def __init__(self):
+    def __init__(self, rng=None, seed=None):
+        """
+        Args:
+            rng: Gerador de números aleatórios compartilhado pelos bots criados
+            seed: Semente da partida, da qual derivam as sementes dos rollouts dos bots 'mcts'
+        """
+        self.rng = rng
+        self.seed = seed
         self.bots = {}
         self.tempo_resposta_ms = 500  # Delay para parecer mais natural
+        self.opcoes_mcts = {}  # Parâmetros do AvaliadorMonteCarlo dos bots 'mcts' (ver IIABot)
     
     def criar_bot(self, nome_jogador, dificuldade='medio'):
         """
@@ -243,8 +234,10 @@ class GerenciadorBots:
             nome_jogador: Nome do jogador
             dificuldade: Nível de dificuldade da IA
         """
-        self.bots[nome_jogador] = IIABot(dificuldade)
-        print(f"  > Bot criado para {nome_jogador} (dificuldade: {dificuldade})")
+        semente_mcts = None if self.seed is None else f"{self.seed}:{nome_jogador}"
+        self.bots[nome_jogador] = IIABot(dificuldade, rng=self.rng, semente_mcts=semente_mcts,
+                                         **self.opcoes_mcts)
+        log.info("  > Bot criado para %s (dificuldade: %s)", nome_jogador, dificuldade)
     
     def executar_turno_bot(self, jogador, jogo):
         """
@@ -263,10 +256,11 @@ class GerenciadorBots:
         bot = self.bots[jogador.nome]
         resultado = {"jogador": jogador.nome, "acoes": []}
         
-        print(f"\n  [BOT] Executando turno para {jogador.nome}...")
+        log.info("\n  [BOT] Executando turno para %s...", jogador.nome)
         
-        import time
-        time.sleep(self.tempo_resposta_ms / 1000)
+        if self.tempo_resposta_ms > 0:
+            import time
+            time.sleep(self.tempo_resposta_ms / 1000)
         
         # Pega a casa atual onde o bot parou
         casa_atual = jogo.tabuleiro.get_casa(jogador.posicao)
@@ -274,7 +268,7 @@ class GerenciadorBots:
         # Toma decisões baseadas na casa
         if isinstance(casa_atual, Propriedade) and casa_atual.is_livre():
             # Decide se compra
-            deve_comprar = bot.decidir_compra_propriedade(jogador, casa_atual, jogo.banco)
+            deve_comprar = bot.decidir_compra_propriedade(jogador, casa_atual, jogo.banco, jogo=jogo)
             if deve_comprar:
                 sucesso = jogo.executar_compra()
                 resultado["acoes"].append({
@@ -283,13 +277,19 @@ class GerenciadorBots:
                     "sucesso": sucesso
                 })
         
-        # Decide construções se for seu turno
-        propriedades_construir = bot.decidir_construcao(jogador, jogo.tabuleiro, jogo.banco)
-        for prop in propriedades_construir:
-            resultado["acoes"].append({
-                "tipo": "CONSTRUCAO",
-                "propriedade": prop.nome
-            })
-        
         resultado["sucesso"] = True
         return resultado
+    
+    def executar_construcoes_bot(self, jogador, jogo):
+        """
+        O bot planeja as construções do turno e as aplica em lote (GestorConstrucao.construir_lote).
+        
+        Returns:
+            int: Número de casas construídas
+        """
+        bot = self.bots.get(jogador.nome)
+        if bot is None or not jogador.mascara_monopolios:
+            return 0
+        
+        plano = bot.decidir_construcao(jogador, jogo.tabuleiro, jogo.banco, jogo=jogo)
+        return jogo.gestor_construcao.construir_lote(jogador, plano)
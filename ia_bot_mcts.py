@@ -0,0 +1,218 @@
+# ia_bot_mcts.py
+# Avaliação de decisões dos bots por rollouts Monte Carlo (dificuldade 'mcts').
+# Cada ação candidata é aplicada a um clone do EstadoCompacto da partida e avaliada pelo
+# patrimônio médio do bot após vários rollouts, dentro de um orçamento de tempo e de rollouts.
+
+import random
+import time
+
+from estado_compacto import EstadoCompacto
+from simulacao_compacta import SimuladorCompacto, HOTEL
+
+
+class AvaliadorMonteCarlo:
+    """
+    Escolhe entre ações candidatas jogando rollouts a partir do estado atual.
+
+    Os rollouts de uma mesma rodada usam a mesma seed para todas as candidatas
+    (números aleatórios comuns), o que reduz a variância da comparação.
+    """
+
+    ORCAMENTO_PADRAO_MS = 30
+    MAX_ROLLOUTS_PADRAO = 2000
+    PROFUNDIDADE_PADRAO = 40  # Turnos jogados em cada rollout
+
+    def __init__(self, orcamento_ms=ORCAMENTO_PADRAO_MS, max_rollouts=MAX_ROLLOUTS_PADRAO,
+                 profundidade_turnos=PROFUNDIDADE_PADRAO, rng=None):
+        """
+        Args:
+            orcamento_ms: Tempo máximo por decisão em milissegundos (None = só o limite de rollouts,
+                          resultado reprodutível com a mesma seed)
+            max_rollouts: Máximo de rollouts por decisão (somando todas as candidatas)
+            profundidade_turnos: Turnos simulados em cada rollout
+            rng: Gerador próprio que sorteia as seeds dos rollouts; não deve ser o rng da
+                 partida, para que os rollouts não avancem a sequência do jogo
+                 (padrão: random.Random com semente aleatória)
+        """
+        self.orcamento_ms = orcamento_ms
+        self.max_rollouts = max_rollouts
+        self.profundidade_turnos = profundidade_turnos
+        self.rng = rng if rng is not None else random.Random()
+        self._rng_rollout = random.Random()
+        self.simulador = SimuladorCompacto(rng=self._rng_rollout)
+        self.rollouts_ultima_decisao = 0
+
+    def avaliar(self, estado, assento, candidatas):
+        """
+        Avalia ações candidatas pelo patrimônio médio do jogador após os rollouts.
+
+        Args:
+            estado: EstadoCompacto no momento da decisão (não é modificado)
+            assento: Assento do jogador que decide
+            candidatas: Funções que recebem um clone do estado e aplicam a ação
+
+        Returns:
+            list: Patrimônio médio de cada candidata (mesma ordem)
+        """
+        num_candidatas = len(candidatas)
+        somas = [0] * num_candidatas
+        rodadas = 0
+        limite_rodadas = max(1, self.max_rollouts // num_candidatas)
+        prazo = None
+        if self.orcamento_ms is not None:
+            prazo = time.perf_counter() + self.orcamento_ms / 1000
+
+        # O prazo é conferido a cada rollout; uma rodada interrompida é descartada para que todas
+        # as candidatas tenham o mesmo número de rollouts (a primeira rodada sempre termina)
+        esgotou = False
+        while rodadas < limite_rodadas and not esgotou:
+            seed = self.rng.getrandbits(32)
+            rodada = []
+            for aplicar in candidatas:
+                if rodadas and prazo is not None and time.perf_counter() >= prazo:
+                    esgotou = True
+                    break
+                simulado = estado.clone()
+                aplicar(simulado)
+                self._rng_rollout.seed(seed)
+                self.simulador.finalizar_turno(simulado)
+                self.simulador.jogar(simulado, self.profundidade_turnos)
+                rodada.append(self.simulador.patrimonio(simulado, assento))
+            if esgotou:
+                break
+            for indice, valor in enumerate(rodada):
+                somas[indice] += valor
+            rodadas += 1
+
+        self.rollouts_ultima_decisao = rodadas * num_candidatas
+        return [soma / rodadas for soma in somas]
+
+    def _melhor(self, estado, assento, candidatas):
+        medias = self.avaliar(estado, assento, candidatas)
+        return max(range(len(medias)), key=medias.__getitem__)
+
+    # --- Decisões sobre um Jogo em andamento ---
+
+    def decidir_compra(self, jogo, jogador, propriedade):
+        """
+        Decide entre comprar ou não a propriedade onde o bot parou.
+
+        Returns:
+            bool: True se comprar tem o maior patrimônio esperado
+        """
+        estado = EstadoCompacto.de_jogo(jogo)
+        assento = estado.nomes.index(jogador.nome)
+        posicao = propriedade.posicao
+        preco = propriedade.preco_compra
+        if estado.saldos[assento] < preco:
+            return False
+
+        def comprar(simulado):
+            simulado.saldos[assento] -= preco
+            simulado.proprietarios[posicao] = assento
+
+        return self._melhor(estado, assento, [lambda simulado: None, comprar]) == 1
+
+    def decidir_construcao(self, jogo, jogador):
+        """
+        Escolhe quantas rodadas de casas construir em cada monopólio (uma casa por propriedade
+        do grupo por rodada, como exige a construção uniforme).
+
+        Returns:
+            list: Propriedades a construir, uma entrada por casa, em ordem de construção
+        """
+        estado = EstadoCompacto.de_jogo(jogo)
+        assento = estado.nomes.index(jogador.nome)
+        saldo = estado.saldos[assento]
+
+        candidatas = [lambda simulado: None]
+        planos = [[]]
+        for membros in self.simulador.grupos_construiveis(estado, assento):
+            plano = []
+            custo_total = 0
+            casas = {posicao: estado.casas[posicao] for posicao in membros}
+            for _ in range(3):
+                rodada = [p for p in sorted(membros, key=casas.__getitem__) if casas[p] < HOTEL]
+                custo_rodada = sum(self.simulador.tabelas.custo_casa[p] for p in rodada)
+                if not rodada or custo_total + custo_rodada > saldo:
+                    break
+                for posicao in rodada:
+                    casas[posicao] += 1
+                plano = plano + rodada
+                custo_total += custo_rodada
+                planos.append(plano)
+                candidatas.append(self._aplicar_construcao(assento, plano))
+
+        if len(candidatas) == 1:
+            return []
+
+        melhor = self._melhor(estado, assento, candidatas)
+        casas_tabuleiro = jogo.tabuleiro.casas
+        return [casas_tabuleiro[posicao] for posicao in planos[melhor]]
+
+    def _aplicar_construcao(self, assento, plano):
+        custos = self.simulador.tabelas.custo_casa
+
+        def construir(simulado):
+            for posicao in plano:
+                simulado.saldos[assento] -= custos[posicao]
+                simulado.casas[posicao] += 1
+        return construir
+
+    def decidir_proposta(self, jogo, jogador, proposta):
+        """
+        Decide se o destinatário aceita uma proposta de troca do SistemaPropostas, comparando
+        recusar e aceitar (propriedades e dinheiro trocados de dono) pelos rollouts.
+
+        Args:
+            jogo: Jogo em andamento
+            jogador: Destinatário da proposta
+            proposta: Dict criado por SistemaPropostas.criar_proposta
+
+        Returns:
+            bool: True se aceitar tem o maior patrimônio esperado
+        """
+        estado = EstadoCompacto.de_jogo(jogo)
+        if proposta["oferente"].nome not in estado.nomes:
+            return False
+        assento = estado.nomes.index(jogador.nome)
+        assento_oferente = estado.nomes.index(proposta["oferente"].nome)
+        dinheiro = proposta["dinheiro_oferecido"] - proposta["dinheiro_solicitado"]
+        if estado.saldos[assento] + dinheiro < 0 or estado.saldos[assento_oferente] - dinheiro < 0:
+            return False
+        recebidas = [p.posicao for p in proposta["props_oferecidas"]]
+        entregues = [p.posicao for p in proposta["props_solicitadas"]]
+
+        def aceitar(simulado):
+            simulado.saldos[assento] += dinheiro
+            simulado.saldos[assento_oferente] -= dinheiro
+            for posicao in recebidas:
+                simulado.proprietarios[posicao] = assento
+            for posicao in entregues:
+                simulado.proprietarios[posicao] = assento_oferente
+
+        return self._melhor(estado, assento, [lambda simulado: None, aceitar]) == 1
+
+if __name__ == '__main__':
+    from registro import log, DESLIGADO
+    from jogo import Jogo
+    from gerenciador_inicializacao import GerenciadorInicializacao
+    from propriedades import Propriedade
+
+    log.definir_nivel(DESLIGADO)
+    jogo = Jogo([], lista_jogadores=GerenciadorInicializacao.gerar_lista_bots(['medio'] * 4),
+                headless=True, seed=3)
+    for _ in range(20):
+        jogo.executar_turno_bot_nao_bloqueante(jogo.jogadores[jogo.indice_turno_atual])
+
+    print("--- Teste do Módulo AvaliadorMonteCarlo ---")
+    avaliador = AvaliadorMonteCarlo(orcamento_ms=50, rng=random.Random(1))
+    jogador = jogo.jogadores[jogo.indice_turno_atual]
+    livres = [casa for casa in jogo.tabuleiro.casas if isinstance(casa, Propriedade) and casa.is_livre()]
+
+    for propriedade in livres[:3]:
+        inicio = time.perf_counter()
+        comprar = avaliador.decidir_compra(jogo, jogador, propriedade)
+        duracao = (time.perf_counter() - inicio) * 1000
+        print(f"{jogador.nome} compraria {propriedade.nome} (R${propriedade.preco_compra})? {comprar} "
+              f"[{avaliador.rollouts_ultima_decisao} rollouts em {duracao:.1f} ms]")
@@ -1,14 +1,18 @@
 # ia_bot_negociacao.py
 # Módulo de IA avançada para bots tomarem decisões em negociações
 
+from avaliacao import ServicoAvaliacao
+from registro import log
+
 class IIABotNegociacao:
     """
     Aprimoramento da IA dos bots para negociações de propriedades.
     Toma decisões inteligentes baseadas em estratégia, saldo e monopólios.
     """
     
-    def __init__(self, dificuldade='medio'):
+    def __init__(self, dificuldade='medio', avaliacao=None):
         self.dificuldade = dificuldade
+        self.avaliacao = avaliacao if avaliacao is not None else ServicoAvaliacao.padrao()
     
     def decidir_venda_propriedade(self, bot_receptor, propriedade, valor_ofertado, banco):
         """
@@ -26,10 +30,10 @@ class IIABotNegociacao:
         valor_mercado = self._calcular_valor_mercado_propriedade(propriedade)
         saldo_bot = banco.consultar_saldo(bot_receptor.nome)
         
-        print(f"  > [BOT IA] {bot_receptor.nome} analisando proposta...")
-        print(f"    Valor de mercado: R${valor_mercado}")
-        print(f"    Valor ofertado: R${valor_ofertado}")
-        print(f"    Saldo do bot: R${saldo_bot}")
+        log.info("  > [BOT IA] %s analisando proposta...", bot_receptor.nome)
+        log.info("    Valor de mercado: R$%s", valor_mercado)
+        log.info("    Valor ofertado: R$%s", valor_ofertado)
+        log.info("    Saldo do bot: R$%s", saldo_bot)
         
         if self.dificuldade == 'facil':
             # Bot fácil aceita qualquer oferta acima de 50% do valor de mercado
@@ -74,20 +78,8 @@ class IIABotNegociacao:
         return False
     
     def _calcular_valor_mercado_propriedade(self, propriedade):
-        """Calcula o valor de mercado de uma propriedade"""
-        if hasattr(propriedade, 'preco_compra'):
-            preco_base = propriedade.preco_compra
-        else:
-            preco_base = 200  # Valor padrão
-        
-        # Ajusta baseado em casas/hotéis
-        if hasattr(propriedade, 'casas'):
-            if propriedade.casas > 0:
-                preco_base *= (1 + propriedade.casas * 0.3)
-            if propriedade.casas == 5:
-                preco_base *= 2
-        
-        return int(preco_base)
+        """Calcula o valor de mercado de uma propriedade (valor esperado para o dono atual)"""
+        return int(self.avaliacao.valor_propriedade(propriedade, propriedade.proprietario))
     
     def _calcular_importancia_propriedade(self, jogador, propriedade):
         """
@@ -96,23 +88,41 @@ class IIABotNegociacao:
         Returns:
             int: Score de importância (0-5)
         """
-        score = 0
+        return self.avaliacao.importancia(propriedade, jogador)
+    
+    def decidir_proposta(self, bot_receptor, proposta, banco):
+        """
+        Decide se o bot aceita uma proposta de troca do SistemaPropostas (pacotes de
+        propriedades + dinheiro), pela variação do valor das suas posses.
         
-        # 1. Faz parte de um monopólio?
-        if hasattr(propriedade, 'grupo_cor'):
-            progresso_monopolio = jogador.contar_propriedades_grupo(propriedade.grupo_cor)
-            score += progresso_monopolio
+        Args:
+            bot_receptor: Bot destinatário da proposta
+            proposta: Dict criado por SistemaPropostas.criar_proposta
+            banco: Objeto banco
+            
+        Returns:
+            bool: True para aceitar, False para recusar
+        """
+        dinheiro = proposta["dinheiro_oferecido"] - proposta["dinheiro_solicitado"]
+        if banco.consultar_saldo(bot_receptor.nome) + dinheiro < 0:
+            return False
         
-        # 2. Tem casas/hotéis?
-        if hasattr(propriedade, 'casas') and propriedade.casas > 0:
-            score += 2
+        ganho = self.avaliacao.avaliar_troca(
+            bot_receptor,
+            recebe=proposta["props_oferecidas"],
+            entrega=proposta["props_solicitadas"],
+            dinheiro=dinheiro
+        )
+        log.info("  > [BOT IA] %s avalia a troca: ganho esperado R$%.0f", bot_receptor.nome, ganho)
         
-        # 3. É uma estação/serviço?
-        if hasattr(propriedade, 'grupo_cor'):
-            if propriedade.grupo_cor in ['METRÔ', 'SERVIÇO']:
-                score += 1
+        if self.dificuldade == 'facil':
+            return ganho > 0
+        elif self.dificuldade == 'medio':
+            return ganho >= 25
+        elif self.dificuldade == 'dificil':
+            return ganho >= 50
         
-        return score
+        return False
     
     def decidir_compra_inteligente(self, bot_comprador, propriedade, preco_sugerido, banco):
         """
@@ -7,6 +7,7 @@ from cartas import (
     BaralhoCartas
 )
 from sistema_eventos import SistemaEventos, TipoEvento
+from registro import log
 
 class GerenciadorCartasAvancado:
     """
@@ -14,14 +15,15 @@ class GerenciadorCartasAvancado:
     Estende a funcionalidade básica de cartas com sistema de eventos.
     """
     
-    def __init__(self, sistema_eventos):
+    def __init__(self, sistema_eventos, rng=None):
         """
         Args:
             sistema_eventos: Instância do SistemaEventos
+            rng: Gerador de números aleatórios usado para embaralhar
         """
         self.sistema_eventos = sistema_eventos
-        self.baralho_sorte = BaralhoCartas('SORTE')
-        self.baralho_cofre = BaralhoCartas('COFRE')
+        self.baralho_sorte = BaralhoCartas('SORTE', rng=rng)
+        self.baralho_cofre = BaralhoCartas('COFRE', rng=rng)
         self.ultima_carta_sorte = None
         self.ultima_carta_cofre = None
     
@@ -46,8 +48,8 @@ class GerenciadorCartasAvancado:
         self.sistema_eventos.disparar_evento(
             TipoEvento.PEGAR_CARTA,
             jogador.nome,
-            f"Puxou carta de Sorte: {carta.descricao[:50]}...",
-            {'tipo_baralho': 'SORTE', 'descricao_completa': carta.descricao}
+            lambda: f"Puxou carta de Sorte: {carta.descricao[:50]}...",
+            lambda: {'tipo_baralho': 'SORTE', 'descricao_completa': carta.descricao}
         )
         
         # Executa a carta
@@ -80,8 +82,8 @@ class GerenciadorCartasAvancado:
         self.sistema_eventos.disparar_evento(
             TipoEvento.PEGAR_CARTA,
             jogador.nome,
-            f"Puxou carta de Cofre: {carta.descricao[:50]}...",
-            {'tipo_baralho': 'COFRE', 'descricao_completa': carta.descricao}
+            lambda: f"Puxou carta de Cofre: {carta.descricao[:50]}...",
+            lambda: {'tipo_baralho': 'COFRE', 'descricao_completa': carta.descricao}
         )
         
         # Executa a carta
@@ -110,7 +112,9 @@ class GerenciadorCartasAvancado:
             deve_retornar = carta.executar(jogador, jogo.banco, jogo.tabuleiro, jogo=jogo)
             
             # Dispara eventos específicos baseado no tipo de carta
-            if isinstance(carta, CartaDinheiro):
+            eventos = self.sistema_eventos
+            if isinstance(carta, CartaDinheiro) and eventos.tem_interesse(
+                    TipoEvento.PASSAGEM_SAIDA if carta.valor > 0 else TipoEvento.PAGAR_IMPOSTO):
                 if carta.valor > 0:
                     self.sistema_eventos.disparar_evento(
                         TipoEvento.PASSAGEM_SAIDA,  # Ou evento de ganho
@@ -126,7 +130,7 @@ class GerenciadorCartasAvancado:
                         {'valor': abs(carta.valor), 'tipo_baralho': tipo_baralho}
                     )
             
-            elif isinstance(carta, CartaPrisao):
+            elif isinstance(carta, CartaPrisao) and eventos.tem_interesse(TipoEvento.PRISAO):
                 self.sistema_eventos.disparar_evento(
                     TipoEvento.PRISAO,
                     jogador.nome,
@@ -134,7 +138,7 @@ class GerenciadorCartasAvancado:
                     {'tipo_baralho': tipo_baralho}
                 )
             
-            elif isinstance(carta, CartaLivrePrisao):
+            elif isinstance(carta, CartaLivrePrisao) and eventos.tem_interesse(TipoEvento.PEGAR_CARTA):
                 self.sistema_eventos.disparar_evento(
                     TipoEvento.PEGAR_CARTA,
                     jogador.nome,
@@ -150,7 +154,7 @@ class GerenciadorCartasAvancado:
             }
         
         except Exception as e:
-            print(f"  > ERRO ao executar carta: {e}")
+            log.erro("  > ERRO ao executar carta: %s", e)
             return {
                 "sucesso": False,
                 "erro": str(e),
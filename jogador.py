@@ -1,7 +1,17 @@
 # jogador.py
 # Módulo responsável pela classe Jogador, que armazena o estado e as ações de cada participante.
 
+from registro import log
+from tabuleiro import Tabuleiro
+
 class Jogador:
+    # Atributos fixos: sem __dict__ por instância (estados de jogo mais leves)
+    __slots__ = (
+        'nome', 'peca', 'posicao', 'propriedades', 'em_prisao', 'is_ia',
+        'cartas_livre_prisao', 'ultima_rolagem', 'turnos_na_prisao', 'falido',
+        'inventario_itens', 'contagem_grupos', 'mascara_monopolios'
+    )
+
     def __init__(self, nome, peca, is_ia=False):
         """
         Inicializa o jogador. O saldo será gerenciado pelo módulo 'banco'.
@@ -17,6 +27,9 @@ class Jogador:
         self.turnos_na_prisao = 0
         self.falido = False       # Flag que indica se o jogador está falido
         self.inventario_itens = {}  # Dicionário para armazenar itens especiais
+        # Contadores mantidos por adicionar/remover_propriedade (consultas O(1))
+        self.contagem_grupos = {}   # grupo -> nº de propriedades do grupo
+        self.mascara_monopolios = 0 # Bit do grupo ligado = monopólio (ver Tabuleiro.bit_grupo_padrao)
 
     def mover(self, dados_rolados):
         """
@@ -26,7 +39,7 @@ class Jogador:
         posicao_antiga = self.posicao
         self.posicao = (self.posicao + dados_rolados) % 40
         
-        print(f"  > {self.nome} rolou {dados_rolados} e moveu de {posicao_antiga} para a Casa {self.posicao}.")
+        log.info("  > %s rolou %s e moveu de %s para a Casa %s.", self.nome, dados_rolados, posicao_antiga, self.posicao)
         
         return posicao_antiga
 
@@ -37,7 +50,7 @@ class Jogador:
         """
         posicao_antiga = self.posicao
         self.posicao = posicao_destino % 40
-        print(f"  > {self.nome} foi movido de {posicao_antiga} para a Casa {self.posicao}.")
+        log.info("  > %s foi movido de %s para a Casa %s.", self.nome, posicao_antiga, self.posicao)
         return posicao_antiga
 
     def pode_mover(self):
@@ -52,13 +65,13 @@ class Jogador:
         self.em_prisao = True
         self.turnos_na_prisao = 0
         self.posicao = 10  # Posição da prisão
-        print(f"  > {self.nome} entrou na prisão!")
+        log.info("  > %s entrou na prisão!", self.nome)
 
     def sair_prisao(self):
         """Libera o jogador da prisão"""
         self.em_prisao = False
         self.turnos_na_prisao = 0
-        print(f"  > {self.nome} saiu da prisão!")
+        log.info("  > %s saiu da prisão!", self.nome)
 
     def incrementar_turno_prisao(self):
         """Incrementa o contador de turnos na prisão"""
@@ -71,29 +84,57 @@ class Jogador:
         """Adiciona uma propriedade comprada ou recebida à lista do jogador."""
         self.propriedades.append(propriedade)
         propriedade.proprietario = self
-        print(f"  > {self.nome} adquiriu a propriedade: {propriedade.nome}.")
+        self._atualizar_contagem_grupo(propriedade, 1)
+        log.info("  > %s adquiriu a propriedade: %s.", self.nome, propriedade.nome)
         
     def remover_propriedade(self, propriedade):
         """Remove uma propriedade (em caso de venda/hipoteca/falência)."""
         if propriedade in self.propriedades:
             self.propriedades.remove(propriedade)
             propriedade.proprietario = None
-            print(f"  > {self.nome} perdeu a propriedade: {propriedade.nome}.")
+            self._atualizar_contagem_grupo(propriedade, -1)
+            log.info("  > %s perdeu a propriedade: %s.", self.nome, propriedade.nome)
             return True
         return False
 
+    def _atualizar_contagem_grupo(self, propriedade, delta):
+        """Atualiza a contagem do grupo da propriedade e o bit de monopólio correspondente."""
+        grupo = getattr(propriedade, 'grupo_cor', None)
+        if grupo is None:
+            return
+        
+        quantidade = self.contagem_grupos.get(grupo, 0) + delta
+        self.contagem_grupos[grupo] = quantidade
+        
+        bit = Tabuleiro.bit_grupo_padrao(grupo)
+        if quantidade == Tabuleiro.tamanho_grupo_padrao(grupo):
+            self.mascara_monopolios |= bit
+        else:
+            self.mascara_monopolios &= ~bit
+
     def tem_propriedade(self, propriedade):
         """Verifica se o jogador possui uma propriedade específica"""
         return propriedade in self.propriedades
 
     def contar_propriedades_grupo(self, grupo):
         """Conta quantas propriedades de um grupo específico o jogador possui"""
-        return sum(1 for prop in self.propriedades if hasattr(prop, 'grupo_cor') and prop.grupo_cor == grupo)
+        return self.contagem_grupos.get(grupo, 0)
 
-    def tem_monopolio(self, grupo, total_grupo):
-        """Verifica se o jogador tem todas as propriedades de um grupo (monopólio)"""
+    def tem_monopolio(self, grupo, total_grupo=None):
+        """
+        Verifica se o jogador tem todas as propriedades de um grupo (monopólio).
+        Sem total_grupo, usa a máscara de monopólios do tabuleiro padrão.
+        """
+        if total_grupo is None:
+            return bool(self.mascara_monopolios & Tabuleiro.bit_grupo_padrao(grupo))
         return self.contar_propriedades_grupo(grupo) == total_grupo
 
+    def listar_grupos_monopolio(self):
+        """Retorna os grupos em que o jogador tem monopólio"""
+        if not self.mascara_monopolios:
+            return []
+        return [grupo for grupo in self.contagem_grupos if self.tem_monopolio(grupo)]
+
     def status_resumido(self, saldo):
         """
         Gera um resumo do estado do jogador para a Interface do Jogador (Requisito 04: Usabilidade).
@@ -113,18 +154,18 @@ class Jogador:
     def declarar_falencia(self):
         """Marca o jogador como falido"""
         self.falido = True
-        print(f"  > {self.nome} declarou falência!")
+        log.info("  > %s declarou falência!", self.nome)
 
     def adicionar_carta_livre_prisao(self, carta):
         """Adiciona uma carta 'Saia Livre da Prisão' ao inventário negociável"""
         self.cartas_livre_prisao.append(carta)
-        print(f"  > {self.nome} agora possui {len(self.cartas_livre_prisao)} carta(s) de 'Saia Livre da Prisão'")
+        log.info("  > %s agora possui %s carta(s) de 'Saia Livre da Prisão'", self.nome, len(self.cartas_livre_prisao))
 
     def usar_carta_livre_prisao(self):
         """Remove uma carta de 'Saia Livre da Prisão' do inventário ao usá-la"""
         if self.cartas_livre_prisao:
             carta = self.cartas_livre_prisao.pop(0)
-            print(f"  > {self.nome} usou a carta 'Saia Livre da Prisão'!")
+            log.info("  > %s usou a carta 'Saia Livre da Prisão'!", self.nome)
             return carta
         return None
 
@@ -137,13 +178,13 @@ class Jogador:
         if tipo_item not in self.inventario_itens:
             self.inventario_itens[tipo_item] = []
         self.inventario_itens[tipo_item].append(item)
-        print(f"  > {self.nome} adicionou ao inventário: {tipo_item}")
+        log.info("  > %s adicionou ao inventário: %s", self.nome, tipo_item)
 
     def usar_item(self, tipo_item):
         """Remove e retorna um item do inventário"""
         if tipo_item in self.inventario_itens and self.inventario_itens[tipo_item]:
             item = self.inventario_itens[tipo_item].pop(0)
-            print(f"  > {self.nome} usou o item: {tipo_item}")
+            log.info("  > %s usou o item: %s", self.nome, tipo_item)
             return item
         return None
 
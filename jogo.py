@@ -10,10 +10,10 @@ from tabuleiro import Tabuleiro
 from constantes import VALOR_PASSAGEM_SAIDA
 # Importações novas necessárias
 from propriedades import Propriedade, CasaCompanhia
-from casas import CasaImposto, CasaVAPrisao, CasaSorteReves, CasaCofre
+from casas import CasaImposto, CasaVAPrisao, CasaSorteReves, CasaCofre, VALOR_SORTEIO
 from cartas import BaralhoCartas, CartaDinheiro, CartaMovimento
 
-from dados import Dados
+from dados import Dados, DadosPreGerados
 from sistema_propostas import SistemaPropostas
 from construcao import GestorConstrucao
 from regras_propriedades import GestorPropriedades
@@ -23,44 +23,77 @@ from sistema_eventos import SistemaEventos, TipoEvento
 from integracao_cartas import GerenciadorCartasAvancado
 from gerenciador_inicializacao import GerenciadorInicializacao
 from exibidor_cartas import ExibidorCartas
-from negociador_propriedades import NegociadorPropriedades
-from ia_bot_negociacao import IIABotNegociacao
+from registro import log, INFO
+from aluguel import calcular_aluguel
 
 class Jogo:
     
-    def __init__(self, nomes_jogadores, num_humanos=None):
-        """Inicializa o Banco, o Tabuleiro e os Jogadores."""
-        if num_humanos is None:
-            num_humanos = len(nomes_jogadores)
+    def __init__(self, nomes_jogadores, num_humanos=None, lista_jogadores=None, headless=False,
+                 seed=None, rng=None, trocas_bots=True):
+        """
+        Inicializa o Banco, o Tabuleiro e os Jogadores.
+        
+        Args:
+            nomes_jogadores: Nomes dos jogadores humanos
+            num_humanos: Número de humanos (padrão: len(nomes_jogadores))
+            lista_jogadores: Lista pronta de jogadores (ver GerenciadorInicializacao);
+                             quando informada, ignora nomes_jogadores/num_humanos
+            headless: Modo sem interface (simulação): sem delays e sem turnos
+                      automáticos de bots em threads
+            seed: Semente da partida; a mesma seed reproduz a partida inteira
+            rng: Gerador random.Random já criado (tem prioridade sobre seed)
+            trocas_bots: Se False, os bots não buscam nem propõem trocas entre si
+                         (caminho rápido para simulações em massa)
+        """
+        # Fonte única de aleatoriedade da partida (dados, baralhos, casas e bots)
+        self.seed = seed
+        self.rng = rng if rng is not None else random.Random(seed)
         
-        GerenciadorInicializacao.validar_numero_jogadores(num_humanos)
-        lista_jogadores = GerenciadorInicializacao.gerar_lista_jogadores(num_humanos, nomes_jogadores)
+        if lista_jogadores is None:
+            if num_humanos is None:
+                num_humanos = len(nomes_jogadores)
+            
+            GerenciadorInicializacao.validar_numero_jogadores(num_humanos)
+            lista_jogadores = GerenciadorInicializacao.gerar_lista_jogadores(num_humanos, nomes_jogadores, rng=self.rng)
         
+        self.headless = headless
+        self.trocas_bots = trocas_bots
         self.banco = Banco()
-        self.tabuleiro = Tabuleiro()
+        self.tabuleiro = Tabuleiro(rng=self.rng)
         
-        self.dados_obj = Dados(num_dados=2)
-        self.baralho_sorte = BaralhoCartas('SORTE')
-        self.baralho_cofre = BaralhoCartas('COFRE')
+        # No modo headless os dados vêm de blocos pré-sorteados (mais rápido para simulações)
+        if headless:
+            self.dados_obj = DadosPreGerados(rng=self.rng)
+        else:
+            self.dados_obj = Dados(num_dados=2, rng=self.rng)
+        self.baralho_sorte = BaralhoCartas('SORTE', rng=self.rng)
+        self.baralho_cofre = BaralhoCartas('COFRE', rng=self.rng)
         self.gestor_prisao = GestorPrisao(self.banco)
         self.gestor_construcao = GestorConstrucao(self.tabuleiro, self.banco)
         self.gestor_propriedades = GestorPropriedades(self.banco, self.tabuleiro)
         self.sistema_propostas = SistemaPropostas(self.banco, self.tabuleiro)
+        self.banco.liquidador = self._cobrir_divida
+        self.banco.planejador_liquidacao = self._pode_cobrir_divida
         self.indice_turno_atual = 0
         self.jogo_finalizado = False
         
         self.jogadores = []
+        self.jogadores_falidos = []  # Em ordem de falência
         self.ultimo_d1 = 1 
         self.ultimo_d2 = 1 
         self.eh_duplo_ultimo = False
         self.duplas_consecutivas = 0
 
-        self.sistema_eventos = SistemaEventos()
-        self.gerenciador_bots = GerenciadorBots()
-        self.exibidor_cartas = ExibidorCartas(tempo_exibicao=2.0)
-        self.negociador_propriedades = NegociadorPropriedades(self.banco)
-        self.ia_bot_negociacao = IIABotNegociacao()
-        self.gerenciador_cartas_avancado = GerenciadorCartasAvancado(self.sistema_eventos)
+        # No modo headless ninguém lê o histórico: só tipos com callback são disparados
+        self.sistema_eventos = SistemaEventos(gravar=not headless)
+        self.gerenciador_bots = GerenciadorBots(rng=self.rng, seed=seed)
+        self.exibidor_cartas = ExibidorCartas(tempo_exibicao=0 if headless else 2.0)
+        # Subsistemas opcionais: criados (e seus módulos importados) no primeiro uso
+        self._liquidador = None
+        self._negociador_propriedades = None
+        self._ia_bot_negociacao = None
+        self._buscador_trocas = None
+        self.gerenciador_cartas_avancado = GerenciadorCartasAvancado(self.sistema_eventos, rng=self.rng)
         
         for info in lista_jogadores:
             novo_jogador = Jogador(info["nome"], info["peca"], is_ia=info["eh_bot"])
@@ -70,27 +103,63 @@ class Jogo:
             if info["eh_bot"]:
                 self.gerenciador_bots.criar_bot(info["nome"], info["dificuldade"])
         
-        self._registrar_callbacks_eventos()
+        if headless:
+            self.gerenciador_bots.tempo_resposta_ms = 0
+        
+        if not headless:
+            self._registrar_callbacks_eventos()
+
+    @property
+    def liquidador(self):
+        """Liquidador de dívidas (só é preciso quando um pagamento obrigatório não cabe no saldo)."""
+        if self._liquidador is None:
+            from liquidacao import Liquidador
+            self._liquidador = Liquidador(self.gestor_construcao, self.gestor_propriedades)
+        return self._liquidador
+
+    @property
+    def negociador_propriedades(self):
+        """Negociações de compra e venda entre jogadores."""
+        if self._negociador_propriedades is None:
+            from negociador_propriedades import NegociadorPropriedades
+            self._negociador_propriedades = NegociadorPropriedades(self.banco)
+        return self._negociador_propriedades
+
+    @property
+    def ia_bot_negociacao(self):
+        """Decisões dos bots sobre negociações e propostas de troca."""
+        if self._ia_bot_negociacao is None:
+            from ia_bot_negociacao import IIABotNegociacao
+            self._ia_bot_negociacao = IIABotNegociacao()
+        return self._ia_bot_negociacao
+
+    @property
+    def buscador_trocas(self):
+        """Busca de trocas propostas pelos bots."""
+        if self._buscador_trocas is None:
+            from busca_trocas import BuscadorTrocas
+            self._buscador_trocas = BuscadorTrocas()
+        return self._buscador_trocas
 
     def _registrar_callbacks_eventos(self):
         """Registra callbacks para eventos importantes do jogo"""
         # Monitora saldo crítico
         self.sistema_eventos.registrar_callback(
             TipoEvento.SALDO_CRITICO,
-            lambda e: print(f"  [ALERTA] {e.jogador} com saldo crítico!")
+            lambda e: log.aviso("  [ALERTA] %s com saldo crítico!", e.jogador)
         )
         
         # Monitora monopólios
         self.sistema_eventos.registrar_callback(
             TipoEvento.MONOPÓLIO_COMPLETADO,
-            lambda e: print(f"  [MONOPÓLIO] {e.jogador} completou monopólio!")
+            lambda e: log.info("  [MONOPÓLIO] %s completou monopólio!", e.jogador)
         )
 
     def rolar_dados(self):
         """Simula a rolagem de dois dados (2d6)."""
         total, valores, eh_duplo = self.dados_obj.rolar()
         
-        print(f"  > Dados rolados: {valores[0]} e {valores[1]}. Total: {total} ({'DUPLO!' if eh_duplo else 'Simples'})")
+        log.info("  > Dados rolados: %s e %s. Total: %s (%s)", valores[0], valores[1], total, 'DUPLO!' if eh_duplo else 'Simples')
         
         self.ultimo_d1 = valores[0]
         self.ultimo_d2 = valores[1]
@@ -106,7 +175,7 @@ class Jogo:
     def verificar_passagem_saida(self, jogador_obj, posicao_antiga, posicao_nova):
         """Verifica se o jogador passou pela casa 'Saída' e credita o valor."""
         if posicao_nova < posicao_antiga:
-            print(f"  > **PASSOU PELA SAÍDA!** Recebe R${VALOR_PASSAGEM_SAIDA}.")
+            log.info("  > **PASSOU PELA SAÍDA!** Recebe R$%s.", VALOR_PASSAGEM_SAIDA)
             self.banco.depositar(jogador_obj.nome, VALOR_PASSAGEM_SAIDA)
 
     def rolar_dados_e_mover(self):
@@ -117,12 +186,12 @@ class Jogo:
         jogador = self.jogadores[self.indice_turno_atual]
         posicao_antiga = jogador.posicao
         
-        print(f"\n==========================================")
-        print(f"TURNO DE: {jogador.nome} | Posição Inicial: {posicao_antiga}")
-        print(f"==========================================")
+        log.info("\n==========================================")
+        log.info("TURNO DE: %s | Posição Inicial: %s", jogador.nome, posicao_antiga)
+        log.info("==========================================")
         
         if jogador.is_ia:
-            print(f"  [BOT] {jogador.nome} está jogando...")
+            log.info("  [BOT] %s está jogando...", jogador.nome)
         
         if jogador.em_prisao:
             saiu, pode_mover, valor_movimento = self.gestor_prisao.processar_turno_prisao(jogador, self.dados_obj)
@@ -143,7 +212,7 @@ class Jogo:
             rolagem = self.rolar_dados()
             
             if self.duplas_consecutivas >= 3:
-                print(f"  > {jogador.nome} tirou 3 duplas seguidas! Vai para a prisão!")
+                log.info("  > %s tirou 3 duplas seguidas! Vai para a prisão!", jogador.nome)
                 self.gestor_prisao.enviar_prisao(jogador)
                 self.duplas_consecutivas = 0
                 self.eh_duplo_ultimo = False
@@ -194,10 +263,12 @@ class Jogo:
         jogador_atual = self.jogadores[self.indice_turno_atual]
 
         if isinstance(casa_atual, (CasaSorteReves, CasaCofre)):
-            casa_atual.acao_ao_cair(jogador_atual, self.banco)
+            if not casa_atual.acao_ao_cair(jogador_atual, self.banco):
+                if self.verificar_falencia(jogador_atual, divida=VALOR_SORTEIO, credor="Banco"):
+                    return self._resultado_acao("FALENCIA", "%s faliu!", jogador_atual.nome)
             
             # Se tiver sistema de cartas, executar aqui
-            print(f"\n  > ===== ACIONANDO BARALHO DE CARTAS =====")
+            log.info("\n  > ===== ACIONANDO BARALHO DE CARTAS =====")
             
             if isinstance(casa_atual, CasaSorteReves):
                 carta = self.baralho_sorte.pegar_carta()
@@ -207,7 +278,7 @@ class Jogo:
                 tipo_baralho = 'COFRE'
             
             if carta:
-                # Exibe carta por 2 segundos antes de executar
+                # Exibe a carta; o efeito é aplicado ao fim da exibição (ver atualizar)
                 resultado = self.exibidor_cartas.executar_carta_apos_delay(
                     carta, jogador_atual, self.banco, self
                 )
@@ -220,7 +291,8 @@ class Jogo:
                     "tipo": "CARTA",
                     "mensagem": carta.descricao,
                     "tipo_baralho": tipo_baralho,
-                    "tempo_exibicao": 2.0
+                    "tempo_exibicao": resultado["exibicao"]["tempo_exibicao"],
+                    "pendente": resultado["execucao"] is None
                 }
             else:
                 return {"tipo": "CARTA", "mensagem": "Erro ao puxar carta"}
@@ -228,10 +300,12 @@ class Jogo:
         # Ação de Imposto ou Vá para Prisão
         if isinstance(casa_atual, CasaVAPrisao):
             self.gestor_prisao.enviar_prisao(jogador_atual)
-            return {"tipo": "PRISAO", "mensagem": f"{jogador_atual.nome} foi para a prisão!"}
+            return self._resultado_acao("PRISAO", "%s foi para a prisão!", jogador_atual.nome)
         elif isinstance(casa_atual, CasaImposto):
-            casa_atual.acao_ao_cair(jogador_atual, self.banco)
-            return {"tipo": "IMPOSTO", "mensagem": f"Pagou R${casa_atual.valor} de imposto"}
+            if not casa_atual.acao_ao_cair(jogador_atual, self.banco):
+                if self.verificar_falencia(jogador_atual, divida=casa_atual.valor, credor="Banco"):
+                    return self._resultado_acao("FALENCIA", "%s faliu!", jogador_atual.nome)
+            return self._resultado_acao("IMPOSTO", "Pagou R$%s de imposto", casa_atual.valor)
         
         # Ação de Pagar Aluguel
         elif (isinstance(casa_atual, Propriedade) and 
@@ -239,18 +313,41 @@ class Jogo:
               casa_atual.proprietario != jogador_atual):
             
             rolagem_para_aluguel = self.ultimo_d1 + self.ultimo_d2
-            aluguel = casa_atual.calcular_aluguel(rolagem_dados=rolagem_para_aluguel) 
+            aluguel = calcular_aluguel(casa_atual, rolagem_para_aluguel)
             
-            print(f"  > Pagando aluguel de R${aluguel} para {casa_atual.proprietario.nome}...")
-            sucesso = self.banco.pagar(jogador_atual.nome, aluguel, casa_atual.proprietario.nome)
+            log.info("  > Pagando aluguel de R$%s para %s...", aluguel, casa_atual.proprietario.nome)
+            sucesso = self.banco.pagar(jogador_atual.nome, aluguel, casa_atual.proprietario.nome, obrigatorio=True)
             
             if not sucesso:
-                self.verificar_falencia(jogador_atual)
+                if self.verificar_falencia(jogador_atual, divida=aluguel, credor=casa_atual.proprietario.nome):
+                    return self._resultado_acao("FALENCIA", "%s faliu!", jogador_atual.nome)
             
-            return {"tipo": "ALUGUEL", "mensagem": f"Pagou R${aluguel} de aluguel"}
+            return self._resultado_acao("ALUGUEL", "Pagou R$%s de aluguel", aluguel)
         
         return None
 
+    def _resultado_acao(self, tipo, formato, *args):
+        """
+        Resultado de executar_acao_automatica para o frontend. A mensagem só é formatada
+        fora do modo headless, onde ninguém a lê.
+        """
+        if self.headless:
+            return {"tipo": tipo}
+        return {"tipo": tipo, "mensagem": formato % args}
+
+    def atualizar(self, dt):
+        """
+        Avança os elementos temporizados da partida (exibição de cartas).
+        Chamado a cada quadro pelo laço da interface.
+        
+        Args:
+            dt: Segundos desde o último quadro
+            
+        Returns:
+            dict: Resultado da carta cujo efeito foi aplicado neste quadro, ou None
+        """
+        return self.exibidor_cartas.atualizar(dt)
+
     def executar_compra(self):
         """
         Etapa 3 (Opcional): Chamado pelo frontend quando o jogador
@@ -266,10 +363,10 @@ class Jogo:
         if self.banco.pagar(jogador_atual.nome, propriedade.preco_compra, recebedor="Banco"):
             propriedade.proprietario = jogador_atual
             jogador_atual.adicionar_propriedade(propriedade)
-            print(f"  > {jogador_atual.nome} comprou {propriedade.nome}!")
+            log.info("  > %s comprou %s!", jogador_atual.nome, propriedade.nome)
             return True
         else:
-            print(f"  > {jogador_atual.nome} não tem saldo para comprar {propriedade.nome}.")
+            log.aviso("  > %s não tem saldo para comprar %s.", jogador_atual.nome, propriedade.nome)
             return False # Saldo insuficiente
 
     def comprar_propriedade(self, jogador, propriedade):
@@ -298,9 +395,13 @@ class Jogo:
         if not self.eh_duplo_ultimo:
             self.indice_turno_atual = (self.indice_turno_atual + 1) % len(self.jogadores)
             self.duplas_consecutivas = 0  # Reset doubles counter
-            print(f"  > Turno finalizado. Próximo jogador: {self.jogadores[self.indice_turno_atual].nome}")
+            log.info("  > Turno finalizado. Próximo jogador: %s", self.jogadores[self.indice_turno_atual].nome)
         else:
-            print(f"  > Jogou dados duplos! Joga novamente.")
+            log.info("  > Jogou dados duplos! Joga novamente.")
+        
+        # No modo headless quem conduz os turnos é o chamador (ex: SimuladorPartidas)
+        if self.headless:
+            return
         
         if self.jogadores:
             proximo_jogador = self.jogadores[self.indice_turno_atual]
@@ -309,23 +410,48 @@ class Jogo:
         
         self.status_geral()
 
-    def verificar_falencia(self, jogador):
-        """Verifica se o jogador está falido e o remove do jogo"""
+    def _cobrir_divida(self, nome_jogador, valor_faltante):
+        """Liquidador do banco: vende casas/hipoteca (menor perda) para cobrir um pagamento obrigatório."""
+        for jogador in self.jogadores:
+            if jogador.nome == nome_jogador:
+                return self.liquidador.liquidar(jogador, valor_faltante)
+        return False
+
+    def _pode_cobrir_divida(self, nome_jogador, valor_faltante):
+        """Planejador do banco: indica se o liquidador cobre a dívida, sem vender nada."""
+        for jogador in self.jogadores:
+            if jogador.nome == nome_jogador:
+                return self.liquidador.planejar(jogador, valor_faltante) is not None
+        return False
+
+    def verificar_falencia(self, jogador, divida=0, credor="Banco"):
+        """
+        Verifica se o jogador está falido e o remove do jogo.
+        Com uma dívida, está falido se nem liquidando tudo (Liquidador) consegue pagá-la;
+        sem dívida, se não tem saldo nem nada para liquidar. O saldo restante do falido
+        vai para o credor.
+        """
         saldo = self.banco.consultar_saldo(jogador.nome)
+        valor_liquidavel = self.liquidador.valor_liquidavel(jogador)
         
-        # Calculate property value
-        valor_propriedades = sum(
-            prop.valor_hipoteca for prop in jogador.propriedades 
-            if hasattr(prop, 'valor_hipoteca') and not getattr(prop, 'hipotecada', False)
-        )
+        if divida:
+            falido = saldo + valor_liquidavel < divida
+        else:
+            falido = saldo <= 0 and valor_liquidavel == 0
         
-        if saldo <= 0 and valor_propriedades == 0:
-            print(f"\n{'='*50}")
-            print(f"FALÊNCIA! {jogador.nome} está fora do jogo!")
-            print(f"{'='*50}\n")
+        if falido:
+            log.info("\n==================================================")
+            log.info("FALÊNCIA! %s está fora do jogo!", jogador.nome)
+            log.info("==================================================\n")
             
             jogador.declarar_falencia()
             
+            # Saldo restante para o credor (transação registrada no livro-razão)
+            if saldo > 0:
+                transacao = self.banco.iniciar_transacao("Falência")  # O falido é a origem da perna
+                transacao.transferir(jogador.nome, credor, saldo)
+                transacao.confirmar()
+            
             # Return properties to bank
             for prop in jogador.propriedades[:]:
                 jogador.remover_propriedade(prop)
@@ -337,12 +463,18 @@ class Jogo:
             
             # Remove player
             if jogador in self.jogadores:
+                indice = self.jogadores.index(jogador)
                 self.jogadores.remove(jogador)
-            
-            # Adjust turn index
-            if self.indice_turno_atual >= len(self.jogadores) and self.jogadores:
-                self.indice_turno_atual = 0
-            
+                self.jogadores_falidos.append(jogador)
+
+                # Adjust turn index: quem estava depois do falido subiu uma posição na lista,
+                # então o índice volta uma casa para finalizar_turno chegar ao próximo jogador
+                if indice == self.indice_turno_atual:
+                    self.eh_duplo_ultimo = False  # O falido não joga de novo pelos dados duplos
+                    self.duplas_consecutivas = 0
+                if indice <= self.indice_turno_atual and self.jogadores:
+                    self.indice_turno_atual = (self.indice_turno_atual - 1) % len(self.jogadores)
+
             return True
         
         return False
@@ -352,22 +484,25 @@ class Jogo:
         if len(self.jogadores) <= 1:
             self.jogo_finalizado = True
             if self.jogadores:
-                print(f"\n{'='*50}")
-                print(f"FIM DE JOGO!")
-                print(f"VENCEDOR: {self.jogadores[0].nome}")
-                print(f"{'='*50}\n")
+                log.info("\n==================================================")
+                log.info("FIM DE JOGO!")
+                log.info("VENCEDOR: %s", self.jogadores[0].nome)
+                log.info("==================================================\n")
             return True
         return False
 
     def status_geral(self):
         """Exibe o status de todos os jogadores."""
-        print("\n--- STATUS GERAL DOS JOGADORES ---")
+        if not log.ativo(INFO):
+            return
+        
+        log.info("\n--- STATUS GERAL DOS JOGADORES ---")
         for jogador in self.jogadores:
             saldo = self.banco.consultar_saldo(jogador.nome)
             status = jogador.status_resumido(saldo)
             if jogador.em_prisao:
                 status += f" [PRISÃO: {jogador.turnos_na_prisao}/3]"
-            print(status)
+            log.info("%s", status)
 
     def propor_troca(self, jogador_ofertante, jogador_receptor, propriedades_ofertadas, propriedades_recebidas):
         """
@@ -437,6 +572,53 @@ class Jogo:
         else:
             return self.negociador_propriedades.recusar_negociacao(negociacao)
 
+    def executar_negociacoes_bot(self, jogador_bot):
+        """
+        O bot busca a melhor troca com os outros bots (BuscadorTrocas) e a propõe pelo
+        SistemaPropostas; o destinatário decide pela IIABotNegociacao. Bots 'facil' não propõem,
+        e ninguém propõe quando a partida foi criada com trocas_bots=False.
+        
+        Returns:
+            bool: True se uma troca foi executada
+        """
+        if not self.trocas_bots:
+            return False
+        bot = self.gerenciador_bots.bots.get(jogador_bot.nome)
+        if bot is None or bot.dificuldade == 'facil':
+            return False
+        
+        adversarios = [j for j in self.jogadores
+                       if j is not jogador_bot and j.nome in self.gerenciador_bots.bots]
+        proposta = self.buscador_trocas.propor(self.sistema_propostas, jogador_bot, adversarios, self.banco)
+        if proposta is None:
+            return False
+        
+        log.info("%s", self.sistema_propostas.obter_resumo_proposta())
+        destinatario = proposta["destinatario"]
+        bot_destinatario = self.gerenciador_bots.bots[destinatario.nome]
+        if bot_destinatario.avaliador:
+            # Bots 'mcts' decidem pelos rollouts do AvaliadorMonteCarlo
+            aceita = bot_destinatario.avaliador.decidir_proposta(self, destinatario, proposta)
+        else:
+            aceita = self.ia_bot_negociacao.decidir_proposta(destinatario, proposta, self.banco)
+        if not aceita:
+            self.sistema_propostas.recusar_proposta()
+            return False
+        
+        if not self.sistema_propostas.aceitar_proposta():
+            self.sistema_propostas.recusar_proposta()
+            return False
+        if not self.sistema_eventos.tem_interesse(TipoEvento.TRANSFERENCIA_PROPRIEDADE):
+            return True
+        for prop in proposta["props_oferecidas"] + proposta["props_solicitadas"]:
+            self.sistema_eventos.disparar_evento(
+                TipoEvento.TRANSFERENCIA_PROPRIEDADE,
+                prop.proprietario.nome,
+                f"{prop.proprietario.nome} recebeu {prop.nome} em troca",
+                {'propriedade': prop.nome}
+            )
+        return True
+
     def hipotecar_propriedade(self, jogador, propriedade):
         """Hipoteca uma propriedade do jogador."""
         return self.gestor_propriedades.hipotecar_propriedade(jogador, propriedade)
@@ -445,53 +627,76 @@ class Jogo:
         """Deshipoteca uma propriedade do jogador."""
         return self.gestor_propriedades.deshipotecar_propriedade(jogador, propriedade)
 
+    def _pausar(self, segundos):
+        """Pausa entre ações de bot para a interface acompanhar (ignorado no modo headless)."""
+        if not self.headless:
+            import time
+            time.sleep(segundos)
+
+    def _executar_etapas_turno_bot(self, jogador_bot):
+        """
+        Executa as etapas de um turno de bot: rolar, agir na casa e finalizar.
+        Usado tanto pela thread da interface quanto pela simulação headless.
+        """
+        self._pausar(0.5)
+        
+        # 1. Rolar dados e mover
+        casa_atual = self.rolar_dados_e_mover()
+        self._pausar(0.3)  # Reduzido para 300ms para animação dos dados
+        
+        # 2. Obter ação necessária
+        acao = self.obter_acao_para_casa(casa_atual)
+        
+        # 3. Executar ações automáticas (Sorte, Cofre, Imposto, Aluguel, etc)
+        if acao["tipo"] in ("ACAO_AUTOMATICA", "PAGAR_ALUGUEL", "PEGAR_CARTA"):
+            self.executar_acao_automatica(casa_atual)
+            # A carta fica à mostra até o laço da interface aplicar o efeito
+            if self.exibidor_cartas.em_exibicao:
+                self.exibidor_cartas.aguardar_conclusao()
+            self._pausar(0.3)
+        
+        # 4. Para decisões de compra, usar bot
+        elif acao["tipo"] == "DECISAO_COMPRA":
+            resultado_bot = self.gerenciador_bots.executar_turno_bot(jogador_bot, self)
+            if resultado_bot.get("sucesso"):
+                registrar_compra = self.sistema_eventos.tem_interesse(TipoEvento.COMPRA_PROPRIEDADE)
+                for acao_bot in resultado_bot.get("acoes", []):
+                    log.info("    [BOT AÇÃO] %s", acao_bot)
+                    self._pausar(0.3)
+                    if registrar_compra:
+                        self.sistema_eventos.disparar_evento(
+                            TipoEvento.COMPRA_PROPRIEDADE,
+                            jogador_bot.nome,
+                            f"Bot comprou {acao_bot.get('propriedade')}",
+                            {'propriedade': acao_bot.get('propriedade')}
+                        )
+        
+        # 5. Propor trocas a outros bots e 6. construir nos monopólios (plano aplicado em lote),
+        # a menos que o bot tenha falido nas ações da casa
+        if not jogador_bot.falido:
+            self.executar_negociacoes_bot(jogador_bot)
+            self.gerenciador_bots.executar_construcoes_bot(jogador_bot, self)
+        
+        # 7. Finalizar turno com delay
+        self._pausar(0.3)
+        self.finalizar_turno()
+
     def _executar_turno_automatico_bot(self, jogador_bot):
         """
         Executa turno do bot com delays usando threading para evitar travamento.
         Permite que o jogo continue respondendo normalmente enquanto o bot joga.
         """
         import threading
-        import time
         
         def executar_bot_thread():
             """Executa o turno do bot em thread separada"""
             global turno_bot_em_execucao
             
-            print(f"\n  [BOT AUTO] Iniciando turno automático para {jogador_bot.nome}...")
+            log.info("\n  [BOT AUTO] Iniciando turno automático para %s...", jogador_bot.nome)
             turno_bot_em_execucao = True  # Desabilita HUD durante bot turn
             
             try:
-                time.sleep(0.5)
-                
-                # 1. Rolar dados e mover
-                casa_atual = self.rolar_dados_e_mover()
-                time.sleep(0.3)
-                
-                # 2. Obter ação necessária
-                acao = self.obter_acao_para_casa(casa_atual)
-                
-                # 3. Executar ações automáticas
-                if acao["tipo"] == "ACAO_AUTOMATICA":
-                    self.executar_acao_automatica(casa_atual)
-                    time.sleep(0.3)
-                
-                # 4. Para decisões de compra, usar bot
-                elif acao["tipo"] == "DECISAO_COMPRA":
-                    resultado_bot = self.gerenciador_bots.executar_turno_bot(jogador_bot, self)
-                    if resultado_bot.get("sucesso"):
-                        for acao_bot in resultado_bot.get("acoes", []):
-                            print(f"    [BOT AÇÃO] {acao_bot}")
-                            time.sleep(0.3)
-                            self.sistema_eventos.disparar_evento(
-                                TipoEvento.COMPRA_PROPRIEDADE,
-                                jogador_bot.nome,
-                                f"Bot comprou {acao_bot.get('propriedade')}",
-                                {'propriedade': acao_bot.get('propriedade')}
-                            )
-                
-                # 5. Finalizar turno com delay
-                time.sleep(0.3)
-                self.finalizar_turno()
+                self._executar_etapas_turno_bot(jogador_bot)
             finally:
                 turno_bot_em_execucao = False  # Reabilita HUD após bot terminar
         
@@ -502,41 +707,9 @@ class Jogo:
         """
         Executa o turno de um bot de forma não-bloqueante com delays entre ações.
         Permite que o jogo continue respondendo enquanto o bot joga.
+        No modo headless os delays são ignorados.
         """
-        import time
-        
-        # Delay inicial antes de iniciar o turno do bot
-        time.sleep(0.5)
-        
-        # 1. Rolar dados e mover
-        casa_atual = self.rolar_dados_e_mover()
-        time.sleep(0.3)  # Reduzido para 300ms para animação dos dados
-        
-        # 2. Obter ação necessária
-        acao = self.obter_acao_para_casa(casa_atual)
-        
-        # 3. Executar ações automáticas (Sorte, Cofre, Imposto, etc)
-        if acao["tipo"] == "ACAO_AUTOMATICA":
-            resultado = self.executar_acao_automatica(casa_atual)
-            time.sleep(0.3)
-        
-        # 4. Para decisões de compra, usar bot
-        elif acao["tipo"] == "DECISAO_COMPRA":
-            resultado_bot = self.gerenciador_bots.executar_turno_bot(jogador_bot, self)
-            if resultado_bot.get("sucesso"):
-                for acao_bot in resultado_bot.get("acoes", []):
-                    print(f"    [BOT AÇÃO] {acao_bot}")
-                    time.sleep(0.3)
-                    self.sistema_eventos.disparar_evento(
-                        TipoEvento.COMPRA_PROPRIEDADE,
-                        jogador_bot.nome,
-                        f"Bot comprou {acao_bot.get('propriedade')}",
-                        {'propriedade': acao_bot.get('propriedade')}
-                    )
-        
-        # 5. Finalizar turno com delay
-        time.sleep(0.3)
-        self.finalizar_turno()
+        self._executar_etapas_turno_bot(jogador_bot)
 
     def obter_estatisticas_eventos(self, nome_jogador=None):
         """Retorna estatísticas baseadas em eventos"""
@@ -544,6 +717,6 @@ class Jogo:
             return self.sistema_eventos.obter_estatisticas_jogador(nome_jogador)
         else:
             return {
-                'total_eventos': len(self.sistema_eventos.eventos),
-                'tipos_eventos': list(set(e.tipo.value for e in self.sistema_eventos.eventos))
+                'total_eventos': self.sistema_eventos.contar_eventos(),
+                'tipos_eventos': [tipo.value for tipo in self.sistema_eventos.tipos_registrados()]
             }
@@ -0,0 +1,189 @@
+# liquidacao.py
+# Liquidação de dívidas antes da falência: quando um pagamento obrigatório não cabe no saldo,
+# escolhe quais casas vender (GestorConstrucao.vender_casa) e quais propriedades hipotecar
+# (GestorPropriedades.hipotecar_propriedade) para cobrir a dívida perdendo o menor valor
+# possível. A escolha é uma mochila de múltipla escolha: uma opção por grupo de cor.
+
+from collections import namedtuple
+from itertools import combinations
+from math import gcd
+
+from construcao import GestorConstrucao
+from avaliacao import ServicoAvaliacao
+
+
+# Opção de liquidação de um grupo: quantas casas vender e quais propriedades hipotecar
+OpcaoLiquidacao = namedtuple(
+    "OpcaoLiquidacao",
+    [
+        "grupo_cor",       # Grupo de cor da opção
+        "dinheiro",        # Dinheiro levantado
+        "perda",           # Valor perdido além do dinheiro levantado (ServicoAvaliacao)
+        "casas_vendidas",  # Nº de casas vendidas, sempre das propriedades mais construídas
+        "hipotecas",       # Propriedades a hipotecar depois das vendas
+    ]
+)
+
+
+class Liquidador:
+    """
+    Planeja e executa a liquidação de ativos de um jogador para cobrir uma dívida.
+
+    A perda de uma opção é a queda do valor do grupo (ServicoAvaliacao) menos o dinheiro
+    levantado: vender uma casa perde metade do custo mais o aluguel que ela renderia;
+    hipotecar perde só o aluguel da propriedade.
+    """
+
+    def __init__(self, gestor_construcao, gestor_propriedades, avaliacao=None):
+        """
+        Args:
+            gestor_construcao: GestorConstrucao (venda de casas)
+            gestor_propriedades: GestorPropriedades (hipotecas)
+            avaliacao: ServicoAvaliacao (padrão: instância compartilhada)
+        """
+        self.gestor_construcao = gestor_construcao
+        self.gestor_propriedades = gestor_propriedades
+        self.avaliacao = avaliacao if avaliacao is not None else ServicoAvaliacao.padrao()
+
+    def valor_liquidavel(self, jogador):
+        """Dinheiro máximo que o jogador levanta vendendo todas as casas e hipotecando tudo."""
+        total = 0
+        for propriedade in jogador.propriedades:
+            if propriedade.casas:
+                total += propriedade.casas * (GestorConstrucao.CUSTO_CONSTRUCAO.get(propriedade.grupo_cor, 100) // 2)
+            if not propriedade.hipotecada:
+                total += propriedade.valor_hipoteca
+        return total
+
+    def planejar(self, jogador, valor_necessario):
+        """
+        Escolhe a combinação de vendas e hipotecas de menor perda que levanta o valor.
+
+        Args:
+            jogador: Jogador devedor
+            valor_necessario: Dinheiro que falta para o pagamento
+
+        Returns:
+            list: Uma OpcaoLiquidacao por grupo usado, ou None se nem tudo cobre a dívida
+        """
+        if valor_necessario <= 0:
+            return []
+
+        grupos = self.avaliacao.tabelas.grupos
+        por_grupo = {}
+        for propriedade in jogador.propriedades:
+            por_grupo.setdefault(grupos[propriedade.posicao], []).append(propriedade)
+        opcoes_por_grupo = [self._opcoes_grupo(grupo, props) for grupo, props in por_grupo.items()]
+
+        # Unidade da mochila: mdc dos valores levantados (todos múltiplos de 5 no tabuleiro padrão)
+        unidade = 0
+        for opcoes in opcoes_por_grupo:
+            for opcao in opcoes:
+                unidade = gcd(unidade, opcao.dinheiro)
+        if unidade == 0:
+            return None
+        alvo = -(-valor_necessario // unidade)
+
+        # melhor[dinheiro] = (perda, escolhas); dinheiro em unidades, limitado ao alvo
+        melhor = {0: (0.0, ())}
+        for opcoes in opcoes_por_grupo:
+            proximo = dict(melhor)
+            for dinheiro, (perda, escolhas) in melhor.items():
+                for opcao in opcoes:
+                    novo = min(alvo, dinheiro + opcao.dinheiro // unidade)
+                    nova_perda = perda + opcao.perda
+                    if novo not in proximo or nova_perda < proximo[novo][0]:
+                        proximo[novo] = (nova_perda, escolhas + (opcao,))
+            melhor = proximo
+
+        if alvo not in melhor:
+            return None
+        return list(melhor[alvo][1])
+
+    def _opcoes_grupo(self, grupo, props):
+        """Opções de um grupo: vender 0..N casas (das mais construídas) e hipotecar um subconjunto."""
+        avaliacao = self.avaliacao
+        indice = avaliacao.indice_no_grupo
+        chave = avaliacao.chave_conjunto(props)[grupo]
+        valor_atual = sum(avaliacao.valor_grupo(grupo, *chave))
+        mascara = chave[0]
+        venda_casa = GestorConstrucao.CUSTO_CONSTRUCAO.get(props[0].grupo_cor, 100) // 2
+
+        opcoes = []
+        casas = {p: p.casas for p in props}
+        total_casas = sum(casas.values())
+        for vendidas in range(total_casas + 1):
+            if vendidas:
+                mais_construida = max(props, key=casas.__getitem__)
+                casas[mais_construida] -= 1
+
+            tupla_casas = [0] * len(avaliacao.tabelas.posicoes_grupo[grupo])
+            for p in props:
+                tupla_casas[indice[p.posicao]] = casas[p]
+            tupla_casas = tuple(tupla_casas) if any(tupla_casas) else None
+
+            hipotecaveis = [p for p in props if not p.hipotecada and casas[p] == 0]
+            for quantidade in range(len(hipotecaveis) + 1):
+                for hipotecas in combinations(hipotecaveis, quantidade):
+                    if not vendidas and not hipotecas:
+                        continue
+                    bits = chave[2]
+                    for p in hipotecas:
+                        bits |= 1 << indice[p.posicao]
+                    dinheiro = vendidas * venda_casa + sum(p.valor_hipoteca for p in hipotecas)
+                    valor_novo = sum(avaliacao.valor_grupo(grupo, mascara, tupla_casas, bits))
+                    opcoes.append(OpcaoLiquidacao(props[0].grupo_cor, dinheiro,
+                                                  valor_atual - valor_novo - dinheiro, vendidas, hipotecas))
+        return opcoes
+
+    def liquidar(self, jogador, valor_necessario):
+        """
+        Planeja e executa a liquidação. Se os ativos não cobrem a dívida, nada é vendido.
+
+        Returns:
+            bool: True se o jogador levantou o valor necessário
+        """
+        plano = self.planejar(jogador, valor_necessario)
+        if plano is None:
+            return False
+
+        for opcao in plano:
+            for _ in range(opcao.casas_vendidas):
+                do_grupo = [p for p in jogador.propriedades if p.grupo_cor == opcao.grupo_cor]
+                self.gestor_construcao.vender_casa(jogador, max(do_grupo, key=lambda p: p.casas))
+            for propriedade in opcao.hipotecas:
+                self.gestor_propriedades.hipotecar_propriedade(jogador, propriedade)
+        return True
+
+
+if __name__ == '__main__':
+    from tabuleiro import Tabuleiro
+    from jogador import Jogador
+    from banco import Banco
+    from regras_propriedades import GestorPropriedades
+    from registro import log, DESLIGADO
+
+    log.definir_nivel(DESLIGADO)
+    print("--- Teste do Módulo Liquidador ---")
+    tabuleiro = Tabuleiro()
+    banco = Banco()
+    jogador = Jogador("Ana", "Carro")
+    banco.inicializar_conta(jogador.nome)
+    banco.ajustar_saldo(jogador.nome, 0)
+    for grupo in ("Laranja", "METRÔ"):
+        for propriedade in tabuleiro.listar_propriedades_por_grupo(grupo):
+            jogador.adicionar_propriedade(propriedade)
+            propriedade.proprietario = jogador
+    for propriedade in tabuleiro.listar_propriedades_por_grupo("Laranja"):
+        propriedade.casas = 3
+
+    liquidador = Liquidador(GestorConstrucao(tabuleiro, banco), GestorPropriedades(banco, tabuleiro))
+    print(f"Valor liquidável: R${liquidador.valor_liquidavel(jogador)}")
+    for divida in (100, 400, 900, 5000):
+        plano = liquidador.planejar(jogador, divida)
+        if plano is None:
+            print(f"Dívida R${divida}: impossível cobrir (falência)")
+            continue
+        descricao = [f"{o.casas_vendidas} casa(s) + hipoteca {[p.nome for p in o.hipotecas]}" for o in plano]
+        print(f"Dívida R${divida}: levanta R${sum(o.dinheiro for o in plano)}, "
+              f"perda R${sum(o.perda for o in plano):.0f} -> {descricao}")
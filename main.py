@@ -1,53 +1,36 @@
+# main.py
+# Interface gráfica do jogo (pygame). Importar este módulo não abre janela nem carrega recursos:
+# a interface é montada em main(), e o motor do jogo (jogo.py) só é importado ao iniciar uma partida.
+
 import pygame
 import sys
-import os
 import random
-from jogo import Jogo
 from propriedades import Propriedade
 from menu import MenuInicial, TelaFimDeJogo
 from posicoes_board import POSICOES_CASAS_PRECISAS, OFFSETS_POR_JOGADOR
+from cache_texto import renderizar_texto
+from renderizador import RenderizadorCamadas
+from recursos import recursos
 
-# --- 1. Inicialização e Configurações ---
-pygame.init()
-pygame.font.init()
-
-try:
-    FONTE_PADRAO = pygame.font.SysFont('Arial', 18)
-    FONTE_PEQUENA = pygame.font.SysFont('Arial', 13)
-    FONTE_GRANDE = pygame.font.SysFont('Arial', 26)
-    FONTE_MEDIA = pygame.font.SysFont('Arial', 18)
-except Exception as e:
-    print(f"Erro ao carregar fonte: {e}. Usando fonte padrão.")
-    FONTE_PADRAO = pygame.font.Font(None, 18)
-    FONTE_PEQUENA = pygame.font.Font(None, 13)
-    FONTE_GRANDE = pygame.font.Font(None, 26)
-    FONTE_MEDIA = pygame.font.Font(None, 18)
-
+# --- 1. Configurações ---
 LARGURA_TELA = 1600
 ALTURA_TELA = 900
 flags = pygame.FULLSCREEN | pygame.SCALED
-
-screen = pygame.display.set_mode((LARGURA_TELA, ALTURA_TELA), flags)
-pygame.display.set_caption("Monopoly")
 COR_FUNDO = (10, 10, 20)
 
+# Janela, fontes e imagens: criadas por inicializar_interface()
+screen = None
+FONTE_PADRAO = FONTE_PEQUENA = FONTE_GRANDE = FONTE_MEDIA = None
+tabuleiro_img = None
+
 # --- Carregamento de Assets ---
 def carregar_imagem(nome_arquivo, alpha=False):
-    """Carrega uma imagem da pasta 'assets'."""
-    caminho_completo = os.path.join(os.path.dirname(__file__), 'assets', nome_arquivo)
+    """Carrega uma imagem da pasta 'assets' (uma única vez, já convertida para o formato da tela)."""
     try:
-        imagem = pygame.image.load(caminho_completo)
-    except pygame.error as e:
+        return recursos.imagem(nome_arquivo, alpha=alpha)
+    except (FileNotFoundError, pygame.error) as e:
         print(f"Erro ao carregar imagem '{nome_arquivo}': {e}")
         sys.exit()
-    
-    if alpha:
-        return imagem.convert_alpha()
-    else:
-        return imagem.convert()
-
-# --- Carregando as imagens ---
-tabuleiro_img = carregar_imagem('tabuleiro.png')
 
 BOARD_IMG_WIDTH = 768
 BOARD_IMG_HEIGHT = 768
@@ -90,12 +73,6 @@ AJUSTE_CONSTRUCOES_Y = 0       # Aumentar para mover construções para BAIXO
 AJUSTE_HUD_X = 0
 # AJUSTE_HUD_Y = 0 # Removed and replaced by the above
 
-print(f"[v0] Board image size: {BOARD_IMG_WIDTH}x{BOARD_IMG_HEIGHT}")
-print(f"[v0] Board position on screen: ({X_TABULEIRO}, {Y_TABULEIRO})")
-print(f"[v0] Pawn adjustment: ({AJUSTE_GLOBAL_PEOES_X}, {AJUSTE_GLOBAL_PEOES_Y})")
-print(f"[v0] HUD adjustment: ({HUD_MENU_X}, {HUD_MENU_Y})")
-print(f"[v0] Construction adjustment: ({AJUSTE_CONSTRUCOES_X}, {AJUSTE_CONSTRUCOES_Y})")
-
 # The board has 40 squares: 11 on each side (including corners)
 # Bottom row: positions 0-10 (right to left)
 # Left row: positions 11-19 (bottom to top) 
@@ -158,41 +135,10 @@ REGULAR_SIZE = 63  # Regular property squares
 #     (690, 627),   # 39: Rua Oscar Freire
 # ]
 
-print(f"[v0] Generated {len(POSICOES_CASAS_PRECISAS)} position coordinates")
-print(f"[v0] Position 0 (Start): {POSICOES_CASAS_PRECISAS[0]}")
-print(f"[v0] Position 10 (Jail): {POSICOES_CASAS_PRECISAS[10]}")
-print(f"[v0] Position 20 (Free Parking): {POSICOES_CASAS_PRECISAS[20]}")
-print(f"[v0] Position 30 (Go to Jail): {POSICOES_CASAS_PRECISAS[30]}")
 
 
-# Carregando peões (6 jogadores)
 PEOES_IMG = [] # Renamed from 'peoes' to avoid confusion with player's pawn list
-for i in range(1, 7):
-    try:
-        peao_img = pygame.transform.scale(carregar_imagem(f'peao{i}.png', alpha=True), (28, 28))
-        PEOES_IMG.append(peao_img)
-    except:
-        # Fallback: criar círculo colorido se imagem não existir
-        peao_surf = pygame.Surface((28, 28), pygame.SRCALPHA)
-        cores_fallback = [(0, 100, 255), (255, 200, 0), (255, 100, 200), (255, 50, 50), (50, 50, 50), (0, 200, 100)]
-        pygame.draw.circle(peao_surf, cores_fallback[i-1], (14, 14), 14)
-        PEOES_IMG.append(peao_surf)
-
-# Carregando imagens dos dados (usadas na renderização dos dados)
-imagens_dados = []
-for i in range(1, 7):
-    try:
-        dado_img = carregar_imagem(f'dado_{i}.png', alpha=True)
-        imagens_dados.append(dado_img)
-    except:
-        # Fallback: criar representação numérica do dado se imagem não existir
-        dado_surf = pygame.Surface((60, 60), pygame.SRCALPHA)
-        pygame.draw.rect(dado_surf, (255, 255, 255), (2, 2, 56, 56))
-        pygame.draw.rect(dado_surf, (0, 0, 0), (2, 2, 56, 56), 2)
-        texto_dado = FONTE_GRANDE.render(str(i), True, (0, 0, 0))
-        texto_rect = texto_dado.get_rect(center=(30, 30))
-        dado_surf.blit(texto_dado, texto_rect)
-        imagens_dados.append(dado_surf)
+imagens_dados = [] # Dados já redimensionados para o HUD
 
 # --- Player info display positions (right side) ---
 POSICOES_TEXTO_JOGADOR = [
@@ -259,26 +205,27 @@ def calcular_posicao_construcao(indice_casa):
                 return (pos_x - 25, pos_y + 5)
     return (0, 0) # Default if out of bounds
 
-def desenhar_construcoes_no_tabuleiro():
-    """Draws houses and hotels on properties"""
+def desenhar_construcoes_no_tabuleiro(superficie=None):
+    """Draws houses and hotels on properties (na tela ou na camada estática do renderizador)"""
     if not jogo_backend:
         return
-    
+    destino = superficie if superficie is not None else screen
+
     for i, casa in enumerate(jogo_backend.tabuleiro.casas):
         if isinstance(casa, Propriedade) and hasattr(casa, 'casas') and casa.casas > 0:
             pos_x, pos_y = calcular_posicao_construcao(i)
             
             if casa.casas == 5:  # Hotel
                 # Draw a red square for the hotel
-                pygame.draw.rect(screen, (255, 0, 0), (pos_x, pos_y, 20, 20))
+                pygame.draw.rect(destino, (255, 0, 0), (pos_x, pos_y, 20, 20))
                 # Render 'H' for hotel
-                texto_hotel = FONTE_PEQUENA.render("H", True, (255, 255, 255))
-                screen.blit(texto_hotel, (pos_x + 5, pos_y + 2))
+                texto_hotel = renderizar_texto(FONTE_PEQUENA, "H", (255, 255, 255))
+                destino.blit(texto_hotel, (pos_x + 5, pos_y + 2))
             else:  # Houses
                 largura_casa = 4
                 espacamento = 1
                 for j in range(casa.casas):
-                    pygame.draw.rect(screen, (0, 200, 0), 
+                    pygame.draw.rect(destino, (0, 200, 0), 
                                    (pos_x + j * (largura_casa + espacamento), pos_y, largura_casa, 10))
 
 def desenhar_menu_construcao():
@@ -297,13 +244,13 @@ def desenhar_menu_construcao():
     pygame.draw.rect(screen, CORES_JOGADORES_MENU.get(jogador_atual.nome, (120, 80, 80)), (menu_x, menu_y, menu_width, menu_height))
     pygame.draw.rect(screen, (200, 200, 255), (menu_x, menu_y, menu_width, menu_height), 3)
     
-    titulo = FONTE_GRANDE.render("Construir", True, (255, 255, 255))
+    titulo = renderizar_texto(FONTE_GRANDE, "Construir", (255, 255, 255))
     screen.blit(titulo, (menu_x + menu_width // 2 - 60, menu_y + 15))
     
     botao_fechar_rect = pygame.Rect(menu_x + menu_width - 40, menu_y + 10, 35, 35)
     pygame.draw.rect(screen, (150, 50, 50), botao_fechar_rect)
     pygame.draw.rect(screen, (255, 100, 100), botao_fechar_rect, 2)
-    texto_fechar = FONTE_MEDIA.render("X", True, (255, 255, 255))
+    texto_fechar = renderizar_texto(FONTE_MEDIA, "X", (255, 255, 255))
     screen.blit(texto_fechar, (botao_fechar_rect.x + 10, botao_fechar_rect.y + 5))
     desenhar_menu_construcao.botao_fechar_rect = botao_fechar_rect
     
@@ -329,9 +276,9 @@ def desenhar_menu_construcao():
             propriedades_construiveis.extend(props)
     
     if not propriedades_construiveis:
-        texto_aviso = FONTE_MEDIA.render("Você precisa ter o monopólio", True, (255, 200, 100))
+        texto_aviso = renderizar_texto(FONTE_MEDIA, "Você precisa ter o monopólio", (255, 200, 100))
         screen.blit(texto_aviso, (menu_x + 100, y_offset))
-        texto_aviso2 = FONTE_MEDIA.render("de um grupo para construir!", True, (255, 200, 100))
+        texto_aviso2 = renderizar_texto(FONTE_MEDIA, "de um grupo para construir!", (255, 200, 100))
         screen.blit(texto_aviso2, (menu_x + 100, y_offset + 25))
         return
     
@@ -348,7 +295,7 @@ def desenhar_menu_construcao():
             casas_txt = f"{prop.casas} casa(s)"
         
         cor_texto = (255, 255, 255) if pode else (150, 150, 150)
-        texto_prop = FONTE_PEQUENA.render(f"{prop.nome}: {casas_txt}", True, cor_texto)
+        texto_prop = renderizar_texto(FONTE_PEQUENA, f"{prop.nome}: {casas_txt}", cor_texto)
         screen.blit(texto_prop, (menu_x + 25, y_offset))
         
         if pode and prop.casas < 5:
@@ -361,12 +308,12 @@ def desenhar_menu_construcao():
             pygame.draw.rect(screen, (100, 255, 100), botao_rect, 2)
             
             custo = jogo_backend.gestor_construcao.CUSTO_CONSTRUCAO.get(prop.grupo_cor, 100)
-            texto_construir = FONTE_PEQUENA.render(f"Construir R${custo}", True, (255, 255, 255))
+            texto_construir = renderizar_texto(FONTE_PEQUENA, f"Construir R${custo}", (255, 255, 255))
             screen.blit(texto_construir, (botao_rect.x + 8, botao_rect.y + 8))
             
             desenhar_menu_construcao.botoes_construir.append((botao_rect, prop))
         elif not pode:
-            texto_status = FONTE_PEQUENA.render(mensagem[:30], True, (255, 100, 100))
+            texto_status = renderizar_texto(FONTE_PEQUENA, mensagem[:30], (255, 100, 100))
             screen.blit(texto_status, (menu_x + 25, y_offset + 18))
         
         y_offset += 50
@@ -387,13 +334,13 @@ def desenhar_menu_propostas():
     pygame.draw.rect(screen, CORES_JOGADORES_MENU.get(jogo_backend.jogadores[jogo_backend.indice_turno_atual].nome, (120, 80, 80)), (menu_x, menu_y, menu_width, menu_height))
     pygame.draw.rect(screen, (255, 200, 200), (menu_x, menu_y, menu_width, menu_height), 3)
     
-    titulo = FONTE_GRANDE.render("Gerenciar Propriedades", True, (255, 255, 255))
+    titulo = renderizar_texto(FONTE_GRANDE, "Gerenciar Propriedades", (255, 255, 255))
     screen.blit(titulo, (menu_x + 50, menu_y + 10))
     
     botao_fechar_rect = pygame.Rect(menu_x + menu_width - 40, menu_y + 10, 35, 35)
     pygame.draw.rect(screen, (150, 50, 50), botao_fechar_rect)
     pygame.draw.rect(screen, (255, 100, 100), botao_fechar_rect, 2)
-    texto_fechar = FONTE_MEDIA.render("X", True, (255, 255, 255))
+    texto_fechar = renderizar_texto(FONTE_MEDIA, "X", (255, 255, 255))
     screen.blit(texto_fechar, (botao_fechar_rect.x + 10, botao_fechar_rect.y + 5))
     desenhar_menu_propostas.botao_fechar_rect = botao_fechar_rect
     
@@ -401,24 +348,24 @@ def desenhar_menu_propostas():
     y_offset = menu_y + 60
     
     if not jogador_atual.propriedades:
-        texto_sem_props = FONTE_MEDIA.render("Você não possui propriedades", True, (255, 200, 100))
+        texto_sem_props = renderizar_texto(FONTE_MEDIA, "Você não possui propriedades", (255, 200, 100))
         screen.blit(texto_sem_props, (menu_x + 60, y_offset))
         return
     
     desenhar_menu_propostas.botoes_jogadores = []
     
-    texto_info = FONTE_PEQUENA.render("Suas propriedades:", True, (255, 255, 255))
+    texto_info = renderizar_texto(FONTE_PEQUENA, "Suas propriedades:", (255, 255, 255))
     screen.blit(texto_info, (menu_x + 15, y_offset))
     y_offset += 30
     
     for prop in jogador_atual.propriedades:
         # Property name
-        texto_prop = FONTE_PEQUENA.render(f"• {prop.nome}", True, (200, 200, 255))
+        texto_prop = renderizar_texto(FONTE_PEQUENA, f"• {prop.nome}", (200, 200, 255))
         screen.blit(texto_prop, (menu_x + 20, y_offset))
         
         # Property value
         if hasattr(prop, 'preco_compra'):
-            texto_valor = FONTE_PEQUENA.render(f"R${prop.preco_compra}", True, (150, 255, 150))
+            texto_valor = renderizar_texto(FONTE_PEQUENA, f"R${prop.preco_compra}", (150, 255, 150))
             screen.blit(texto_valor, (menu_x + menu_width - 100, y_offset))
         
         y_offset += 25
@@ -427,7 +374,7 @@ def desenhar_menu_propostas():
             break
     
     y_offset = menu_y + menu_height - 100
-    texto_trocar = FONTE_MEDIA.render("Propor troca com:", True, (255, 255, 255))
+    texto_trocar = renderizar_texto(FONTE_MEDIA, "Propor troca com:", (255, 255, 255))
     screen.blit(texto_trocar, (menu_x + 15, y_offset))
     y_offset += 30
     
@@ -444,7 +391,7 @@ def desenhar_menu_propostas():
         pygame.draw.rect(screen, cor_botao, botao_rect)
         pygame.draw.rect(screen, (150, 200, 255), botao_rect, 2)
         
-        texto_jogador = FONTE_PEQUENA.render(jogador.nome, True, (255, 255, 255))
+        texto_jogador = renderizar_texto(FONTE_PEQUENA, jogador.nome, (255, 255, 255))
         screen.blit(texto_jogador, (botao_rect.x + 15, botao_rect.y + 8))
         
         desenhar_menu_propostas.botoes_jogadores.append((botao_rect, jogador))
@@ -467,7 +414,7 @@ def desenhar_menu_compra():
     pygame.draw.rect(screen, (150, 100, 100), (menu_x, menu_y, menu_width, menu_height), 3)
     
     # Title
-    texto_titulo = FONTE_GRANDE.render("Comprar Propriedade", True, (255, 255, 255))
+    texto_titulo = renderizar_texto(FONTE_GRANDE, "Comprar Propriedade", (255, 255, 255))
     text_rect = texto_titulo.get_rect()
     text_rect.center = (menu_x + menu_width // 2, menu_y + 30)
     screen.blit(texto_titulo, text_rect)
@@ -477,7 +424,7 @@ def desenhar_menu_compra():
     cor_fechar = (255, 100, 100) if fechar_rect.collidepoint(mouse_pos) else (200, 80, 80)
     pygame.draw.rect(screen, cor_fechar, fechar_rect)
     pygame.draw.rect(screen, (255, 150, 150), fechar_rect, 2)
-    texto_x = FONTE_MEDIA.render("X", True, (255, 255, 255))
+    texto_x = renderizar_texto(FONTE_MEDIA, "X", (255, 255, 255))
     texto_x_rect = texto_x.get_rect()
     texto_x_rect.center = fechar_rect.center
     screen.blit(texto_x, texto_x_rect)
@@ -490,23 +437,23 @@ def desenhar_menu_compra():
     y_offset = menu_y + 60
     
     if isinstance(casa_atual, Propriedade):
-        texto_nome = FONTE_MEDIA.render(casa_atual.nome, True, (255, 255, 255))
+        texto_nome = renderizar_texto(FONTE_MEDIA, casa_atual.nome, (255, 255, 255))
         screen.blit(texto_nome, (menu_x + 20, y_offset))
         y_offset += 35
         
         if hasattr(casa_atual, 'proprietario') and casa_atual.proprietario:
-            texto_dono = FONTE_MEDIA.render(f"Proprietário: {casa_atual.proprietario.nome}", True, (255, 200, 100))
+            texto_dono = renderizar_texto(FONTE_MEDIA, f"Proprietário: {casa_atual.proprietario.nome}", (255, 200, 100))
             screen.blit(texto_dono, (menu_x + 20, y_offset))
             y_offset += 30
-            texto_info = FONTE_PEQUENA.render("Esta propriedade já tem dono!", True, (255, 100, 100))
+            texto_info = renderizar_texto(FONTE_PEQUENA, "Esta propriedade já tem dono!", (255, 100, 100))
             screen.blit(texto_info, (menu_x + 20, y_offset))
         else:
-            texto_preco = FONTE_MEDIA.render(f"Preço: R${casa_atual.preco_compra}", True, (150, 255, 150))
+            texto_preco = renderizar_texto(FONTE_MEDIA, f"Preço: R${casa_atual.preco_compra}", (150, 255, 150))
             screen.blit(texto_preco, (menu_x + 20, y_offset))
             y_offset += 35
             
             saldo_jogador = jogo_backend.banco.consultar_saldo(jogador_atual.nome)
-            texto_saldo = FONTE_PEQUENA.render(f"Seu saldo: R${saldo_jogador}", True, (200, 200, 255))
+            texto_saldo = renderizar_texto(FONTE_PEQUENA, f"Seu saldo: R${saldo_jogador}", (200, 200, 255))
             screen.blit(texto_saldo, (menu_x + 20, y_offset))
             y_offset += 50
             
@@ -519,17 +466,17 @@ def desenhar_menu_compra():
                 pygame.draw.rect(screen, cor_botao, botao_comprar_rect)
                 pygame.draw.rect(screen, (100, 255, 100), botao_comprar_rect, 2)
                 
-                texto_comprar = FONTE_MEDIA.render(f"COMPRAR R${casa_atual.preco_compra}", True, (255, 255, 255))
+                texto_comprar = renderizar_texto(FONTE_MEDIA, f"COMPRAR R${casa_atual.preco_compra}", (255, 255, 255))
                 texto_rect = texto_comprar.get_rect()
                 texto_rect.center = (botao_comprar_rect.centerx, botao_comprar_rect.centery)
                 screen.blit(texto_comprar, texto_rect)
                 
                 desenhar_menu_compra.botao_comprar_rect = botao_comprar_rect
             else:
-                texto_sem_saldo = FONTE_MEDIA.render("Saldo insuficiente!", True, (255, 100, 100))
+                texto_sem_saldo = renderizar_texto(FONTE_MEDIA, "Saldo insuficiente!", (255, 100, 100))
                 screen.blit(texto_sem_saldo, (menu_x + 80, y_offset))
     else:
-        texto_nao_propriedade = FONTE_MEDIA.render("Esta casa não pode ser comprada", True, (255, 200, 100))
+        texto_nao_propriedade = renderizar_texto(FONTE_MEDIA, "Esta casa não pode ser comprada", (255, 200, 100))
         screen.blit(texto_nao_propriedade, (menu_x + 40, y_offset))
 
 def desenhar_painel_feedback():
@@ -537,7 +484,7 @@ def desenhar_painel_feedback():
     pygame.draw.rect(screen, (20, 30, 60), (10, 80, 240, 420))
     pygame.draw.rect(screen, (100, 150, 255), (10, 80, 240, 420), 2)
     
-    titulo = FONTE_PEQUENA.render("Historico", True, (100, 200, 255))
+    titulo = renderizar_texto(FONTE_PEQUENA, "Historico", (100, 200, 255))
     screen.blit(titulo, (15, 85))
     
     y_offset = 110
@@ -546,7 +493,7 @@ def desenhar_painel_feedback():
     
     for i, msg in enumerate(mensagens_feedback[start_index:start_index + max_visible]):
         cor = (150, 200, 255) if i % 2 == 0 else (100, 150, 200)
-        texto_msg = FONTE_PEQUENA.render(msg[:26], True, cor)
+        texto_msg = renderizar_texto(FONTE_PEQUENA, msg[:26], cor)
         screen.blit(texto_msg, (15, y_offset))
         y_offset += 22
     
@@ -569,11 +516,8 @@ def adicionar_mensagem_feedback(mensagem):
     if len(mensagens_feedback) > MAX_MENSAGENS_FEEDBACK:
         mensagens_feedback.pop(0)
 
-def desenhar_menu_turno():
-    """Desenha menu de opções de turno com botões de texto"""
-    if not MOSTRAR_HUD_MENU:
-        return
-    
+def retangulo_menu_turno():
+    """Área do menu de turno (HUD) na tela: (x, y, largura, altura)"""
     menu_x = HUD_MENU_X + AJUSTE_HUD_X
     menu_y = HUD_MENU_Y + AJUSTE_HUD_Y
     
@@ -581,8 +525,14 @@ def desenhar_menu_turno():
     menu_x = max(10, min(menu_x, 1600 - HUD_MENU_WIDTH - 10))
     menu_y = max(10, min(menu_y, 900 - HUD_MENU_HEIGHT - 10))
     
-    menu_width = HUD_MENU_WIDTH
-    menu_height = HUD_MENU_HEIGHT
+    return menu_x, menu_y, HUD_MENU_WIDTH, HUD_MENU_HEIGHT
+
+def desenhar_menu_turno():
+    """Desenha menu de opções de turno com botões de texto"""
+    if not MOSTRAR_HUD_MENU:
+        return
+    
+    menu_x, menu_y, menu_width, menu_height = retangulo_menu_turno()
     
     jogador_atual = jogo_backend.jogadores[jogo_backend.indice_turno_atual]
     cor_fundo = CORES_JOGADORES_MENU.get(jogador_atual.nome, (40, 60, 100))
@@ -591,7 +541,7 @@ def desenhar_menu_turno():
     pygame.draw.rect(screen, cor_fundo, (menu_x, menu_y, menu_width, menu_height))
     pygame.draw.rect(screen, cor_borda, (menu_x, menu_y, menu_width, menu_height), 2)
     
-    turno_texto = FONTE_MEDIA.render(f"Turno: {jogador_atual.nome}", True, (255, 255, 255))
+    turno_texto = renderizar_texto(FONTE_MEDIA, f"Turno: {jogador_atual.nome}", (255, 255, 255))
     text_rect = turno_texto.get_rect()
     text_rect.center = (menu_x + menu_width // 2, menu_y + 15)
     screen.blit(turno_texto, text_rect)
@@ -609,7 +559,7 @@ def desenhar_menu_turno():
         cor_borda = (100, 200, 100) if not botoes_bloqueados else (120, 120, 120)
         pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
         pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-        texto_lancar = FONTE_PEQUENA.render("LANÇAR DADOS", True, (255, 255, 255))
+        texto_lancar = renderizar_texto(FONTE_PEQUENA, "LANÇAR DADOS", (255, 255, 255))
         screen.blit(texto_lancar, (x_botao + 40, y_botao + 8))
         y_botao += 50
     else:
@@ -619,7 +569,7 @@ def desenhar_menu_turno():
         cor_borda = (120, 120, 120)
         pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
         pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-        texto_lancar = FONTE_PEQUENA.render("LANÇAR DADOS", True, (150, 150, 150))
+        texto_lancar = renderizar_texto(FONTE_PEQUENA, "LANÇAR DADOS", (150, 150, 150))
         screen.blit(texto_lancar, (x_botao + 40, y_botao + 8))
         y_botao += 50
     
@@ -632,7 +582,7 @@ def desenhar_menu_turno():
             cor_borda = (200, 200, 100) if not botoes_bloqueados else (150, 150, 100)
             pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
             pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-            texto_comprar = FONTE_PEQUENA.render("COMPRAR", True, (255, 255, 255))
+            texto_comprar = renderizar_texto(FONTE_PEQUENA, "COMPRAR", (255, 255, 255))
             screen.blit(texto_comprar, (x_botao + 60, y_botao + 8))
             y_botao += 50
         else:
@@ -642,7 +592,7 @@ def desenhar_menu_turno():
             cor_borda = (120, 120, 120)
             pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
             pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-            texto_comprar = FONTE_PEQUENA.render("COMPRAR", True, (150, 150, 150))
+            texto_comprar = renderizar_texto(FONTE_PEQUENA, "COMPRAR", (150, 150, 150))
             screen.blit(texto_comprar, (x_botao + 60, y_botao + 8))
             y_botao += 50
     elif estado_turno == "APOS_LANCAR_DADOS" or turno_bot_em_execucao:
@@ -652,7 +602,7 @@ def desenhar_menu_turno():
         cor_borda = (120, 120, 120)
         pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
         pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-        texto_comprar = FONTE_PEQUENA.render("COMPRAR", True, (150, 150, 150))
+        texto_comprar = renderizar_texto(FONTE_PEQUENA, "COMPRAR", (150, 150, 150))
         screen.blit(texto_comprar, (x_botao + 60, y_botao + 8))
         y_botao += 50
     
@@ -662,7 +612,7 @@ def desenhar_menu_turno():
         cor_borda = (200, 150, 100) if not botoes_bloqueados else (150, 120, 80)
         pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
         pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-        texto_propriedades = FONTE_PEQUENA.render("PROPRIEDADES", True, (255, 255, 255))
+        texto_propriedades = renderizar_texto(FONTE_PEQUENA, "PROPRIEDADES", (255, 255, 255))
         screen.blit(texto_propriedades, (x_botao + 35, y_botao + 8))
         y_botao += 50
     elif estado_turno == "APOS_LANCAR_DADOS" and len(jogador_atual.propriedades) > 0:
@@ -672,7 +622,7 @@ def desenhar_menu_turno():
         cor_borda = (120, 120, 120)
         pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
         pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-        texto_propriedades = FONTE_PEQUENA.render("PROPRIEDADES", True, (150, 150, 150))
+        texto_propriedades = renderizar_texto(FONTE_PEQUENA, "PROPRIEDADES", (150, 150, 150))
         screen.blit(texto_propriedades, (x_botao + 35, y_botao + 8))
         y_botao += 50
     
@@ -682,7 +632,7 @@ def desenhar_menu_turno():
         cor_borda = (200, 100, 200) if not botoes_bloqueados else (150, 80, 150)
         pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
         pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-        texto_negociar = FONTE_PEQUENA.render("NEGOCIAR", True, (255, 255, 255))
+        texto_negociar = renderizar_texto(FONTE_PEQUENA, "NEGOCIAR", (255, 255, 255))
         screen.blit(texto_negociar, (x_botao + 50, y_botao + 8))
         y_botao += 50
     elif estado_turno == "APOS_LANCAR_DADOS" and len(jogador_atual.propriedades) > 0:
@@ -692,7 +642,7 @@ def desenhar_menu_turno():
         cor_borda = (120, 120, 120)
         pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
         pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-        texto_negociar = FONTE_PEQUENA.render("NEGOCIAR", True, (150, 150, 150))
+        texto_negociar = renderizar_texto(FONTE_PEQUENA, "NEGOCIAR", (150, 150, 150))
         screen.blit(texto_negociar, (x_botao + 50, y_botao + 8))
         y_botao += 50
     
@@ -702,7 +652,7 @@ def desenhar_menu_turno():
         cor_borda = (200, 100, 100) if not botoes_bloqueados else (150, 80, 80)
         pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
         pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-        texto_passar = FONTE_PEQUENA.render("PASSAR A VEZ", True, (255, 255, 255))
+        texto_passar = renderizar_texto(FONTE_PEQUENA, "PASSAR A VEZ", (255, 255, 255))
         screen.blit(texto_passar, (x_botao + 50, y_botao + 8))
     else:
         # Passar desabilitado durante turno de bot
@@ -711,7 +661,7 @@ def desenhar_menu_turno():
         cor_borda = (120, 120, 120)
         pygame.draw.rect(screen, cor_fundo, (x_botao, y_botao, largura_botao, altura_botao))
         pygame.draw.rect(screen, cor_borda, (x_botao, y_botao, largura_botao, altura_botao), 2)
-        texto_passar = FONTE_PEQUENA.render("PASSAR A VEZ", True, (150, 150, 150))
+        texto_passar = renderizar_texto(FONTE_PEQUENA, "PASSAR A VEZ", (150, 150, 150))
         screen.blit(texto_passar, (x_botao + 50, y_botao + 8))
 
 def desenhar_popup_carta():
@@ -729,17 +679,14 @@ def desenhar_popup_carta():
     popup_y = (ALTURA_TELA - popup_height) // 2
     
     # Fundo do pop-up com transparência
-    overlay = pygame.Surface((LARGURA_TELA, ALTURA_TELA))
-    overlay.set_alpha(100)
-    overlay.fill((0, 0, 0))
-    screen.blit(overlay, (0, 0))
+    screen.blit(recursos.sobreposicao((LARGURA_TELA, ALTURA_TELA), (0, 0, 0), 100), (0, 0))
     
     # Caixa do pop-up
     pygame.draw.rect(screen, (40, 60, 100), (popup_x, popup_y, popup_width, popup_height))
     pygame.draw.rect(screen, (100, 200, 255), (popup_x, popup_y, popup_width, popup_height), 3)
     
     # Título
-    titulo = FONTE_GRANDE.render("INTERAÇÃO EM ANDAMENTO!", True, (255, 200, 50))
+    titulo = renderizar_texto(FONTE_GRANDE, "INTERAÇÃO EM ANDAMENTO!", (255, 200, 50))
     titulo_rect = titulo.get_rect()
     titulo_rect.center = (LARGURA_TELA // 2, popup_y + 25)
     screen.blit(titulo, titulo_rect)
@@ -762,7 +709,7 @@ def desenhar_popup_carta():
     
     y_texto = popup_y + 70
     for linha in linhas:
-        texto = FONTE_MEDIA.render(linha, True, (200, 220, 255))
+        texto = renderizar_texto(FONTE_MEDIA, linha, (200, 220, 255))
         texto_rect = texto.get_rect()
         texto_rect.center = (LARGURA_TELA // 2, y_texto)
         screen.blit(texto, texto_rect)
@@ -822,17 +769,14 @@ def desenhar_painel_propriedades_jogador(jogador):
     painel_y = (ALTURA_TELA - painel_height) // 2
     
     # Draw background with transparency
-    overlay = pygame.Surface((LARGURA_TELA, ALTURA_TELA))
-    overlay.set_alpha(100)
-    overlay.fill((0, 0, 0))
-    screen.blit(overlay, (0, 0))
+    screen.blit(recursos.sobreposicao((LARGURA_TELA, ALTURA_TELA), (0, 0, 0), 100), (0, 0))
     
     # Draw panel
     pygame.draw.rect(screen, (40, 40, 80), (painel_x, painel_y, painel_width, painel_height))
     pygame.draw.rect(screen, (150, 150, 200), (painel_x, painel_y, painel_width, painel_height), 3)
     
     # Title
-    titulo = FONTE_GRANDE.render(f"Propriedades de {jogador.nome}", True, (200, 255, 200))
+    titulo = renderizar_texto(FONTE_GRANDE, f"Propriedades de {jogador.nome}", (200, 255, 200))
     titulo_rect = titulo.get_rect()
     titulo_rect.center = (painel_x + painel_width // 2, painel_y + 15)
     screen.blit(titulo, titulo_rect)
@@ -842,7 +786,7 @@ def desenhar_painel_propriedades_jogador(jogador):
     mouse_pos = pygame.mouse.get_pos()
     cor_fechar = (255, 100, 100) if fechar_rect.collidepoint(mouse_pos) else (200, 80, 80)
     pygame.draw.rect(screen, cor_fechar, fechar_rect)
-    texto_x = FONTE_PEQUENA.render("X", True, (255, 255, 255))
+    texto_x = renderizar_texto(FONTE_PEQUENA, "X", (255, 255, 255))
     texto_x_rect = texto_x.get_rect()
     texto_x_rect.center = fechar_rect.center
     screen.blit(texto_x, texto_x_rect)
@@ -856,7 +800,7 @@ def desenhar_painel_propriedades_jogador(jogador):
         
         # Group title with colored background
         pygame.draw.rect(screen, cor_grupo, (painel_x + 10, y_offset, painel_width - 20, 25))
-        texto_grupo = FONTE_PEQUENA.render(grupo, True, (255, 255, 255))
+        texto_grupo = renderizar_texto(FONTE_PEQUENA, grupo, (255, 255, 255))
         screen.blit(texto_grupo, (painel_x + 15, y_offset + 5))
         y_offset += 28
         
@@ -865,7 +809,7 @@ def desenhar_painel_propriedades_jogador(jogador):
             pygame.draw.circle(screen, cor_grupo, (painel_x + 20, y_offset + 10), 6)
             
             # Property name
-            texto_prop = FONTE_PEQUENA.render(prop.nome, True, (200, 220, 255))
+            texto_prop = renderizar_texto(FONTE_PEQUENA, prop.nome, (200, 220, 255))
             screen.blit(texto_prop, (painel_x + 35, y_offset + 4))
             
             y_offset += 28
@@ -884,13 +828,13 @@ def desenhar_menu_negociacao():
     pygame.draw.rect(screen, (50, 50, 100), (menu_x, menu_y, menu_width, menu_height))
     pygame.draw.rect(screen, (150, 150, 200), (menu_x, menu_y, menu_width, menu_height), 3)
     
-    titulo = FONTE_GRANDE.render("Negociar Propriedades", True, (200, 255, 200))
+    titulo = renderizar_texto(FONTE_GRANDE, "Negociar Propriedades", (200, 255, 200))
     screen.blit(titulo, (menu_x + 30, menu_y + 10))
     
     botao_fechar_rect = pygame.Rect(menu_x + menu_width - 40, menu_y + 10, 35, 35)
     pygame.draw.rect(screen, (150, 50, 50), botao_fechar_rect)
     pygame.draw.rect(screen, (255, 100, 100), botao_fechar_rect, 2)
-    texto_fechar = FONTE_MEDIA.render("X", True, (255, 255, 255))
+    texto_fechar = renderizar_texto(FONTE_MEDIA, "X", (255, 255, 255))
     screen.blit(texto_fechar, (botao_fechar_rect.x + 10, botao_fechar_rect.y + 5))
     desenhar_menu_negociacao.fechar_rect = botao_fechar_rect
     
@@ -900,7 +844,7 @@ def desenhar_menu_negociacao():
     x_player_btn = menu_x + 20
     y_player_btn = menu_y + 55
     
-    screen.blit(FONTE_MEDIA.render("Negociar com:", True, (255, 255, 255)), (menu_x + 20, y_player_btn - 20))
+    screen.blit(renderizar_texto(FONTE_MEDIA, "Negociar com:", (255, 255, 255)), (menu_x + 20, y_player_btn - 20))
     
     for i, jogador in enumerate(jogo_backend.jogadores):
         if jogador == jogador_atual or jogador.falido:
@@ -912,7 +856,7 @@ def desenhar_menu_negociacao():
         pygame.draw.rect(screen, cor_btn, btn_rect)
         pygame.draw.rect(screen, (150, 200, 255), btn_rect, 2)
         
-        txt = FONTE_PEQUENA.render(jogador.nome, True, (255, 255, 255))
+        txt = renderizar_texto(FONTE_PEQUENA, jogador.nome, (255, 255, 255))
         screen.blit(txt, (btn_rect.x + 10, btn_rect.y + 5))
         desenhar_menu_negociacao.player_buttons.append((btn_rect, jogador))
         
@@ -928,7 +872,7 @@ def desenhar_menu_negociacao():
         y_offset = y_player_btn + 45
         
         # Your properties
-        screen.blit(FONTE_MEDIA.render("Suas Propriedades:", True, (255, 255, 255)), (menu_x + 20, y_offset))
+        screen.blit(renderizar_texto(FONTE_MEDIA, "Suas Propriedades:", (255, 255, 255)), (menu_x + 20, y_offset))
         y_offset += 30
         
         desenhar_menu_negociacao.sua_propriedades_buttons = []
@@ -942,14 +886,14 @@ def desenhar_menu_negociacao():
             
             pygame.draw.rect(screen, cor_prop, prop_rect)
             pygame.draw.rect(screen, (150, 255, 150), prop_rect, 2)
-            txt = FONTE_PEQUENA.render(f"{prop.nome} (R${prop.preco_compra})", True, (255, 255, 255))
+            txt = renderizar_texto(FONTE_PEQUENA, f"{prop.nome} (R${prop.preco_compra})", (255, 255, 255))
             screen.blit(txt, (prop_rect.x + 5, prop_rect.y + 5))
             desenhar_menu_negociacao.sua_propriedades_buttons.append((prop_rect, prop))
         
         y_offset += len(jogador_atual.propriedades) * 28 + 30
         
         # Other player's properties
-        screen.blit(FONTE_MEDIA.render(f"{jogador_a_trocar.nome}'s Propriedades:", True, (255, 255, 255)), (menu_x + 20, y_offset))
+        screen.blit(renderizar_texto(FONTE_MEDIA, f"{jogador_a_trocar.nome}'s Propriedades:", (255, 255, 255)), (menu_x + 20, y_offset))
         y_offset += 30
         
         desenhar_menu_negociacao.outra_propriedades_buttons = []
@@ -959,7 +903,7 @@ def desenhar_menu_negociacao():
             cor_prop = (100, 100, 150) if prop_rect.collidepoint(mouse_pos) else (50, 50, 80)
             pygame.draw.rect(screen, cor_prop, prop_rect)
             pygame.draw.rect(screen, (150, 150, 255), prop_rect, 2)
-            txt = FONTE_PEQUENA.render(f"{prop.nome} (R${prop.preco_compra})", True, (255, 255, 255))
+            txt = renderizar_texto(FONTE_PEQUENA, f"{prop.nome} (R${prop.preco_compra})", (255, 255, 255))
             screen.blit(txt, (prop_rect.x + 5, prop_rect.y + 5))
             desenhar_menu_negociacao.outra_propriedades_buttons.append((prop_rect, prop))
         
@@ -974,7 +918,7 @@ def desenhar_menu_negociacao():
             pygame.draw.rect(screen, cor_trade_btn, trade_btn_rect)
             pygame.draw.rect(screen, (200, 150, 100), trade_btn_rect, 2)
             
-            txt_trade = FONTE_PEQUENA.render("Propor Troca", True, (255, 255, 255))
+            txt_trade = renderizar_texto(FONTE_PEQUENA, "Propor Troca", (255, 255, 255))
             screen.blit(txt_trade, (trade_btn_rect.x + 15, trade_btn_rect.y + 8))
             desenhar_menu_negociacao.propor_troca_rect = trade_btn_rect
 
@@ -1015,9 +959,10 @@ dados_lancados = False
 # botoes_desabilitados = False # Removed based on updates
 # tempo_desabilitacao = 0     # Removed based on updates
 
-clock = pygame.time.Clock()
-
-menu_inicial = MenuInicial(screen)
+clock = None
+renderizador = None
+jogadores_marcados = 0  # Quantos jogadores tinham regiões no renderizador no último quadro
+menu_inicial = None
 tela_fim_jogo = None
 
 def atualizar_bloqueio_botoes():
@@ -1033,145 +978,412 @@ def atualizar_bloqueio_botoes():
     else:
         botoes_bloqueados = False
 
-# --- MAIN GAME LOOP ---
-while running:
-    # Removed botoes_desabilitados check from event handling
+def posicao_tela_peao(indice):
+    """Posição (x, y) do peão do jogador na tela, ou None se ele não é desenhado"""
+    jogador = jogo_backend.jogadores[indice]
+    if jogador.falido or jogador.posicao >= len(POSICOES_CASAS_PRECISAS) or indice >= len(PEOES_IMG):
+        return None
+    
+    # Use precise positions from the POSICOES_CASAS_PRECISAS
+    pos_x, pos_y = POSICOES_CASAS_PRECISAS[jogador.posicao]
+    
+    # Use dynamic offsets based on how many players are in the same square
+    offset_x, offset_y = calcular_offsets_peoes_dinamicos(indice, jogo_backend.jogadores)
+    
+    peao_img = PEOES_IMG[indice]
+    # Apply global adjustments and center the pawn
+    screen_x = X_TABULEIRO + pos_x + offset_x - peao_img.get_width() // 2 + AJUSTE_GLOBAL_PEOES_X
+    screen_y = Y_TABULEIRO + pos_y + offset_y - peao_img.get_height() // 2 + AJUSTE_GLOBAL_PEOES_Y
+    return (screen_x, screen_y)
+
+def desenhar_camada_estatica(camada):
+    """Conteúdo estático da tela de jogo: tabuleiro e construções"""
+    camada.blit(tabuleiro_img, (X_TABULEIRO, Y_TABULEIRO))
+    desenhar_construcoes_no_tabuleiro(camada)
+
+def marcar_regioes_jogo():
+    """
+    Registra no renderizador cada elemento dinâmico da tela de jogo com a área que ocupa e
+    uma assinatura do que mostra. Só os elementos cuja assinatura mudou são redesenhados.
+    """
+    global jogadores_marcados
+    casas_construidas = tuple(getattr(casa, 'casas', 0) for casa in jogo_backend.tabuleiro.casas)
+    renderizador.atualizar_estatica((id(jogo_backend), casas_construidas), desenhar_camada_estatica)
     
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
+    # Menus e pop-ups têm efeitos de mouse e temporizadores: enquanto abertos, a tela é redesenhada inteira
+    sobreposicoes = (mostrar_menu_compra, mostrar_menu_proposta, mostrar_menu_construcao, mostrar_menu_negociacao,
+                     bool(mostrar_painel_propriedades and jogador_selecionado_para_info), mostrar_popup_carta)
+    if any(sobreposicoes):
+        renderizador.invalidar()
+    renderizador.marcar("sobreposicoes", screen.get_rect(), sobreposicoes)
+    
+    for i, jogador in enumerate(jogo_backend.jogadores):
+        posicao = posicao_tela_peao(i)
+        if posicao is None:
+            renderizador.esquecer(("peao", i))
+        else:
+            renderizador.marcar(("peao", i), PEOES_IMG[i].get_rect(topleft=posicao), posicao)
         
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
+        pos_texto_x, pos_texto_y = POSICOES_TEXTO_JOGADOR[i % len(POSICOES_TEXTO_JOGADOR)]
+        renderizador.marcar(
+            ("jogador", i),
+            (pos_texto_x, pos_texto_y, 240, 55),
+            (jogador.nome, jogador.falido, jogo_backend.banco.consultar_saldo(jogador.nome),
+             len(jogador.propriedades), i == jogo_backend.indice_turno_atual)
+        )
+    
+    # Jogadores removidos (falência) deixam de ser marcados: libera as regiões dos índices que sobraram
+    for i in range(len(jogo_backend.jogadores), jogadores_marcados):
+        renderizador.esquecer(("peao", i))
+        renderizador.esquecer(("jogador", i))
+    jogadores_marcados = len(jogo_backend.jogadores)
+    
+    renderizador.marcar("dados", (20, 530, 140, 80), (dados_lancados, dado1_valor, dado2_valor))
+    renderizador.marcar("historico", (10, 80, 240, 420), (tuple(mensagens_feedback), scroll_feedback))
+    
+    jogador_atual = jogo_backend.jogadores[jogo_backend.indice_turno_atual]
+    casa_atual = jogo_backend.tabuleiro.casas[jogador_atual.posicao]
+    renderizador.marcar(
+        "menu_turno",
+        retangulo_menu_turno(),
+        (jogo_backend.indice_turno_atual, estado_turno, botoes_bloqueados, turno_bot_em_execucao,
+         len(jogador_atual.propriedades), jogador_atual.posicao, getattr(casa_atual, 'proprietario', None))
+    )
+
+# --- Inicialização da interface ---
+def inicializar_interface():
+    """Inicia o pygame, abre a janela e carrega fontes e imagens (uma única vez)."""
+    global screen, FONTE_PADRAO, FONTE_PEQUENA, FONTE_GRANDE, FONTE_MEDIA, tabuleiro_img
+    global clock, renderizador, menu_inicial
+    
+    pygame.init()
+    pygame.font.init()
+    
+    try:
+        FONTE_PADRAO = pygame.font.SysFont('Arial', 18)
+        FONTE_PEQUENA = pygame.font.SysFont('Arial', 13)
+        FONTE_GRANDE = pygame.font.SysFont('Arial', 26)
+        FONTE_MEDIA = pygame.font.SysFont('Arial', 18)
+    except Exception as e:
+        print(f"Erro ao carregar fonte: {e}. Usando fonte padrão.")
+        FONTE_PADRAO = pygame.font.Font(None, 18)
+        FONTE_PEQUENA = pygame.font.Font(None, 13)
+        FONTE_GRANDE = pygame.font.Font(None, 26)
+        FONTE_MEDIA = pygame.font.Font(None, 18)
+    
+    screen = pygame.display.set_mode((LARGURA_TELA, ALTURA_TELA), flags)
+    pygame.display.set_caption("Monopoly")
+    
+    # --- Carregando as imagens ---
+    tabuleiro_img = carregar_imagem('tabuleiro.png')
+    
+    # Carregando peões (6 jogadores)
+    for i in range(1, 7):
+        try:
+            recursos.imagem(f'peao{i}.png', alpha=True)
+        except (FileNotFoundError, pygame.error):
+            # Fallback: criar círculo colorido se imagem não existir
+            peao_surf = pygame.Surface((28, 28), pygame.SRCALPHA)
+            cores_fallback = [(0, 100, 255), (255, 200, 0), (255, 100, 200), (255, 50, 50), (50, 50, 50), (0, 200, 100)]
+            pygame.draw.circle(peao_surf, cores_fallback[i-1], (14, 14), 14)
+            recursos.registrar(f'peao{i}.png', peao_surf)
+        PEOES_IMG.append(recursos.escalada(f'peao{i}.png', (28, 28)))
+    
+    # Carregando imagens dos dados (usadas na renderização dos dados)
+    for i in range(1, 7):
+        try:
+            recursos.imagem(f'dado_{i}.png', alpha=True)
+        except (FileNotFoundError, pygame.error):
+            # Fallback: criar representação numérica do dado se imagem não existir
+            dado_surf = pygame.Surface((60, 60), pygame.SRCALPHA)
+            pygame.draw.rect(dado_surf, (255, 255, 255), (2, 2, 56, 56))
+            pygame.draw.rect(dado_surf, (0, 0, 0), (2, 2, 56, 56), 2)
+            texto_dado = renderizar_texto(FONTE_GRANDE, str(i), (0, 0, 0))
+            texto_rect = texto_dado.get_rect(center=(30, 30))
+            dado_surf.blit(texto_dado, texto_rect)
+            recursos.registrar(f'dado_{i}.png', dado_surf)
+        # Os dados só aparecem em 50x50 no HUD: a versão redimensionada é criada aqui, não a cada quadro
+        imagens_dados.append(recursos.escalada(f'dado_{i}.png', (50, 50)))
+    
+    clock = pygame.time.Clock()
+    renderizador = RenderizadorCamadas(screen, COR_FUNDO)
+    menu_inicial = MenuInicial(screen)
+
+def imprimir_ajustes():
+    """Mostra os ajustes de posicionamento da interface (python main.py --debug)."""
+    print(f"[v0] Board image size: {BOARD_IMG_WIDTH}x{BOARD_IMG_HEIGHT}")
+    print(f"[v0] Board position on screen: ({X_TABULEIRO}, {Y_TABULEIRO})")
+    print(f"[v0] Pawn adjustment: ({AJUSTE_GLOBAL_PEOES_X}, {AJUSTE_GLOBAL_PEOES_Y})")
+    print(f"[v0] HUD adjustment: ({HUD_MENU_X}, {HUD_MENU_Y})")
+    print(f"[v0] Construction adjustment: ({AJUSTE_CONSTRUCOES_X}, {AJUSTE_CONSTRUCOES_Y})")
+    print(f"[v0] Generated {len(POSICOES_CASAS_PRECISAS)} position coordinates")
+    print(f"[v0] Position 0 (Start): {POSICOES_CASAS_PRECISAS[0]}")
+    print(f"[v0] Position 10 (Jail): {POSICOES_CASAS_PRECISAS[10]}")
+    print(f"[v0] Position 20 (Free Parking): {POSICOES_CASAS_PRECISAS[20]}")
+    print(f"[v0] Position 30 (Go to Jail): {POSICOES_CASAS_PRECISAS[30]}")
+
+# --- MAIN GAME LOOP ---
+def main(max_quadros=None):
+    """
+    Monta a interface e executa o laço principal do jogo.
+    
+    Args:
+        max_quadros: Encerra depois desse nº de quadros (None = até o jogador sair);
+                     usado pelo benchmark de inicialização
+    """
+    global dado1_valor, dado2_valor, dados_lancados, estado_jogo, estado_turno
+    global jogador_selecionado_para_info, jogo_backend, mensagem_carta_atual, mensagens_feedback
+    global mensagens_log, menu_inicial, mostrar_menu_compra, mostrar_menu_construcao
+    global mostrar_menu_negociacao, mostrar_menu_proposta, mostrar_painel_propriedades
+    global mostrar_popup_carta, running, scroll_feedback, tela_fim_jogo, tempo_bloqueio_botoes
+    global tempo_mensagem_carta
+    
+    inicializar_interface()
+    if '--debug' in sys.argv:
+        imprimir_ajustes()
+    
+    quadros = 0
+    dt = 0.0
+    while running:
+        # Removed botoes_desabilitados check from event handling
+    
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
                 running = False
         
-        # --- PROCESSAMENTO POR ESTADO ---
-        if estado_jogo == "MENU":
-            resultado = menu_inicial.handle_events(event)
-            if resultado:
-                acao, nomes_jogadores = resultado
-                if acao == "INICIAR_JOGO":
-                    jogo_backend = Jogo(nomes_jogadores)
-                    estado_jogo = "INICIO_TURNO"
-                    scroll_feedback = 0
-                    mensagens_feedback = []
-                    mensagens_log = []
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
         
-        elif estado_jogo == "FIM_JOGO":
-            resultado = tela_fim_jogo.handle_events(event)
-            if resultado == "NOVO_JOGO":
-                menu_inicial = MenuInicial(screen)
-                estado_jogo = "MENU"
-                mensagens_log = []
-                mensagens_feedback = []
-                scroll_feedback = 0
-            elif resultado == "SAIR":
-                running = False
+            # --- PROCESSAMENTO POR ESTADO ---
+            if estado_jogo == "MENU":
+                resultado = menu_inicial.handle_events(event)
+                if resultado:
+                    acao, nomes_jogadores = resultado
+                    if acao == "INICIAR_JOGO":
+                        from jogo import Jogo  # Motor importado só ao iniciar a primeira partida
+                        jogo_backend = Jogo(nomes_jogadores)
+                        estado_jogo = "INICIO_TURNO"
+                        scroll_feedback = 0
+                        mensagens_feedback = []
+                        mensagens_log = []
+        
+            elif estado_jogo == "FIM_JOGO":
+                resultado = tela_fim_jogo.handle_events(event)
+                if resultado == "NOVO_JOGO":
+                    menu_inicial = MenuInicial(screen)
+                    estado_jogo = "MENU"
+                    mensagens_log = []
+                    mensagens_feedback = []
+                    scroll_feedback = 0
+                elif resultado == "SAIR":
+                    running = False
         
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            print(f"Clique do mouse em: {event.pos}")
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                print(f"Clique do mouse em: {event.pos}")
             
-            if estado_jogo == "INICIO_TURNO" and not mostrar_menu_compra and not mostrar_menu_proposta and not mostrar_menu_construcao and not mostrar_menu_negociacao:
-                for i, (pos_x, pos_y) in enumerate(POSICOES_TEXTO_JOGADOR):
-                    if i < len(jogo_backend.jogadores):
-                        rect_jogador = pygame.Rect(pos_x, pos_y, 220, 100)
-                        if rect_jogador.collidepoint(event.pos):
-                            jogador_selecionado_para_info = jogo_backend.jogadores[i]
-                            mostrar_painel_propriedades = True
-                            break
+                if estado_jogo == "INICIO_TURNO" and not mostrar_menu_compra and not mostrar_menu_proposta and not mostrar_menu_construcao and not mostrar_menu_negociacao:
+                    for i, (pos_x, pos_y) in enumerate(POSICOES_TEXTO_JOGADOR):
+                        if i < len(jogo_backend.jogadores):
+                            rect_jogador = pygame.Rect(pos_x, pos_y, 220, 100)
+                            if rect_jogador.collidepoint(event.pos):
+                                jogador_selecionado_para_info = jogo_backend.jogadores[i]
+                                mostrar_painel_propriedades = True
+                                break
             
-            if mostrar_painel_propriedades and hasattr(desenhar_painel_propriedades_jogador, 'fechar_rect'):
-                if desenhar_painel_propriedades_jogador.fechar_rect.collidepoint(event.pos):
-                    mostrar_painel_propriedades = False
-                    jogador_selecionado_para_info = None
+                if mostrar_painel_propriedades and hasattr(desenhar_painel_propriedades_jogador, 'fechar_rect'):
+                    if desenhar_painel_propriedades_jogador.fechar_rect.collidepoint(event.pos):
+                        mostrar_painel_propriedades = False
+                        jogador_selecionado_para_info = None
             
-            if MOSTRAR_HUD_MENU and estado_jogo == "INICIO_TURNO":
-                if hasattr(desenhar_menu_turno, 'botao_lancar_rect') and \
-                   desenhar_menu_turno.botao_lancar_rect.collidepoint(event.pos):
+                if MOSTRAR_HUD_MENU and estado_jogo == "INICIO_TURNO":
+                    if hasattr(desenhar_menu_turno, 'botao_lancar_rect') and \
+                       desenhar_menu_turno.botao_lancar_rect.collidepoint(event.pos):
                     
-                    if estado_turno == "ANTES_LANCAR_DADOS" and not turno_bot_em_execucao:
-                        tempo_bloqueio_botoes = 60
-                        estado_turno = "LANCANDO_DADOS"
+                        if estado_turno == "ANTES_LANCAR_DADOS" and not turno_bot_em_execucao:
+                            tempo_bloqueio_botoes = 60
+                            estado_turno = "LANCANDO_DADOS"
                         
-                        jogador_antes = jogo_backend.jogadores[jogo_backend.indice_turno_atual].nome
+                            jogador_antes = jogo_backend.jogadores[jogo_backend.indice_turno_atual].nome
                         
-                        casa_onde_parei = jogo_backend.rolar_dados_e_mover()
-                        print(f"Backend moveu jogador para: {casa_onde_parei.nome}")
+                            casa_onde_parei = jogo_backend.rolar_dados_e_mover()
+                            print(f"Backend moveu jogador para: {casa_onde_parei.nome}")
                         
-                        dado1_valor = jogo_backend.ultimo_d1
-                        dado2_valor = jogo_backend.ultimo_d2
-                        dados_lancados = True
+                            dado1_valor = jogo_backend.ultimo_d1
+                            dado2_valor = jogo_backend.ultimo_d2
+                            dados_lancados = True
                         
-                        adicionar_mensagem_log(f"{jogador_antes}: {dado1_valor}+{dado2_valor} -> {casa_onde_parei.nome}")
-                        adicionar_mensagem_feedback(f"{jogador_antes}: {dado1_valor}+{dado2_valor} -> {casa_onde_parei.nome}")
+                            adicionar_mensagem_log(f"{jogador_antes}: {dado1_valor}+{dado2_valor} -> {casa_onde_parei.nome}")
+                            adicionar_mensagem_feedback(f"{jogador_antes}: {dado1_valor}+{dado2_valor} -> {casa_onde_parei.nome}")
                         
-                        acao_necessaria = jogo_backend.obter_acao_para_casa(casa_onde_parei)
+                            acao_necessaria = jogo_backend.obter_acao_para_casa(casa_onde_parei)
                         
-                        estado_turno_acao = acao_necessaria["tipo"]
-                        posicao_para_decisao = jogo_backend.jogadores[jogo_backend.indice_turno_atual].posicao
-                        
-                        if acao_necessaria["tipo"] == "PEGAR_CARTA":
-                            print(f"[v0] Acionando PEGAR_CARTA para jogador {jogador_antes}")
-                            casa_atual = jogo_backend.tabuleiro.get_casa(jogo_backend.jogadores[jogo_backend.indice_turno_atual].posicao)
-                            resultado = jogo_backend.executar_acao_automatica(casa_atual)
-                            print(f"[v0] Resultado de executar_acao_automatica: {resultado}")
+                            if acao_necessaria["tipo"] == "PEGAR_CARTA":
+                                print(f"[v0] Acionando PEGAR_CARTA para jogador {jogador_antes}")
+                                casa_atual = jogo_backend.tabuleiro.get_casa(jogo_backend.jogadores[jogo_backend.indice_turno_atual].posicao)
+                                resultado = jogo_backend.executar_acao_automatica(casa_atual)
+                                print(f"[v0] Resultado de executar_acao_automatica: {resultado}")
                             
-                            if resultado is not None and isinstance(resultado, dict) and "mensagem" in resultado:
-                                mensagem_carta_atual = resultado["mensagem"]
-                                tempo_mensagem_carta = 300  # 5 seconds at 60fps
-                                mostrar_popup_carta = True
-                                print(f"[v0] Adicionando ao log: {resultado['mensagem']}")
-                                adicionar_mensagem_log(f"CARTA: {resultado['mensagem']}")
-                                adicionar_mensagem_feedback(f"CARTA: {resultado['mensagem']}")
-                            else:
-                                print(f"[v0] AVISO: Resultado vazio ou inválido de executar_acao_automatica")
+                                if resultado is not None and isinstance(resultado, dict) and "mensagem" in resultado:
+                                    mensagem_carta_atual = resultado["mensagem"]
+                                    tempo_mensagem_carta = 300  # 5 seconds at 60fps
+                                    mostrar_popup_carta = True
+                                    print(f"[v0] Adicionando ao log: {resultado['mensagem']}")
+                                    adicionar_mensagem_log(f"CARTA: {resultado['mensagem']}")
+                                    adicionar_mensagem_feedback(f"CARTA: {resultado['mensagem']}")
+                                else:
+                                    print(f"[v0] AVISO: Resultado vazio ou inválido de executar_acao_automatica")
                             
-                            jogo_backend.finalizar_turno()
-                            if jogo_backend.jogo_finalizado:
-                                tela_fim_jogo = TelaFimDeJogo(screen, jogo_backend)
-                                estado_jogo = "FIM_JOGO"
-                            else:
-                                estado_turno = "ANTES_LANCAR_DADOS"
+                                if resultado and resultado.get("pendente"):
+                                    # O efeito da carta é aplicado ao fim da exibição; o turno termina depois
+                                    estado_turno = "EXIBINDO_CARTA"
+                                else:
+                                    jogo_backend.finalizar_turno()
+                                    if jogo_backend.jogo_finalizado:
+                                        tela_fim_jogo = TelaFimDeJogo(screen, jogo_backend)
+                                        estado_jogo = "FIM_JOGO"
+                                    else:
+                                        estado_turno = "ANTES_LANCAR_DADOS"
                         
-                        elif acao_necessaria["tipo"] in ["ACAO_AUTOMATICA", "PAGAR_ALUGUEL"]:
-                            if acao_necessaria["tipo"] == "PAGAR_ALUGUEL":
-                                adicionar_mensagem_log(f"Pagando aluguel...")
-                                adicionar_mensagem_feedback(f"Pagando aluguel...")
+                            elif acao_necessaria["tipo"] in ["ACAO_AUTOMATICA", "PAGAR_ALUGUEL"]:
+                                if acao_necessaria["tipo"] == "PAGAR_ALUGUEL":
+                                    adicionar_mensagem_log(f"Pagando aluguel...")
+                                    adicionar_mensagem_feedback(f"Pagando aluguel...")
                             
-                            resultado = jogo_backend.executar_acao_automatica(casa_atual)
-                            if resultado and "mensagem" in resultado:
-                                tempo_mensagem_carta = 200
-                                mensagem_carta_atual = resultado["mensagem"]
-                                mostrar_popup_carta = True
-                                adicionar_mensagem_log(resultado["mensagem"])
-                                adicionar_mensagem_feedback(resultado["mensagem"])
+                                resultado = jogo_backend.executar_acao_automatica(casa_atual)
+                                if resultado and "mensagem" in resultado:
+                                    tempo_mensagem_carta = 200
+                                    mensagem_carta_atual = resultado["mensagem"]
+                                    mostrar_popup_carta = True
+                                    adicionar_mensagem_log(resultado["mensagem"])
+                                    adicionar_mensagem_feedback(resultado["mensagem"])
                             
-                            jogo_backend.finalizar_turno()
-                            if jogo_backend.jogo_finalizado:
-                                tela_fim_jogo = TelaFimDeJogo(screen, jogo_backend)
-                                estado_jogo = "FIM_JOGO"
+                                jogo_backend.finalizar_turno()
+                                if jogo_backend.jogo_finalizado:
+                                    tela_fim_jogo = TelaFimDeJogo(screen, jogo_backend)
+                                    estado_jogo = "FIM_JOGO"
+                                else:
+                                    estado_turno = "ANTES_LANCAR_DADOS"
+                        
+                            elif acao_necessaria["tipo"] == "NENHUMA_ACAO":
+                                jogo_backend.finalizar_turno()
+                                if jogo_backend.jogo_finalizado:
+                                    tela_fim_jogo = TelaFimDeJogo(screen, jogo_backend)
+                                    estado_jogo = "FIM_JOGO"
+                                else:
+                                    estado_turno = "ANTES_LANCAR_DADOS"
+                        
                             else:
-                                estado_turno = "ANTES_LANCAR_DADOS"
+                                estado_turno = "APOS_LANCAR_DADOS"
+                        continue
+                
+                    elif hasattr(desenhar_menu_turno, 'botao_comprar_rect') and \
+                         desenhar_menu_turno.botao_comprar_rect.collidepoint(event.pos):
+                        if estado_turno == "APOS_LANCAR_DADOS" and not turno_bot_em_execucao:
+                            # Direct purchase logic without disabling buttons
+                            jogador_atual = jogo_backend.jogadores[jogo_backend.indice_turno_atual]
+                            casa_atual = jogo_backend.tabuleiro.casas[jogador_atual.posicao]
                         
-                        elif acao_necessaria["tipo"] == "NENHUMA_ACAO":
+                            if isinstance(casa_atual, Propriedade) and not casa_atual.proprietario:
+                                sucesso = jogo_backend.executar_compra()
+                                if sucesso:
+                                    adicionar_mensagem_log(f"{jogador_atual.nome} comprou {casa_atual.nome}")
+                                    adicionar_mensagem_feedback(f"{jogador_atual.nome} comprou {casa_atual.nome}")
+                                    mostrar_menu_compra = False # Close the purchase menu
+                                    # Auto-pass turn after buying
+                                    jogo_backend.finalizar_turno()
+                                    if jogo_backend.jogo_finalizado:
+                                        tela_fim_jogo = TelaFimDeJogo(screen, jogo_backend)
+                                        estado_jogo = "FIM_JOGO"
+                                    else:
+                                        estado_turno = "ANTES_LANCAR_DADOS"
+                                        dados_lancados = False
+                                else:
+                                    adicionar_mensagem_log("Não foi possível comprar a propriedade")
+                                    adicionar_mensagem_feedback("Não foi possível comprar a propriedade")
+                            continue
+                
+                    elif hasattr(desenhar_menu_turno, 'botao_propriedades_rect') and \
+                         desenhar_menu_turno.botao_propriedades_rect.collidepoint(event.pos):
+                        if estado_turno == "APOS_LANCAR_DADOS" and not turno_bot_em_execucao:
+                            mostrar_menu_proposta = True
+                            adicionar_mensagem_log("Abrindo gerenciador de propriedades")
+                            adicionar_mensagem_feedback("Abrindo gerenciador de propriedades")
+                        continue
+                
+                    elif hasattr(desenhar_menu_turno, 'botao_negociar_rect') and \
+                         desenhar_menu_turno.botao_negociar_rect.collidepoint(event.pos):
+                        if estado_turno == "APOS_LANCAR_DADOS" and not turno_bot_em_execucao:
+                            mostrar_menu_negociacao = True
+                        continue
+                
+                    elif hasattr(desenhar_menu_turno, 'botao_passar_rect') and \
+                         desenhar_menu_turno.botao_passar_rect.collidepoint(event.pos):
+                        if estado_turno == "APOS_LANCAR_DADOS" and not turno_bot_em_execucao:
                             jogo_backend.finalizar_turno()
                             if jogo_backend.jogo_finalizado:
                                 tela_fim_jogo = TelaFimDeJogo(screen, jogo_backend)
                                 estado_jogo = "FIM_JOGO"
                             else:
                                 estado_turno = "ANTES_LANCAR_DADOS"
-                        
-                        else:
-                            estado_turno = "APOS_LANCAR_DADOS"
+                                dados_lancados = False
+                            adicionar_mensagem_log("Passou a vez")
+                            adicionar_mensagem_feedback("Passou a vez")
+                        continue
+            
+                if mostrar_menu_construcao:
+                    # Check close button
+                    if hasattr(desenhar_menu_construcao, 'botao_fechar_rect') and \
+                       desenhar_menu_construcao.botao_fechar_rect.collidepoint(event.pos):
+                        mostrar_menu_construcao = False
+                        continue
+                
+                    # Check construction buttons
+                    if hasattr(desenhar_menu_construcao, 'botoes_construir'):
+                        for botao_rect, propriedade in desenhar_menu_construcao.botoes_construir:
+                            if botao_rect.collidepoint(event.pos):
+                                jogador_atual = jogo_backend.jogadores[jogo_backend.indice_turno_atual]
+                                sucesso = jogo_backend.construir_na_propriedade(jogador_atual, propriedade)
+                                if sucesso:
+                                    casas_txt = "Hotel" if propriedade.casas == 5 else f"{propriedade.casas} casas"
+                                    adicionar_mensagem_log(f"Construiu em {propriedade.nome}: {casas_txt}")
+                                    adicionar_mensagem_feedback(f"Construiu em {propriedade.nome}: {casas_txt}")
+                                    # No change in state here, construction menu stays open until closed
+                                break
+                    continue
+            
+                if mostrar_menu_proposta:
+                    # Check close button
+                    if hasattr(desenhar_menu_propostas, 'botao_fechar_rect') and \
+                       desenhar_menu_propostas.botao_fechar_rect.collidepoint(event.pos):
+                        mostrar_menu_proposta = False
+                        continue
+                
+                    # Check player selection buttons
+                    if hasattr(desenhar_menu_propostas, 'botoes_jogadores'):
+                        for botao_rect, jogador in desenhar_menu_propostas.botoes_jogadores:
+                            if botao_rect.collidepoint(event.pos):
+                                adicionar_mensagem_log(f"Sistema de proposta em desenvolvimento")
+                                adicionar_mensagem_log(f"Negociar com {jogador.nome}")
+                                adicionar_mensagem_feedback(f"Sistema de proposta em desenvolvimento")
+                                adicionar_mensagem_feedback(f"Negociar com {jogador.nome}")
+                                mostrar_menu_proposta = False
+                                break
                     continue
+            
+                if mostrar_menu_compra:
+                    # Check close button
+                    if hasattr(desenhar_menu_compra, 'fechar_rect') and \
+                       desenhar_menu_compra.fechar_rect.collidepoint(event.pos):
+                        mostrar_menu_compra = False
+                        continue
                 
-                elif hasattr(desenhar_menu_turno, 'botao_comprar_rect') and \
-                     desenhar_menu_turno.botao_comprar_rect.collidepoint(event.pos):
-                    if estado_turno == "APOS_LANCAR_DADOS" and not turno_bot_em_execucao:
-                        # Direct purchase logic without disabling buttons
+                    # Check buy button
+                    if hasattr(desenhar_menu_compra, 'botao_comprar_rect') and \
+                       desenhar_menu_compra.botao_comprar_rect.collidepoint(event.pos):
                         jogador_atual = jogo_backend.jogadores[jogo_backend.indice_turno_atual]
                         casa_atual = jogo_backend.tabuleiro.casas[jogador_atual.posicao]
-                        
+                    
                         if isinstance(casa_atual, Propriedade) and not casa_atual.proprietario:
                             sucesso = jogo_backend.executar_compra()
                             if sucesso:
@@ -1189,265 +1401,171 @@ while running:
                             else:
                                 adicionar_mensagem_log("Não foi possível comprar a propriedade")
                                 adicionar_mensagem_feedback("Não foi possível comprar a propriedade")
-                        continue
-                
-                elif hasattr(desenhar_menu_turno, 'botao_propriedades_rect') and \
-                     desenhar_menu_turno.botao_propriedades_rect.collidepoint(event.pos):
-                    if estado_turno == "APOS_LANCAR_DADOS" and not turno_bot_em_execucao:
-                        mostrar_menu_proposta = True
-                        adicionar_mensagem_log("Abrindo gerenciador de propriedades")
-                        adicionar_mensagem_feedback("Abrindo gerenciador de propriedades")
-                    continue
-                
-                elif hasattr(desenhar_menu_turno, 'botao_negociar_rect') and \
-                     desenhar_menu_turno.botao_negociar_rect.collidepoint(event.pos):
-                    if estado_turno == "APOS_LANCAR_DADOS" and not turno_bot_em_execucao:
-                        mostrar_menu_negociacao = True
-                    continue
-                
-                elif hasattr(desenhar_menu_turno, 'botao_passar_rect') and \
-                     desenhar_menu_turno.botao_passar_rect.collidepoint(event.pos):
-                    if estado_turno == "APOS_LANCAR_DADOS" and not turno_bot_em_execucao:
-                        jogo_backend.finalizar_turno()
-                        if jogo_backend.jogo_finalizado:
-                            tela_fim_jogo = TelaFimDeJogo(screen, jogo_backend)
-                            estado_jogo = "FIM_JOGO"
-                        else:
-                            estado_turno = "ANTES_LANCAR_DADOS"
-                            dados_lancados = False
-                        adicionar_mensagem_log("Passou a vez")
-                        adicionar_mensagem_feedback("Passou a vez")
-                    continue
-            
-            if mostrar_menu_construcao:
-                # Check close button
-                if hasattr(desenhar_menu_construcao, 'botao_fechar_rect') and \
-                   desenhar_menu_construcao.botao_fechar_rect.collidepoint(event.pos):
-                    mostrar_menu_construcao = False
-                    continue
-                
-                # Check construction buttons
-                if hasattr(desenhar_menu_construcao, 'botoes_construir'):
-                    for botao_rect, propriedade in desenhar_menu_construcao.botoes_construir:
-                        if botao_rect.collidepoint(event.pos):
-                            jogador_atual = jogo_backend.jogadores[jogo_backend.indice_turno_atual]
-                            sucesso = jogo_backend.construir_na_propriedade(jogador_atual, propriedade)
-                            if sucesso:
-                                casas_txt = "Hotel" if propriedade.casas == 5 else f"{propriedade.casas} casas"
-                                adicionar_mensagem_log(f"Construiu em {propriedade.nome}: {casas_txt}")
-                                adicionar_mensagem_feedback(f"Construiu em {propriedade.nome}: {casas_txt}")
-                                # No change in state here, construction menu stays open until closed
-                            break
-                continue
-            
-            if mostrar_menu_proposta:
-                # Check close button
-                if hasattr(desenhar_menu_propostas, 'botao_fechar_rect') and \
-                   desenhar_menu_propostas.botao_fechar_rect.collidepoint(event.pos):
-                    mostrar_menu_proposta = False
-                    continue
-                
-                # Check player selection buttons
-                if hasattr(desenhar_menu_propostas, 'botoes_jogadores'):
-                    for botao_rect, jogador in desenhar_menu_propostas.botoes_jogadores:
-                        if botao_rect.collidepoint(event.pos):
-                            adicionar_mensagem_log(f"Sistema de proposta em desenvolvimento")
-                            adicionar_mensagem_log(f"Negociar com {jogador.nome}")
-                            adicionar_mensagem_feedback(f"Sistema de proposta em desenvolvimento")
-                            adicionar_mensagem_feedback(f"Negociar com {jogador.nome}")
-                            mostrar_menu_proposta = False
-                            break
-                continue
-            
-            if mostrar_menu_compra:
-                # Check close button
-                if hasattr(desenhar_menu_compra, 'fechar_rect') and \
-                   desenhar_menu_compra.fechar_rect.collidepoint(event.pos):
-                    mostrar_menu_compra = False
                     continue
-                
-                # Check buy button
-                if hasattr(desenhar_menu_compra, 'botao_comprar_rect') and \
-                   desenhar_menu_compra.botao_comprar_rect.collidepoint(event.pos):
-                    jogador_atual = jogo_backend.jogadores[jogo_backend.indice_turno_atual]
-                    casa_atual = jogo_backend.tabuleiro.casas[jogador_atual.posicao]
-                    
-                    if isinstance(casa_atual, Propriedade) and not casa_atual.proprietario:
-                        sucesso = jogo_backend.executar_compra()
-                        if sucesso:
-                            adicionar_mensagem_log(f"{jogador_atual.nome} comprou {casa_atual.nome}")
-                            adicionar_mensagem_feedback(f"{jogador_atual.nome} comprou {casa_atual.nome}")
-                            mostrar_menu_compra = False # Close the purchase menu
-                            # Auto-pass turn after buying
-                            jogo_backend.finalizar_turno()
-                            if jogo_backend.jogo_finalizado:
-                                tela_fim_jogo = TelaFimDeJogo(screen, jogo_backend)
-                                estado_jogo = "FIM_JOGO"
-                            else:
-                                estado_turno = "ANTES_LANCAR_DADOS"
-                                dados_lancados = False
-                        else:
-                            adicionar_mensagem_log("Não foi possível comprar a propriedade")
-                            adicionar_mensagem_feedback("Não foi possível comprar a propriedade")
-                continue
 
-            if mostrar_menu_negociacao and hasattr(desenhar_menu_negociacao, 'fechar_rect'):
-                if desenhar_menu_negociacao.fechar_rect.collidepoint(event.pos):
-                    mostrar_menu_negociacao = False
-                    desenhar_menu_negociacao.jogador_selecionado_para_negociacao = None # Reset selected player
-                    continue
+                if mostrar_menu_negociacao and hasattr(desenhar_menu_negociacao, 'fechar_rect'):
+                    if desenhar_menu_negociacao.fechar_rect.collidepoint(event.pos):
+                        mostrar_menu_negociacao = False
+                        desenhar_menu_negociacao.jogador_selecionado_para_negociacao = None # Reset selected player
+                        continue
                 
-                # Player selection
-                if hasattr(desenhar_menu_negociacao, 'player_buttons'):
-                    for player_button, jogador in desenhar_menu_negociacao.player_buttons:
-                        if player_button.collidepoint(event.pos):
-                            desenhar_menu_negociacao.jogador_selecionado_para_negociacao = jogador # Store selected player
-                            # Clear previous selections
-                            if hasattr(desenhar_menu_negociacao, 'sua_prop_selecionada'):
-                                del desenhar_menu_negociacao.sua_prop_selecionada
-                            continue
+                    # Player selection
+                    if hasattr(desenhar_menu_negociacao, 'player_buttons'):
+                        for player_button, jogador in desenhar_menu_negociacao.player_buttons:
+                            if player_button.collidepoint(event.pos):
+                                desenhar_menu_negociacao.jogador_selecionado_para_negociacao = jogador # Store selected player
+                                # Clear previous selections
+                                if hasattr(desenhar_menu_negociacao, 'sua_prop_selecionada'):
+                                    del desenhar_menu_negociacao.sua_prop_selecionada
+                                continue
                 
-                # Your properties selection
-                if hasattr(desenhar_menu_negociacao, 'sua_propriedades_buttons') and hasattr(desenhar_menu_negociacao, 'jogador_selecionado_para_negociacao'):
-                    for prop_button, prop_sua in desenhar_menu_negociacao.sua_propriedades_buttons:
-                        if prop_button.collidepoint(event.pos):
-                            desenhar_menu_negociacao.sua_prop_selecionada = prop_sua
-                            adicionar_mensagem_feedback(f"Selecionou {prop_sua.nome} para oferecer")
-                            continue
+                    # Your properties selection
+                    if hasattr(desenhar_menu_negociacao, 'sua_propriedades_buttons') and hasattr(desenhar_menu_negociacao, 'jogador_selecionado_para_negociacao'):
+                        for prop_button, prop_sua in desenhar_menu_negociacao.sua_propriedades_buttons:
+                            if prop_button.collidepoint(event.pos):
+                                desenhar_menu_negociacao.sua_prop_selecionada = prop_sua
+                                adicionar_mensagem_feedback(f"Selecionou {prop_sua.nome} para oferecer")
+                                continue
                 
-                # Other player's properties selection and trade proposal
-                if hasattr(desenhar_menu_negociacao, 'outra_propriedades_buttons') and hasattr(desenhar_menu_negociacao, 'sua_prop_selecionada') and desenhar_menu_negociacao.sua_prop_selecionada:
-                    for prop_button, prop_deles in desenhar_menu_negociacao.outra_propriedades_buttons:
-                        if prop_button.collidepoint(event.pos):
-                            # Execute trade proposal
-                            jogador_atual = jogo_backend.jogadores[jogo_backend.indice_turno_atual]
-                            jogador_a_trocar = desenhar_menu_negociacao.jogador_selecionado_para_negociacao
+                    # Other player's properties selection and trade proposal
+                    if hasattr(desenhar_menu_negociacao, 'outra_propriedades_buttons') and hasattr(desenhar_menu_negociacao, 'sua_prop_selecionada') and desenhar_menu_negociacao.sua_prop_selecionada:
+                        for prop_button, prop_deles in desenhar_menu_negociacao.outra_propriedades_buttons:
+                            if prop_button.collidepoint(event.pos):
+                                # Execute trade proposal
+                                jogador_atual = jogo_backend.jogadores[jogo_backend.indice_turno_atual]
+                                jogador_a_trocar = desenhar_menu_negociacao.jogador_selecionado_para_negociacao
                             
-                            # Note: The trade proposal function currently acts as an immediate trade for simplicity.
-                            # A full implementation would involve waiting for the other player's response.
-                            sucesso = jogo_backend.negociador_propriedades.propor_troca_propriedades(
-                                jogador_atual,
-                                jogador_a_trocar,
-                                desenhar_menu_negociacao.sua_prop_selecionada,
-                                prop_deles,
-                                0 # Money component not implemented
-                            )
+                                # Note: The trade proposal function currently acts as an immediate trade for simplicity.
+                                # A full implementation would involve waiting for the other player's response.
+                                sucesso = jogo_backend.negociador_propriedades.propor_troca_propriedades(
+                                    jogador_atual,
+                                    jogador_a_trocar,
+                                    desenhar_menu_negociacao.sua_prop_selecionada,
+                                    prop_deles,
+                                    0 # Money component not implemented
+                                )
                             
-                            if sucesso:
-                                # Currently, accepting the trade immediately
-                                jogo_backend.negociador_propriedades.aceitar_troca(sucesso)
-                                adicionar_mensagem_log(f"Troca realizada: {desenhar_menu_negociacao.sua_prop_selecionada.nome} por {prop_deles.nome}")
-                                adicionar_mensagem_feedback(f"Troca realizada com {jogador_a_trocar.nome}")
-                                mostrar_menu_negociacao = False
-                                desenhar_menu_negociacao.jogador_selecionado_para_negociacao = None
-                                del desenhar_menu_negociacao.sua_prop_selecionada
-                            else:
-                                adicionar_mensagem_log("Falha na negociação.")
-                                adicionar_mensagem_feedback("Falha na negociação.")
-                            continue
+                                if sucesso:
+                                    # Currently, accepting the trade immediately
+                                    jogo_backend.negociador_propriedades.aceitar_troca(sucesso)
+                                    adicionar_mensagem_log(f"Troca realizada: {desenhar_menu_negociacao.sua_prop_selecionada.nome} por {prop_deles.nome}")
+                                    adicionar_mensagem_feedback(f"Troca realizada com {jogador_a_trocar.nome}")
+                                    mostrar_menu_negociacao = False
+                                    desenhar_menu_negociacao.jogador_selecionado_para_negociacao = None
+                                    del desenhar_menu_negociacao.sua_prop_selecionada
+                                else:
+                                    adicionar_mensagem_log("Falha na negociação.")
+                                    adicionar_mensagem_feedback("Falha na negociação.")
+                                continue
             
-    # --- ATUALIZAÇÃO DAS ANIMAÇÕES ---
-    if estado_jogo == "MENU":
-        menu_inicial.update()
-    elif estado_jogo == "FIM_JOGO":
-        tela_fim_jogo.update()
-    
-    # --- RENDERIZAÇÃO POR ESTADO ---
-    if estado_jogo == "MENU":
-        menu_inicial.draw()
-    
-    elif estado_jogo == "FIM_JOGO":
-        tela_fim_jogo.draw()
-    
-    else:  # Estados de jogo (INICIO_TURNO, OPCAO_COMPRA)
-        screen.fill(COR_FUNDO)
-        screen.blit(tabuleiro_img, (X_TABULEIRO, Y_TABULEIRO))
-        
-        desenhar_construcoes_no_tabuleiro()
+        # --- ATUALIZAÇÃO DAS ANIMAÇÕES ---
+        if estado_jogo == "MENU":
+            menu_inicial.update()
+        elif estado_jogo == "FIM_JOGO":
+            tela_fim_jogo.update()
+        else:
+            # Exibição de cartas: o efeito é aplicado quando o tempo da carta acaba
+            resultado_carta = jogo_backend.atualizar(dt)
+            if resultado_carta and estado_turno == "EXIBINDO_CARTA":
+                jogo_backend.finalizar_turno()
+                if jogo_backend.jogo_finalizado:
+                    tela_fim_jogo = TelaFimDeJogo(screen, jogo_backend)
+                    estado_jogo = "FIM_JOGO"
+                else:
+                    estado_turno = "ANTES_LANCAR_DADOS"
+    
+        # --- RENDERIZAÇÃO POR ESTADO ---
+        if estado_jogo == "MENU":
+            menu_inicial.draw()
+            renderizador.invalidar()
+    
+        elif estado_jogo == "FIM_JOGO":
+            tela_fim_jogo.draw()
+            renderizador.invalidar()
+    
+        else:  # Estados de jogo (INICIO_TURNO, OPCAO_COMPRA)
+            marcar_regioes_jogo()
         
-        # In the rendering loop where pieces are drawn:
-        for i, jogador in enumerate(jogo_backend.jogadores):
-            if jogador.falido:
-                continue
-            
-            # Use precise positions from the POSICOES_CASAS_PRECISAS
-            if jogador.posicao < len(POSICOES_CASAS_PRECISAS):
-                pos_x, pos_y = POSICOES_CASAS_PRECISAS[jogador.posicao]
-                
-                # Use dynamic offsets based on how many players are in the same square
-                offset_x, offset_y = calcular_offsets_peoes_dinamicos(i, jogo_backend.jogadores)
-                
-                if i < len(PEOES_IMG):
-                    peao_img = PEOES_IMG[i]
-                    # Apply global adjustments and center the pawn
-                    screen_x = X_TABULEIRO + pos_x + offset_x - peao_img.get_width() // 2 + AJUSTE_GLOBAL_PEOES_X
-                    screen_y = Y_TABULEIRO + pos_y + offset_y - peao_img.get_height() // 2 + AJUSTE_GLOBAL_PEOES_Y
-                    screen.blit(peao_img, (screen_x, screen_y))
+            # Quadro sem mudanças: nada é desenhado
+            if renderizador.ha_mudancas():
+                # Fundo, tabuleiro e construções vêm da camada estática
+                renderizador.compor()
         
+                # In the rendering loop where pieces are drawn:
+                for i in range(len(jogo_backend.jogadores)):
+                    posicao = posicao_tela_peao(i)
+                    if posicao is not None:
+                        screen.blit(PEOES_IMG[i], posicao)
         
-        # Renderizando informações dos jogadores com propriedades (LADO DIREITO)
-        for i, jogador in enumerate(jogo_backend.jogadores):
-            pos_texto_x, pos_texto_y = POSICOES_TEXTO_JOGADOR[i % len(POSICOES_TEXTO_JOGADOR)]
+                # Renderizando informações dos jogadores com propriedades (LADO DIREITO)
+                for i, jogador in enumerate(jogo_backend.jogadores):
+                    pos_texto_x, pos_texto_y = POSICOES_TEXTO_JOGADOR[i % len(POSICOES_TEXTO_JOGADOR)]
             
-            cor_nome = (255, 215, 0) if i == jogo_backend.indice_turno_atual else (255, 255, 255)
+                    cor_nome = (255, 215, 0) if i == jogo_backend.indice_turno_atual else (255, 255, 255)
             
-            if jogador.falido:
-                texto_nome = FONTE_PADRAO.render(f"{jogador.nome} (FALIDO)", True, (150, 150, 150))
-            else:
-                texto_nome = FONTE_PADRAO.render(jogador.nome, True, cor_nome)
+                    if jogador.falido:
+                        texto_nome = renderizar_texto(FONTE_PADRAO, f"{jogador.nome} (FALIDO)", (150, 150, 150))
+                    else:
+                        texto_nome = renderizar_texto(FONTE_PADRAO, jogador.nome, cor_nome)
             
-            saldo_jogador = jogo_backend.banco.consultar_saldo(jogador.nome)
-            texto_saldo = FONTE_PEQUENA.render(f"${saldo_jogador}", True, (150, 255, 150))
+                    saldo_jogador = jogo_backend.banco.consultar_saldo(jogador.nome)
+                    texto_saldo = renderizar_texto(FONTE_PEQUENA, f"${saldo_jogador}", (150, 255, 150))
             
-            screen.blit(texto_nome, (pos_texto_x, pos_texto_y))
-            screen.blit(texto_saldo, (pos_texto_x, pos_texto_y + 20))
+                    screen.blit(texto_nome, (pos_texto_x, pos_texto_y))
+                    screen.blit(texto_saldo, (pos_texto_x, pos_texto_y + 20))
             
-            num_props = len(jogador.propriedades)
-            if num_props > 0:
-                texto_props_info = FONTE_PEQUENA.render(f"Propriedades: {num_props} [clique]", True, (200, 200, 100))
-                screen.blit(texto_props_info, (pos_texto_x, pos_texto_y + 35))
+                    num_props = len(jogador.propriedades)
+                    if num_props > 0:
+                        texto_props_info = renderizar_texto(FONTE_PEQUENA, f"Propriedades: {num_props} [clique]", (200, 200, 100))
+                        screen.blit(texto_props_info, (pos_texto_x, pos_texto_y + 35))
         
-        if mostrar_painel_propriedades and jogador_selecionado_para_info:
-            desenhar_painel_propriedades_jogador(jogador_selecionado_para_info)
+                if mostrar_painel_propriedades and jogador_selecionado_para_info:
+                    desenhar_painel_propriedades_jogador(jogador_selecionado_para_info)
         
-        # Draw dados if they were rolled
-        if dados_lancados and dado1_valor and dado2_valor:
-            # Draw white background for dice
-            pygame.draw.rect(screen, (255, 255, 255), (20, 530, 140, 60))
-            pygame.draw.rect(screen, (0, 0, 0), (20, 530, 140, 60), 2)
+                # Draw dados if they were rolled
+                if dados_lancados and dado1_valor and dado2_valor:
+                    # Draw white background for dice
+                    pygame.draw.rect(screen, (255, 255, 255), (20, 530, 140, 60))
+                    pygame.draw.rect(screen, (0, 0, 0), (20, 530, 140, 60), 2)
             
-            # Draw dice images
-            dado1_img = pygame.transform.scale(imagens_dados[dado1_valor - 1], (50, 50))
-            dado2_img = pygame.transform.scale(imagens_dados[dado2_valor - 1], (50, 50))
-            screen.blit(dado1_img, (30, 535))
-            screen.blit(dado2_img, (90, 535))
+                    # Draw dice images
+                    screen.blit(imagens_dados[dado1_valor - 1], (30, 535))
+                    screen.blit(imagens_dados[dado2_valor - 1], (90, 535))
             
-            # Draw text below
-            texto_dados = FONTE_PEQUENA.render(f"Dados: {dado1_valor} + {dado2_valor}", True, (255, 255, 255))
-            screen.blit(texto_dados, (25, 595))
+                    # Draw text below
+                    texto_dados = renderizar_texto(FONTE_PEQUENA, f"Dados: {dado1_valor} + {dado2_valor}", (255, 255, 255))
+                    screen.blit(texto_dados, (25, 595))
 
-        if mostrar_menu_compra:
-            desenhar_menu_compra()
+                if mostrar_menu_compra:
+                    desenhar_menu_compra()
         
-        if mostrar_menu_proposta:
-            desenhar_menu_propostas()
+                if mostrar_menu_proposta:
+                    desenhar_menu_propostas()
         
-        if mostrar_menu_construcao:
-            desenhar_menu_construcao()
+                if mostrar_menu_construcao:
+                    desenhar_menu_construcao()
         
-        if mostrar_menu_negociacao:
-            desenhar_menu_negociacao()
+                if mostrar_menu_negociacao:
+                    desenhar_menu_negociacao()
         
-        desenhar_painel_feedback()
-        desenhar_menu_turno() # Draw the turn menu on the left - ONLY HUD
+                desenhar_painel_feedback()
+                desenhar_menu_turno() # Draw the turn menu on the left - ONLY HUD
         
-        if mostrar_popup_carta:
-            desenhar_popup_carta()
+                if mostrar_popup_carta:
+                    desenhar_popup_carta()
     
-    atualizar_bloqueio_botoes()
+        atualizar_bloqueio_botoes()
 
-    pygame.display.flip()
-    clock.tick(60)
+        # Menu e fim de jogo são animados (tela inteira); na tela de jogo só as áreas sujas são enviadas
+        renderizador.apresentar()
+        dt = clock.tick(60) / 1000
+        
+        quadros += 1
+        if max_quadros is not None and quadros >= max_quadros:
+            running = False
+    
+    pygame.quit()
 
-pygame.quit()
-sys.exit()
+if __name__ == '__main__':
+    main()
+    sys.exit()
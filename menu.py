@@ -6,6 +6,9 @@ import sys
 import math
 import random
 
+from cache_texto import renderizar_texto
+from recursos import recursos
+
 class CampoTexto:
     """Classe para campo de entrada de texto com design melhorado"""
     def __init__(self, x, y, largura, altura, texto_placeholder=""):
@@ -63,7 +66,7 @@ class CampoTexto:
         texto_display = self.texto if self.texto else self.placeholder
         cor_texto = (255, 255, 255) if self.texto else (120, 120, 140)
         
-        texto_surface = self.fonte.render(texto_display, True, cor_texto)
+        texto_surface = renderizar_texto(self.fonte, texto_display, cor_texto)
         texto_rect = texto_surface.get_rect(midleft=(self.rect.x + 15, self.rect.centery))
         screen.blit(texto_surface, texto_rect)
         
@@ -102,12 +105,10 @@ class Botao:
         
         # Brilho no topo
         brilho_rect = pygame.Rect(rect_atual.x, rect_atual.y, rect_atual.width, rect_atual.height // 3)
-        brilho_surface = pygame.Surface((brilho_rect.width, brilho_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(brilho_surface, (255, 255, 255, 30), brilho_surface.get_rect(), border_radius=12)
-        screen.blit(brilho_surface, brilho_rect)
+        screen.blit(recursos.painel(brilho_rect.size, (255, 255, 255, 30), raio=12), brilho_rect)
         
         # Texto centralizado
-        texto_surface = self.fonte.render(self.texto, True, (255, 255, 255))
+        texto_surface = renderizar_texto(self.fonte, self.texto, (255, 255, 255))
         texto_rect = texto_surface.get_rect(center=rect_atual.center)
         screen.blit(texto_surface, texto_rect)
         
@@ -306,17 +307,17 @@ class MenuInicial:
         titulo_texto = "MONOPOLY"
         
         # Sombra do título
-        sombra_titulo = self.fonte_titulo.render(titulo_texto, True, (0, 0, 0))
+        sombra_titulo = renderizar_texto(self.fonte_titulo, titulo_texto, (0, 0, 0))
         sombra_rect = sombra_titulo.get_rect(center=(self.largura // 2 + 5, 90 + self.titulo_offset + 5))
         self.screen.blit(sombra_titulo, sombra_rect)
         
         # Título principal
-        titulo = self.fonte_titulo.render(titulo_texto, True, (255, 215, 0))
+        titulo = renderizar_texto(self.fonte_titulo, titulo_texto, (255, 215, 0))
         titulo_rect = titulo.get_rect(center=(self.largura // 2, 90 + self.titulo_offset))
         self.screen.blit(titulo, titulo_rect)
         
         # Brilho do título
-        brilho_titulo = self.fonte_titulo.render(titulo_texto, True, (255, 255, 200, 100))
+        brilho_titulo = renderizar_texto(self.fonte_titulo, titulo_texto, (255, 255, 200, 100))
         brilho_rect = brilho_titulo.get_rect(center=(self.largura // 2 - 2, 88 + self.titulo_offset))
         self.screen.blit(brilho_titulo, brilho_rect)
         
@@ -326,7 +327,7 @@ class MenuInicial:
                         (self.largura // 2 + 200, 150), 3)
         
         # Subtítulo - Número de Jogadores
-        subtitulo = self.fonte_subtitulo.render("Selecione o número de jogadores:", True, (220, 220, 240))
+        subtitulo = renderizar_texto(self.fonte_subtitulo, "Selecione o número de jogadores:", (220, 220, 240))
         subtitulo_rect = subtitulo.get_rect(center=(self.largura // 2, 195))
         self.screen.blit(subtitulo, subtitulo_rect)
         
@@ -336,7 +337,7 @@ class MenuInicial:
             botao.draw(self.screen)
         
         # Texto - Digite os nomes
-        texto_nomes = self.fonte_subtitulo.render("Digite os nomes dos jogadores:", True, (220, 220, 240))
+        texto_nomes = renderizar_texto(self.fonte_subtitulo, "Digite os nomes dos jogadores:", (220, 220, 240))
         texto_nomes_rect = texto_nomes.get_rect(center=(self.largura // 2, 285))
         self.screen.blit(texto_nomes, texto_nomes_rect)
         
@@ -395,7 +396,7 @@ class BotaoCircular:
         pygame.draw.circle(screen, cor_borda, (self.x, self.y), self.raio, 4)
         
         # Texto
-        texto_surface = self.fonte.render(self.texto, True, (255, 255, 255))
+        texto_surface = renderizar_texto(self.fonte, self.texto, (255, 255, 255))
         texto_rect = texto_surface.get_rect(center=(self.x, self.y))
         screen.blit(texto_surface, texto_rect)
 
@@ -515,11 +516,11 @@ class TelaFimDeJogo:
         
         # Título com animação
         brilho = abs(math.sin(self.animacao_offset * 0.05)) * 50 + 205
-        titulo = self.fonte_titulo.render("FIM DE JOGO!", True, (255, int(brilho), 0))
+        titulo = renderizar_texto(self.fonte_titulo, "FIM DE JOGO!", (255, int(brilho), 0))
         titulo_rect = titulo.get_rect(center=(self.largura // 2, 60))
         
         # Sombra do título
-        sombra = self.fonte_titulo.render("FIM DE JOGO!", True, (0, 0, 0))
+        sombra = renderizar_texto(self.fonte_titulo, "FIM DE JOGO!", (0, 0, 0))
         sombra_rect = sombra.get_rect(center=(self.largura // 2 + 4, 64))
         self.screen.blit(sombra, sombra_rect)
         self.screen.blit(titulo, titulo_rect)
@@ -529,21 +530,21 @@ class TelaFimDeJogo:
             vencedor_obj, patrimonio, saldo, props = self.vencedor[0]
             
             # Troféu
-            trofeu = self.fonte_grande.render("🏆", True, (255, 215, 0))
+            trofeu = renderizar_texto(self.fonte_grande, "🏆", (255, 215, 0))
             trofeu_rect = trofeu.get_rect(center=(self.largura // 2, 135))
             self.screen.blit(trofeu, trofeu_rect)
             
-            texto_vencedor = self.fonte_subtitulo.render(
+            texto_vencedor = renderizar_texto(
+                self.fonte_subtitulo,
                 f"VENCEDOR: {vencedor_obj.nome.upper()}",
-                True,
                 (255, 215, 0)
             )
             texto_vencedor_rect = texto_vencedor.get_rect(center=(self.largura // 2, 180))
             
             # Sombra
-            sombra_venc = self.fonte_subtitulo.render(
+            sombra_venc = renderizar_texto(
+                self.fonte_subtitulo,
                 f"VENCEDOR: {vencedor_obj.nome.upper()}",
-                True,
                 (0, 0, 0)
             )
             sombra_venc_rect = sombra_venc.get_rect(center=(self.largura // 2 + 2, 182))
@@ -551,9 +552,9 @@ class TelaFimDeJogo:
             self.screen.blit(texto_vencedor, texto_vencedor_rect)
             
             # Patrimônio do vencedor
-            texto_patrimonio = self.fonte_texto.render(
+            texto_patrimonio = renderizar_texto(
+                self.fonte_texto,
                 f"Patrimônio Total: R$ {patrimonio:,.2f}",
-                True,
                 (200, 255, 200)
             )
             texto_patrimonio_rect = texto_patrimonio.get_rect(center=(self.largura // 2, 215))
@@ -581,13 +582,11 @@ class TelaFimDeJogo:
         painel_rect = pygame.Rect(self.largura // 2 - 400, painel_y, 800, painel_altura)
         
         # Fundo do painel
-        painel_surface = pygame.Surface((painel_rect.width, painel_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(painel_surface, (30, 35, 50, 230), painel_surface.get_rect(), border_radius=15)
-        self.screen.blit(painel_surface, painel_rect)
+        self.screen.blit(recursos.painel(painel_rect.size, (30, 35, 50, 230), raio=15), painel_rect)
         pygame.draw.rect(self.screen, (100, 120, 150), painel_rect, 3, border_radius=15)
         
         # Título
-        titulo_stats = self.fonte_subtitulo.render("ESTATÍSTICAS FINAIS", True, (220, 220, 240))
+        titulo_stats = renderizar_texto(self.fonte_subtitulo, "ESTATÍSTICAS FINAIS", (220, 220, 240))
         titulo_stats_rect = titulo_stats.get_rect(center=(self.largura // 2, painel_y + 30))
         self.screen.blit(titulo_stats, titulo_stats_rect)
         
@@ -611,13 +610,11 @@ class TelaFimDeJogo:
         painel_rect = pygame.Rect(self.largura // 2 - 500, painel_y, 1000, painel_altura)
         
         # Fundo do painel
-        painel_surface = pygame.Surface((painel_rect.width, painel_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(painel_surface, (30, 35, 50, 230), painel_surface.get_rect(), border_radius=15)
-        self.screen.blit(painel_surface, painel_rect)
+        self.screen.blit(recursos.painel(painel_rect.size, (30, 35, 50, 230), raio=15), painel_rect)
         pygame.draw.rect(self.screen, (100, 120, 150), painel_rect, 3, border_radius=15)
         
         # Título
-        titulo_stats = self.fonte_subtitulo.render("ESTATÍSTICAS FINAIS", True, (220, 220, 240))
+        titulo_stats = renderizar_texto(self.fonte_subtitulo, "ESTATÍSTICAS FINAIS", (220, 220, 240))
         titulo_stats_rect = titulo_stats.get_rect(center=(self.largura // 2, painel_y + 30))
         self.screen.blit(titulo_stats, titulo_stats_rect)
         
@@ -659,25 +656,25 @@ class TelaFimDeJogo:
         fonte_medalha = self.fonte_grande if compacto else self.fonte_texto
         
         # Medalha
-        texto_medalha = fonte_medalha.render(medalha, True, cor_posicao)
+        texto_medalha = renderizar_texto(fonte_medalha, medalha, cor_posicao)
         self.screen.blit(texto_medalha, (x_base, y_base - 5))
         
         # Nome
-        texto_nome = self.fonte_grande.render(jogador.nome, True, cor_posicao)
+        texto_nome = renderizar_texto(self.fonte_grande, jogador.nome, cor_posicao)
         self.screen.blit(texto_nome, (x_base + 50, y_base))
         
         # Saldo
-        texto_saldo = self.fonte_texto.render(
+        texto_saldo = renderizar_texto(
+            self.fonte_texto,
             f"💰 Saldo: R$ {saldo:,.2f}",
-            True,
             (150, 255, 150)
         )
         self.screen.blit(texto_saldo, (x_base + 50, y_base + 28))
         
         # Propriedades
-        texto_props = self.fonte_texto.render(
+        texto_props = renderizar_texto(
+            self.fonte_texto,
             f"🏠 Propriedades: {len(jogador.propriedades)} (R$ {valor_props:,.2f})",
-            True,
             (150, 200, 255)
         )
         self.screen.blit(texto_props, (x_base + 50, y_base + 50))
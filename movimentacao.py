@@ -1,6 +1,7 @@
 # movimentacao.py
 
 from constantes import POSICAO_SAIDA, VALOR_PASSAGEM_SAIDA, POSICAO_PRISAO
+from registro import log
 
 class GerenciadorMovimentacao:
     """
@@ -80,7 +81,7 @@ class GerenciadorMovimentacao:
         """
         jogador.entrar_prisao()
         jogador.posicao = POSICAO_PRISAO
-        print(f"  > {jogador.nome} foi enviado para a prisão na posição {POSICAO_PRISAO}!")
+        log.info("  > %s foi enviado para a prisão na posição %s!", jogador.nome, POSICAO_PRISAO)
     
     def voltar_casas(self, jogador, quantidade_casas):
         """
@@ -113,18 +114,12 @@ class GerenciadorMovimentacao:
         Returns:
             Casa objeto encontrada ou None se não encontrar
         """
-        posicao_atual = jogador.posicao
+        # Consulta a tabela de "próxima casa do grupo" montada pelo Tabuleiro
+        posicao_destino = self.tabuleiro.get_proxima_posicao_grupo(jogador.posicao, tipo_casa)
+        if posicao_destino is None:
+            return None
         
-        # Procura a próxima casa do tipo especificado
-        for i in range(1, 40):  # Percorre o tabuleiro uma vez
-            posicao_teste = (posicao_atual + i) % 40
-            casa = self.tabuleiro.get_casa(posicao_teste)
-            
-            # Verifica se é uma propriedade com o grupo correto
-            if hasattr(casa, 'grupo_cor') and casa.grupo_cor == tipo_casa:
-                return self.mover_jogador_para_posicao(jogador, posicao_teste)
-        
-        return None
+        return self.mover_jogador_para_posicao(jogador, posicao_destino)
     
     def calcular_distancia(self, posicao_origem, posicao_destino):
         """
@@ -169,7 +164,7 @@ class GerenciadorMovimentacao:
             jogador: Objeto Jogador que passou pela saída
         """
         self.banco.depositar(jogador.nome, VALOR_PASSAGEM_SAIDA)
-        print(f"  > {jogador.nome} passou pela saída e recebeu R${VALOR_PASSAGEM_SAIDA}!")
+        log.info("  > %s passou pela saída e recebeu R$%s!", jogador.nome, VALOR_PASSAGEM_SAIDA)
     
     def obter_info_posicao(self, posicao):
         """
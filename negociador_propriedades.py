@@ -1,6 +1,7 @@
 # Sistema avançado para negociação de propriedades entre jogadores
 
 from enum import Enum
+from registro import log
 
 class StatusNegociacaoEnum(Enum):
     PENDENTE = "pendente"
@@ -55,31 +56,31 @@ class NegociadorPropriedades:
         """
         # Validações
         if propriedade not in receptor.propriedades:
-            print(f"  > Erro: {receptor.nome} não possui {propriedade.nome}")
+            log.erro("  > Erro: %s não possui %s", receptor.nome, propriedade.nome)
             return None
         
         if propriedade in proponente.propriedades:
-            print(f"  > Erro: {proponente.nome} já possui {propriedade.nome}")
+            log.erro("  > Erro: %s já possui %s", proponente.nome, propriedade.nome)
             return None
         
         if hasattr(propriedade, 'hipotecada') and propriedade.hipotecada:
-            print(f"  > Erro: {propriedade.nome} está hipotecada e não pode ser negociada")
+            log.erro("  > Erro: %s está hipotecada e não pode ser negociada", propriedade.nome)
             return None
         
         saldo_proponente = self.banco.consultar_saldo(proponente.nome)
         if saldo_proponente < valor_ofertado:
-            print(f"  > Erro: {proponente.nome} não tem R${valor_ofertado}")
+            log.erro("  > Erro: %s não tem R$%s", proponente.nome, valor_ofertado)
             return None
         
         # Additional check: if property is part of a monopoly with buildings, special consideration
         if hasattr(propriedade, 'casas') and propriedade.casas > 0:
-            print(f"  > Aviso: {propriedade.nome} possui construções que serão perdidas na venda")
+            log.aviso("  > Aviso: %s possui construções que serão perdidas na venda", propriedade.nome)
         
         # Cria proposta
         negociacao = NegociacaoProposta(proponente, receptor, propriedade, valor_ofertado)
         self.negociacoes_ativas.append(negociacao)
         
-        print(f"  > [NEGOCIAÇÃO] {proponente.nome} ofereceu R${valor_ofertado} por {propriedade.nome}")
+        log.info("  > [NEGOCIAÇÃO] %s ofereceu R$%s por %s", proponente.nome, valor_ofertado, propriedade.nome)
         
         return negociacao
     
@@ -97,7 +98,7 @@ class NegociadorPropriedades:
         sucesso_pagamento = self.banco.pagar(proponente.nome, valor, receptor.nome)
         
         if not sucesso_pagamento:
-            print(f"  > Erro: Falha na transferência de dinheiro")
+            log.erro("  > Erro: Falha na transferência de dinheiro")
             return False
         
         # Transfere propriedade
@@ -109,7 +110,7 @@ class NegociadorPropriedades:
         self.historico_negociacoes.append(negociacao)
         self.negociacoes_ativas.remove(negociacao)
         
-        print(f"  > [NEGOCIAÇÃO ACEITA] {propriedade.nome} vendida de {receptor.nome} para {proponente.nome} por R${valor}")
+        log.info("  > [NEGOCIAÇÃO ACEITA] %s vendida de %s para %s por R$%s", propriedade.nome, receptor.nome, proponente.nome, valor)
         
         return True
     
@@ -122,7 +123,7 @@ class NegociadorPropriedades:
         self.historico_negociacoes.append(negociacao)
         self.negociacoes_ativas.remove(negociacao)
         
-        print(f"  > [NEGOCIAÇÃO RECUSADA] {negociacao.receptor.nome} recusou a oferta de {negociacao.proponente.nome}")
+        log.info("  > [NEGOCIAÇÃO RECUSADA] %s recusou a oferta de %s", negociacao.receptor.nome, negociacao.proponente.nome)
         
         return True
     
@@ -135,7 +136,7 @@ class NegociadorPropriedades:
         self.historico_negociacoes.append(negociacao)
         self.negociacoes_ativas.remove(negociacao)
         
-        print(f"  > [NEGOCIAÇÃO CANCELADA]")
+        log.info("  > [NEGOCIAÇÃO CANCELADA]")
         
         return True
     
@@ -155,25 +156,25 @@ class NegociadorPropriedades:
         """
         # Validações de ambas as propriedades
         if propriedade_oferecida not in proponente.propriedades:
-            print(f"  > Erro: {proponente.nome} não possui {propriedade_oferecida.nome}")
+            log.erro("  > Erro: %s não possui %s", proponente.nome, propriedade_oferecida.nome)
             return None
         
         if propriedade_desejada not in receptor.propriedades:
-            print(f"  > Erro: {receptor.nome} não possui {propriedade_desejada.nome}")
+            log.erro("  > Erro: %s não possui %s", receptor.nome, propriedade_desejada.nome)
             return None
         
         # Validações de hipoteca
         if hasattr(propriedade_oferecida, 'hipotecada') and propriedade_oferecida.hipotecada:
-            print(f"  > Erro: {propriedade_oferecida.nome} está hipotecada")
+            log.erro("  > Erro: %s está hipotecada", propriedade_oferecida.nome)
             return None
         
         if hasattr(propriedade_desejada, 'hipotecada') and propriedade_desejada.hipotecada:
-            print(f"  > Erro: {propriedade_desejada.nome} está hipotecada")
+            log.erro("  > Erro: %s está hipotecada", propriedade_desejada.nome)
             return None
         
         saldo_proponente = self.banco.consultar_saldo(proponente.nome)
         if valor_adicional > 0 and saldo_proponente < valor_adicional:
-            print(f"  > Erro: {proponente.nome} não tem R${valor_adicional} para adicionar")
+            log.erro("  > Erro: %s não tem R$%s para adicionar", proponente.nome, valor_adicional)
             return None
         
         # Cria proposta de troca
@@ -182,7 +183,7 @@ class NegociadorPropriedades:
         negociacao.é_troca = True
         self.negociacoes_ativas.append(negociacao)
         
-        print(f"  > [TROCA] {proponente.nome} ofereceu {propriedade_oferecida.nome} + R${valor_adicional} por {propriedade_desejada.nome}")
+        log.info("  > [TROCA] %s ofereceu %s + R$%s por %s", proponente.nome, propriedade_oferecida.nome, valor_adicional, propriedade_desejada.nome)
         
         return negociacao
     
@@ -201,7 +202,7 @@ class NegociadorPropriedades:
         if valor_adicional > 0:
             sucesso = self.banco.pagar(proponente.nome, valor_adicional, receptor.nome)
             if not sucesso:
-                print(f"  > Erro: Falha na transferência de dinheiro")
+                log.erro("  > Erro: Falha na transferência de dinheiro")
                 return False
         
         # Transfere propriedades
@@ -217,10 +218,12 @@ class NegociadorPropriedades:
         self.historico_negociacoes.append(negociacao)
         self.negociacoes_ativas.remove(negociacao)
         
-        msg = f"  > [TROCA ACEITA] {proponente.nome} trocou {prop_oferecida.nome} por {prop_desejada.nome}"
         if valor_adicional > 0:
-            msg += f" (+ R${valor_adicional})"
-        print(msg)
+            log.info("  > [TROCA ACEITA] %s trocou %s por %s (+ R$%s)",
+                     proponente.nome, prop_oferecida.nome, prop_desejada.nome, valor_adicional)
+        else:
+            log.info("  > [TROCA ACEITA] %s trocou %s por %s",
+                     proponente.nome, prop_oferecida.nome, prop_desejada.nome)
         
         return True
     
@@ -0,0 +1,111 @@
+# planejador_construcao.py
+# Planejamento das construções dos bots: com o saldo disponível acima de uma reserva, escolhe
+# em uma passada quantas casas construir em cada monopólio, respeitando a construção uniforme
+# e a regra do hotel. O plano é aplicado de uma vez por GestorConstrucao.construir_lote.
+
+from construcao import GestorConstrucao
+from avaliacao import ServicoAvaliacao
+
+
+class PlanejadorConstrucao:
+    """
+    Alocação gulosa de casas entre os monopólios do jogador.
+
+    A cada passo constrói uma casa na propriedade menos construída do grupo com a melhor
+    relação aluguel esperado / custo. Como o ganho de aluguel muda de uma casa para a outra,
+    a relação de um grupo é a melhor média entre as próximas construções possíveis, não só
+    a da próxima casa.
+    """
+
+    def __init__(self, avaliacao=None):
+        """
+        Args:
+            avaliacao: ServicoAvaliacao com as frequências de pouso e tabelas de aluguel
+        """
+        self.avaliacao = avaliacao if avaliacao is not None else ServicoAvaliacao.padrao()
+
+    def planejar(self, jogador, tabuleiro, saldo, reserva=0):
+        """
+        Calcula o plano de construção.
+
+        Args:
+            jogador: Dono dos monopólios
+            tabuleiro: Tabuleiro da partida
+            saldo: Saldo atual do jogador
+            reserva: Saldo mínimo que deve sobrar depois das construções
+
+        Returns:
+            list: Propriedades a construir, uma entrada por casa, em ordem de construção
+        """
+        orcamento = saldo - reserva
+        grupos = []
+        for grupo in jogador.listar_grupos_monopolio():
+            props = list(tabuleiro.listar_propriedades_por_grupo(grupo))
+            if not props or not props[0].construivel or any(p.hipotecada for p in props):
+                continue
+            grupos.append((GestorConstrucao.CUSTO_CONSTRUCAO.get(grupo, 100), props))
+
+        casas = {p.posicao: p.casas for _, props in grupos for p in props}
+        plano = []
+        while True:
+            melhor = None
+            for custo, props in grupos:
+                if custo > orcamento:
+                    continue
+                relacao = self._melhor_relacao(props, casas, custo, orcamento)
+                if relacao > 0 and (melhor is None or relacao > melhor[0]):
+                    melhor = (relacao, custo, props)
+            if melhor is None:
+                return plano
+
+            _, custo, props = melhor
+            proxima = min(props, key=lambda p: casas[p.posicao])
+            casas[proxima.posicao] += 1
+            orcamento -= custo
+            plano.append(proxima)
+
+    def _melhor_relacao(self, props, casas, custo, orcamento):
+        """Maior aluguel esperado por real gasto entre as próximas construções que cabem no orçamento."""
+        frequencias = self.avaliacao.frequencias
+        tabelas = self.avaliacao.tabelas.tabelas_aluguel
+        simuladas = {p.posicao: casas[p.posicao] for p in props}
+
+        melhor = 0.0
+        ganho_total = 0.0
+        gasto = 0
+        while gasto + custo <= orcamento:
+            posicao = min(simuladas, key=simuladas.__getitem__)
+            atual = simuladas[posicao]
+            if atual >= GestorConstrucao.HOTEL:
+                break
+            # Com n casas o aluguel está no nível n+1 (nível 1 = monopólio sem casas)
+            tabela = tabelas[posicao]
+            ganho_total += frequencias[posicao] * (tabela[atual + 2] - tabela[atual + 1])
+            gasto += custo
+            simuladas[posicao] = atual + 1
+            melhor = max(melhor, ganho_total / gasto)
+        return melhor
+
+
+if __name__ == '__main__':
+    from tabuleiro import Tabuleiro
+    from jogador import Jogador
+    from registro import log, DESLIGADO
+
+    log.definir_nivel(DESLIGADO)
+    print("--- Teste do Módulo PlanejadorConstrucao ---")
+    tabuleiro = Tabuleiro()
+    jogador = Jogador("Ana", "Carro")
+    for grupo in ("Marrom", "Laranja", "Verde"):
+        for propriedade in tabuleiro.listar_propriedades_por_grupo(grupo):
+            jogador.adicionar_propriedade(propriedade)
+            propriedade.proprietario = jogador
+
+    planejador = PlanejadorConstrucao()
+    for saldo in (300, 800, 2000):
+        plano = planejador.planejar(jogador, tabuleiro, saldo, reserva=150)
+        resumo = {}
+        for propriedade in plano:
+            resumo[propriedade.grupo_cor] = resumo.get(propriedade.grupo_cor, 0) + 1
+        custo = sum(GestorConstrucao.CUSTO_CONSTRUCAO[p.grupo_cor] for p in plano)
+        print(f"Saldo R${saldo}: {len(plano)} casas (R${custo}) -> {resumo}")
@@ -0,0 +1,294 @@
+# probabilidades_tabuleiro.py
+# Modelo de cadeia de Markov do tabuleiro: com que frequência cada uma das 40 casas recebe
+# um jogador e quanto aluguel cada propriedade rende, em média, por turno de um adversário.
+#
+# O estado da cadeia é o início de um turno: posição 0-39 (jogador livre) ou 1º/2º/3º turno
+# na prisão. A transição de um turno cobre as duplas (até 3 rolagens; a 3ª dupla leva à prisão,
+# como em Jogo.rolar_dados_e_mover), a casa "Vá para a Prisão", as cartas de movimento
+# e a política de permanência na prisão. O resultado é calculado uma vez por conjunto de regras.
+
+from collections import namedtuple
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele a distribuição é obtida por iteração de potência
+    np = None
+
+from aluguel import TIPO_ALUGUEL_COMPANHIA, calcular_aluguel
+from cartas import BaralhoCartas, CartaMovimento, CartaMovimentoRelativo, CartaPrisao
+from constantes import POSICAO_PRISAO, MAX_TURNOS_PRISAO
+from dados import ROLAGENS_2D6
+from tabuleiro import Tabuleiro, CODIGO_SORTE, CODIGO_COFRE, CODIGO_VA_PRISAO
+
+NUM_CASAS = 40
+ROLAGEM_MEDIA = 7  # Total médio de 2d6 (aluguel das companhias)
+
+# Políticas de permanência na prisão
+PRISAO_TENTAR_DUPLA = 'tentar_dupla'   # Como o GestorPrisao: tenta dupla e paga no 3º turno
+PRISAO_PAGAR_LOGO = 'pagar_logo'       # Paga a fiança no início do turno e joga normalmente
+
+RegrasMarkov = namedtuple('RegrasMarkov', ['politica_prisao', 'cartas_movimento'])
+RegrasMarkov.__doc__ = """
+Conjunto de regras do modelo (chave do cache).
+
+    politica_prisao: PRISAO_TENTAR_DUPLA ou PRISAO_PAGAR_LOGO
+    cartas_movimento: Se False, ignora as cartas (só dados e "Vá para a Prisão")
+"""
+REGRAS_PADRAO = RegrasMarkov(PRISAO_TENTAR_DUPLA, True)
+
+ModeloMarkov = namedtuple('ModeloMarkov', ['regras', 'distribuicao', 'pousos', 'ocupacao', 'prob_prisao'])
+ModeloMarkov.__doc__ = """
+Resultado do modelo para um conjunto de regras.
+
+    distribuicao: Probabilidade estacionária de cada estado de início de turno
+                  (índices 0-39: posições; 40-42: 1º a 3º turno na prisão)
+    pousos: Nº esperado de vezes, por turno, que a rolagem dos dados leva o jogador a cada casa
+            (as casas onde o Jogo cobra aluguel/oferece compra; chegadas por carta não contam)
+    ocupacao: Probabilidade de terminar o turno em cada casa (preso conta na casa da prisão)
+    prob_prisao: Probabilidade de começar o turno preso
+"""
+
+_ESTADO_PRISAO = NUM_CASAS          # Índice do 1º turno na prisão
+NUM_ESTADOS = NUM_CASAS + MAX_TURNOS_PRISAO
+
+_PROB_ROLAGEM = 1 / len(ROLAGENS_2D6)
+
+
+def _destinos_cartas(tipo):
+    """
+    Efeito das cartas de um baralho sobre a posição.
+
+    Returns:
+        list: (probabilidade, destino, deslocamento) - destino absoluto, deslocamento relativo,
+              ou ambos None para a carta de prisão; cartas sem movimento não entram
+    """
+    cartas = BaralhoCartas.cartas_padrao(tipo)
+    prob = 1 / len(cartas)
+    efeitos = []
+    for carta in cartas:
+        if isinstance(carta, CartaMovimento):
+            efeitos.append((prob, carta.posicao_destino, None))
+        elif isinstance(carta, CartaMovimentoRelativo):
+            efeitos.append((prob, None, carta.casas))
+        elif isinstance(carta, CartaPrisao):
+            efeitos.append((prob, None, None))
+    return efeitos
+
+
+def _resolver_casa(posicao, tipos, regras, cartas_por_codigo):
+    """
+    Para onde o jogador vai ao parar na casa por rolagem.
+
+    Returns:
+        list: (probabilidade, destino) com destino None = prisão
+    """
+    tipo = tipos[posicao]
+    if tipo == CODIGO_VA_PRISAO:
+        return [(1.0, None)]
+    if regras.cartas_movimento and tipo in cartas_por_codigo:
+        resultado = []
+        prob_fica = 1.0
+        for prob, destino, deslocamento in cartas_por_codigo[tipo]:
+            prob_fica -= prob
+            if deslocamento is not None:
+                destino = (posicao + deslocamento) % NUM_CASAS
+            resultado.append((prob, destino))
+        resultado.append((prob_fica, posicao))
+        return resultado
+    return [(1.0, posicao)]
+
+
+def _montar_transicoes(regras):
+    """
+    Monta a matriz de transição por turno (NUM_ESTADOS x NUM_ESTADOS) e a matriz de pousos
+    (NUM_ESTADOS x 40), como listas de listas.
+    """
+    tabuleiro = Tabuleiro()
+    tipos = tabuleiro.tipos_casas
+    cartas_por_codigo = {CODIGO_SORTE: _destinos_cartas('SORTE'), CODIGO_COFRE: _destinos_cartas('COFRE')}
+    destinos = [_resolver_casa(posicao, tipos, regras, cartas_por_codigo) for posicao in range(NUM_CASAS)]
+
+    transicoes = [[0.0] * NUM_ESTADOS for _ in range(NUM_ESTADOS)]
+    pousos = [[0.0] * NUM_CASAS for _ in range(NUM_ESTADOS)]
+
+    def jogar_turno_livre(linha_t, linha_p, posicao_inicial):
+        # massa[posicao] = probabilidade de estar em 'posicao' antes da rolagem k (após k duplas)
+        massa = {posicao_inicial: 1.0}
+        for duplas in range(3):
+            proxima = {}
+            for posicao, prob in massa.items():
+                for total, _, dupla in ROLAGENS_2D6:
+                    p = prob * _PROB_ROLAGEM
+                    if dupla and duplas == 2:
+                        linha_t[_ESTADO_PRISAO] += p  # 3ª dupla seguida: prisão sem mover
+                        continue
+                    parada = (posicao + total) % NUM_CASAS
+                    linha_p[parada] += p
+                    for prob_destino, destino in destinos[parada]:
+                        q = p * prob_destino
+                        if destino is None:
+                            linha_t[_ESTADO_PRISAO] += q
+                        elif dupla:
+                            proxima[destino] = proxima.get(destino, 0.0) + q
+                        else:
+                            linha_t[destino] += q
+            massa = proxima
+
+    for posicao in range(NUM_CASAS):
+        jogar_turno_livre(transicoes[posicao], pousos[posicao], posicao)
+
+    for turno in range(MAX_TURNOS_PRISAO):
+        estado = _ESTADO_PRISAO + turno
+        linha_t, linha_p = transicoes[estado], pousos[estado]
+        if regras.politica_prisao == PRISAO_PAGAR_LOGO:
+            jogar_turno_livre(linha_t, linha_p, POSICAO_PRISAO)
+            continue
+        for total, _, dupla in ROLAGENS_2D6:
+            if dupla:
+                # Sai com a dupla e move, sem rolar de novo
+                parada = (POSICAO_PRISAO + total) % NUM_CASAS
+                linha_p[parada] += _PROB_ROLAGEM
+                for prob_destino, destino in destinos[parada]:
+                    q = _PROB_ROLAGEM * prob_destino
+                    linha_t[_ESTADO_PRISAO if destino is None else destino] += q
+            elif turno + 1 >= MAX_TURNOS_PRISAO:
+                linha_t[POSICAO_PRISAO] += _PROB_ROLAGEM  # Paga a fiança e fica na casa da prisão
+            else:
+                linha_t[estado + 1] += _PROB_ROLAGEM
+
+    return transicoes, pousos
+
+
+def _distribuicao_estacionaria(transicoes):
+    """Resolve pi = pi * T com soma 1."""
+    if np is not None:
+        matriz = np.array(transicoes).T - np.eye(NUM_ESTADOS)
+        matriz[-1, :] = 1.0
+        lado_direito = np.zeros(NUM_ESTADOS)
+        lado_direito[-1] = 1.0
+        return tuple(float(x) for x in np.linalg.solve(matriz, lado_direito))
+
+    # Iteração de potência (a cadeia é aperiódica: converge em poucas centenas de passos)
+    distribuicao = [1.0 / NUM_ESTADOS] * NUM_ESTADOS
+    for _ in range(10000):
+        nova = [0.0] * NUM_ESTADOS
+        for origem, prob in enumerate(distribuicao):
+            if prob:
+                linha = transicoes[origem]
+                for destino in range(NUM_ESTADOS):
+                    if linha[destino]:
+                        nova[destino] += prob * linha[destino]
+        diferenca = max(abs(a - b) for a, b in zip(nova, distribuicao))
+        distribuicao = nova
+        if diferenca < 1e-13:
+            break
+    total = sum(distribuicao)
+    return tuple(prob / total for prob in distribuicao)
+
+
+@lru_cache(maxsize=None)
+def resolver_modelo(regras=REGRAS_PADRAO):
+    """
+    Calcula (uma vez por conjunto de regras) a distribuição estacionária e as frequências de pouso.
+
+    Args:
+        regras: RegrasMarkov
+
+    Returns:
+        ModeloMarkov
+    """
+    transicoes, pousos = _montar_transicoes(regras)
+    distribuicao = _distribuicao_estacionaria(transicoes)
+
+    frequencias = [0.0] * NUM_CASAS
+    for estado, prob in enumerate(distribuicao):
+        for posicao, pouso in enumerate(pousos[estado]):
+            frequencias[posicao] += prob * pouso
+
+    ocupacao = [0.0] * NUM_CASAS
+    for estado, prob_inicio in enumerate(distribuicao):
+        for destino, prob in enumerate(transicoes[estado]):
+            casa = destino if destino < NUM_CASAS else POSICAO_PRISAO
+            ocupacao[casa] += prob_inicio * prob
+
+    return ModeloMarkov(
+        regras=regras,
+        distribuicao=distribuicao,
+        pousos=tuple(frequencias),
+        ocupacao=tuple(ocupacao),
+        prob_prisao=sum(distribuicao[_ESTADO_PRISAO:]),
+    )
+
+
+def frequencias_pouso(regras=REGRAS_PADRAO):
+    """Nº esperado de pousos por turno em cada casa (tupla de 40 posições)."""
+    return resolver_modelo(regras).pousos
+
+
+def aluguel_esperado_por_turno(propriedade, regras=REGRAS_PADRAO):
+    """
+    Aluguel que a propriedade rende, em média, a cada turno de um adversário (estado atual:
+    dono, casas, monopólio e hipoteca). Companhias usam a rolagem média.
+
+    Args:
+        propriedade: Propriedade, CasaMetro ou CasaCompanhia (com posicao definida pelo Tabuleiro)
+        regras: RegrasMarkov
+
+    Returns:
+        float: Aluguel esperado por turno de um adversário
+    """
+    return frequencias_pouso(regras)[propriedade.posicao] * calcular_aluguel(propriedade, ROLAGEM_MEDIA)
+
+
+def tabela_aluguel_esperado(propriedade, regras=REGRAS_PADRAO):
+    """
+    Aluguel esperado por turno de um adversário para cada entrada da tabela de aluguel da
+    propriedade (ver aluguel.py): sem/com monopólio e 1-4 casas/hotel, ou nº de metrôs/companhias.
+
+    Returns:
+        tuple: Valores esperados, no mesmo índice de propriedade.tabela_aluguel
+    """
+    frequencia = frequencias_pouso(regras)[propriedade.posicao]
+    fator = ROLAGEM_MEDIA if propriedade.tipo_aluguel == TIPO_ALUGUEL_COMPANHIA else 1
+    return tuple(frequencia * valor * fator for valor in propriedade.tabela_aluguel)
+
+
+
+@lru_cache(maxsize=None)
+def ranking_grupos(regras=REGRAS_PADRAO):
+    """
+    Grupos do tabuleiro ordenados pelo aluguel esperado por turno de adversário com o grupo
+    no nível máximo (hotel em todas as propriedades, ou todos os metrôs/companhias).
+
+    Returns:
+        tuple: Nomes dos grupos, do mais rentável ao menos rentável
+    """
+    tabuleiro = Tabuleiro()
+    rendimento = {
+        grupo: sum(tabela_aluguel_esperado(propriedade, regras)[-1] for propriedade in propriedades)
+        for grupo, propriedades in tabuleiro.propriedades_por_grupo.items()
+    }
+    return tuple(sorted(rendimento, key=rendimento.get, reverse=True))
+
+if __name__ == '__main__':
+    import time
+
+    print("--- Teste do Módulo Probabilidades do Tabuleiro ---")
+    inicio = time.perf_counter()
+    modelo = resolver_modelo()
+    duracao = (time.perf_counter() - inicio) * 1000
+    print(f"Modelo resolvido em {duracao:.1f} ms ({'numpy' if np is not None else 'Python puro'})")
+    print(f"Probabilidade de começar o turno preso: {modelo.prob_prisao:.2%}")
+
+    tabuleiro = Tabuleiro()
+    print("\nCasas mais visitadas (pousos por turno):")
+    ranking = sorted(range(NUM_CASAS), key=lambda posicao: -modelo.pousos[posicao])
+    for posicao in ranking[:8]:
+        print(f"  {posicao:2d} {tabuleiro.get_casa(posicao).nome:<40} {modelo.pousos[posicao]:.4f}")
+
+    print(f"\nGrupos mais rentáveis: {', '.join(ranking_grupos()[:4])}")
+    print("\nAluguel esperado por turno de adversário (hotel):")
+    for grupo in tabuleiro.propriedades_por_grupo:
+        propriedade = tabuleiro.propriedades_por_grupo[grupo][-1]
+        print(f"  {grupo:<12} {propriedade.nome:<40} R${tabela_aluguel_esperado(propriedade)[-1]:.2f}")
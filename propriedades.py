@@ -1,9 +1,18 @@
 # src/propriedades.py
 # Importação relativa para usar a classe Casa base
 from casas import Casa 
+from registro import log
+from aluguel import (
+    calcular_aluguel, tabela_aluguel_comum, ALUGUEL_METRO, MULTIPLICADOR_COMPANHIA,
+    TIPO_ALUGUEL_COMUM, TIPO_ALUGUEL_METRO, TIPO_ALUGUEL_COMPANHIA
+)
 
 class Propriedade(Casa):
     """Herda de Casa. Representa propriedades compráveis."""
+    __slots__ = (
+        'preco_compra', 'aluguel_base', 'grupo_cor', 'proprietario', 'casas', 'hipotecada',
+        'aluguel_passagem', 'construivel', 'tipo_aluguel', 'tabela_aluguel'
+    )
     def __init__(self, nome, preco_compra, aluguel_base, grupo_cor, aluguel_passagem=200):
         super().__init__(nome, 'PROPRIEDADE') # Agora herda de Casa em casas.py
         self.preco_compra = preco_compra
@@ -11,89 +20,64 @@ class Propriedade(Casa):
         self.grupo_cor = grupo_cor        # Ex: "Roxo", "Ferrovia", "Serviço Público"
         self.proprietario = None          # Objeto Jogador que é o dono
         self.casas = 0                    # 0 a 4 (Hotel)
+        self.construivel = True           # Aceita casas/hotel (False para metrô e companhias)
         self.hipotecada = False
         self.aluguel_passagem = aluguel_passagem # Ex: R$200 ao passar pelo INICIO
+        # Tabela pré-calculada usada pelo motor de aluguel (aluguel.py)
+        self.tipo_aluguel = TIPO_ALUGUEL_COMUM
+        self.tabela_aluguel = tabela_aluguel_comum(aluguel_base)
 
     def is_livre(self):
         """Verifica se a propriedade está disponível para compra."""
         return self.proprietario is None
 
+    @property
+    def valor_hipoteca(self):
+        """Valor recebido ao hipotecar (50% do preço de compra)."""
+        return self.preco_compra // 2
+
     def calcular_aluguel(self, rolagem_dados=0):
         """
-        Calcula o aluguel baseado no número de casas/hotel.
+        Calcula o aluguel baseado no número de casas/hotel (ver aluguel.py).
+        Sem construções, o aluguel dobra se o dono tem o monopólio do grupo.
         """
-        if self.proprietario and not self.hipotecada:
-            # Se tem casas ou hotel, calcular aluguel progressivo
-            if self.casas == 0:
-                # Sem construções, usar aluguel base
-                return self.aluguel_base
-            elif self.casas == 1:
-                # 1 casa: 5x aluguel base
-                return self.aluguel_base * 5
-            elif self.casas == 2:
-                # 2 casas: 15x aluguel base
-                return self.aluguel_base * 15
-            elif self.casas == 3:
-                # 3 casas: 45x aluguel base
-                return self.aluguel_base * 45
-            elif self.casas == 4:
-                # 4 casas: 80x aluguel base
-                return self.aluguel_base * 80
-            elif self.casas == 5:
-                # Hotel: 100x aluguel base
-                return self.aluguel_base * 100
-        return 0
+        return calcular_aluguel(self, rolagem_dados)
 
     def acao_ao_cair(self, jogador, banco):
         """Ação específica de uma Propriedade ao cair."""
         super().acao_ao_cair(jogador, banco)
         
         if self.is_livre():
-            print(f"  > {self.nome} custa R${self.preco_compra}. Livre para compra!")
+            log.info("  > %s custa R$%s. Livre para compra!", self.nome, self.preco_compra)
             # A decisão de compra/venda fica no módulo 'regras'
         elif self.proprietario.nome != jogador.nome:
             aluguel = self.calcular_aluguel()
-            print(f"  > Propriedade de {self.proprietario.nome}. Aluguel devido: R${aluguel}.")
+            log.info("  > Propriedade de %s. Aluguel devido: R$%s.", self.proprietario.nome, aluguel)
             # A transação financeira também fica no módulo 'regras' (usando banco.py)
         else:
-            print(f"  > Você está em sua própria propriedade ({self.nome}).")
+            log.info("  > Você está em sua própria propriedade (%s).", self.nome)
 
 # Classe especializada para Metrô (Ferrovia)
 class CasaMetro(Propriedade):
+    __slots__ = ()
     def __init__(self, nome, preco, grupo="METRÔ"):
         # Aluguel base não é usado, mas mantemos 25 para herança
         super().__init__(nome, preco, aluguel_base=25, grupo_cor=grupo)
         # Metro stations cannot have houses
-        del self.casas
-        
-    def calcular_aluguel(self, rolagem_dados=0):
-        # O aluguel do metrô depende do número de metrôs que o proprietário possui.
-        if not self.proprietario: return 0
-
-        # Contar quantos Metrôs o proprietário tem
-        num_metros = sum(1 for prop in self.proprietario.propriedades if prop.grupo_cor == "METRÔ")
-        
-        # Regra do Monopoly (25, 50, 100, 200)
-        alugueis = {1: 25, 2: 50, 3: 100, 4: 200}
-        return alugueis.get(num_metros, 25)
+        self.construivel = False
+        # O aluguel do metrô depende do número de metrôs que o proprietário possui (25, 50, 100, 200)
+        self.tipo_aluguel = TIPO_ALUGUEL_METRO
+        self.tabela_aluguel = ALUGUEL_METRO
         
 
 # Classe especializada para Companhia de Serviço
 class CasaCompanhia(Propriedade):
+    __slots__ = ()
     def __init__(self, nome, preco, grupo="SERVIÇO"):
         # Aluguel base não é usado
         super().__init__(nome, preco, aluguel_base=0, grupo_cor=grupo)
         # Companies cannot have houses
-        del self.casas
-        
-    def calcular_aluguel(self, rolagem_dados):
-        if not self.proprietario: return 0
-
-        num_companhias = sum(1 for prop in self.proprietario.propriedades if prop.grupo_cor == "SERVIÇO")
-        
+        self.construivel = False
         # Regra do Monopoly (4x ou 10x a rolagem dos dados)
-        if num_companhias == 1:
-            return 4 * rolagem_dados
-        elif num_companhias >= 2:
-            return 10 * rolagem_dados
-        return 0
+        self.tipo_aluguel = TIPO_ALUGUEL_COMPANHIA
+        self.tabela_aluguel = MULTIPLICADOR_COMPANHIA
@@ -0,0 +1,135 @@
+# recursos.py
+# Gerenciador dos recursos gráficos da interface. As imagens da pasta 'assets' são carregadas
+# uma única vez e convertidas para o formato de pixel da tela; as versões redimensionadas
+# (peões, dados) e as superfícies auxiliares reutilizáveis (sobreposições translúcidas, painéis
+# arredondados) também são criadas uma vez, para que o laço de quadros não aloque superfícies.
+
+import os
+
+import pygame
+
+
+PASTA_ASSETS = os.path.join(os.path.dirname(__file__), 'assets')
+
+
+class GerenciadorRecursos:
+    """
+    Atlas de superfícies da interface, com cache por nome e por tamanho.
+
+    As superfícies devolvidas são compartilhadas: quem desenha só faz blit e não deve
+    alterá-las. Como convert() exige uma janela aberta, as imagens só são carregadas
+    depois de pygame.display.set_mode.
+    """
+
+    def __init__(self, pasta=PASTA_ASSETS):
+        """
+        Args:
+            pasta: Pasta com os arquivos de imagem
+        """
+        self.pasta = pasta
+        self._imagens = {}         # nome -> superfície convertida
+        self._escaladas = {}       # (nome, tamanho) -> superfície redimensionada
+        self._auxiliares = {}      # chave -> sobreposições e painéis prontos
+        self.carregamentos = 0
+
+    def imagem(self, nome_arquivo, alpha=False):
+        """
+        Carrega (na primeira chamada) e retorna uma imagem da pasta de recursos.
+
+        Args:
+            nome_arquivo: Nome do arquivo dentro da pasta
+            alpha: True para imagens com transparência (convert_alpha)
+
+        Returns:
+            pygame.Surface: Imagem no formato de pixel da tela
+
+        Raises:
+            FileNotFoundError: Se o arquivo não existe (permite ao chamador usar um substituto)
+            pygame.error: Se o arquivo não pode ser lido
+        """
+        superficie = self._imagens.get(nome_arquivo)
+        if superficie is None:
+            caminho = os.path.join(self.pasta, nome_arquivo)
+            if not os.path.exists(caminho):
+                raise FileNotFoundError(caminho)
+            imagem = pygame.image.load(caminho)
+            self.carregamentos += 1
+            superficie = imagem.convert_alpha() if alpha else imagem.convert()
+            self._imagens[nome_arquivo] = superficie
+        return superficie
+
+    def registrar(self, nome, superficie, alpha=True):
+        """
+        Registra uma superfície gerada pelo jogo (ex.: substituto de um arquivo ausente)
+        para ser usada como as imagens carregadas.
+        """
+        self._imagens[nome] = superficie.convert_alpha() if alpha else superficie.convert()
+        return self._imagens[nome]
+
+    def escalada(self, nome, tamanho):
+        """
+        Versão redimensionada de uma imagem já carregada ou registrada, criada uma única vez.
+
+        Args:
+            nome: Nome usado em imagem() ou registrar()
+            tamanho: (largura, altura)
+        """
+        chave = (nome, tamanho)
+        superficie = self._escaladas.get(chave)
+        if superficie is None:
+            superficie = self._escaladas[chave] = pygame.transform.scale(self._imagens[nome], tamanho)
+        return superficie
+
+    def sobreposicao(self, tamanho, cor=(0, 0, 0), alpha=100):
+        """Superfície lisa translúcida (escurecer a tela atrás de pop-ups)."""
+        chave = ("sobreposicao", tamanho, cor, alpha)
+        superficie = self._auxiliares.get(chave)
+        if superficie is None:
+            superficie = pygame.Surface(tamanho).convert()
+            superficie.fill(cor)
+            superficie.set_alpha(alpha)
+            self._auxiliares[chave] = superficie
+        return superficie
+
+    def painel(self, tamanho, cor, raio=0):
+        """Retângulo translúcido (cor RGBA) com cantos arredondados, para fundos de painéis e botões."""
+        chave = ("painel", tamanho, cor, raio)
+        superficie = self._auxiliares.get(chave)
+        if superficie is None:
+            superficie = pygame.Surface(tamanho, pygame.SRCALPHA)
+            pygame.draw.rect(superficie, cor, superficie.get_rect(), border_radius=raio)
+            self._auxiliares[chave] = superficie
+        return superficie
+
+    def estatisticas(self):
+        """Retorna o nº de arquivos lidos e de superfícies guardadas por tipo."""
+        return {
+            "carregamentos": self.carregamentos,
+            "imagens": len(self._imagens),
+            "escaladas": len(self._escaladas),
+            "auxiliares": len(self._auxiliares),
+        }
+
+
+# Atlas compartilhado pelas telas do jogo (main.py e menu.py)
+recursos = GerenciadorRecursos()
+
+
+if __name__ == '__main__':
+    import time
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    print("--- Teste do Módulo GerenciadorRecursos ---")
+    pygame.display.set_mode((1600, 900))
+    atlas = GerenciadorRecursos()
+
+    inicio = time.perf_counter()
+    for quadro in range(600):
+        for valor in range(1, 7):
+            atlas.imagem(f'dado_{valor}.png', alpha=True)
+            atlas.escalada(f'dado_{valor}.png', (50, 50))
+        atlas.sobreposicao((1600, 900))
+        atlas.painel((800, 300), (30, 35, 50, 230), raio=15)
+    duracao = (time.perf_counter() - inicio) * 1000
+    print(f"600 quadros em {duracao:.0f} ms | {atlas.estatisticas()}")
@@ -0,0 +1,99 @@
+# registro.py
+# Saída de mensagens do motor do jogo, com filtro por nível.
+# Todos os módulos do jogo escrevem por aqui em vez de usar print() diretamente,
+# para que simulações possam desligar a saída sem pagar o custo de formatação.
+
+# Níveis de mensagem (quanto maior, mais importante)
+DEBUG = 10
+INFO = 20
+AVISO = 30
+ERRO = 40
+DESLIGADO = 100
+
+NOMES_NIVEIS = {
+    DEBUG: "DEBUG",
+    INFO: "INFO",
+    AVISO: "AVISO",
+    ERRO: "ERRO",
+    DESLIGADO: "DESLIGADO",
+}
+
+
+class Registro:
+    """
+    Filtra mensagens por nível e as entrega a um destino configurável.
+
+    As mensagens usam formatação estilo '%' com argumentos separados,
+    ex: log.info("%s pagou R$%s", nome, valor). A formatação só acontece
+    se o nível estiver habilitado.
+    """
+
+    def __init__(self, nivel=INFO, destino=print):
+        """
+        Args:
+            nivel: Nível mínimo das mensagens emitidas
+            destino: Função que recebe a mensagem já formatada (padrão: print)
+        """
+        self.nivel = nivel
+        self.destino = destino
+
+    def definir_nivel(self, nivel):
+        """Define o nível mínimo e retorna o nível anterior (para restaurar depois)."""
+        nivel_anterior = self.nivel
+        self.nivel = nivel
+        return nivel_anterior
+
+    def definir_destino(self, destino):
+        """Define a função de saída e retorna a anterior."""
+        destino_anterior = self.destino
+        self.destino = destino
+        return destino_anterior
+
+    def ativo(self, nivel):
+        """Retorna True se mensagens do nível informado serão emitidas."""
+        return nivel >= self.nivel
+
+    def emitir(self, nivel, mensagem, *args):
+        """Formata e emite a mensagem se o nível estiver habilitado."""
+        if nivel < self.nivel:
+            return
+        if args:
+            mensagem = mensagem % args
+        self.destino(mensagem)
+
+    def debug(self, mensagem, *args):
+        if DEBUG >= self.nivel:
+            self.emitir(DEBUG, mensagem, *args)
+
+    def info(self, mensagem, *args):
+        if INFO >= self.nivel:
+            self.emitir(INFO, mensagem, *args)
+
+    def aviso(self, mensagem, *args):
+        if AVISO >= self.nivel:
+            self.emitir(AVISO, mensagem, *args)
+
+    def erro(self, mensagem, *args):
+        if ERRO >= self.nivel:
+            self.emitir(ERRO, mensagem, *args)
+
+
+# Instância única compartilhada por todos os módulos do jogo
+log = Registro()
+
+
+if __name__ == '__main__':
+    mensagens = []
+    log.definir_destino(mensagens.append)
+
+    log.info("%s pagou R$%s para %s.", "Alice", 200, "Bob")
+    log.definir_nivel(AVISO)
+    log.info("Esta mensagem não é formatada nem emitida")
+    log.aviso("Saldo baixo: R$%s", 50)
+    log.definir_nivel(DESLIGADO)
+    log.erro("Nada é emitido com a saída desligada")
+
+    log.definir_destino(print)
+    log.definir_nivel(INFO)
+    for mensagem in mensagens:
+        log.info("  capturado: %s", mensagem)
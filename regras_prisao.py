@@ -2,6 +2,7 @@
 # Módulo responsável pelas regras da prisão
 
 from constantes import POSICAO_PRISAO
+from registro import log
 
 class GestorPrisao:
     """Gerencia todas as regras relacionadas à prisão"""
@@ -25,7 +26,7 @@ class GestorPrisao:
         - Tira 3 duplas seguidas
         """
         jogador.entrar_prisao()
-        print(f"  > {jogador.nome} foi enviado para a prisão!")
+        log.info("  > %s foi enviado para a prisão!", jogador.nome)
         return True
     
     def pode_sair_prisao_com_carta(self, jogador):
@@ -39,16 +40,16 @@ class GestorPrisao:
             bool: True se conseguiu sair
         """
         if not jogador.em_prisao:
-            print(f"  > {jogador.nome} não está na prisão.")
+            log.info("  > %s não está na prisão.", jogador.nome)
             return False
         
         if jogador.cartas_livre_prisao > 0:
             jogador.cartas_livre_prisao -= 1
             jogador.sair_prisao()
-            print(f"  > {jogador.nome} usou uma carta 'Saia Livre da Prisão'!")
+            log.info("  > %s usou uma carta 'Saia Livre da Prisão'!", jogador.nome)
             return True
         else:
-            print(f"  > {jogador.nome} não tem carta 'Saia Livre da Prisão'.")
+            log.info("  > %s não tem carta 'Saia Livre da Prisão'.", jogador.nome)
             return False
     
     def pode_pagar_fianca(self, jogador):
@@ -66,17 +67,17 @@ class GestorPrisao:
             bool: True se pagou e saiu
         """
         if not jogador.em_prisao:
-            print(f"  > {jogador.nome} não está na prisão.")
+            log.info("  > %s não está na prisão.", jogador.nome)
             return False
         
         sucesso = self.banco.pagar(jogador.nome, self.MULTA_SAIDA, "Banco")
         
         if sucesso:
             jogador.sair_prisao()
-            print(f"  > {jogador.nome} pagou R${self.MULTA_SAIDA} e saiu da prisão!")
+            log.info("  > %s pagou R$%s e saiu da prisão!", jogador.nome, self.MULTA_SAIDA)
             return True
         else:
-            print(f"  > {jogador.nome} não tem dinheiro suficiente para pagar a fiança.")
+            log.aviso("  > %s não tem dinheiro suficiente para pagar a fiança.", jogador.nome)
             return False
     
     def tentar_sair_com_dupla(self, jogador, eh_dupla):
@@ -90,15 +91,15 @@ class GestorPrisao:
         
         if eh_dupla:
             jogador.sair_prisao()
-            print(f"  > {jogador.nome} tirou dupla e saiu da prisão!")
+            log.info("  > %s tirou dupla e saiu da prisão!", jogador.nome)
             return True
         else:
             turnos = jogador.incrementar_turno_prisao()
-            print(f"  > {jogador.nome} não tirou dupla. Turno {turnos}/{self.MAX_TURNOS_PRISAO} na prisão.")
+            log.info("  > %s não tirou dupla. Turno %s/%s na prisão.", jogador.nome, turnos, self.MAX_TURNOS_PRISAO)
             
             # Após 3 turnos, é forçado a pagar
             if turnos >= self.MAX_TURNOS_PRISAO:
-                print(f"  > {jogador.nome} completou {self.MAX_TURNOS_PRISAO} turnos e DEVE pagar a fiança!")
+                log.info("  > %s completou %s turnos e DEVE pagar a fiança!", jogador.nome, self.MAX_TURNOS_PRISAO)
                 return self.pagar_fianca(jogador)
             
             return False
@@ -117,12 +118,12 @@ class GestorPrisao:
         if not jogador.em_prisao:
             return False, False, 0
         
-        print(f"\n  > {jogador.nome} está na prisão (Turno {jogador.turnos_na_prisao + 1}/{self.MAX_TURNOS_PRISAO})")
-        print(f"    Opções: 1) Rolar dados (tentar dupla)  2) Pagar R${self.MULTA_SAIDA}  3) Usar carta")
+        log.info("\n  > %s está na prisão (Turno %s/%s)", jogador.nome, jogador.turnos_na_prisao + 1, self.MAX_TURNOS_PRISAO)
+        log.info("    Opções: 1) Rolar dados (tentar dupla)  2) Pagar R$%s  3) Usar carta", self.MULTA_SAIDA)
         
         # Para fins de demonstração automática, tentamos sair com dupla
         total, valores, eh_dupla = dados_obj.rolar()
-        print(f"    > Rolou dados: {valores[0]} + {valores[1]} = {total}")
+        log.info("    > Rolou dados: %s + %s = %s", valores[0], valores[1], total)
         
         saiu = self.tentar_sair_com_dupla(jogador, eh_dupla)
         
@@ -1,6 +1,9 @@
 # regras_propriedades.py
 # Módulo responsável pelas regras de compra e venda de propriedades
 
+from registro import log
+from aluguel import calcular_aluguel
+
 class GestorPropriedades:
     """Gerencia compra, venda e negociação de propriedades"""
     
@@ -41,7 +44,7 @@ class GestorPropriedades:
         pode, mensagem = self.pode_comprar(jogador, propriedade)
         
         if not pode:
-            print(f"  > Não foi possível comprar: {mensagem}")
+            log.aviso("  > Não foi possível comprar: %s", mensagem)
             return False
         
         # Realiza a transação
@@ -49,7 +52,7 @@ class GestorPropriedades:
         
         if sucesso:
             jogador.adicionar_propriedade(propriedade)
-            print(f"  > {jogador.nome} comprou {propriedade.nome} por R${propriedade.preco_compra}!")
+            log.info("  > %s comprou %s por R$%s!", jogador.nome, propriedade.nome, propriedade.preco_compra)
             
             # Verifica se completou monopólio
             self._verificar_monopolio(jogador, propriedade)
@@ -64,16 +67,13 @@ class GestorPropriedades:
             return
         
         grupo = propriedade.grupo_cor
-        props_grupo = self.tabuleiro.listar_propriedades_por_grupo(grupo)
         
-        if all(p.proprietario == jogador for p in props_grupo):
-            print(f"  > 🎉 {jogador.nome} completou o MONOPÓLIO do grupo {grupo}!")
+        if jogador.tem_monopolio(grupo):
+            log.info("  > 🎉 %s completou o MONOPÓLIO do grupo %s!", jogador.nome, grupo)
     
     def calcular_valor_hipoteca(self, propriedade):
         """Calcula o valor da hipoteca (50% do preço de compra)"""
-        if hasattr(propriedade, 'preco_compra'):
-            return propriedade.preco_compra // 2
-        return 0
+        return getattr(propriedade, 'valor_hipoteca', 0)
     
     def pode_hipotecar(self, jogador, propriedade):
         """Verifica se a propriedade pode ser hipotecada"""
@@ -99,14 +99,14 @@ class GestorPropriedades:
         pode, mensagem = self.pode_hipotecar(jogador, propriedade)
         
         if not pode:
-            print(f"  > Não foi possível hipotecar: {mensagem}")
+            log.aviso("  > Não foi possível hipotecar: %s", mensagem)
             return False
         
         valor = self.calcular_valor_hipoteca(propriedade)
         self.banco.depositar(jogador.nome, valor)
         propriedade.hipotecada = True
         
-        print(f"  > {jogador.nome} hipotecou {propriedade.nome} e recebeu R${valor}")
+        log.info("  > %s hipotecou %s e recebeu R$%s", jogador.nome, propriedade.nome, valor)
         return True
     
     def pode_resgatar_hipoteca(self, jogador, propriedade):
@@ -136,7 +136,7 @@ class GestorPropriedades:
         pode, mensagem = self.pode_resgatar_hipoteca(jogador, propriedade)
         
         if not pode:
-            print(f"  > Não foi possível resgatar: {mensagem}")
+            log.aviso("  > Não foi possível resgatar: %s", mensagem)
             return False
         
         valor_hipoteca = self.calcular_valor_hipoteca(propriedade)
@@ -146,7 +146,7 @@ class GestorPropriedades:
         
         if sucesso:
             propriedade.hipotecada = False
-            print(f"  > {jogador.nome} resgatou a hipoteca de {propriedade.nome} por R${custo_resgate}")
+            log.info("  > %s resgatou a hipoteca de %s por R$%s", jogador.nome, propriedade.nome, custo_resgate)
             return True
         
         return False
@@ -157,34 +157,7 @@ class GestorPropriedades:
         Args:
             rolagem_dados: Valor dos dados (necessário para companhias)
         """
-        if propriedade.hipotecada:
-            return 0
-        
-        # Para propriedades com casas/hotéis
-        if hasattr(propriedade, 'casas') and propriedade.casas > 0:
-            # Aluguel aumenta com construções
-            # Simplificado: base * (2 ^ casas)
-            return propriedade.aluguel_base * (2 ** propriedade.casas)
-        
-        # Para companhias (usa método específico)
-        if hasattr(propriedade, 'calcular_aluguel'):
-            if propriedade.grupo_cor == "SERVIÇO":
-                return propriedade.calcular_aluguel(rolagem_dados)
-            else:
-                return propriedade.calcular_aluguel()
-        
-        # Propriedade normal sem construções
-        # Verifica se tem monopólio para dobrar aluguel
-        if propriedade.proprietario and hasattr(propriedade, 'grupo_cor'):
-            grupo = propriedade.grupo_cor
-            props_grupo = self.tabuleiro.listar_propriedades_por_grupo(grupo)
-            
-            tem_monopolio = all(p.proprietario == propriedade.proprietario for p in props_grupo)
-            
-            if tem_monopolio and propriedade.grupo_cor not in ['METRÔ', 'SERVIÇO']:
-                return propriedade.aluguel_base * 2
-        
-        return propriedade.aluguel_base
+        return calcular_aluguel(propriedade, rolagem_dados)
     
     def cobrar_aluguel(self, proprietario, inquilino, propriedade, rolagem_dados=0):
         """
@@ -196,20 +169,20 @@ class GestorPropriedades:
             return False
         
         if proprietario.nome == inquilino.nome:
-            print(f"  > {inquilino.nome} está em sua própria propriedade.")
+            log.info("  > %s está em sua própria propriedade.", inquilino.nome)
             return True
         
         aluguel = self.calcular_aluguel(propriedade, rolagem_dados)
         
         if aluguel == 0:
-            print(f"  > Propriedade hipotecada. Sem aluguel.")
+            log.info("  > Propriedade hipotecada. Sem aluguel.")
             return True
         
-        print(f"  > {inquilino.nome} deve pagar R${aluguel} de aluguel para {proprietario.nome}")
+        log.info("  > %s deve pagar R$%s de aluguel para %s", inquilino.nome, aluguel, proprietario.nome)
         sucesso = self.banco.pagar(inquilino.nome, aluguel, proprietario.nome)
         
         if not sucesso:
-            print(f"  > {inquilino.nome} não tem dinheiro suficiente! (Possível falência)")
+            log.aviso("  > %s não tem dinheiro suficiente! (Possível falência)", inquilino.nome)
             # Aqui entraria a lógica de falência
         
         return sucesso
@@ -221,18 +194,18 @@ class GestorPropriedades:
             bool: True se vendeu com sucesso
         """
         if propriedade.proprietario != vendedor:
-            print(f"  > {vendedor.nome} não é o proprietário de {propriedade.nome}")
+            log.info("  > %s não é o proprietário de %s", vendedor.nome, propriedade.nome)
             return False
         
         # Não pode vender se tem construções
         if hasattr(propriedade, 'casas') and propriedade.casas > 0:
-            print(f"  > Venda as construções de {propriedade.nome} antes de vendê-la.")
+            log.info("  > Venda as construções de %s antes de vendê-la.", propriedade.nome)
             return False
         
         # Verifica se comprador tem dinheiro
         saldo = self.banco.consultar_saldo(comprador.nome)
         if saldo < preco:
-            print(f"  > {comprador.nome} não tem dinheiro suficiente (R${preco}).")
+            log.aviso("  > %s não tem dinheiro suficiente (R$%s).", comprador.nome, preco)
             return False
         
         # Realiza a transação
@@ -241,7 +214,7 @@ class GestorPropriedades:
         if sucesso:
             vendedor.remover_propriedade(propriedade)
             comprador.adicionar_propriedade(propriedade)
-            print(f"  > {vendedor.nome} vendeu {propriedade.nome} para {comprador.nome} por R${preco}!")
+            log.info("  > %s vendeu %s para %s por R$%s!", vendedor.nome, propriedade.nome, comprador.nome, preco)
             
             # Verifica se completou monopólio
             self._verificar_monopolio(comprador, propriedade)
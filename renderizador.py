@@ -0,0 +1,149 @@
+# renderizador.py
+# Renderização por retângulos sujos da tela de jogo. A camada estática (fundo, tabuleiro e
+# construções) é composta uma vez numa superfície própria e só é refeita quando as construções
+# mudam. Os elementos dinâmicos (peões, painéis, HUD) se registram a cada quadro com um retângulo
+# e uma assinatura do que mostram; só os retângulos cuja assinatura mudou são enviados à tela
+# com pygame.display.update(rects). Um quadro sem mudanças não desenha nem atualiza nada.
+
+import pygame
+
+
+class RenderizadorCamadas:
+    """
+    Controla a camada estática e as regiões sujas de uma tela.
+
+    Uso por quadro:
+        renderizador.atualizar_estatica(assinatura, desenhar)
+        renderizador.marcar(nome, rect, assinatura)   # um por elemento dinâmico
+        if renderizador.ha_mudancas():
+            renderizador.compor()                     # restaura a camada estática na área suja
+            ... desenha os elementos dinâmicos ...
+        renderizador.apresentar()
+    """
+
+    def __init__(self, screen, cor_fundo=(0, 0, 0)):
+        """
+        Args:
+            screen: Superfície da janela (pygame.display.set_mode)
+            cor_fundo: Cor de fundo da camada estática
+        """
+        self.screen = screen
+        self.cor_fundo = cor_fundo
+        self.camada_estatica = pygame.Surface(screen.get_size()).convert()
+        self._assinatura_estatica = None
+        self._regioes = {}       # nome -> (rect, assinatura) do último quadro
+        self._sujos = []
+        self._tela_inteira = True
+        self.quadros_ociosos = 0
+        self.quadros_parciais = 0
+        self.quadros_completos = 0
+
+    def invalidar(self):
+        """Força o redesenho e a atualização da tela inteira no próximo quadro."""
+        self._tela_inteira = True
+
+    def atualizar_estatica(self, assinatura, desenhar):
+        """
+        Refaz a camada estática se a assinatura mudou.
+
+        Args:
+            assinatura: Valor comparável que identifica o conteúdo estático (ex.: casas construídas)
+            desenhar: Função que recebe a superfície da camada e desenha o conteúdo estático
+        """
+        if assinatura == self._assinatura_estatica:
+            return
+        self._assinatura_estatica = assinatura
+        self.camada_estatica.fill(self.cor_fundo)
+        desenhar(self.camada_estatica)
+        self._tela_inteira = True
+
+    def marcar(self, nome, rect, assinatura):
+        """
+        Registra um elemento dinâmico. Se a assinatura ou o retângulo mudaram desde o último
+        quadro, a área antiga e a nova ficam sujas.
+
+        Args:
+            nome: Identificador do elemento
+            rect: Área ocupada na tela (pygame.Rect ou tupla x, y, largura, altura)
+            assinatura: Valor comparável com tudo que o elemento mostra
+        """
+        rect = pygame.Rect(rect)
+        anterior = self._regioes.get(nome)
+        if anterior is not None and anterior[1] == assinatura and anterior[0] == rect:
+            return
+        if anterior is not None:
+            self._sujos.append(anterior[0])
+        self._sujos.append(rect)
+        self._regioes[nome] = (rect, assinatura)
+
+    def esquecer(self, nome):
+        """Remove um elemento que deixou de ser desenhado (a área que ocupava fica suja)."""
+        anterior = self._regioes.pop(nome, None)
+        if anterior is not None:
+            self._sujos.append(anterior[0])
+
+    def ha_mudancas(self):
+        """Indica se o quadro atual precisa ser desenhado."""
+        return self._tela_inteira or bool(self._sujos)
+
+    def compor(self):
+        """
+        Prepara a tela para o desenho dos elementos dinâmicos: restaura a camada estática na
+        área suja e limita (set_clip) o desenho a essa área. Num quadro parcial a área é a
+        união dos retângulos sujos, para que nada seja desenhado duas vezes sobre si mesmo.
+        """
+        if self._tela_inteira:
+            self.screen.set_clip(None)
+            self.screen.blit(self.camada_estatica, (0, 0))
+            return
+        area = self._sujos[0].unionall(self._sujos[1:])
+        self.screen.set_clip(area)
+        self.screen.blit(self.camada_estatica, area, area)
+
+    def apresentar(self):
+        """Envia à tela as áreas sujas e zera o controle para o próximo quadro."""
+        self.screen.set_clip(None)
+        if self._tela_inteira:
+            pygame.display.flip()
+            self.quadros_completos += 1
+        elif self._sujos:
+            pygame.display.update(self._sujos)
+            self.quadros_parciais += 1
+        else:
+            self.quadros_ociosos += 1
+        self._sujos = []
+        self._tela_inteira = False
+
+    def estatisticas(self):
+        """Retorna a contagem de quadros ociosos, parciais e completos."""
+        return {
+            "ociosos": self.quadros_ociosos,
+            "parciais": self.quadros_parciais,
+            "completos": self.quadros_completos,
+        }
+
+
+if __name__ == '__main__':
+    import os
+    import time
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    print("--- Teste do Módulo RenderizadorCamadas ---")
+    tela = pygame.display.set_mode((1600, 900))
+    renderizador = RenderizadorCamadas(tela, (10, 10, 20))
+    peao = pygame.Surface((20, 20))
+    peao.fill((200, 60, 60))
+
+    inicio = time.perf_counter()
+    for quadro in range(600):
+        renderizador.atualizar_estatica(0, lambda camada: pygame.draw.rect(camada, (40, 90, 40), (320, 0, 768, 768)))
+        # O peão anda uma casa a cada segundo (60 quadros); nos outros quadros nada muda
+        x = 400 + (quadro // 60) * 63
+        renderizador.marcar("peao", (x, 700, 20, 20), x)
+        if renderizador.ha_mudancas():
+            renderizador.compor()
+            tela.blit(peao, (x, 700))
+        renderizador.apresentar()
+    duracao = (time.perf_counter() - inicio) * 1000
+    print(f"600 quadros em {duracao:.0f} ms | {renderizador.estatisticas()}")
@@ -0,0 +1,402 @@
+# simulacao_compacta.py
+# Motor de turnos rápido sobre EstadoCompacto, usado em rollouts Monte Carlo dos bots.
+# Segue as regras do Jogo (aluguel, prisão, cartas, impostos) sem objetos, logs nem eventos;
+# compras e construções seguem uma política padrão simples e configurável.
+
+import random
+from functools import lru_cache
+
+from aluguel import TIPO_ALUGUEL_COMUM, TIPO_ALUGUEL_METRO
+from cartas import (
+    BaralhoCartas, CartaDinheiro, CartaMovimento, CartaMovimentoRelativo,
+    CartaPrisao, CartaLivrePrisao, CartaReparos, CartaComunidade
+)
+from constantes import (
+    VALOR_PASSAGEM_SAIDA, POSICAO_PRISAO, MULTA_SAIDA_PRISAO, MAX_TURNOS_PRISAO
+)
+from dados import ROLAGENS_2D6
+from estado_compacto import SEM_DONO, FORA_DA_PRISAO, BIT_LIVRE_SORTE, BIT_LIVRE_COFRE
+from tabuleiro import (
+    TabelasTabuleiro, CODIGO_PROPRIEDADE, CODIGO_METRO, CODIGO_COMPANHIA, CODIGO_SORTE,
+    CODIGO_COFRE, CODIGO_IMPOSTO, CODIGO_VA_PRISAO
+)
+
+HOTEL = 5
+
+# Efeitos de carta (primeiro item da tupla em EFEITOS_CARTAS)
+EFEITO_DINHEIRO = 0      # (EFEITO_DINHEIRO, valor)
+EFEITO_MOVER = 1         # (EFEITO_MOVER, destino, cobra_passagem)
+EFEITO_RELATIVO = 2      # (EFEITO_RELATIVO, casas)
+EFEITO_PRISAO = 3
+EFEITO_LIVRE = 4
+EFEITO_REPAROS = 5       # (EFEITO_REPAROS, valor_por_casa, valor_por_hotel)
+EFEITO_COMUNIDADE = 6    # (EFEITO_COMUNIDADE, valor_por_jogador, eh_recebimento)
+
+
+def _efeito_carta(carta):
+    if isinstance(carta, CartaDinheiro):
+        return (EFEITO_DINHEIRO, carta.valor)
+    if isinstance(carta, CartaMovimento):
+        return (EFEITO_MOVER, carta.posicao_destino, carta.cobra_passagem)
+    if isinstance(carta, CartaMovimentoRelativo):
+        return (EFEITO_RELATIVO, carta.casas)
+    if isinstance(carta, CartaPrisao):
+        return (EFEITO_PRISAO,)
+    if isinstance(carta, CartaLivrePrisao):
+        return (EFEITO_LIVRE,)
+    if isinstance(carta, CartaReparos):
+        return (EFEITO_REPAROS, carta.valor_por_casa, carta.valor_por_hotel)
+    if isinstance(carta, CartaComunidade):
+        return (EFEITO_COMUNIDADE, carta.valor_por_jogador, carta.è_recebimento)
+    return (EFEITO_DINHEIRO, 0)
+
+
+@lru_cache(maxsize=None)
+def efeitos_cartas(tipo):
+    """Efeitos das cartas padrão de um baralho, no mesmo índice de BaralhoCartas.cartas_padrao."""
+    return tuple(_efeito_carta(carta) for carta in BaralhoCartas.cartas_padrao(tipo))
+
+
+class SimuladorCompacto:
+    """
+    Joga turnos sobre um EstadoCompacto (modificando-o no lugar).
+
+    Política padrão de todos os jogadores: compra se sobrar ao menos 'reserva' após a compra
+    e constrói por igual nos monopólios enquanto sobrar a reserva. Quem não consegue pagar
+    hipoteca propriedades (metade do preço); se ainda faltar, vai à falência e devolve tudo ao banco.
+    """
+
+    RESERVA_PADRAO = 150
+
+    def __init__(self, rng=None, tabelas=None, reserva=RESERVA_PADRAO):
+        """
+        Args:
+            rng: Gerador de números aleatórios (padrão: módulo random global)
+            tabelas: TabelasTabuleiro (padrão: tabuleiro padrão)
+            reserva: Saldo mínimo que a política padrão mantém após comprar/construir
+        """
+        self.rng = rng if rng is not None else random
+        self.tabelas = tabelas if tabelas is not None else TabelasTabuleiro.padrao()
+        self.reserva = reserva
+
+    # --- Turnos ---
+
+    def jogar(self, estado, num_turnos):
+        """
+        Joga até num_turnos turnos (ou até restar um jogador).
+
+        Returns:
+            int: Número de turnos jogados
+        """
+        for turno in range(num_turnos):
+            if self.num_ativos(estado) <= 1:
+                return turno
+            self.jogar_turno(estado)
+        return num_turnos
+
+    def jogar_turno(self, estado):
+        """Joga o turno do jogador da vez (rolar, mover, resolver a casa, construir e passar a vez)."""
+        assento = estado.indice_turno
+        total, _, dupla = ROLAGENS_2D6[int(self.rng.random() * 36)]
+        estado.dupla_pendente = False
+
+        if estado.prisao[assento] != FORA_DA_PRISAO:
+            if not self._turno_na_prisao(estado, assento, total, dupla):
+                self.finalizar_turno(estado)
+                return
+        else:
+            if dupla:
+                estado.duplas_consecutivas += 1
+                if estado.duplas_consecutivas >= 3:
+                    self._enviar_prisao(estado, assento)
+                    estado.duplas_consecutivas = 0
+                    self.finalizar_turno(estado)
+                    return
+                estado.dupla_pendente = True
+            else:
+                estado.duplas_consecutivas = 0
+
+        self._mover(estado, assento, total, cobra_passagem=True)
+        self._resolver_casa(estado, assento, total)
+        if estado.ativos[assento]:
+            self.construir(estado, assento)
+        self.finalizar_turno(estado)
+
+    def finalizar_turno(self, estado):
+        """Passa a vez ao próximo jogador ativo, a menos que a última rolagem tenha sido dupla."""
+        assento = estado.indice_turno
+        if estado.dupla_pendente and estado.ativos[assento]:
+            return
+        estado.dupla_pendente = False
+        estado.duplas_consecutivas = 0
+        num_jogadores = len(estado.ativos)
+        for passo in range(1, num_jogadores + 1):
+            proximo = (assento + passo) % num_jogadores
+            if estado.ativos[proximo]:
+                estado.indice_turno = proximo
+                return
+
+    def _turno_na_prisao(self, estado, assento, total, dupla):
+        """Retorna True se o jogador sai e se move neste turno."""
+        if estado.cartas_livre[assento]:
+            # Usa a carta e devolve ao descarte do baralho de origem
+            if estado.cartas_livre[assento] & BIT_LIVRE_SORTE:
+                estado.cartas_livre[assento] &= ~BIT_LIVRE_SORTE
+                estado.descarte_sorte.append(self._indice_livre('SORTE'))
+            else:
+                estado.cartas_livre[assento] &= ~BIT_LIVRE_COFRE
+                estado.descarte_cofre.append(self._indice_livre('COFRE'))
+            estado.prisao[assento] = FORA_DA_PRISAO
+            return False
+
+        if dupla:
+            estado.prisao[assento] = FORA_DA_PRISAO
+            return True
+
+        estado.prisao[assento] += 1
+        if estado.prisao[assento] >= MAX_TURNOS_PRISAO:
+            estado.prisao[assento] = FORA_DA_PRISAO
+            self.pagar(estado, assento, MULTA_SAIDA_PRISAO)
+        return False
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _indice_livre(tipo):
+        return next(i for i, efeito in enumerate(efeitos_cartas(tipo)) if efeito[0] == EFEITO_LIVRE)
+
+    def _enviar_prisao(self, estado, assento):
+        estado.posicoes[assento] = POSICAO_PRISAO
+        estado.prisao[assento] = 0
+        estado.dupla_pendente = False
+
+    def _mover(self, estado, assento, casas, cobra_passagem):
+        nova = estado.posicoes[assento] + casas
+        if nova >= 40:
+            nova -= 40
+            if cobra_passagem:
+                estado.saldos[assento] += VALOR_PASSAGEM_SAIDA
+        elif nova < 0:
+            nova += 40
+        estado.posicoes[assento] = nova
+
+    def _resolver_casa(self, estado, assento, rolagem):
+        posicao = estado.posicoes[assento]
+        tipo = self.tabelas.tipos[posicao]
+
+        if tipo in (CODIGO_PROPRIEDADE, CODIGO_METRO, CODIGO_COMPANHIA):
+            dono = estado.proprietarios[posicao]
+            if dono == SEM_DONO:
+                if self.deve_comprar(estado, assento, posicao):
+                    self.comprar(estado, assento, posicao)
+            elif dono != assento:
+                aluguel = self.calcular_aluguel(estado, posicao, rolagem)
+                if aluguel:
+                    self.pagar(estado, assento, aluguel, credor=dono)
+        elif tipo == CODIGO_SORTE or tipo == CODIGO_COFRE:
+            # Prêmio ou taxa de R$100 da própria casa, depois a carta
+            if self.rng.random() < 0.5:
+                estado.saldos[assento] += 100
+            else:
+                self.pagar(estado, assento, 100)
+            if estado.ativos[assento]:
+                self._pegar_carta(estado, assento, 'SORTE' if tipo == CODIGO_SORTE else 'COFRE')
+        elif tipo == CODIGO_IMPOSTO:
+            self.pagar(estado, assento, self.tabelas.impostos[posicao])
+        elif tipo == CODIGO_VA_PRISAO:
+            self._enviar_prisao(estado, assento)
+
+    def _pegar_carta(self, estado, assento, tipo):
+        if tipo == 'SORTE':
+            baralho, descarte = estado.baralho_sorte, estado.descarte_sorte
+        else:
+            baralho, descarte = estado.baralho_cofre, estado.descarte_cofre
+
+        if not baralho:
+            if not descarte:
+                return
+            baralho.extend(descarte)
+            del descarte[:]
+            cartas = baralho.tolist()
+            self.rng.shuffle(cartas)
+            baralho[:] = type(baralho)('b', cartas)
+
+        indice = baralho.pop(0)
+        efeito = efeitos_cartas(tipo)[indice]
+        codigo = efeito[0]
+
+        # Como no Jogo, só cartas de dinheiro e de movimento voltam ao baralho
+        if codigo == EFEITO_DINHEIRO:
+            descarte.append(indice)
+            if efeito[1] > 0:
+                estado.saldos[assento] += efeito[1]
+            elif efeito[1] < 0:
+                self.pagar(estado, assento, -efeito[1])
+        elif codigo == EFEITO_MOVER:
+            descarte.append(indice)
+            destino = efeito[1]
+            if efeito[2] and estado.posicoes[assento] > destino:
+                estado.saldos[assento] += VALOR_PASSAGEM_SAIDA
+            estado.posicoes[assento] = destino
+        elif codigo == EFEITO_RELATIVO:
+            self._mover(estado, assento, efeito[1], cobra_passagem=efeito[1] > 0)
+        elif codigo == EFEITO_PRISAO:
+            self._enviar_prisao(estado, assento)
+        elif codigo == EFEITO_LIVRE:
+            estado.cartas_livre[assento] |= BIT_LIVRE_SORTE if tipo == 'SORTE' else BIT_LIVRE_COFRE
+        elif codigo == EFEITO_REPAROS:
+            total = 0
+            for posicao, dono in enumerate(estado.proprietarios):
+                if dono == assento and estado.casas[posicao]:
+                    total += efeito[2] if estado.casas[posicao] == HOTEL else efeito[1] * estado.casas[posicao]
+            if total:
+                self.pagar(estado, assento, total)
+        elif codigo == EFEITO_COMUNIDADE:
+            for outro in range(len(estado.ativos)):
+                if outro != assento and estado.ativos[outro]:
+                    if efeito[2]:
+                        self.pagar(estado, outro, efeito[1], credor=assento)
+                    else:
+                        self.pagar(estado, assento, efeito[1], credor=outro)
+
+    # --- Regras de propriedade ---
+
+    def calcular_aluguel(self, estado, posicao, rolagem=7):
+        """Aluguel da casa na posição (mesmas tabelas de aluguel.py)."""
+        dono = estado.proprietarios[posicao]
+        if dono == SEM_DONO or estado.hipotecas >> posicao & 1:
+            return 0
+
+        tabelas = self.tabelas
+        tabela = tabelas.tabelas_aluguel[posicao]
+        membros = tabelas.posicoes_grupo[tabelas.grupos[posicao]]
+        quantidade = 0
+        for membro in membros:
+            if estado.proprietarios[membro] == dono:
+                quantidade += 1
+
+        tipo = tabelas.tipos_aluguel[posicao]
+        if tipo == TIPO_ALUGUEL_COMUM:
+            casas = estado.casas[posicao]
+            if casas:
+                return tabela[casas + 1]
+            return tabela[1 if quantidade == len(membros) else 0]
+        if tipo == TIPO_ALUGUEL_METRO:
+            return tabela[quantidade]
+        return tabela[quantidade] * rolagem
+
+    def deve_comprar(self, estado, assento, posicao):
+        """Política padrão de compra."""
+        return estado.saldos[assento] - self.tabelas.precos[posicao] >= self.reserva
+
+    def comprar(self, estado, assento, posicao):
+        estado.saldos[assento] -= self.tabelas.precos[posicao]
+        estado.proprietarios[posicao] = assento
+
+    def grupos_construiveis(self, estado, assento):
+        """Posições dos grupos construíveis em que o jogador tem monopólio sem hipotecas."""
+        tabelas = self.tabelas
+        resultado = []
+        for membros in tabelas.posicoes_grupo:
+            if not tabelas.construivel[membros[0]]:
+                continue
+            if all(estado.proprietarios[m] == assento and not estado.hipotecas >> m & 1 for m in membros):
+                resultado.append(membros)
+        return resultado
+
+    def construir(self, estado, assento):
+        """Política padrão de construção: uma casa por vez na propriedade menos construída do grupo."""
+        custo_casa = self.tabelas.custo_casa
+        for membros in self.grupos_construiveis(estado, assento):
+            while True:
+                alvo = min(membros, key=estado.casas.__getitem__)
+                if estado.casas[alvo] >= HOTEL:
+                    break
+                if estado.saldos[assento] - custo_casa[alvo] < self.reserva:
+                    return
+                estado.saldos[assento] -= custo_casa[alvo]
+                estado.casas[alvo] += 1
+
+    # --- Pagamentos e falência ---
+
+    def pagar(self, estado, assento, valor, credor=SEM_DONO):
+        """
+        Debita 'valor' do jogador (e credita ao credor, se houver). Sem saldo, hipoteca
+        propriedades; se ainda faltar, o jogador vai à falência e o credor recebe o que restou.
+        """
+        saldos = estado.saldos
+        saldos[assento] -= valor
+        if saldos[assento] < 0:
+            self._levantar_dinheiro(estado, assento)
+        if saldos[assento] < 0:
+            pago = valor + saldos[assento]
+            self._falir(estado, assento)
+        else:
+            pago = valor
+        if credor != SEM_DONO and pago > 0:
+            saldos[credor] += pago
+
+    def _levantar_dinheiro(self, estado, assento):
+        """Vende casas (metade do custo) e hipoteca propriedades (metade do preço) até cobrir o saldo."""
+        tabelas = self.tabelas
+        for posicao, dono in enumerate(estado.proprietarios):
+            if estado.saldos[assento] >= 0:
+                return
+            if dono != assento:
+                continue
+            if estado.casas[posicao]:
+                estado.saldos[assento] += estado.casas[posicao] * tabelas.custo_casa[posicao] // 2
+                estado.casas[posicao] = 0
+            if not estado.hipotecas >> posicao & 1:
+                estado.hipotecas |= 1 << posicao
+                estado.saldos[assento] += tabelas.precos[posicao] // 2
+
+    def _falir(self, estado, assento):
+        estado.ativos[assento] = 0
+        estado.saldos[assento] = 0
+        estado.cartas_livre[assento] = 0
+        estado.prisao[assento] = FORA_DA_PRISAO
+        for posicao, dono in enumerate(estado.proprietarios):
+            if dono == assento:
+                estado.proprietarios[posicao] = SEM_DONO
+                estado.casas[posicao] = 0
+                estado.hipotecas &= ~(1 << posicao)
+
+    # --- Avaliação ---
+
+    @staticmethod
+    def num_ativos(estado):
+        return sum(estado.ativos)
+
+    def patrimonio(self, estado, assento):
+        """Saldo + preço das propriedades (metade se hipotecadas) + custo das construções."""
+        if not estado.ativos[assento]:
+            return 0
+        tabelas = self.tabelas
+        total = estado.saldos[assento]
+        for posicao, dono in enumerate(estado.proprietarios):
+            if dono == assento:
+                preco = tabelas.precos[posicao]
+                total += preco // 2 if estado.hipotecas >> posicao & 1 else preco
+                total += estado.casas[posicao] * tabelas.custo_casa[posicao]
+        return total
+
+
+if __name__ == '__main__':
+    import time
+    from estado_compacto import EstadoCompacto
+
+    print("--- Teste do Módulo SimuladorCompacto ---")
+    simulador = SimuladorCompacto(rng=random.Random(42))
+    inicial = EstadoCompacto(["A", "B", "C", "D"])
+
+    partidas, turnos = 200, 0
+    inicio = time.perf_counter()
+    for _ in range(partidas):
+        estado = inicial.clone()
+        turnos += simulador.jogar(estado, 300)
+    duracao = time.perf_counter() - inicio
+
+    print(f"{partidas} rollouts de até 300 turnos em {duracao:.2f}s "
+          f"({turnos / duracao:,.0f} turnos/s)")
+    print(f"Último rollout: ativos={list(estado.ativos)} saldos={list(estado.saldos)}")
+    print(f"Patrimônios: {[simulador.patrimonio(estado, a) for a in range(estado.num_jogadores)]}")
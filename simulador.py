@@ -0,0 +1,148 @@
+# simulador.py
+# Módulo para simular partidas completas entre bots, sem interface gráfica.
+# Usado para avaliar estratégias da IA em lote (sem pygame, sem delays, sem saída no terminal).
+# Roda o motor completo (objetos do Jogo, bots com busca de trocas); para rollouts em massa,
+# onde bastam regras e uma política fixa, use o SimuladorCompacto (simulacao_compacta.py).
+# Com trocas=False os bots não buscam trocas (o passo mais caro do turno): é o caminho rápido
+# para lotes grandes. As metas de vazão de cada caminho ficam em benchmark_simulacao.py.
+
+import time
+from collections import namedtuple
+
+from jogo import Jogo
+from gerenciador_inicializacao import GerenciadorInicializacao
+from avaliacao import ServicoAvaliacao
+from registro import log, DESLIGADO
+
+
+# Registro compacto do resultado de uma partida simulada
+ResultadoPartida = namedtuple(
+    "ResultadoPartida",
+    [
+        "vencedor",          # Nome do vencedor (ou o mais rico, se atingiu o limite de turnos)
+        "turnos",            # Número de turnos jogados
+        "ordem_falencias",   # Tupla com os nomes dos falidos, na ordem em que faliram
+        "finalizada",        # True se terminou por falência de todos os outros jogadores
+        "patrimonios",       # Tupla (nome, patrimônio) de todos os jogadores, na ordem dos assentos
+        "seed",              # Semente usada (permite reproduzir a partida)
+    ]
+)
+
+
+class SimuladorPartidas:
+    """
+    Conduz partidas bot-vs-bot do início ao fim usando o Jogo em modo headless.
+    """
+
+    MAX_TURNOS_PADRAO = 1000
+
+    def __init__(self, max_turnos=MAX_TURNOS_PADRAO, silencioso=True, trocas=True):
+        """
+        Args:
+            max_turnos: Limite de turnos por partida (partidas de Monopoly podem não terminar)
+            silencioso: Se True, desliga a saída do motor do jogo durante a partida
+            trocas: Se False, os bots não buscam nem propõem trocas (simulações em massa)
+        """
+        self.max_turnos = max_turnos
+        self.silencioso = silencioso
+        self.trocas = trocas
+
+    def simular_partida(self, dificuldades, seed=None):
+        """
+        Simula uma partida completa entre bots.
+
+        Args:
+            dificuldades: Lista com a dificuldade de cada bot ('facil', 'medio', 'dificil', 'mcts'),
+                          na ordem dos assentos
+            seed: Semente da partida (a mesma seed reproduz a mesma partida)
+
+        Returns:
+            ResultadoPartida: Resultado compacto da partida
+        """
+        lista_jogadores = GerenciadorInicializacao.gerar_lista_bots(dificuldades)
+
+        if not self.silencioso:
+            return self._executar_partida(lista_jogadores, seed)
+
+        nivel_anterior = log.definir_nivel(DESLIGADO)
+        try:
+            return self._executar_partida(lista_jogadores, seed)
+        finally:
+            log.definir_nivel(nivel_anterior)
+
+    def simular_lote(self, dificuldades, num_partidas, seed_inicial=None):
+        """
+        Simula várias partidas com a mesma configuração de bots.
+
+        Args:
+            dificuldades: Lista com a dificuldade de cada bot
+            num_partidas: Número de partidas a simular
+            seed_inicial: Se informada, a partida i usa seed_inicial + i
+
+        Returns:
+            list: Lista de ResultadoPartida
+        """
+        if seed_inicial is None:
+            return [self.simular_partida(dificuldades) for _ in range(num_partidas)]
+        return [self.simular_partida(dificuldades, seed_inicial + i) for i in range(num_partidas)]
+
+    def _executar_partida(self, lista_jogadores, seed):
+        """Executa os turnos até restar um jogador ou atingir o limite de turnos."""
+        jogo = Jogo([], lista_jogadores=lista_jogadores, headless=True, seed=seed, trocas_bots=self.trocas)
+        todos_jogadores = list(jogo.jogadores)
+
+        turnos = 0
+        while not jogo.jogo_finalizado and turnos < self.max_turnos:
+            jogador_atual = jogo.jogadores[jogo.indice_turno_atual]
+            jogo.executar_turno_bot_nao_bloqueante(jogador_atual)
+            turnos += 1
+
+        patrimonios = tuple(
+            (jogador.nome, self._calcular_patrimonio(jogo, jogador))
+            for jogador in todos_jogadores
+        )
+
+        if jogo.jogo_finalizado and jogo.jogadores:
+            vencedor = jogo.jogadores[0].nome
+        else:
+            ativos = [(nome, valor) for nome, valor in patrimonios
+                      if nome in {j.nome for j in jogo.jogadores}]
+            vencedor = max(ativos, key=lambda item: item[1])[0] if ativos else None
+
+        return ResultadoPartida(
+            vencedor=vencedor,
+            turnos=turnos,
+            ordem_falencias=tuple(j.nome for j in jogo.jogadores_falidos),
+            finalizada=jogo.jogo_finalizado,
+            patrimonios=patrimonios,
+            seed=seed
+        )
+
+    @staticmethod
+    def _calcular_patrimonio(jogo, jogador):
+        """Saldo + valor contábil das propriedades e construções (0 para falidos)."""
+        if jogador.falido:
+            return 0
+        saldo = jogo.banco.consultar_saldo(jogador.nome)
+        return saldo + ServicoAvaliacao.padrao().valor_contabil(jogador.propriedades)
+
+
+if __name__ == '__main__':
+    simulador = SimuladorPartidas(max_turnos=500)
+    configuracao = ['facil', 'medio', 'dificil', 'medio']
+    num_partidas = 20
+
+    inicio = time.perf_counter()
+    resultados = simulador.simular_lote(configuracao, num_partidas, seed_inicial=0)
+    duracao = time.perf_counter() - inicio
+
+    vitorias = {}
+    for resultado in resultados:
+        vitorias[resultado.vencedor] = vitorias.get(resultado.vencedor, 0) + 1
+
+    print(f"=== {num_partidas} partidas simuladas em {duracao:.2f}s "
+          f"({num_partidas / duracao:.1f} partidas/s) ===")
+    print(f"Turnos médios: {sum(r.turnos for r in resultados) / num_partidas:.1f}")
+    print(f"Partidas finalizadas por falência: {sum(1 for r in resultados if r.finalizada)}")
+    for nome, total in sorted(vitorias.items(), key=lambda item: -item[1]):
+        print(f"  {nome}: {total} vitórias")
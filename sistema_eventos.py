@@ -1,8 +1,11 @@
 # sistema_eventos.py
 # Módulo para gerenciar eventos do jogo (ganhos, perdas, marcos, etc)
 
-from datetime import datetime
+import time
+from collections import deque
 from enum import Enum
+from itertools import count
+from registro import log
 
 class TipoEvento(Enum):
     """Tipos de eventos que podem ocorrer no jogo"""
@@ -28,25 +31,57 @@ class TipoEvento(Enum):
     SALDO_ALTO = "saldo_alto"  # Saldo acima de 3000
 
 
+# Tuplas de chaves dos dados dos eventos, compartilhadas entre eventos com as mesmas chaves
+_CHAVES_DADOS = {}
+
+
 class Evento:
-    """Representa um evento no jogo"""
+    """
+    Representa um evento no jogo.
+    Os dados adicionais são guardados como uma tupla de valores e uma tupla de chaves
+    compartilhada, em vez de um dict por evento (o histórico costuma ter milhares de eventos).
+    """
+    __slots__ = ('tipo', 'jogador', 'descricao', 'timestamp', '_chaves', '_valores', 'sequencia')
     
-    def __init__(self, tipo, jogador, descricao, dados_adicionais=None):
+    def __init__(self, tipo, jogador, descricao, dados_adicionais=None, sequencia=0):
         """
         Args:
             tipo: TipoEvento
             jogador: Nome do jogador envolvido
             descricao: Descrição textual do evento
             dados_adicionais: Dict com dados específicos do evento
+            sequencia: Número do evento no SistemaEventos (crescente)
         """
         self.tipo = tipo
         self.jogador = jogador
         self.descricao = descricao
-        self.timestamp = datetime.now()
-        self.dados_adicionais = dados_adicionais or {}
+        self.timestamp = time.monotonic_ns()  # Inteiro monotônico (ns), não afetado por ajustes do relógio
+        if dados_adicionais:
+            chaves = tuple(dados_adicionais)
+            self._chaves = _CHAVES_DADOS.setdefault(chaves, chaves)
+            # Com uma única chave (o caso comum) o valor é guardado sem tupla
+            self._valores = tuple(dados_adicionais.values()) if len(chaves) > 1 else dados_adicionais[chaves[0]]
+        else:
+            self._chaves = self._valores = ()
+        self.sequencia = sequencia
+    
+    def _tupla_valores(self):
+        return (self._valores,) if len(self._chaves) == 1 else self._valores
+    
+    @property
+    def dados_adicionais(self):
+        """Dict (novo a cada acesso) com os dados específicos do evento."""
+        return dict(zip(self._chaves, self._tupla_valores()))
+    
+    def dado(self, chave, padrao=None):
+        """Um dado específico do evento, sem montar o dict."""
+        try:
+            return self._tupla_valores()[self._chaves.index(chave)]
+        except ValueError:
+            return padrao
     
     def __str__(self):
-        return f"[{self.timestamp.strftime('%H:%M:%S')}] {self.tipo.value.upper()}: {self.descricao}"
+        return f"[#{self.sequencia}] {self.tipo.value.upper()}: {self.descricao}"
     
     def to_dict(self):
         """Converte evento para dicionário"""
@@ -54,21 +89,56 @@ class Evento:
             'tipo': self.tipo.value,
             'jogador': self.jogador,
             'descricao': self.descricao,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp,
+            'sequencia': self.sequencia,
             'dados': self.dados_adicionais
         }
 
 
+# Contadores de obter_estatisticas_jogador atualizados a cada evento: tipo -> chave
+CONTADORES_ESTATISTICAS = {
+    TipoEvento.COMPRA_PROPRIEDADE: 'propriedades_compradas',
+    TipoEvento.VENDA_PROPRIEDADE: 'propriedades_vendidas',
+    TipoEvento.CONSTRUCAO_CASA: 'casas_construidas',
+    TipoEvento.CONSTRUCAO_HOTEL: 'hoteis_construidos',
+    TipoEvento.PRISAO: 'vezes_preso',
+    TipoEvento.PASSAGEM_SAIDA: 'vezes_passou_saida',
+    TipoEvento.MONOPÓLIO_COMPLETADO: 'monopolios_completados',
+}
+
+# Somas do dado 'valor' dos eventos: tipo -> chave
+SOMAS_ESTATISTICAS = {
+    TipoEvento.PAGAMENTO_ALUGUEL: 'aluguel_pago_total',
+    TipoEvento.RECEBIMENTO_ALUGUEL: 'aluguel_recebido_total',
+}
+
+
 class SistemaEventos:
     """
     Gerencia todos os eventos que ocorrem durante o jogo.
     Mantém histórico, dispara callbacks e fornece análises.
     """
     
-    def __init__(self):
-        self.eventos = []
+    def __init__(self, retencao=None, gravar=True):
+        """
+        Args:
+            retencao: Máximo de eventos guardados no histórico (buffer circular);
+                      None guarda todos. As estatísticas sempre contam a partida inteira.
+            gravar: Se False, eventos não entram no histórico nem nas estatísticas
+                    (só os tipos com callbacks são disparados)
+        """
+        self.retencao = retencao
+        self.gravar = gravar
+        self.eventos = deque(maxlen=retencao)
         self.callbacks = {}  # {TipoEvento: [funções_callback]}
         self.habilitado = True
+        self._sequencia = count(1)
+        # Índices do histórico (mesma retenção; eventos já descartados são podados na consulta)
+        self._por_tipo = {}
+        self._por_jogador = {}
+        self._por_jogador_tipo = {}
+        # Estatísticas incrementais por jogador
+        self._estatisticas = {}
     
     def registrar_callback(self, tipo_evento, funcao_callback):
         """
@@ -81,7 +151,14 @@ class SistemaEventos:
         if tipo_evento not in self.callbacks:
             self.callbacks[tipo_evento] = []
         self.callbacks[tipo_evento].append(funcao_callback)
-        print(f"  > Callback registrado para {tipo_evento.value}")
+        log.info("  > Callback registrado para %s", tipo_evento.value)
+    
+    def tem_interesse(self, tipo):
+        """
+        Indica se um evento do tipo seria usado (histórico gravado ou callback registrado).
+        Permite ao chamador pular a montagem da descrição e dos dados do evento.
+        """
+        return self.habilitado and (self.gravar or tipo in self.callbacks)
     
     def disparar_evento(self, tipo, jogador, descricao, dados_adicionais=None):
         """
@@ -90,23 +167,73 @@ class SistemaEventos:
         Args:
             tipo: TipoEvento
             jogador: Nome do jogador
-            descricao: Descrição do evento
-            dados_adicionais: Dados extras
+            descricao: Descrição do evento (ou função sem argumentos que a monta)
+            dados_adicionais: Dados extras (ou função sem argumentos que os monta)
         """
-        if not self.habilitado:
+        if not self.tem_interesse(tipo):
             return
         
-        evento = Evento(tipo, jogador, descricao, dados_adicionais)
-        self.eventos.append(evento)
+        # Descrição e dados só são montados quando o evento é de fato usado
+        if callable(descricao):
+            descricao = descricao()
+        if callable(dados_adicionais):
+            dados_adicionais = dados_adicionais()
         
-        print(f"  > EVENTO: {evento}")
+        evento = Evento(tipo, jogador, descricao, dados_adicionais, next(self._sequencia))
+        if self.gravar:
+            self._indexar(evento)
+            self._contabilizar(evento)
+        
+        log.info("  > EVENTO: %s", evento)
         
         if tipo in self.callbacks:
             for callback in self.callbacks[tipo]:
                 try:
                     callback(evento)
                 except Exception as e:
-                    print(f"  > ERRO ao executar callback: {e}")
+                    log.erro("  > ERRO ao executar callback: %s", e)
+    
+    def _indexar(self, evento):
+        """Guarda o evento no histórico e nos índices por tipo, por jogador e por (jogador, tipo)."""
+        self.eventos.append(evento)
+        for indice, chave in ((self._por_tipo, evento.tipo),
+                              (self._por_jogador, evento.jogador),
+                              (self._por_jogador_tipo, (evento.jogador, evento.tipo))):
+            lista = indice.get(chave)
+            if lista is None:
+                lista = indice[chave] = deque(maxlen=self.retencao)
+            lista.append(evento)
+    
+    def _contabilizar(self, evento):
+        """Atualiza as estatísticas do jogador do evento."""
+        stats = self._estatisticas.get(evento.jogador)
+        if stats is None:
+            stats = self._estatisticas[evento.jogador] = self._estatisticas_vazias(evento.jogador)
+        stats['total_eventos'] += 1
+        chave = CONTADORES_ESTATISTICAS.get(evento.tipo)
+        if chave is not None:
+            stats[chave] += 1
+        else:
+            chave = SOMAS_ESTATISTICAS.get(evento.tipo)
+            if chave is not None:
+                stats[chave] += evento.dado('valor', 0)
+    
+    @staticmethod
+    def _estatisticas_vazias(nome_jogador):
+        stats = {'nome': nome_jogador, 'total_eventos': 0}
+        for chave in CONTADORES_ESTATISTICAS.values():
+            stats[chave] = 0
+        for chave in SOMAS_ESTATISTICAS.values():
+            stats[chave] = 0
+        return stats
+    
+    def _retidos(self, lista):
+        """Poda do início de um índice os eventos que já saíram do buffer circular."""
+        if self.retencao is not None and self.eventos:
+            primeiro = self.eventos[0].sequencia
+            while lista and lista[0].sequencia < primeiro:
+                lista.popleft()
+        return lista
     
     def obter_historico(self, filtro_jogador=None, filtro_tipo=None, limite=None):
         """
@@ -120,18 +247,21 @@ class SistemaEventos:
         Returns:
             list: Lista de eventos
         """
-        resultado = self.eventos[:]
-        
-        if filtro_jogador:
-            resultado = [e for e in resultado if e.jogador == filtro_jogador]
-        
-        if filtro_tipo:
-            resultado = [e for e in resultado if e.tipo == filtro_tipo]
+        if filtro_jogador and filtro_tipo:
+            fonte = self._por_jogador_tipo.get((filtro_jogador, filtro_tipo), ())
+        elif filtro_jogador:
+            fonte = self._por_jogador.get(filtro_jogador, ())
+        elif filtro_tipo:
+            fonte = self._por_tipo.get(filtro_tipo, ())
+        else:
+            fonte = self.eventos
+        if fonte:
+            fonte = self._retidos(fonte)
         
         if limite:
-            resultado = resultado[-limite:]
-        
-        return resultado
+            inicio = max(0, len(fonte) - limite)
+            return [fonte[i] for i in range(inicio, len(fonte))]
+        return list(fonte)
     
     def obter_estatisticas_jogador(self, nome_jogador):
         """
@@ -143,28 +273,28 @@ class SistemaEventos:
         Returns:
             dict: Estatísticas do jogador
         """
-        eventos_jogador = self.obter_historico(filtro_jogador=nome_jogador)
-        
-        stats = {
-            'nome': nome_jogador,
-            'total_eventos': len(eventos_jogador),
-            'propriedades_compradas': len([e for e in eventos_jogador if e.tipo == TipoEvento.COMPRA_PROPRIEDADE]),
-            'propriedades_vendidas': len([e for e in eventos_jogador if e.tipo == TipoEvento.VENDA_PROPRIEDADE]),
-            'casas_construidas': len([e for e in eventos_jogador if e.tipo == TipoEvento.CONSTRUCAO_CASA]),
-            'hoteis_construidos': len([e for e in eventos_jogador if e.tipo == TipoEvento.CONSTRUCAO_HOTEL]),
-            'vezes_preso': len([e for e in eventos_jogador if e.tipo == TipoEvento.PRISAO]),
-            'vezes_passou_saida': len([e for e in eventos_jogador if e.tipo == TipoEvento.PASSAGEM_SAIDA]),
-            'aluguel_pago_total': sum([e.dados_adicionais.get('valor', 0) for e in eventos_jogador if e.tipo == TipoEvento.PAGAMENTO_ALUGUEL]),
-            'aluguel_recebido_total': sum([e.dados_adicionais.get('valor', 0) for e in eventos_jogador if e.tipo == TipoEvento.RECEBIMENTO_ALUGUEL]),
-            'monopolios_completados': len([e for e in eventos_jogador if e.tipo == TipoEvento.MONOPÓLIO_COMPLETADO]),
-        }
-        
-        return stats
+        stats = self._estatisticas.get(nome_jogador)
+        if stats is None:
+            return self._estatisticas_vazias(nome_jogador)
+        return dict(stats)
+    
+    def contar_eventos(self, tipo=None):
+        """Nº de eventos no histórico retido (de um tipo ou de todos)."""
+        if tipo is None:
+            return len(self.eventos)
+        return len(self._retidos(self._por_tipo.get(tipo, deque())))
+    
+    def tipos_registrados(self):
+        """Tipos com pelo menos um evento no histórico retido."""
+        return [tipo for tipo, lista in self._por_tipo.items() if self._retidos(lista)]
     
     def limpar_historico(self):
-        """Limpa o histórico de eventos (use com cautela)"""
-        self.eventos = []
-        print("  > Histórico de eventos limpo")
+        """Limpa o histórico de eventos (use com cautela); as estatísticas são mantidas"""
+        self.eventos.clear()
+        self._por_tipo.clear()
+        self._por_jogador.clear()
+        self._por_jogador_tipo.clear()
+        log.info("  > Histórico de eventos limpo")
     
     def exportar_historico(self, caminho_arquivo):
         """
@@ -177,7 +307,7 @@ class SistemaEventos:
         dados = [e.to_dict() for e in self.eventos]
         with open(caminho_arquivo, 'w', encoding='utf-8') as f:
             json.dump(dados, f, indent=2, ensure_ascii=False)
-        print(f"  > Histórico exportado para {caminho_arquivo}")
+        log.info("  > Histórico exportado para %s", caminho_arquivo)
     
     def __str__(self):
         return f"SistemaEventos: {len(self.eventos)} eventos registrados"
@@ -1,3 +1,5 @@
+from registro import log
+
 class SistemaPropostas:
     """Sistema para gerenciar propostas de troca entre jogadores"""
     
@@ -30,27 +32,27 @@ class SistemaPropostas:
         # Verifica se o oferente tem as propriedades que está oferecendo
         for prop in propriedades_oferecidas:
             if prop not in jogador_oferente.propriedades:
-                print(f"Erro: {jogador_oferente.nome} não possui {prop.nome}")
+                log.erro("Erro: %s não possui %s", jogador_oferente.nome, prop.nome)
                 return None
         
         # Verifica se o destinatário tem as propriedades solicitadas
         for prop in propriedades_solicitadas:
             if prop not in jogador_destinatario.propriedades:
-                print(f"Erro: {jogador_destinatario.nome} não possui {prop.nome}")
+                log.erro("Erro: %s não possui %s", jogador_destinatario.nome, prop.nome)
                 return None
         
         # Verifica saldo do oferente se está oferecendo dinheiro
         if dinheiro_oferecido > 0:
             saldo_oferente = self.banco.consultar_saldo(jogador_oferente.nome)
             if saldo_oferente < dinheiro_oferecido:
-                print(f"Erro: {jogador_oferente.nome} não tem R${dinheiro_oferecido}")
+                log.erro("Erro: %s não tem R$%s", jogador_oferente.nome, dinheiro_oferecido)
                 return None
         
         # Verifica saldo do destinatário se está pedindo dinheiro dele
         if dinheiro_solicitado > 0:
             saldo_destinatario = self.banco.consultar_saldo(jogador_destinatario.nome)
             if saldo_destinatario < dinheiro_solicitado:
-                print(f"Erro: {jogador_destinatario.nome} não tem R${dinheiro_solicitado}")
+                log.erro("Erro: %s não tem R$%s", jogador_destinatario.nome, dinheiro_solicitado)
                 return None
         
         self.proposta_ativa = {
@@ -73,33 +75,33 @@ class SistemaPropostas:
         oferente = proposta["oferente"]
         destinatario = proposta["destinatario"]
         
+        # Dinheiro primeiro, numa única transação: se algum lado não puder pagar, nada muda
+        transacao = self.banco.iniciar_transacao(f"Proposta {oferente.nome}/{destinatario.nome}")
+        transacao.transferir(oferente.nome, destinatario.nome, proposta["dinheiro_oferecido"])
+        transacao.transferir(destinatario.nome, oferente.nome, proposta["dinheiro_solicitado"])
+        if not transacao.confirmar():
+            log.aviso("\n✗ Proposta não executada: saldo insuficiente.")
+            return False
+        if proposta["dinheiro_oferecido"] > 0:
+            log.info("  > R$%s: %s → %s", proposta['dinheiro_oferecido'], oferente.nome, destinatario.nome)
+        if proposta["dinheiro_solicitado"] > 0:
+            log.info("  > R$%s: %s → %s", proposta['dinheiro_solicitado'], destinatario.nome, oferente.nome)
+        
         # Transferir propriedades oferecidas
         for prop in proposta["props_oferecidas"]:
             oferente.remover_propriedade(prop)
             destinatario.adicionar_propriedade(prop)
             prop.proprietario = destinatario
-            print(f"  > {prop.nome}: {oferente.nome} → {destinatario.nome}")
+            log.info("  > %s: %s → %s", prop.nome, oferente.nome, destinatario.nome)
         
         # Transferir propriedades solicitadas
         for prop in proposta["props_solicitadas"]:
             destinatario.remover_propriedade(prop)
             oferente.adicionar_propriedade(prop)
             prop.proprietario = oferente
-            print(f"  > {prop.nome}: {destinatario.nome} → {oferente.nome}")
-        
-        # Transferir dinheiro oferecido (oferente → destinatário)
-        if proposta["dinheiro_oferecido"] > 0:
-            self.banco.transferir(oferente.nome, destinatario.nome, 
-                                 proposta["dinheiro_oferecido"])
-            print(f"  > R${proposta['dinheiro_oferecido']}: {oferente.nome} → {destinatario.nome}")
-        
-        # Transferir dinheiro solicitado (destinatário → oferente)
-        if proposta["dinheiro_solicitado"] > 0:
-            self.banco.transferir(destinatario.nome, oferente.nome, 
-                                 proposta["dinheiro_solicitado"])
-            print(f"  > R${proposta['dinheiro_solicitado']}: {destinatario.nome} → {oferente.nome}")
+            log.info("  > %s: %s → %s", prop.nome, destinatario.nome, oferente.nome)
         
-        print(f"\n✓ Proposta aceita e executada!")
+        log.info("\n✓ Proposta aceita e executada!")
         self.proposta_ativa = None
         return True
     
@@ -108,7 +110,7 @@ class SistemaPropostas:
         if not self.proposta_ativa:
             return False
         
-        print(f"\n✗ Proposta recusada por {self.proposta_ativa['destinatario'].nome}")
+        log.aviso("\n✗ Proposta recusada por %s", self.proposta_ativa['destinatario'].nome)
         self.proposta_ativa = None
         return True
     
@@ -117,7 +119,7 @@ class SistemaPropostas:
         if not self.proposta_ativa:
             return False
         
-        print(f"\n✗ Proposta cancelada por {self.proposta_ativa['oferente'].nome}")
+        log.aviso("\n✗ Proposta cancelada por %s", self.proposta_ativa['oferente'].nome)
         self.proposta_ativa = None
         return True
     
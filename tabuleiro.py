@@ -3,10 +3,38 @@
 # Importação dos novos módulos e classes
 from casas import Casa, CasaImposto, CasaVAPrisao, CasaSorteReves, CasaCofre
 from propriedades import Propriedade, CasaMetro, CasaCompanhia
-from constantes import IMPOSTO_RENDA_VALOR, VALOR_FERROVIA, VALOR_COMPANHIA_SERVICO, TAXA_RIQUEZA_VALOR
+from constantes import (
+    IMPOSTO_RENDA_VALOR, VALOR_FERROVIA, VALOR_COMPANHIA_SERVICO, TAXA_RIQUEZA_VALOR, CUSTO_CONSTRUCAO
+)
+from aluguel import TIPO_ALUGUEL_COMUM
+from types import MappingProxyType
+
+# Códigos de tipo de casa (índice tipos_casas do Tabuleiro)
+CODIGO_OUTRA = 0        # Início, Prisão (visita), Estacionamento
+CODIGO_PROPRIEDADE = 1
+CODIGO_METRO = 2
+CODIGO_COMPANHIA = 3
+CODIGO_SORTE = 4
+CODIGO_COFRE = 5
+CODIGO_IMPOSTO = 6
+CODIGO_VA_PRISAO = 7
+
+# Tamanho e bit (máscara de monopólios) de cada grupo do tabuleiro padrão,
+# preenchidos na primeira construção de um Tabuleiro
+_TAMANHO_GRUPOS_PADRAO = None
+_BITS_GRUPOS_PADRAO = None
+
+# Índices que dependem só do layout (tipos e posições), compartilhados
+# por todos os tabuleiros com o mesmo layout: layout -> (tipos, tamanhos, próximas)
+_INDICES_POR_LAYOUT = {}
 
 class Tabuleiro:
-    def __init__(self):
+    def __init__(self, rng=None):
+        """
+        Args:
+            rng: Gerador de números aleatórios repassado às casas de Sorte/Revés e Cofre
+        """
+        self.rng = rng
         self.casas = []
         self._current_pos = 0 # Contador temporário de casas
         
@@ -15,6 +43,68 @@ class Tabuleiro:
         # Verificação final para garantir 40 casas
         if len(self.casas) != 40:
             raise Exception(f"Erro ao construir o tabuleiro: {len(self.casas)} casas encontradas, 40 esperadas.")
+        
+        self._construir_indices()
+
+    def _construir_indices(self):
+        """
+        Monta os índices imutáveis do tabuleiro (o layout não muda durante a partida):
+        - propriedades_por_grupo: grupo -> tupla de propriedades (ordem do tabuleiro)
+        - tamanho_grupos: grupo -> número de propriedades
+        - tipos_casas: posição -> código do tipo da casa (CODIGO_*)
+        - proxima_posicao_grupo: grupo -> tupla de 40 posições com a próxima casa do grupo
+        """
+        global _TAMANHO_GRUPOS_PADRAO, _BITS_GRUPOS_PADRAO
+        
+        grupos = {}
+        tipos = []
+        for posicao, casa in enumerate(self.casas):
+            casa.posicao = posicao
+            
+            if isinstance(casa, CasaMetro):
+                tipos.append(CODIGO_METRO)
+            elif isinstance(casa, CasaCompanhia):
+                tipos.append(CODIGO_COMPANHIA)
+            elif isinstance(casa, Propriedade):
+                tipos.append(CODIGO_PROPRIEDADE)
+            elif isinstance(casa, CasaSorteReves):
+                tipos.append(CODIGO_SORTE)
+            elif isinstance(casa, CasaCofre):
+                tipos.append(CODIGO_COFRE)
+            elif isinstance(casa, CasaImposto):
+                tipos.append(CODIGO_IMPOSTO)
+            elif isinstance(casa, CasaVAPrisao):
+                tipos.append(CODIGO_VA_PRISAO)
+            else:
+                tipos.append(CODIGO_OUTRA)
+            
+            if isinstance(casa, Propriedade):
+                grupos.setdefault(casa.grupo_cor, []).append(casa)
+        
+        self.propriedades_por_grupo = MappingProxyType({g: tuple(props) for g, props in grupos.items()})
+        
+        layout = (tuple(tipos), tuple((g, tuple(p.posicao for p in props)) for g, props in grupos.items()))
+        indices = _INDICES_POR_LAYOUT.get(layout)
+        if indices is None:
+            proxima = {}
+            for grupo, posicoes in layout[1]:
+                # Para cada posição, a primeira casa do grupo estritamente à frente (dando a volta)
+                proxima[grupo] = tuple(
+                    min(posicoes, key=lambda destino: (destino - origem - 1) % 40)
+                    for origem in range(40)
+                )
+            indices = _INDICES_POR_LAYOUT[layout] = (
+                layout[0],
+                MappingProxyType({g: len(posicoes) for g, posicoes in layout[1]}),
+                MappingProxyType(proxima),
+            )
+        self.tipos_casas, self.tamanho_grupos, self.proxima_posicao_grupo = indices
+        
+        if _TAMANHO_GRUPOS_PADRAO is None:
+            _TAMANHO_GRUPOS_PADRAO = self.tamanho_grupos
+            _BITS_GRUPOS_PADRAO = MappingProxyType(
+                {grupo: 1 << i for i, grupo in enumerate(self.propriedades_por_grupo)}
+            )
 
     def _construir_tabuleiro(self):
         """Constrói o tabuleiro com todas as 40 casas seguindo o layout clássico do Monopoly"""
@@ -24,7 +114,7 @@ class Tabuleiro:
         
         # Grupo 1: Marrom (Posições 1, 3)
         self._add_prop(nome="Avenida Sumaré", preco=60, aluguel=2, grupo="Marrom")
-        self.casas.append(CasaCofre())
+        self.casas.append(CasaCofre(rng=self.rng))
         self._add_prop(nome="Praça da Sé", preco=60, aluguel=4, grupo="Marrom")
         
         # Posição 4: Imposto de Renda
@@ -35,7 +125,7 @@ class Tabuleiro:
         
         # Grupo 2: Azul Claro (Posições 6, 8, 9)
         self._add_prop(nome="Rua 25 de Março", preco=100, aluguel=6, grupo="Azul Claro")
-        self.casas.append(CasaSorteReves())
+        self.casas.append(CasaSorteReves(rng=self.rng))
         self._add_prop(nome="Avenida São João", preco=100, aluguel=6, grupo="Azul Claro")
         self._add_prop(nome="Avenida Paulista", preco=120, aluguel=8, grupo="Azul Claro")
         
@@ -53,7 +143,7 @@ class Tabuleiro:
         
         # Grupo 4: Laranja (Posições 16, 18, 19)
         self._add_prop(nome="Avenida Presidente Juscelino Kubitschek", preco=180, aluguel=14, grupo="Laranja")
-        self.casas.append(CasaCofre())
+        self.casas.append(CasaCofre(rng=self.rng))
         self._add_prop(nome="Avenida Engenheiro Luis Carlos Berrini", preco=180, aluguel=14, grupo="Laranja")
         self._add_prop(nome="Avenida Brigadeiro Faria Lima", preco=200, aluguel=16, grupo="Laranja")
         
@@ -62,7 +152,7 @@ class Tabuleiro:
         
         # Grupo 5: Vermelho (Posições 21, 23, 24)
         self._add_prop(nome="Ipanema", preco=220, aluguel=18, grupo="Vermelho")
-        self.casas.append(CasaSorteReves())
+        self.casas.append(CasaSorteReves(rng=self.rng))
         self._add_prop(nome="Leblon", preco=220, aluguel=18, grupo="Vermelho")
         self._add_prop(nome="Copacabana", preco=240, aluguel=20, grupo="Vermelho")
         
@@ -81,14 +171,14 @@ class Tabuleiro:
         # Grupo 7: Verde (Posições 31, 32, 34)
         self._add_prop(nome="Barra da Tijuca", preco=300, aluguel=26, grupo="Verde")
         self._add_prop(nome="Jardim Botânico", preco=300, aluguel=26, grupo="Verde")
-        self.casas.append(CasaCofre())
+        self.casas.append(CasaCofre(rng=self.rng))
         self._add_prop(nome="Lagoa Rodrigo de Freitas", preco=320, aluguel=28, grupo="Verde")
         
         # Posição 35: Metrô/Ferrovia
         self.casas.append(CasaMetro(nome="Estação de Metrô República", preco=VALOR_FERROVIA))
         
         # Grupo 8: Azul Escuro (Posições 37, 39)
-        self.casas.append(CasaSorteReves())
+        self.casas.append(CasaSorteReves(rng=self.rng))
         self._add_prop(nome="Avenida Morumbi", preco=350, aluguel=35, grupo="Azul Escuro")
         
         # Posição 38: Taxa de Riqueza
@@ -120,13 +210,23 @@ class Tabuleiro:
         """
         Retorna todas as propriedades de um grupo específico.
         Útil para verificar monopólios.
+        Retorna a tupla do índice (não deve ser modificada).
         """
-        propriedades_grupo = []
-        for casa in self.casas:
-            if isinstance(casa, Propriedade) and hasattr(casa, 'grupo_cor'):
-                if casa.grupo_cor == grupo:
-                    propriedades_grupo.append(casa)
-        return propriedades_grupo
+        return self.propriedades_por_grupo.get(grupo, ())
+
+    def get_tamanho_grupo(self, grupo):
+        """Retorna o número de propriedades de um grupo (0 se o grupo não existe)"""
+        return self.tamanho_grupos.get(grupo, 0)
+
+    def get_proxima_posicao_grupo(self, posicao, grupo):
+        """
+        Retorna a posição da próxima casa do grupo à frente de 'posicao'
+        (ex: próximo METRÔ ou SERVIÇO), ou None se o grupo não existe.
+        """
+        proximas = self.proxima_posicao_grupo.get(grupo)
+        if proximas is None:
+            return None
+        return proximas[posicao % 40]
 
     def listar_todas_propriedades(self):
         """Retorna lista de todas as propriedades do tabuleiro"""
@@ -144,6 +244,23 @@ class Tabuleiro:
             'cofre': [2, 17, 33]
         }
 
+    @staticmethod
+    def tamanho_grupo_padrao(grupo):
+        """
+        Número de propriedades de um grupo no tabuleiro padrão.
+        Para quem não tem acesso a uma instância de Tabuleiro (ex: IIABot, ValidadorRegras).
+        """
+        if _TAMANHO_GRUPOS_PADRAO is None:
+            Tabuleiro()
+        return _TAMANHO_GRUPOS_PADRAO.get(grupo, 0)
+
+    @staticmethod
+    def bit_grupo_padrao(grupo):
+        """Bit do grupo na máscara de monopólios do Jogador (0 se o grupo não existe)."""
+        if _BITS_GRUPOS_PADRAO is None:
+            Tabuleiro()
+        return _BITS_GRUPOS_PADRAO.get(grupo, 0)
+
     # --- Métodos Auxiliares para simplificar a criação ---
     def _add_prop(self, nome, preco, aluguel, grupo):
         """Adiciona uma propriedade comum ao tabuleiro"""
@@ -160,6 +277,59 @@ class Tabuleiro:
     def __repr__(self):
         return self.__str__()
 
+class TabelasTabuleiro:
+    """
+    Dados estáticos do tabuleiro indexados por posição (0-39), montados uma vez a partir de um Tabuleiro.
+    Posições que não são propriedades têm preço 0, tabela None e grupo -1.
+    """
+    __slots__ = (
+        'tipos', 'precos', 'tipos_aluguel', 'tabelas_aluguel', 'grupos', 'construivel',
+        'custo_casa', 'impostos', 'posicoes_grupo'
+    )
+
+    def __init__(self, tabuleiro):
+        nomes_grupos = list(tabuleiro.propriedades_por_grupo)
+        precos, tipos_aluguel, tabelas, grupos, construivel, custos, impostos = [], [], [], [], [], [], []
+
+        for casa in tabuleiro.casas:
+            if isinstance(casa, Propriedade):
+                precos.append(casa.preco_compra)
+                tipos_aluguel.append(casa.tipo_aluguel)
+                tabelas.append(casa.tabela_aluguel)
+                grupos.append(nomes_grupos.index(casa.grupo_cor))
+                construivel.append(casa.construivel)
+                custos.append(CUSTO_CONSTRUCAO.get(casa.grupo_cor, 100))
+            else:
+                precos.append(0)
+                tipos_aluguel.append(TIPO_ALUGUEL_COMUM)
+                tabelas.append(None)
+                grupos.append(-1)
+                construivel.append(False)
+                custos.append(0)
+            impostos.append(getattr(casa, 'valor', 0) if casa.tipo == 'IMPOSTO' else 0)
+
+        self.tipos = tabuleiro.tipos_casas
+        self.precos = tuple(precos)
+        self.tipos_aluguel = tuple(tipos_aluguel)
+        self.tabelas_aluguel = tuple(tabelas)
+        self.grupos = tuple(grupos)
+        self.construivel = tuple(construivel)
+        self.custo_casa = tuple(custos)
+        self.impostos = tuple(impostos)
+        self.posicoes_grupo = tuple(
+            tuple(propriedade.posicao for propriedade in tabuleiro.propriedades_por_grupo[grupo])
+            for grupo in nomes_grupos
+        )
+
+    _padrao = None
+
+    @classmethod
+    def padrao(cls):
+        """Tabelas do tabuleiro padrão (criadas na primeira chamada)."""
+        if cls._padrao is None:
+            cls._padrao = cls(Tabuleiro())
+        return cls._padrao
+
 # Bloco de teste/demonstração (deve ser movido para src/main.py no final)
 if __name__ == '__main__':
     print("--- Teste do Módulo Tabuleiro (Mapeamento) ---")
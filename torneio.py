@@ -0,0 +1,331 @@
+# torneio.py
+# Módulo para rodar torneios de bots em paralelo (uma partida simulada por vez em cada processo).
+# Distribui lotes de partidas entre os núcleos da CPU, grava o progresso em disco
+# e consolida taxa de vitória, duração média e ordem de falência num único relatório.
+
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from simulador import SimuladorPartidas
+
+
+DIFICULDADES_VALIDAS = ('facil', 'medio', 'dificil', 'mcts')
+
+
+def _dificuldade_do_nome(nome):
+    """Extrai a dificuldade do nome gerado por gerar_lista_bots ('Bot2_medio' -> 'medio')."""
+    return nome.split('_', 1)[1]
+
+
+def _assento_do_nome(nome):
+    """Extrai o assento (0-based) do nome gerado por gerar_lista_bots ('Bot2_medio' -> 1)."""
+    return int(nome.split('_', 1)[0][3:]) - 1
+
+
+def _estatisticas_vazias():
+    """Estrutura de estatísticas agregadas (somente tipos serializáveis em JSON)."""
+    return {
+        "partidas": 0,
+        "turnos_total": 0,
+        "finalizadas": 0,
+        "participacoes": {},           # dificuldade -> nº de assentos ocupados
+        "vitorias": {},                # dificuldade -> nº de vitórias
+        "vitorias_por_assento": {},    # assento -> nº de vitórias
+        "falencias": {},               # dificuldade -> nº de falências
+        "soma_ordem_falencia": {},     # dificuldade -> soma da posição na ordem de falência (1 = primeiro)
+        "primeiro_falido": {},         # dificuldade -> nº de vezes que faliu primeiro
+    }
+
+
+def _incrementar(contador, chave, valor=1):
+    contador[chave] = contador.get(chave, 0) + valor
+
+
+def _acumular_resultado(estatisticas, dificuldades, resultado):
+    """Adiciona um ResultadoPartida às estatísticas agregadas."""
+    estatisticas["partidas"] += 1
+    estatisticas["turnos_total"] += resultado.turnos
+    if resultado.finalizada:
+        estatisticas["finalizadas"] += 1
+
+    for dificuldade in dificuldades:
+        _incrementar(estatisticas["participacoes"], dificuldade)
+
+    if resultado.vencedor:
+        _incrementar(estatisticas["vitorias"], _dificuldade_do_nome(resultado.vencedor))
+        _incrementar(estatisticas["vitorias_por_assento"], str(_assento_do_nome(resultado.vencedor)))
+
+    for ordem, nome in enumerate(resultado.ordem_falencias, start=1):
+        dificuldade = _dificuldade_do_nome(nome)
+        _incrementar(estatisticas["falencias"], dificuldade)
+        _incrementar(estatisticas["soma_ordem_falencia"], dificuldade, ordem)
+        if ordem == 1:
+            _incrementar(estatisticas["primeiro_falido"], dificuldade)
+
+
+def mesclar_estatisticas(destino, origem):
+    """
+    Soma as estatísticas de 'origem' em 'destino' (in-place).
+
+    Args:
+        destino: Estatísticas acumuladas
+        origem: Estatísticas de um lote
+
+    Returns:
+        dict: destino
+    """
+    for chave, valor in origem.items():
+        if isinstance(valor, dict):
+            for subchave, subvalor in valor.items():
+                _incrementar(destino[chave], subchave, subvalor)
+        else:
+            destino[chave] += valor
+    return destino
+
+
+def _executar_lote(indice_lote, dificuldades, seeds, max_turnos):
+    """
+    Executa um lote de partidas dentro de um processo trabalhador.
+
+    Cada partida recebe sua própria seed (RNG local do Jogo), então o resultado
+    de um lote não depende de qual processo o executou nem da ordem de execução.
+
+    Returns:
+        tuple: (indice_lote, estatisticas do lote)
+    """
+    simulador = SimuladorPartidas(max_turnos=max_turnos)
+    estatisticas = _estatisticas_vazias()
+
+    for seed in seeds:
+        resultado = simulador.simular_partida(dificuldades, seed)
+        _acumular_resultado(estatisticas, dificuldades, resultado)
+
+    return indice_lote, estatisticas
+
+
+class TorneioBots:
+    """
+    Roda um torneio entre configurações de bots em vários processos.
+
+    O torneio é dividido em lotes (configuração de assentos + faixa de seeds).
+    Cada lote concluído é gravado como uma linha JSON no arquivo de progresso,
+    permitindo acompanhar e retomar execuções longas. A primeira linha do arquivo guarda
+    a configuração do torneio, e só um torneio com a mesma configuração retoma dele.
+    """
+
+    TAMANHO_LOTE_PADRAO = 200
+
+    def __init__(self, roster, partidas_por_configuracao, permutar_assentos=True,
+                 max_turnos=SimuladorPartidas.MAX_TURNOS_PADRAO, num_processos=None,
+                 seed_base=0, tamanho_lote=TAMANHO_LOTE_PADRAO, arquivo_progresso=None):
+        """
+        Args:
+            roster: Lista de dificuldades dos bots, ex: ['facil', 'medio', 'dificil']
+            partidas_por_configuracao: Nº de partidas para cada ordem de assentos
+            permutar_assentos: Se True, joga todas as permutações distintas dos assentos
+            max_turnos: Limite de turnos por partida
+            num_processos: Nº de processos (padrão: nº de núcleos da CPU)
+            seed_base: Seed inicial; a partida i de todo o torneio usa seed_base + i
+            tamanho_lote: Nº de partidas por lote enviado a um processo
+            arquivo_progresso: Caminho do arquivo JSONL de progresso (opcional)
+        """
+        for dificuldade in roster:
+            if dificuldade not in DIFICULDADES_VALIDAS:
+                raise ValueError(f"Dificuldade inválida: {dificuldade}")
+
+        self.roster = list(roster)
+        self.partidas_por_configuracao = partidas_por_configuracao
+        self.max_turnos = max_turnos
+        self.num_processos = num_processos or os.cpu_count() or 1
+        self.seed_base = seed_base
+        self.tamanho_lote = tamanho_lote
+        self.arquivo_progresso = arquivo_progresso
+        self.permutar_assentos = permutar_assentos
+
+        if permutar_assentos:
+            self.configuracoes = sorted(set(itertools.permutations(self.roster)))
+        else:
+            self.configuracoes = [tuple(self.roster)]
+
+    def gerar_lotes(self):
+        """
+        Gera a lista determinística de lotes do torneio.
+
+        Returns:
+            list: Tuplas (indice_lote, dificuldades, seeds)
+        """
+        lotes = []
+        proxima_seed = self.seed_base
+
+        for dificuldades in self.configuracoes:
+            restantes = self.partidas_por_configuracao
+            while restantes > 0:
+                quantidade = min(self.tamanho_lote, restantes)
+                seeds = range(proxima_seed, proxima_seed + quantidade)
+                lotes.append((len(lotes), dificuldades, seeds))
+                proxima_seed += quantidade
+                restantes -= quantidade
+
+        return lotes
+
+    def configuracao(self):
+        """
+        Parâmetros que definem os lotes e seus resultados (primeira linha do arquivo de progresso).
+
+        Returns:
+            dict: Configuração serializável em JSON
+        """
+        return {
+            "roster": self.roster,
+            "permutar_assentos": self.permutar_assentos,
+            "partidas_por_configuracao": self.partidas_por_configuracao,
+            "seed_base": self.seed_base,
+            "tamanho_lote": self.tamanho_lote,
+            "max_turnos": self.max_turnos,
+        }
+
+    def _carregar_progresso(self):
+        """
+        Lê os lotes já concluídos do arquivo de progresso (para retomar).
+
+        Raises:
+            ValueError: Se o arquivo é de um torneio com outra configuração (ou não tem cabeçalho)
+        """
+        concluidos = {}
+        if not self.arquivo_progresso or not os.path.exists(self.arquivo_progresso):
+            return concluidos
+
+        configuracao = None
+        with open(self.arquivo_progresso, 'r', encoding='utf-8') as arquivo:
+            for linha in arquivo:
+                linha = linha.strip()
+                if not linha:
+                    continue
+                try:
+                    registro = json.loads(linha)
+                except json.JSONDecodeError:
+                    # Linha parcial de uma execução interrompida
+                    continue
+                if configuracao is None:
+                    configuracao = registro.get("configuracao")
+                    if configuracao != self.configuracao():
+                        raise ValueError(
+                            f"Arquivo de progresso {self.arquivo_progresso} é de outro torneio "
+                            f"(configuração {configuracao}); use outro arquivo para esta configuração."
+                        )
+                    continue
+                concluidos[registro["lote"]] = registro["estatisticas"]
+
+        return concluidos
+
+    def executar(self, ao_progresso=None):
+        """
+        Executa o torneio (retomando do arquivo de progresso, se existir).
+
+        Args:
+            ao_progresso: Callback chamado a cada lote concluído com o relatório parcial
+
+        Returns:
+            dict: Relatório final (ver gerar_relatorio)
+        """
+        lotes = self.gerar_lotes()
+        concluidos = self._carregar_progresso()
+
+        totais = _estatisticas_vazias()
+        for estatisticas in concluidos.values():
+            mesclar_estatisticas(totais, estatisticas)
+
+        pendentes = [lote for lote in lotes if lote[0] not in concluidos]
+        arquivo = None
+        if self.arquivo_progresso:
+            arquivo = open(self.arquivo_progresso, 'a', encoding='utf-8')
+            if arquivo.tell() == 0:
+                arquivo.write(json.dumps({"configuracao": self.configuracao()}) + "\n")
+                arquivo.flush()
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.num_processos) as executor:
+                # Mantém poucos lotes em voo para limitar memória em torneios enormes
+                fila = iter(pendentes)
+                em_execucao = set()
+                max_em_execucao = self.num_processos * 2
+
+                def enviar_proximos():
+                    for indice, dificuldades, seeds in itertools.islice(fila, max_em_execucao - len(em_execucao)):
+                        em_execucao.add(executor.submit(_executar_lote, indice, dificuldades, seeds, self.max_turnos))
+
+                enviar_proximos()
+                while em_execucao:
+                    prontos, _ = wait(em_execucao, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        em_execucao.discard(futuro)
+                        indice, estatisticas = futuro.result()
+                        mesclar_estatisticas(totais, estatisticas)
+
+                        if arquivo:
+                            arquivo.write(json.dumps({"lote": indice, "estatisticas": estatisticas}) + "\n")
+                            arquivo.flush()
+
+                        if ao_progresso:
+                            ao_progresso(self.gerar_relatorio(totais))
+                    enviar_proximos()
+        finally:
+            if arquivo:
+                arquivo.close()
+
+        return self.gerar_relatorio(totais)
+
+    def gerar_relatorio(self, totais):
+        """
+        Consolida as estatísticas agregadas em um relatório.
+
+        Returns:
+            dict: partidas, duração média, taxas de vitória e de falência por dificuldade
+        """
+        partidas = totais["partidas"]
+        total_previsto = len(self.configuracoes) * self.partidas_por_configuracao
+
+        por_dificuldade = {}
+        for dificuldade, participacoes in totais["participacoes"].items():
+            falencias = totais["falencias"].get(dificuldade, 0)
+            por_dificuldade[dificuldade] = {
+                "taxa_vitoria": totais["vitorias"].get(dificuldade, 0) / participacoes,
+                "taxa_falencia": falencias / participacoes,
+                "ordem_media_falencia": (totais["soma_ordem_falencia"].get(dificuldade, 0) / falencias
+                                         if falencias else None),
+                "faliu_primeiro": totais["primeiro_falido"].get(dificuldade, 0),
+            }
+
+        return {
+            "partidas": partidas,
+            "progresso": partidas / total_previsto if total_previsto else 1.0,
+            "turnos_medios": totais["turnos_total"] / partidas if partidas else 0.0,
+            "taxa_finalizadas": totais["finalizadas"] / partidas if partidas else 0.0,
+            "por_dificuldade": por_dificuldade,
+            "vitorias_por_assento": dict(sorted(totais["vitorias_por_assento"].items())),
+        }
+
+
+if __name__ == '__main__':
+    torneio = TorneioBots(
+        roster=['facil', 'medio', 'dificil'],
+        partidas_por_configuracao=20,
+        max_turnos=300,
+        tamanho_lote=10
+    )
+
+    inicio = time.perf_counter()
+    relatorio = torneio.executar(
+        ao_progresso=lambda parcial: print(f"  > Progresso: {parcial['progresso']:.0%} ({parcial['partidas']} partidas)")
+    )
+    duracao = time.perf_counter() - inicio
+
+    print(f"\n=== TORNEIO: {relatorio['partidas']} partidas em {duracao:.2f}s "
+          f"com {torneio.num_processos} processos ===")
+    print(f"Turnos médios: {relatorio['turnos_medios']:.1f}")
+    for dificuldade, dados in relatorio["por_dificuldade"].items():
+        print(f"  {dificuldade}: vitória {dados['taxa_vitoria']:.1%} | falência {dados['taxa_falencia']:.1%}")
+    print(f"Vitórias por assento: {relatorio['vitorias_por_assento']}")
@@ -7,6 +7,110 @@ from constantes import (
     TAXA_RIQUEZA_VALOR,
     MULTA_SAIDA_PRISAO
 )
+from array import array
+
+from registro import log
+
+
+class HistoricoTransacoes:
+    """
+    Histórico de transações só de acréscimo, em colunas: arrays paralelos com o código do tipo,
+    ids de origem e destino, valor, turno e id da descrição (nomes e descrições repetidos são
+    guardados uma vez só). Mantém totais pagos/recebidos e a lista de índices de cada conta,
+    então os totais são O(1) e o histórico de um jogador é O(k).
+    """
+
+    TIPOS = ('ALUGUEL', 'TRANSFERENCIA', 'IMPOSTO', 'TAXA', 'MULTA', 'COMPRA',
+             'SALARIO', 'PREMIO', 'VENDA', 'HIPOTECA', 'DESHIPOTECA')
+    CODIGO_TIPO = {tipo: codigo for codigo, tipo in enumerate(TIPOS)}
+
+    def __init__(self):
+        self.tipos = array('B')
+        self.origens = array('H')
+        self.destinos = array('H')
+        self.valores = array('i')
+        self.turnos = array('I')
+        self.descricoes = array('H')
+
+        self.nomes = []            # id -> nome da conta
+        self._id_por_nome = {}
+        self.textos = []           # id -> descrição
+        self._id_por_texto = {}
+
+        self.total_pago = []       # Por id de conta
+        self.total_recebido = []
+        self.indices_por_conta = []  # Por id de conta: array com os índices das suas transações
+
+    def __len__(self):
+        return len(self.valores)
+
+    def _id_conta(self, nome):
+        id_conta = self._id_por_nome.get(nome)
+        if id_conta is None:
+            id_conta = self._id_por_nome[nome] = len(self.nomes)
+            self.nomes.append(nome)
+            self.total_pago.append(0)
+            self.total_recebido.append(0)
+            self.indices_por_conta.append(array('I'))
+        return id_conta
+
+    def _id_texto(self, texto):
+        id_texto = self._id_por_texto.get(texto)
+        if id_texto is None:
+            id_texto = self._id_por_texto[texto] = len(self.textos)
+            self.textos.append(texto)
+        return id_texto
+
+    def registrar(self, tipo, origem, destino, valor, descricao="", turno=0):
+        """Acrescenta uma transação (tipo deve estar em TIPOS)."""
+        indice = len(self.valores)
+        id_origem = self._id_conta(origem)
+        id_destino = self._id_conta(destino)
+
+        self.tipos.append(self.CODIGO_TIPO[tipo])
+        self.origens.append(id_origem)
+        self.destinos.append(id_destino)
+        self.valores.append(valor)
+        self.turnos.append(turno)
+        self.descricoes.append(self._id_texto(descricao))
+
+        self.total_pago[id_origem] += valor
+        self.total_recebido[id_destino] += valor
+        self.indices_por_conta[id_origem].append(indice)
+        if id_destino != id_origem:
+            self.indices_por_conta[id_destino].append(indice)
+
+    def transacao(self, indice):
+        """Monta o dict de uma transação (mesmo formato do histórico antigo, mais o turno)."""
+        return {
+            'tipo': self.TIPOS[self.tipos[indice]],
+            'origem': self.nomes[self.origens[indice]],
+            'destino': self.nomes[self.destinos[indice]],
+            'valor': self.valores[indice],
+            'descricao': self.textos[self.descricoes[indice]],
+            'turno': self.turnos[indice],
+        }
+
+    def ultimas(self, nome=None, limite=10):
+        """Últimas transações (todas ou de uma conta), da mais antiga para a mais recente."""
+        if nome is None:
+            indices = range(max(0, len(self.valores) - limite) if limite else 0, len(self.valores))
+        else:
+            id_conta = self._id_por_nome.get(nome)
+            if id_conta is None:
+                return []
+            indices = self.indices_por_conta[id_conta]
+            indices = indices[-limite:] if limite else indices
+        return [self.transacao(indice) for indice in indices]
+
+    def total_pago_por(self, nome):
+        id_conta = self._id_por_nome.get(nome)
+        return 0 if id_conta is None else self.total_pago[id_conta]
+
+    def total_recebido_por(self, nome):
+        id_conta = self._id_por_nome.get(nome)
+        return 0 if id_conta is None else self.total_recebido[id_conta]
+
 
 class GerenciadorTransacoes:
     """
@@ -22,7 +126,13 @@ class GerenciadorTransacoes:
             banco: Instância da classe Banco que gerencia as contas
         """
         self.banco = banco
-        self.historico_transacoes = []  # Log de todas as transações
+        self.historico = HistoricoTransacoes()  # Log colunar de todas as transações
+        self.turno_atual = 0  # Gravado em cada transação (atualizado por quem controla os turnos)
+    
+    @property
+    def historico_transacoes(self):
+        """Lista de dicts com todas as transações (montada sob demanda; prefira obter_historico)."""
+        return [self.historico.transacao(indice) for indice in range(len(self.historico))]
         
     def _registrar_transacao(self, tipo, origem, destino, valor, descricao=""):
         """
@@ -35,14 +145,7 @@ class GerenciadorTransacoes:
             valor: Valor da transação
             descricao: Descrição adicional da transação
         """
-        transacao = {
-            'tipo': tipo,
-            'origem': origem,
-            'destino': destino,
-            'valor': valor,
-            'descricao': descricao
-        }
-        self.historico_transacoes.append(transacao)
+        self.historico.registrar(tipo, origem, destino, valor, descricao, self.turno_atual)
     
     # ===== TRANSAÇÕES ENTRE JOGADORES =====
     
@@ -59,13 +162,13 @@ class GerenciadorTransacoes:
             bool: True se o pagamento foi bem-sucedido, False caso contrário
         """
         if inquilino.nome == proprietario.nome:
-            print(f"  > {inquilino.nome} caiu em sua própria propriedade. Sem cobrança.")
+            log.info("  > %s caiu em sua própria propriedade. Sem cobrança.", inquilino.nome)
             return True
             
-        print(f"\n--- PAGAMENTO DE ALUGUEL ---")
-        print(f"  Inquilino: {inquilino.nome}")
-        print(f"  Proprietário: {proprietario.nome}")
-        print(f"  Valor: R${valor_aluguel}")
+        log.info("\n--- PAGAMENTO DE ALUGUEL ---")
+        log.info("  Inquilino: %s", inquilino.nome)
+        log.info("  Proprietário: %s", proprietario.nome)
+        log.info("  Valor: R$%s", valor_aluguel)
         
         sucesso = self.banco.pagar(inquilino.nome, valor_aluguel, proprietario.nome)
         
@@ -77,10 +180,10 @@ class GerenciadorTransacoes:
                 valor_aluguel,
                 f"Pagamento de aluguel"
             )
-            print(f"  ✓ Aluguel pago com sucesso!")
+            log.info("  ✓ Aluguel pago com sucesso!")
             return True
         else:
-            print(f"  ✗ {inquilino.nome} não tem saldo suficiente para pagar o aluguel!")
+            log.aviso("  ✗ %s não tem saldo suficiente para pagar o aluguel!", inquilino.nome)
             # Aqui seria acionada a lógica de falência/negociação
             return False
     
@@ -98,12 +201,12 @@ class GerenciadorTransacoes:
         Returns:
             bool: True se a transferência foi bem-sucedida
         """
-        print(f"\n--- TRANSFERÊNCIA ENTRE JOGADORES ---")
-        print(f"  De: {pagador.nome}")
-        print(f"  Para: {recebedor.nome}")
-        print(f"  Valor: R${valor}")
+        log.info("\n--- TRANSFERÊNCIA ENTRE JOGADORES ---")
+        log.info("  De: %s", pagador.nome)
+        log.info("  Para: %s", recebedor.nome)
+        log.info("  Valor: R$%s", valor)
         if motivo:
-            print(f"  Motivo: {motivo}")
+            log.info("  Motivo: %s", motivo)
         
         sucesso = self.banco.pagar(pagador.nome, valor, recebedor.nome)
         
@@ -115,10 +218,10 @@ class GerenciadorTransacoes:
                 valor,
                 motivo
             )
-            print(f"  ✓ Transferência realizada com sucesso!")
+            log.info("  ✓ Transferência realizada com sucesso!")
             return True
         else:
-            print(f"  ✗ Transferência falhou - saldo insuficiente!")
+            log.aviso("  ✗ Transferência falhou - saldo insuficiente!")
             return False
     
     # ===== PAGAMENTOS AO BANCO (IMPOSTOS E TAXAS) =====
@@ -135,10 +238,10 @@ class GerenciadorTransacoes:
         Returns:
             bool: True se o pagamento foi bem-sucedido
         """
-        print(f"\n--- PAGAMENTO DE IMPOSTO ---")
-        print(f"  Jogador: {jogador.nome}")
-        print(f"  Tipo: {tipo_imposto}")
-        print(f"  Valor: R${valor_imposto}")
+        log.info("\n--- PAGAMENTO DE IMPOSTO ---")
+        log.info("  Jogador: %s", jogador.nome)
+        log.info("  Tipo: %s", tipo_imposto)
+        log.info("  Valor: R$%s", valor_imposto)
         
         sucesso = self.banco.pagar(jogador.nome, valor_imposto, "Banco")
         
@@ -150,10 +253,10 @@ class GerenciadorTransacoes:
                 valor_imposto,
                 tipo_imposto
             )
-            print(f"  ✓ Imposto pago ao banco!")
+            log.info("  ✓ Imposto pago ao banco!")
             return True
         else:
-            print(f"  ✗ Saldo insuficiente para pagar o imposto!")
+            log.aviso("  ✗ Saldo insuficiente para pagar o imposto!")
             return False
     
     def pagar_taxa_construcao(self, jogador, valor_total, quantidade_casas=0, quantidade_hoteis=0):
@@ -169,10 +272,10 @@ class GerenciadorTransacoes:
         Returns:
             bool: True se o pagamento foi bem-sucedido
         """
-        print(f"\n--- TAXA DE REPAROS ---")
-        print(f"  Jogador: {jogador.nome}")
-        print(f"  Casas: {quantidade_casas} | Hotéis: {quantidade_hoteis}")
-        print(f"  Valor Total: R${valor_total}")
+        log.info("\n--- TAXA DE REPAROS ---")
+        log.info("  Jogador: %s", jogador.nome)
+        log.info("  Casas: %s | Hotéis: %s", quantidade_casas, quantidade_hoteis)
+        log.info("  Valor Total: R$%s", valor_total)
         
         sucesso = self.banco.pagar(jogador.nome, valor_total, "Banco")
         
@@ -186,7 +289,7 @@ class GerenciadorTransacoes:
             )
             return True
         else:
-            print(f"  ✗ Saldo insuficiente para pagar a taxa de reparos!")
+            log.aviso("  ✗ Saldo insuficiente para pagar a taxa de reparos!")
             return False
     
     def pagar_multa_prisao(self, jogador):
@@ -199,9 +302,9 @@ class GerenciadorTransacoes:
         Returns:
             bool: True se o pagamento foi bem-sucedido
         """
-        print(f"\n--- PAGAMENTO DE MULTA DA PRISÃO ---")
-        print(f"  Jogador: {jogador.nome}")
-        print(f"  Valor: R${MULTA_SAIDA_PRISAO}")
+        log.info("\n--- PAGAMENTO DE MULTA DA PRISÃO ---")
+        log.info("  Jogador: %s", jogador.nome)
+        log.info("  Valor: R$%s", MULTA_SAIDA_PRISAO)
         
         sucesso = self.banco.pagar(jogador.nome, MULTA_SAIDA_PRISAO, "Banco")
         
@@ -214,10 +317,10 @@ class GerenciadorTransacoes:
                 "Multa para sair da prisão"
             )
             jogador.sair_prisao()
-            print(f"  ✓ {jogador.nome} pagou a multa e saiu da prisão!")
+            log.info("  ✓ %s pagou a multa e saiu da prisão!", jogador.nome)
             return True
         else:
-            print(f"  ✗ Saldo insuficiente para pagar a multa!")
+            log.aviso("  ✗ Saldo insuficiente para pagar a multa!")
             return False
     
     def pagar_compra_propriedade(self, jogador, propriedade):
@@ -231,10 +334,10 @@ class GerenciadorTransacoes:
         Returns:
             bool: True se a compra foi bem-sucedida
         """
-        print(f"\n--- COMPRA DE PROPRIEDADE ---")
-        print(f"  Comprador: {jogador.nome}")
-        print(f"  Propriedade: {propriedade.nome}")
-        print(f"  Valor: R${propriedade.preco_compra}")
+        log.info("\n--- COMPRA DE PROPRIEDADE ---")
+        log.info("  Comprador: %s", jogador.nome)
+        log.info("  Propriedade: %s", propriedade.nome)
+        log.info("  Valor: R$%s", propriedade.preco_compra)
         
         sucesso = self.banco.pagar(jogador.nome, propriedade.preco_compra, "Banco")
         
@@ -247,10 +350,10 @@ class GerenciadorTransacoes:
                 f"Compra de {propriedade.nome}"
             )
             jogador.adicionar_propriedade(propriedade)
-            print(f"  ✓ Propriedade comprada com sucesso!")
+            log.info("  ✓ Propriedade comprada com sucesso!")
             return True
         else:
-            print(f"  ✗ Saldo insuficiente para comprar a propriedade!")
+            log.aviso("  ✗ Saldo insuficiente para comprar a propriedade!")
             return False
     
     # ===== RECEBIMENTOS =====
@@ -265,9 +368,9 @@ class GerenciadorTransacoes:
         Returns:
             bool: True sempre (não há como falhar em receber)
         """
-        print(f"\n--- PASSOU PELA SAÍDA ---")
-        print(f"  Jogador: {jogador.nome}")
-        print(f"  Bônus: R${VALOR_PASSAGEM_SAIDA}")
+        log.info("\n--- PASSOU PELA SAÍDA ---")
+        log.info("  Jogador: %s", jogador.nome)
+        log.info("  Bônus: R$%s", VALOR_PASSAGEM_SAIDA)
         
         sucesso = self.banco.depositar(jogador.nome, VALOR_PASSAGEM_SAIDA)
         
@@ -279,7 +382,7 @@ class GerenciadorTransacoes:
                 VALOR_PASSAGEM_SAIDA,
                 "Passou pela saída"
             )
-            print(f"  ✓ Salário recebido!")
+            log.info("  ✓ Salário recebido!")
         
         return sucesso
     
@@ -295,10 +398,10 @@ class GerenciadorTransacoes:
         Returns:
             bool: True sempre
         """
-        print(f"\n--- PRÊMIO RECEBIDO ---")
-        print(f"  Jogador: {jogador.nome}")
-        print(f"  Valor: R${valor}")
-        print(f"  Motivo: {descricao}")
+        log.info("\n--- PRÊMIO RECEBIDO ---")
+        log.info("  Jogador: %s", jogador.nome)
+        log.info("  Valor: R$%s", valor)
+        log.info("  Motivo: %s", descricao)
         
         sucesso = self.banco.depositar(jogador.nome, valor)
         
@@ -310,7 +413,7 @@ class GerenciadorTransacoes:
                 valor,
                 descricao
             )
-            print(f"  ✓ Prêmio creditado!")
+            log.info("  ✓ Prêmio creditado!")
         
         return sucesso
     
@@ -326,10 +429,10 @@ class GerenciadorTransacoes:
         Returns:
             bool: True sempre
         """
-        print(f"\n--- VENDA DE PROPRIEDADE ---")
-        print(f"  Vendedor: {jogador.nome}")
-        print(f"  Propriedade: {propriedade_nome}")
-        print(f"  Valor: R${valor}")
+        log.info("\n--- VENDA DE PROPRIEDADE ---")
+        log.info("  Vendedor: %s", jogador.nome)
+        log.info("  Propriedade: %s", propriedade_nome)
+        log.info("  Valor: R$%s", valor)
         
         sucesso = self.banco.depositar(jogador.nome, valor)
         
@@ -341,7 +444,7 @@ class GerenciadorTransacoes:
                 valor,
                 f"Venda de {propriedade_nome}"
             )
-            print(f"  ✓ Valor da venda creditado!")
+            log.info("  ✓ Valor da venda creditado!")
         
         return sucesso
     
@@ -357,15 +460,15 @@ class GerenciadorTransacoes:
             bool: True se a hipoteca foi realizada
         """
         if propriedade.hipotecada:
-            print(f"  ✗ {propriedade.nome} já está hipotecada!")
+            log.aviso("  ✗ %s já está hipotecada!", propriedade.nome)
             return False
         
         valor_hipoteca = propriedade.preco_compra // 2  # Metade do valor de compra
         
-        print(f"\n--- HIPOTECA DE PROPRIEDADE ---")
-        print(f"  Jogador: {jogador.nome}")
-        print(f"  Propriedade: {propriedade.nome}")
-        print(f"  Valor: R${valor_hipoteca}")
+        log.info("\n--- HIPOTECA DE PROPRIEDADE ---")
+        log.info("  Jogador: %s", jogador.nome)
+        log.info("  Propriedade: %s", propriedade.nome)
+        log.info("  Valor: R$%s", valor_hipoteca)
         
         propriedade.hipotecada = True
         sucesso = self.banco.depositar(jogador.nome, valor_hipoteca)
@@ -378,7 +481,7 @@ class GerenciadorTransacoes:
                 valor_hipoteca,
                 f"Hipoteca de {propriedade.nome}"
             )
-            print(f"  ✓ Hipoteca realizada!")
+            log.info("  ✓ Hipoteca realizada!")
         
         return sucesso
     
@@ -394,16 +497,16 @@ class GerenciadorTransacoes:
             bool: True se o pagamento foi bem-sucedido
         """
         if not propriedade.hipotecada:
-            print(f"  ✗ {propriedade.nome} não está hipotecada!")
+            log.aviso("  ✗ %s não está hipotecada!", propriedade.nome)
             return False
         
         valor_base = propriedade.preco_compra // 2
         valor_total = int(valor_base * 1.1)  # Valor + 10% de juros
         
-        print(f"\n--- DESHIPOTECAR PROPRIEDADE ---")
-        print(f"  Jogador: {jogador.nome}")
-        print(f"  Propriedade: {propriedade.nome}")
-        print(f"  Valor: R${valor_total} (com 10% de juros)")
+        log.info("\n--- DESHIPOTECAR PROPRIEDADE ---")
+        log.info("  Jogador: %s", jogador.nome)
+        log.info("  Propriedade: %s", propriedade.nome)
+        log.info("  Valor: R$%s (com 10%% de juros)", valor_total)
         
         sucesso = self.banco.pagar(jogador.nome, valor_total, "Banco")
         
@@ -416,10 +519,10 @@ class GerenciadorTransacoes:
                 valor_total,
                 f"Deshipoteca de {propriedade.nome}"
             )
-            print(f"  ✓ Propriedade deshipotecada!")
+            log.info("  ✓ Propriedade deshipotecada!")
             return True
         else:
-            print(f"  ✗ Saldo insuficiente para deshipotecar!")
+            log.aviso("  ✗ Saldo insuficiente para deshipotecar!")
             return False
     
     # ===== RELATÓRIOS E CONSULTAS =====
@@ -435,14 +538,7 @@ class GerenciadorTransacoes:
         Returns:
             list: Lista de transações
         """
-        if jogador_nome:
-            filtradas = [
-                t for t in self.historico_transacoes
-                if t['origem'] == jogador_nome or t['destino'] == jogador_nome
-            ]
-            return filtradas[-limite:]
-        else:
-            return self.historico_transacoes[-limite:]
+        return self.historico.ultimas(jogador_nome or None, limite)
     
     def imprimir_historico(self, jogador_nome=None, limite=10):
         """
@@ -454,23 +550,23 @@ class GerenciadorTransacoes:
         """
         transacoes = self.obter_historico(jogador_nome, limite)
         
-        print("\n" + "="*60)
-        print("HISTÓRICO DE TRANSAÇÕES")
+        log.info("\n" + "=" * 60)
+        log.info("HISTÓRICO DE TRANSAÇÕES")
         if jogador_nome:
-            print(f"Jogador: {jogador_nome}")
-        print("="*60)
+            log.info("Jogador: %s", jogador_nome)
+        log.info("=" * 60)
         
         if not transacoes:
-            print("  Nenhuma transação registrada.")
+            log.info("  Nenhuma transação registrada.")
         else:
             for i, t in enumerate(transacoes, 1):
-                print(f"\n{i}. {t['tipo']}")
-                print(f"   De: {t['origem']} → Para: {t['destino']}")
-                print(f"   Valor: R${t['valor']}")
+                log.info("\n%s. %s", i, t['tipo'])
+                log.info("   De: %s → Para: %s", t['origem'], t['destino'])
+                log.info("   Valor: R$%s", t['valor'])
                 if t['descricao']:
-                    print(f"   Descrição: {t['descricao']}")
+                    log.info("   Descrição: %s", t['descricao'])
         
-        print("="*60 + "\n")
+        log.info("=" * 60 + "\n")
     
     def obter_total_pago(self, jogador_nome):
         """
@@ -482,11 +578,7 @@ class GerenciadorTransacoes:
         Returns:
             int: Total pago
         """
-        total = sum(
-            t['valor'] for t in self.historico_transacoes
-            if t['origem'] == jogador_nome
-        )
-        return total
+        return self.historico.total_pago_por(jogador_nome)
     
     def obter_total_recebido(self, jogador_nome):
         """
@@ -498,11 +590,7 @@ class GerenciadorTransacoes:
         Returns:
             int: Total recebido
         """
-        total = sum(
-            t['valor'] for t in self.historico_transacoes
-            if t['destino'] == jogador_nome
-        )
-        return total
+        return self.historico.total_recebido_por(jogador_nome)
 
 
 # ===== TESTE DO MÓDULO =====
@@ -4,6 +4,8 @@ Garante que todas as ações dos jogadores sigam as regras oficiais do jogo.
 """
 
 from propriedades import Propriedade, CasaMetro, CasaCompanhia
+from tabuleiro import Tabuleiro
+from aluguel import calcular_aluguel
 
 
 class ValidadorRegras:
@@ -60,7 +62,7 @@ class ValidadorRegras:
             return False, "Você não é dono desta propriedade"
         
         # Só propriedades comuns podem ter casas (não ferrovias/companhias)
-        if not isinstance(propriedade, Propriedade) or not hasattr(propriedade, 'casas'):
+        if not isinstance(propriedade, Propriedade) or not propriedade.construivel:
             return False, "Esta propriedade não aceita construções"
         
         # Regra 6: Não pode estar hipotecada
@@ -72,14 +74,16 @@ class ValidadorRegras:
             return False, "Propriedade sem grupo definido"
         
         grupo = propriedade.grupo_cor
-        propriedades_grupo = [p for p in jogador.propriedades 
-                             if hasattr(p, 'grupo_cor') and p.grupo_cor == grupo]
         
         # Contar total de propriedades no grupo (do tabuleiro)
         total_grupo = ValidadorRegras._contar_propriedades_grupo_tabuleiro(grupo)
+        quantidade_grupo = jogador.contar_propriedades_grupo(grupo)
+        
+        if quantidade_grupo < total_grupo:
+            return False, f"Você precisa ter monopólio do grupo {grupo} (tem {quantidade_grupo}/{total_grupo})"
         
-        if len(propriedades_grupo) < total_grupo:
-            return False, f"Você precisa ter monopólio do grupo {grupo} (tem {len(propriedades_grupo)}/{total_grupo})"
+        propriedades_grupo = [p for p in jogador.propriedades 
+                             if hasattr(p, 'grupo_cor') and p.grupo_cor == grupo]
         
         # Regra 3: Construção uniforme
         casas_no_grupo = [p.casas for p in propriedades_grupo if hasattr(p, 'casas')]
@@ -195,7 +199,7 @@ class ValidadorRegras:
         return True, "Deshipoteca válida"
 
     @staticmethod
-    def validar_pagamento_aluguel(jogador, propriedade, banco):
+    def validar_pagamento_aluguel(jogador, propriedade, banco, rolagem_dados=0):
         """
         Valida pagamento de aluguel.
         
@@ -221,7 +225,7 @@ class ValidadorRegras:
             return False, 0, "Propriedade hipotecada não cobra aluguel"
         
         # Calcular aluguel
-        aluguel = propriedade.calcular_aluguel() if hasattr(propriedade, 'calcular_aluguel') else 0
+        aluguel = calcular_aluguel(propriedade, rolagem_dados)
         
         return True, aluguel, "Deve pagar aluguel"
 
@@ -266,20 +270,7 @@ class ValidadorRegras:
         Conta quantas propriedades existem em um grupo no tabuleiro.
         Usado para verificar monopólios.
         """
-        # Mapeamento dos grupos e quantidades
-        grupos_monopoly = {
-            'Marrom': 2,
-            'Azul Claro': 3,
-            'Rosa': 3,
-            'Laranja': 3,
-            'Vermelho': 3,
-            'Amarelo': 3,
-            'Verde': 3,
-            'Azul Escuro': 2,
-            'Ferrovia': 4,
-            'Companhia': 2
-        }
-        return grupos_monopoly.get(grupo, 3)
+        return Tabuleiro.tamanho_grupo_padrao(grupo)
 
     @staticmethod
     def validar_turno_jogador(jogador, gerenciador_partida):